@@ -0,0 +1,36 @@
+"""Add content-hash index on langchain_pg_embedding for incremental re-index
+
+Revision ID: add_embedding_hash_idx
+Revises: extend_upload_jobs
+Create Date: 2026-02-01 10:00:00.000000+07:00
+
+Incremental re-indexing looks up existing vectors by
+cmetadata->>'embedding_hash' (sha256 of model, dimension and chunk text)
+so unchanged chunks are not re-embedded.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "add_embedding_hash_idx"
+down_revision: Union[str, None] = "extend_upload_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add expression index on cmetadata->>'embedding_hash'."""
+    op.create_index(
+        "idx_embedding_hash",
+        "langchain_pg_embedding",
+        [sa.literal_column("(cmetadata ->> 'embedding_hash')")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop embedding hash index."""
+    op.drop_index("idx_embedding_hash", table_name="langchain_pg_embedding")
@@ -0,0 +1,97 @@
+"""Add bulk_import_checkpoints table for resumable bulk imports
+
+Revision ID: add_import_checkpoints
+Revises: add_embedding_hash_idx
+Create Date: 2026-02-05 10:00:00.000000+07:00
+
+scripts/bulk_import_from_raw.py records per-file status and content hash
+so a rerun skips files already imported (same hash) and retries failed or
+interrupted ones instead of starting over.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "add_import_checkpoints"
+down_revision: Union[str, None] = "add_embedding_hash_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create bulk_import_checkpoints table."""
+    op.create_table(
+        "bulk_import_checkpoints",
+        sa.Column(
+            "file_path",
+            sa.Text(),
+            primary_key=True,
+            comment="File path relative to the raw data folder",
+        ),
+        sa.Column(
+            "content_hash",
+            sa.String(64),
+            nullable=False,
+            comment="SHA-256 of the file bytes when last attempted",
+        ),
+        sa.Column(
+            "status",
+            sa.String(20),
+            nullable=False,
+            server_default="running",
+            comment="running, completed or failed",
+        ),
+        sa.Column(
+            "stage",
+            sa.String(20),
+            nullable=True,
+            comment="Stage that failed (parse, embed_write)",
+        ),
+        sa.Column(
+            "document_id",
+            sa.String(255),
+            nullable=True,
+            comment="documents.document_id written for this file",
+        ),
+        sa.Column(
+            "chunks",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Chunks written for this file",
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Number of import attempts",
+        ),
+        sa.Column(
+            "error_message",
+            sa.Text(),
+            nullable=True,
+            comment="Last error if failed",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(),
+            nullable=False,
+            server_default=sa.text("now()"),
+            comment="Last update timestamp",
+        ),
+        comment="Per-file progress of scripts/bulk_import_from_raw.py",
+    )
+
+    op.create_index(
+        "ix_import_checkpoints_status", "bulk_import_checkpoints", ["status"]
+    )
+
+
+def downgrade() -> None:
+    """Drop bulk_import_checkpoints table."""
+    op.drop_index("ix_import_checkpoints_status", table_name="bulk_import_checkpoints")
+    op.drop_table("bulk_import_checkpoints")
@@ -0,0 +1,60 @@
+"""Add content fingerprint columns to documents for duplicate detection
+
+Revision ID: add_doc_fingerprints
+Revises: add_import_checkpoints
+Create Date: 2026-02-10 10:00:00.000000+07:00
+
+Uploads are checked against existing documents before chunking/embedding:
+- file_hash: SHA-256 of raw bytes (exact duplicate)
+- text_hash: SHA-256 of normalized extracted text (exact duplicate)
+- minhash_signature / minhash_bands: MinHash + LSH bands (near-duplicate)
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_doc_fingerprints"
+down_revision: Union[str, None] = "add_import_checkpoints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add fingerprint columns and lookup indexes."""
+    # file_hash is part of schema v3 but may be missing on older databases
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS file_hash VARCHAR(64)")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS text_hash VARCHAR(64)")
+    op.execute(
+        "ALTER TABLE documents ADD COLUMN IF NOT EXISTS minhash_signature BIGINT[]"
+    )
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS minhash_bands TEXT[]")
+
+    op.execute(
+        "COMMENT ON COLUMN documents.text_hash IS "
+        "'SHA-256 of normalized extracted text for deduplication'"
+    )
+    op.execute(
+        "COMMENT ON COLUMN documents.minhash_bands IS "
+        "'LSH band hashes of minhash_signature for near-duplicate lookup'"
+    )
+
+    op.create_index("idx_documents_file_hash", "documents", ["file_hash"])
+    op.create_index("idx_documents_text_hash", "documents", ["text_hash"])
+    op.create_index(
+        "idx_documents_minhash_bands",
+        "documents",
+        ["minhash_bands"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Drop fingerprint indexes and columns (file_hash is kept)."""
+    op.drop_index("idx_documents_minhash_bands", table_name="documents")
+    op.drop_index("idx_documents_text_hash", table_name="documents")
+    op.drop_index("idx_documents_file_hash", table_name="documents")
+    op.drop_column("documents", "minhash_bands")
+    op.drop_column("documents", "minhash_signature")
+    op.drop_column("documents", "text_hash")
@@ -0,0 +1,162 @@
+"""Add document_catalog summary table maintained per document
+
+Revision ID: add_document_catalog
+Revises: add_doc_fingerprints
+Create Date: 2026-02-15 10:00:00.000000+07:00
+
+GET /documents/catalog used to GROUP BY cmetadata->>'document_id' over the
+whole langchain_pg_embedding table on every request. document_catalog keeps
+one row per document (chunk count, chunk ids, type, status, first chunk
+metadata) and is refreshed for the affected documents only by
+refresh_document_catalog(document_ids) from the upload, import, reindex and
+status-update paths. refresh_document_catalog(NULL) rebuilds everything.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_document_catalog"
+down_revision: Union[str, None] = "add_doc_fingerprints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create document_catalog, its refresh function, and backfill it."""
+    op.create_table(
+        "document_catalog",
+        sa.Column("document_id", sa.String(255), primary_key=True),
+        sa.Column("document_type", sa.String(50), nullable=True),
+        sa.Column(
+            "status",
+            sa.String(50),
+            nullable=False,
+            server_default="active",
+            comment="documents.status (active if no documents row)",
+        ),
+        sa.Column("chunk_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "chunk_ids",
+            postgresql.ARRAY(sa.String()),
+            nullable=False,
+            server_default="{}",
+            comment="langchain_pg_embedding ids in chunk_index order",
+        ),
+        sa.Column(
+            "first_chunk_metadata",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default="{}",
+            comment="cmetadata of the first chunk (title, dates, hierarchy)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            nullable=False,
+            comment="Latest chunk created_at (catalog sort key)",
+        ),
+        sa.Column(
+            "refreshed_at",
+            sa.TIMESTAMP(),
+            nullable=False,
+            server_default=sa.text("clock_timestamp()"),
+            comment="Last refresh of this row (ETag input)",
+        ),
+        comment="Per-document summary of langchain_pg_embedding for the catalog",
+    )
+
+    # Keyset pagination: ORDER BY created_at DESC, document_id DESC
+    op.create_index(
+        "ix_document_catalog_created",
+        "document_catalog",
+        ["created_at", "document_id"],
+    )
+    op.create_index(
+        "ix_document_catalog_type_status",
+        "document_catalog",
+        ["document_type", "status"],
+    )
+
+    # Per-document refresh must not scan the embedding table
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_embedding_document_id
+        ON langchain_pg_embedding ((cmetadata ->> 'document_id'))
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION refresh_document_catalog(doc_ids text[] DEFAULT NULL)
+        RETURNS integer AS $$
+        DECLARE
+            refreshed integer;
+        BEGIN
+            -- Documents whose chunks are all gone
+            DELETE FROM document_catalog c
+            WHERE (doc_ids IS NULL OR c.document_id = ANY(doc_ids))
+            AND NOT EXISTS (
+                SELECT 1 FROM langchain_pg_embedding e
+                WHERE e.cmetadata ->> 'document_id' = c.document_id
+            );
+
+            INSERT INTO document_catalog (
+                document_id, document_type, status, chunk_count, chunk_ids,
+                first_chunk_metadata, created_at, refreshed_at
+            )
+            SELECT
+                g.document_id,
+                g.first_chunk_metadata ->> 'document_type',
+                COALESCE(d.status, 'active'),
+                g.chunk_count,
+                g.chunk_ids,
+                g.first_chunk_metadata,
+                -- Chunks without created_at keep the catalog's existing value;
+                -- now() only on first insert
+                COALESCE(g.created_at, existing.created_at, now()),
+                clock_timestamp()
+            FROM (
+                SELECT
+                    e.cmetadata ->> 'document_id' AS document_id,
+                    COUNT(*) AS chunk_count,
+                    MAX(CAST(e.cmetadata ->> 'created_at' AS TIMESTAMP)) AS created_at,
+                    array_agg(e.id::text ORDER BY (e.cmetadata ->> 'chunk_index')::int) AS chunk_ids,
+                    (array_agg(e.cmetadata ORDER BY (e.cmetadata ->> 'chunk_index')::int))[1]
+                        AS first_chunk_metadata
+                FROM langchain_pg_embedding e
+                WHERE e.cmetadata ->> 'document_id' IS NOT NULL
+                AND (doc_ids IS NULL OR e.cmetadata ->> 'document_id' = ANY(doc_ids))
+                GROUP BY e.cmetadata ->> 'document_id'
+            ) g
+            LEFT JOIN documents d ON d.document_id = g.document_id
+            LEFT JOIN document_catalog existing ON existing.document_id = g.document_id
+            ON CONFLICT (document_id) DO UPDATE SET
+                document_type = EXCLUDED.document_type,
+                status = EXCLUDED.status,
+                chunk_count = EXCLUDED.chunk_count,
+                chunk_ids = EXCLUDED.chunk_ids,
+                first_chunk_metadata = EXCLUDED.first_chunk_metadata,
+                created_at = EXCLUDED.created_at,
+                refreshed_at = EXCLUDED.refreshed_at;
+
+            GET DIAGNOSTICS refreshed = ROW_COUNT;
+            RETURN refreshed;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    op.execute("SELECT refresh_document_catalog(NULL)")
+
+
+def downgrade() -> None:
+    """Drop document_catalog and its refresh function."""
+    op.execute("DROP FUNCTION IF EXISTS refresh_document_catalog(text[])")
+    op.execute("DROP INDEX IF EXISTS idx_embedding_document_id")
+    op.drop_index("ix_document_catalog_type_status", table_name="document_catalog")
+    op.drop_index("ix_document_catalog_created", table_name="document_catalog")
+    op.drop_table("document_catalog")
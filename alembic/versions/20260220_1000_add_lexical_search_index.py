@@ -0,0 +1,70 @@
+"""Add accent-insensitive full-text column on langchain_pg_embedding
+
+Revision ID: add_lexical_search
+Revises: add_document_catalog
+Create Date: 2026-02-20 10:00:00.000000+07:00
+
+Hybrid retrieval (create_retriever(mode="hybrid")) runs a lexical search next
+to the vector search. Vietnamese has no snowball stemmer, so the tsvector
+uses the 'simple' config over unaccented text ("Điều 14" matches "dieu 14").
+It is a stored generated column so ranking does not re-parse every match.
+
+idx_document_chunks_fts (english config on Vietnamese text, never queried)
+is dropped.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_lexical_search"
+down_revision: Union[str, None] = "add_document_catalog"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add vn_unaccent(), document_tsv column and its GIN index."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+
+    # unaccent() is STABLE; generated columns and indexes need IMMUTABLE
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION vn_unaccent(text)
+        RETURNS text AS $$
+            SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+        $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE langchain_pg_embedding
+        ADD COLUMN IF NOT EXISTS document_tsv tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', vn_unaccent(coalesce(document, '')))
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_embedding_document_tsv
+        ON langchain_pg_embedding USING gin (document_tsv)
+        """
+    )
+
+    op.execute("DROP INDEX IF EXISTS idx_document_chunks_fts")
+
+
+def downgrade() -> None:
+    """Drop the lexical search column and restore the old FTS index."""
+    op.execute("DROP INDEX IF EXISTS idx_embedding_document_tsv")
+    op.execute("ALTER TABLE langchain_pg_embedding DROP COLUMN IF EXISTS document_tsv")
+    op.execute("DROP FUNCTION IF EXISTS vn_unaccent(text)")
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_document_chunks_fts
+        ON document_chunks USING gin (to_tsvector('english'::regconfig, content))
+        """
+    )
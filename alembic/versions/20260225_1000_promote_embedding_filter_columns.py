@@ -0,0 +1,75 @@
+"""Promote filter keys out of langchain_pg_embedding.cmetadata
+
+Revision ID: promote_embedding_filters
+Revises: add_lexical_search
+Create Date: 2026-02-25 10:00:00.000000+07:00
+
+Filtered vector search (src/embedding/store/filtered_search.py) filters on
+typed, indexed columns instead of JSONB evaluated after the ANN scan:
+- document_type, document_id: copied from cmetadata
+- status: cmetadata->>'status' (written by the status endpoint), 'active'
+  when absent
+
+They are STORED generated columns, so every writer (PGVector, bulk writer,
+status updates) keeps them in sync without code changes. Exact filtered
+top-k comes from pgvector iterative index scans (>= 0.8.0) on the existing
+HNSW index, set per query.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "promote_embedding_filters"
+down_revision: Union[str, None] = "add_lexical_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PROMOTED_COLUMNS = {
+    "document_type": "varchar(50) GENERATED ALWAYS AS (cmetadata ->> 'document_type') STORED",
+    "document_id": "varchar(255) GENERATED ALWAYS AS (cmetadata ->> 'document_id') STORED",
+    "status": (
+        "varchar(50) GENERATED ALWAYS AS "
+        "(COALESCE(cmetadata ->> 'status', 'active')) STORED"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Add generated filter columns and their indexes."""
+    # One ALTER TABLE: stored generated columns rewrite the table, so
+    # adding them together costs a single rewrite instead of three
+    op.execute(
+        "ALTER TABLE langchain_pg_embedding "
+        + ", ".join(
+            f"ADD COLUMN IF NOT EXISTS {column} {definition}"
+            for column, definition in PROMOTED_COLUMNS.items()
+        )
+    )
+
+    op.create_index(
+        "ix_embedding_collection_type_status",
+        "langchain_pg_embedding",
+        ["collection_id", "document_type", "status"],
+    )
+    op.create_index(
+        "ix_embedding_filter_document_id",
+        "langchain_pg_embedding",
+        ["document_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop promoted filter columns."""
+    op.drop_index("ix_embedding_filter_document_id", table_name="langchain_pg_embedding")
+    op.drop_index(
+        "ix_embedding_collection_type_status", table_name="langchain_pg_embedding"
+    )
+    op.execute(
+        "ALTER TABLE langchain_pg_embedding "
+        + ", ".join(
+            f"DROP COLUMN IF EXISTS {column}" for column in reversed(list(PROMOTED_COLUMNS))
+        )
+    )
@@ -0,0 +1,84 @@
+"""Notify document status changes on the document_status channel
+
+Revision ID: add_document_status_notify
+Revises: promote_embedding_filters
+Create Date: 2026-03-01 10:00:00.000000+07:00
+
+API workers keep an in-memory document_id → status map
+(src/retrieval/document_status.py) instead of querying documents for every
+answer. This trigger sends pg_notify('document_status', json) when a
+document is inserted or deleted, or its status / metadata->>'valid_until'
+changes, so each worker's map is updated without polling.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_document_status_notify"
+down_revision: Union[str, None] = "promote_embedding_filters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create notify function and triggers on documents."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_document_status()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            row documents%ROWTYPE;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                row := OLD;
+            ELSE
+                row := NEW;
+            END IF;
+
+            PERFORM pg_notify(
+                'document_status',
+                json_build_object(
+                    'op', TG_OP,
+                    'document_id', row.document_id,
+                    'status', row.status,
+                    'valid_until', row.metadata ->> 'valid_until'
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER trigger_document_status_insert_delete
+        AFTER INSERT OR DELETE ON documents
+        FOR EACH ROW
+        EXECUTE FUNCTION notify_document_status();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trigger_document_status_update
+        AFTER UPDATE ON documents
+        FOR EACH ROW
+        WHEN (
+            OLD.status IS DISTINCT FROM NEW.status
+            OR OLD.metadata ->> 'valid_until' IS DISTINCT FROM NEW.metadata ->> 'valid_until'
+            OR OLD.document_id IS DISTINCT FROM NEW.document_id
+        )
+        EXECUTE FUNCTION notify_document_status();
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop document status triggers and function."""
+    op.execute("DROP TRIGGER IF EXISTS trigger_document_status_update ON documents")
+    op.execute(
+        "DROP TRIGGER IF EXISTS trigger_document_status_insert_delete ON documents"
+    )
+    op.execute("DROP FUNCTION IF EXISTS notify_document_status()")
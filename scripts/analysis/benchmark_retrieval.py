@@ -21,45 +21,7 @@ from langchain_postgres import PGVector
 from langchain_core.documents import Document
 
 from src.config.models import settings
-
-
-# Test queries organized by category
-BENCHMARK_QUERIES = {
-    "law": [
-        "Điều kiện tham gia đấu thầu của nhà thầu là gì?",
-        "Nhà thầu cần có những năng lực gì để tham gia đấu thầu?",
-        "Quy định về hồ sơ đề xuất của nhà thầu?",
-        "Thời hạn có hiệu lực của hồ sơ dự thầu?",
-        "Bảo đảm dự thầu được quy định như thế nào?",
-        "Các hình thức lựa chọn nhà thầu theo luật đấu thầu?",
-        "Trường hợp nào phải đấu thầu rộng rãi?",
-    ],
-    "decree": [
-        "Hồ sơ mời thầu gồm những nội dung gì?",
-        "Tiêu chuẩn đánh giá hồ sơ dự thầu?",
-        "Quy trình mở thầu được thực hiện như thế nào?",
-        "Nội dung đánh giá về kỹ thuật trong hồ sơ dự thầu?",
-        "Thành phần tổ chức chấm thầu gồm những ai?",
-        "Trình tự đánh giá hồ sơ dự thầu theo nghị định?",
-        "Quy định về thời gian công bố kết quả đấu thầu?",
-    ],
-    "bidding": [
-        "Mẫu hợp đồng xây dựng có những phần nào?",
-        "Biểu mẫu dự thầu cần điền những thông tin gì?",
-        "Bảng dự toán chi phí xây dựng gồm các hạng mục nào?",
-        "Cam kết của nhà thầu trong hồ sơ dự thầu?",
-        "Mẫu bảo lãnh thực hiện hợp đồng?",
-        "Điều khoản thanh toán trong hợp đồng xây dựng?",
-        "Yêu cầu về tiến độ thi công trong hợp đồng?",
-    ],
-    "mixed": [
-        "Quy trình từ đấu thầu đến ký hợp đồng?",
-        "Trách nhiệm của bên mời thầu và nhà thầu?",
-        "Điều kiện thanh toán và bảo lãnh trong đấu thầu?",
-        "So sánh đấu thầu rộng rãi và đấu thầu hạn chế?",
-        "Quy trình đánh giá và phê duyệt kết quả đấu thầu?",
-    ],
-}
+from src.evaluation.benchmarks.queries import BENCHMARK_QUERIES
 
 
 class RetrievalBenchmark:
@@ -9,6 +9,14 @@ Script này sẽ:
 3. Sử dụng WorkingUploadPipeline
 4. Store embeddings vào vector database
 
+Pipeline (work queue):
+    discover → hash → [process pool: parse + chunk] → queue
+    → [writer threads: embed (EmbeddingJobRunner) + COPY write] → checkpoint
+
+Mỗi file được ghi vào bảng bulk_import_checkpoints (status + SHA-256).
+Chạy lại sẽ bỏ qua files đã completed (cùng hash) và retry files
+failed/bị ngắt giữa chừng.
+
 Usage:
     python scripts/bulk_import_from_raw.py [--dry-run] [--folder FOLDER]
 
@@ -24,12 +32,23 @@ Examples:
 
     # Import tất cả folders
     python scripts/bulk_import_from_raw.py --all
+
+    # 8 parse processes, 3 embed/write workers
+    python scripts/bulk_import_from_raw.py --all --workers 8 --writers 3
+
+    # Bỏ qua checkpoints, import lại tất cả
+    python scripts/bulk_import_from_raw.py --all --no-resume
 """
 
 import sys
+import asyncio
+import hashlib
 import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import argparse
 from datetime import datetime
 import time
@@ -38,11 +57,15 @@ import time
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.api.services.document_catalog import refresh_document_catalog
 from src.config.database import get_db_sync
 from src.config.embedding_provider import get_default_embeddings
 from src.preprocessing.upload_pipeline import WorkingUploadPipeline
-from src.embedding.store.pgvector_store import PGVectorStore
-from langchain_core.documents import Document
+from src.embedding.store.bulk_writer import (
+    BulkChunkWriter,
+    ChunkRow,
+    attach_embeddings,
+)
 
 # Setup logging
 logging.basicConfig(
@@ -76,22 +99,180 @@ DOC_TYPE_MAPPING = {
     "Câu hỏi thi": "exam",
 }
 
+DEFAULT_PARSE_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+DEFAULT_WRITE_WORKERS = 2
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_content_hash(file_path: Path) -> str:
+    """SHA-256 of the file bytes (checkpoint identity)."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# =============================================================================
+# Parse stage - runs in worker processes
+# =============================================================================
+
+_worker_pipeline: Optional[WorkingUploadPipeline] = None
+
+
+def _init_parse_worker(enable_enrichment: bool = True):
+    """Process pool initializer: one pipeline per worker process."""
+    global _worker_pipeline
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker_pipeline = WorkingUploadPipeline(enable_enrichment=enable_enrichment)
+
+
+def _parse_file(
+    file_path: str, doc_type: str, batch_name: str
+) -> Tuple[bool, Optional[list], Optional[str], float]:
+    """
+    Load + chunk one file (CPU-bound: docx parsing, regex chunking)
+
+    Returns:
+        (success, chunks, error, seconds)
+    """
+    start = time.perf_counter()
+    try:
+        success, chunks, error = _worker_pipeline.process_file(
+            file_path=Path(file_path),
+            document_type=doc_type,
+            batch_name=batch_name,
+        )
+        if success and not chunks:
+            success, error = False, "No chunks generated"
+    except Exception as e:
+        success, chunks, error = False, None, f"{type(e).__name__}: {e}"
+    return success, chunks if success else None, error, time.perf_counter() - start
+
+
+# =============================================================================
+# Checkpoints
+# =============================================================================
+
+
+class ImportCheckpointStore:
+    """Per-file status + content hash in bulk_import_checkpoints"""
+
+    def __init__(self, connection_factory=get_db_sync):
+        self._connection_factory = connection_factory
+
+    def _execute(self, sql: str, params, many: bool = False):
+        conn = self._connection_factory()
+        try:
+            with conn.cursor() as cursor:
+                if many:
+                    cursor.executemany(sql, params)
+                else:
+                    cursor.execute(sql, params)
+                rows = cursor.fetchall() if cursor.description else []
+            conn.commit()
+            return rows
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def load(self, file_keys: List[str]) -> Dict[str, Tuple[str, str]]:
+        """file_key → (content_hash, status)"""
+        if not file_keys:
+            return {}
+        rows = self._execute(
+            """
+            SELECT file_path, content_hash, status
+            FROM bulk_import_checkpoints
+            WHERE file_path = ANY(%(keys)s)
+            """,
+            {"keys": file_keys},
+        )
+        return {key: (content_hash, status) for key, content_hash, status in rows}
+
+    def mark_running(self, entries: List[Tuple[str, str]]):
+        """Claim files for this run; an interrupted run leaves them 'running'."""
+        if not entries:
+            return
+        self._execute(
+            """
+            INSERT INTO bulk_import_checkpoints (
+                file_path, content_hash, status, attempts, updated_at
+            ) VALUES (%s, %s, 'running', 1, NOW())
+            ON CONFLICT (file_path) DO UPDATE SET
+                content_hash = EXCLUDED.content_hash,
+                status = 'running',
+                stage = NULL,
+                error_message = NULL,
+                attempts = bulk_import_checkpoints.attempts + 1,
+                updated_at = NOW()
+            """,
+            entries,
+            many=True,
+        )
+
+    def mark_completed(self, file_key: str, document_id: str, chunks: int):
+        self._execute(
+            """
+            UPDATE bulk_import_checkpoints
+            SET status = 'completed', stage = NULL, error_message = NULL,
+                document_id = %(document_id)s, chunks = %(chunks)s,
+                updated_at = NOW()
+            WHERE file_path = %(file_path)s
+            """,
+            {"file_path": file_key, "document_id": document_id, "chunks": chunks},
+        )
+
+    def mark_failed(self, file_key: str, stage: str, error: str):
+        self._execute(
+            """
+            UPDATE bulk_import_checkpoints
+            SET status = 'failed', stage = %(stage)s,
+                error_message = %(error)s, updated_at = NOW()
+            WHERE file_path = %(file_path)s
+            """,
+            {"file_path": file_key, "stage": stage, "error": (error or "")[:2000]},
+        )
+
 
 class BulkImporter:
     """Bulk importer cho data/raw với CASCADE checking"""
 
-    def __init__(self, raw_data_path: Path):
+    def __init__(
+        self,
+        raw_data_path: Path,
+        workers: int = DEFAULT_PARSE_WORKERS,
+        writers: int = DEFAULT_WRITE_WORKERS,
+        resume: bool = True,
+    ):
         self.raw_data_path = raw_data_path
         self.pipeline = WorkingUploadPipeline(enable_enrichment=True)
-        self.vector_store = PGVectorStore()
+        self.embedder = get_default_embeddings()
+        self.chunk_writer = BulkChunkWriter()
+        self.checkpoints = ImportCheckpointStore()
+        self.workers = max(1, workers)
+        self.writers = max(1, writers)
+        self.resume = resume
+        self._stats_lock = threading.Lock()
 
         # Statistics
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset statistics (between folders)"""
         self.stats = {
             "total_files": 0,
             "processed": 0,
             "failed": 0,
             "skipped": 0,
             "total_chunks": 0,
+            "rows_written": 0,
+            "write_seconds": 0.0,
+            "parse_seconds": 0.0,
+            "store_seconds": 0.0,
+            "pipeline_seconds": 0.0,
             "errors": [],
         }
 
@@ -235,82 +416,52 @@ class BulkImporter:
 
         return files
 
-    def import_file(
-        self, file_path: Path, category: str, doc_type: str
-    ) -> Tuple[bool, str, int]:
+    def file_key(self, file_path: Path) -> str:
+        """Checkpoint key: path relative to raw data folder"""
+        try:
+            return file_path.relative_to(self.raw_data_path).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def store_file(
+        self, file_path: Path, category: str, doc_type: str, chunks: list
+    ) -> Tuple[str, int]:
         """
-        Import một file vào database
+        Embed + write một file đã chunk vào database
 
         Returns:
-            (success, document_id, num_chunks)
+            (document_id, num_chunks)
         """
-        try:
-            logger.info(f"\n📄 Processing: {file_path.name}")
-
-            # Step 1: Process through pipeline
-            success, chunks, error_msg = self.pipeline.process_file(
-                file_path=file_path,
-                document_type=doc_type,
-                batch_name=f"bulk_import_{datetime.now().strftime('%Y%m%d')}",
-            )
-
-            if not success:
-                logger.error(f"  ❌ Pipeline failed: {error_msg}")
-                return False, None, 0
-
-            if not chunks:
-                logger.warning(f"  ⚠️  No chunks generated")
-                return False, None, 0
-
-            logger.info(f"  ✅ Generated {len(chunks)} chunks")
-
-            # Step 2: Convert to LangChain Documents
-            documents = []
-            for chunk in chunks:
-                chunk_metadata = chunk.to_dict()
-                chunk_metadata.pop("content", None)
-                doc = Document(page_content=chunk.content, metadata=chunk_metadata)
-                documents.append(doc)
-
-            # Step 3: Store embeddings
-            logger.info(f"  🔄 Storing embeddings...")
-            self.vector_store.add_documents(documents)
-            logger.info(f"  ✅ Stored {len(documents)} embeddings")
-
-            # Step 4: Insert into documents table
-            first_chunk = chunks[0]
-            document_id = first_chunk.document_id
-            document_name = (
-                first_chunk.extra_metadata.get("document_title")
-                or first_chunk.extra_metadata.get("title")
-                or first_chunk.section_title
-                or file_path.stem
-            )
-
-            doc_uuid = self._insert_document_record(
-                document_id=document_id,
-                document_name=document_name,
-                document_type=doc_type,
-                category=category,
-                filename=file_path.name,
-                source_file=str(file_path),
-                total_chunks=len(chunks),
-            )
-
-            # Step 5: Insert chunks into document_chunks table
-            logger.info(f"  🔄 Inserting chunks into document_chunks...")
-            chunk_id_map = self._insert_chunks(doc_uuid, chunks)
-
-            # Step 6: Update langchain_pg_embedding with chunk_id references
-            logger.info(f"  🔄 Linking embeddings to chunks...")
-            self._update_embedding_chunk_ids(chunk_id_map)
+        # Step 1: Embed chunks (EmbeddingJobRunner, shared rate limiter)
+        rows = [ChunkRow.from_chunk(chunk) for chunk in chunks]
+        attach_embeddings(rows, self.embedder)
+
+        # Step 2: Insert into documents table
+        first_chunk = chunks[0]
+        document_id = first_chunk.document_id
+        document_name = (
+            first_chunk.extra_metadata.get("document_title")
+            or first_chunk.extra_metadata.get("title")
+            or first_chunk.section_title
+            or file_path.stem
+        )
 
-            logger.info(f"  ✅ Document saved: {document_id}")
-            return True, document_id, len(chunks)
+        doc_uuid = self._insert_document_record(
+            document_id=document_id,
+            document_name=document_name,
+            document_type=doc_type,
+            category=category,
+            filename=file_path.name,
+            source_file=str(file_path),
+            total_chunks=len(chunks),
+        )
+        if doc_uuid is None:
+            raise RuntimeError(f"Document record not written: {document_id}")
 
-        except Exception as e:
-            logger.error(f"  ❌ Error: {str(e)}", exc_info=True)
-            return False, None, 0
+        # Step 3: Insert chunks + embeddings (COPY, one transaction)
+        self._insert_chunks(doc_uuid, rows)
+        refresh_document_catalog([document_id])
+        return document_id, len(chunks)
 
     def _insert_document_record(
         self,
@@ -377,111 +528,24 @@ class BulkImporter:
             if conn:
                 conn.close()
 
-    def _insert_chunks(self, doc_uuid, chunks: list) -> dict:
+    def _insert_chunks(self, doc_uuid, rows: List[ChunkRow]) -> dict:
         """
-        Insert chunks vào document_chunks table và trả về mapping chunk_id -> uuid
+        Bulk upsert chunks vào document_chunks và langchain_pg_embedding (COPY)
 
         Returns:
             Dict mapping chunk_id string -> chunk UUID
         """
-        conn = None
-        chunk_id_map = {}
-
-        try:
-            conn = get_db_sync()
-            cursor = conn.cursor()
-
-            for chunk in chunks:
-                chunk_dict = chunk.to_dict()
-                chunk_id = (
-                    chunk_dict.get("chunk_id")
-                    or f"{chunk_dict.get('document_id')}_{chunk_dict.get('chunk_index', 0)}"
-                )
-
-                cursor.execute(
-                    """
-                    INSERT INTO document_chunks (
-                        document_id, chunk_id, content, chunk_index,
-                        section_title, hierarchy_path, keywords,
-                        char_count, created_at, updated_at
-                    ) VALUES (
-                        %(document_id)s, %(chunk_id)s, %(content)s, %(chunk_index)s,
-                        %(section_title)s, %(hierarchy_path)s, %(keywords)s,
-                        %(char_count)s, NOW(), NOW()
-                    )
-                    ON CONFLICT (chunk_id) DO UPDATE SET
-                        content = EXCLUDED.content,
-                        updated_at = NOW()
-                    RETURNING id
-                """,
-                    {
-                        "document_id": doc_uuid,
-                        "chunk_id": chunk_id,
-                        "content": chunk.content,
-                        "chunk_index": chunk_dict.get("chunk_index", 0),
-                        "section_title": chunk_dict.get("section_title"),
-                        "hierarchy_path": chunk_dict.get("hierarchy_path"),
-                        "keywords": chunk_dict.get("keywords"),
-                        "char_count": len(chunk.content),
-                    },
-                )
-
-                result = cursor.fetchone()
-                if result:
-                    chunk_id_map[chunk_id] = result[0]
-
-            conn.commit()
-            logger.info(
-                f"  ✅ Inserted {len(chunk_id_map)} chunks into document_chunks"
+        result = self.chunk_writer.write(doc_uuid, rows)
+        with self._stats_lock:
+            self.stats["write_seconds"] += result.duration_s
+            self.stats["rows_written"] += (
+                result.chunks_written + result.embeddings_written
             )
-            return chunk_id_map
-
-        except Exception as e:
-            logger.error(f"Failed to insert chunks: {e}")
-            if conn:
-                conn.rollback()
-            raise
-        finally:
-            if conn:
-                conn.close()
-
-    def _update_embedding_chunk_ids(self, chunk_id_map: dict):
-        """
-        Update langchain_pg_embedding để set chunk_id reference
-        """
-        if not chunk_id_map:
-            return
-
-        conn = None
-        try:
-            conn = get_db_sync()
-            cursor = conn.cursor()
-
-            updated = 0
-            for chunk_id_str, chunk_uuid in chunk_id_map.items():
-                # Update embeddings where cmetadata contains this chunk_id
-                cursor.execute(
-                    """
-                    UPDATE langchain_pg_embedding 
-                    SET chunk_id = %(chunk_uuid)s
-                    WHERE cmetadata->>'chunk_id' = %(chunk_id)s
-                    AND chunk_id IS NULL
-                """,
-                    {"chunk_uuid": chunk_uuid, "chunk_id": chunk_id_str},
-                )
-                updated += cursor.rowcount
-
-            conn.commit()
-            if updated > 0:
-                logger.info(f"  ✅ Updated {updated} embedding chunk_id references")
-
-        except Exception as e:
-            logger.error(f"Failed to update embedding chunk_ids: {e}")
-            if conn:
-                conn.rollback()
-        finally:
-            if conn:
-                conn.close()
+        logger.info(
+            f"  ✅ Wrote {result.chunks_written} chunks, "
+            f"{result.embeddings_written} embeddings ({result.rows_per_sec:.0f} rows/s)"
+        )
+        return result.chunk_id_map
 
     def run(self, dry_run: bool = False, category_filter: str = None):
         """
@@ -518,31 +582,165 @@ class BulkImporter:
                 )
             return
 
-        # Step 3: Process files
+        # Step 3: Skip files already imported (same content hash)
+        pending = self._filter_completed(files)
+        if not pending:
+            logger.info("\n✅ All files already imported (checkpoints)")
+            self._print_summary(time.time() - start_time)
+            return True
+
+        # Step 4: Parse (process pool) → embed + write (writer threads)
         logger.info("\n" + "=" * 100)
-        logger.info("📦 Starting import...")
+        logger.info(
+            f"📦 Starting import: {len(pending)} files, "
+            f"{self.workers} parse workers, {self.writers} writers"
+        )
         logger.info("=" * 100)
 
-        for i, (file_path, category, doc_type) in enumerate(files, 1):
-            logger.info(f"\n[{i}/{len(files)}] {category} - {file_path.name}")
+        pipeline_start = time.perf_counter()
+        asyncio.run(self._run_pipeline(pending))
+        self.stats["pipeline_seconds"] = time.perf_counter() - pipeline_start
 
-            success, document_id, num_chunks = self.import_file(
-                file_path, category, doc_type
+        # Step 5: Summary
+        elapsed = time.time() - start_time
+        self._print_summary(elapsed)
+        return self.stats["failed"] == 0
+
+    def _filter_completed(
+        self, files: List[Tuple[Path, str, str]]
+    ) -> List[Tuple[Path, str, str, str, str]]:
+        """
+        Hash files and drop those completed with the same hash
+
+        Returns:
+            List of (file_path, category, doc_type, file_key, content_hash)
+        """
+        entries = []
+        for file_path, category, doc_type in files:
+            try:
+                content_hash = file_content_hash(file_path)
+            except OSError as e:
+                logger.error(f"  ❌ Cannot read {file_path}: {e}")
+                self._record_failure(file_path, category, str(e))
+                continue
+            entries.append(
+                (file_path, category, doc_type, self.file_key(file_path), content_hash)
             )
 
-            if success:
-                self.stats["processed"] += 1
-                self.stats["total_chunks"] += num_chunks
+        done = {}
+        if self.resume:
+            done = self.checkpoints.load([entry[3] for entry in entries])
+
+        pending = []
+        for entry in entries:
+            if done.get(entry[3]) == (entry[4], "completed"):
+                self.stats["skipped"] += 1
             else:
-                self.stats["failed"] += 1
-                self.stats["errors"].append(
-                    {"file": str(file_path), "category": category}
+                pending.append(entry)
+
+        if self.stats["skipped"]:
+            logger.info(
+                f"⏭️  Skipping {self.stats['skipped']} files already imported"
+            )
+        self.checkpoints.mark_running([(entry[3], entry[4]) for entry in pending])
+        return pending
+
+    async def _run_pipeline(self, entries: List[Tuple[Path, str, str, str, str]]):
+        """
+        Work queue: parse/chunk in a process pool, embed/write in threads
+
+        The queue is bounded so parsed chunks never pile up faster than the
+        embedding stage can drain them.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.writers * 2)
+        in_flight = asyncio.Semaphore(self.workers * 2)
+        batch_name = f"bulk_import_{datetime.now().strftime('%Y%m%d')}"
+        total = len(entries)
+        done = [0]
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_parse_worker,
+            initargs=(True,),
+        ) as parse_pool, ThreadPoolExecutor(
+            max_workers=self.writers, thread_name_prefix="bulk-import-writer"
+        ) as write_pool:
+
+            async def parse(entry):
+                file_path, category, doc_type, file_key, _ = entry
+                async with in_flight:
+                    success, chunks, error, seconds = await loop.run_in_executor(
+                        parse_pool, _parse_file, str(file_path), doc_type, batch_name
+                    )
+                    with self._stats_lock:
+                        self.stats["parse_seconds"] += seconds
+                    if success:
+                        await queue.put((entry, chunks))
+                        return
+                done[0] += 1
+                logger.error(f"[{done[0]}/{total}] ❌ Parse failed: {file_key}: {error}")
+                await loop.run_in_executor(
+                    write_pool, self._fail, file_path, category, file_key, "parse", error
                 )
 
-        # Step 4: Summary
-        elapsed = time.time() - start_time
-        self._print_summary(elapsed)
-        return self.stats["failed"] == 0
+            async def produce():
+                await asyncio.gather(*(parse(entry) for entry in entries))
+                for _ in range(self.writers):
+                    await queue.put(None)
+
+            async def consume():
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    entry, chunks = item
+                    message = await loop.run_in_executor(
+                        write_pool, self._store_entry, entry, chunks
+                    )
+                    done[0] += 1
+                    logger.info(f"[{done[0]}/{total}] {message}")
+
+            await asyncio.gather(produce(), *(consume() for _ in range(self.writers)))
+
+    def _store_entry(self, entry: Tuple[Path, str, str, str, str], chunks: list) -> str:
+        """Embed/write stage for one parsed file (writer thread)"""
+        file_path, category, doc_type, file_key, _ = entry
+        start = time.perf_counter()
+        try:
+            document_id, num_chunks = self.store_file(
+                file_path, category, doc_type, chunks
+            )
+            self.checkpoints.mark_completed(file_key, document_id, num_chunks)
+        except Exception as e:
+            logger.error(f"  ❌ {file_key}: {e}", exc_info=True)
+            self._fail(file_path, category, file_key, "embed_write", str(e))
+            return f"❌ Store failed: {file_key}"
+        finally:
+            with self._stats_lock:
+                self.stats["store_seconds"] += time.perf_counter() - start
+
+        with self._stats_lock:
+            self.stats["processed"] += 1
+            self.stats["total_chunks"] += num_chunks
+        return f"✅ {file_key} → {document_id} ({num_chunks} chunks)"
+
+    def _fail(
+        self, file_path: Path, category: str, file_key: str, stage: str, error: str
+    ):
+        """Record a failed file in stats and checkpoints"""
+        self._record_failure(file_path, category, error)
+        try:
+            self.checkpoints.mark_failed(file_key, stage, error)
+        except Exception as e:
+            logger.warning(f"⚠️  Checkpoint update failed for {file_key}: {e}")
+
+    def _record_failure(self, file_path: Path, category: str, error: str):
+        with self._stats_lock:
+            self.stats["failed"] += 1
+            self.stats["errors"].append(
+                {"file": str(file_path), "category": category, "error": error}
+            )
 
     def run_folder(self, folder_name: str, dry_run: bool = False) -> bool:
         """
@@ -605,11 +803,35 @@ class BulkImporter:
             logger.info(
                 f"  ⚡ Avg time/doc:   {elapsed_time / self.stats['processed']:.2f}s"
             )
+        if self.stats["write_seconds"] > 0:
+            logger.info(
+                f"  💾 DB write:      {self.stats['rows_written']} rows, "
+                f"{self.stats['rows_written'] / self.stats['write_seconds']:.0f} rows/s"
+            )
+
+        pipeline_seconds = self.stats["pipeline_seconds"]
+        if pipeline_seconds > 0:
+            attempted = self.stats["processed"] + self.stats["failed"]
+            parse_util = self.stats["parse_seconds"] / (pipeline_seconds * self.workers)
+            store_util = self.stats["store_seconds"] / (pipeline_seconds * self.writers)
+            logger.info(f"\n🏭 Pipeline:")
+            logger.info(f"  📄 Files/sec:     {attempted / pipeline_seconds:.2f}")
+            logger.info(
+                f"  🔧 Parse stage:   {parse_util:.0%} busy "
+                f"({self.workers} processes, {self.stats['parse_seconds']:.1f}s)"
+            )
+            logger.info(
+                f"  🧠 Embed/write:   {store_util:.0%} busy "
+                f"({self.writers} workers, {self.stats['store_seconds']:.1f}s)"
+            )
 
         if self.stats["errors"]:
             logger.error(f"\n❌ Failed files ({len(self.stats['errors'])}):")
             for error in self.stats["errors"]:
-                logger.error(f"  - {error['file']} ({error['category']})")
+                logger.error(
+                    f"  - {error['file']} ({error['category']}): {error.get('error')}"
+                )
+            logger.info("💡 Chạy lại script để retry các files failed")
 
         logger.info("\n" + "=" * 100)
 
@@ -672,14 +894,7 @@ def interactive_mode(importer: BulkImporter, dry_run: bool = False):
                         if not success:
                             print(f"⚠️  Folder {folder_name} có lỗi, tiếp tục...")
                         # Reset stats for next folder
-                        importer.stats = {
-                            "total_files": 0,
-                            "processed": 0,
-                            "failed": 0,
-                            "skipped": 0,
-                            "total_chunks": 0,
-                            "errors": [],
-                        }
+                        importer.reset_stats()
                     print("\n✅ Hoàn thành import tất cả folders!")
                 break
 
@@ -699,14 +914,7 @@ def interactive_mode(importer: BulkImporter, dry_run: bool = False):
                     print("👋 Bye!")
                     break
                 # Reset stats for next folder
-                importer.stats = {
-                    "total_files": 0,
-                    "processed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                    "total_chunks": 0,
-                    "errors": [],
-                }
+                importer.reset_stats()
             else:
                 print("❌ Số không hợp lệ!")
 
@@ -759,6 +967,26 @@ Examples:
         "--list", action="store_true", help="List available folders only"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_PARSE_WORKERS,
+        help=f"Parse/chunk processes (default: {DEFAULT_PARSE_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--writers",
+        type=int,
+        default=DEFAULT_WRITE_WORKERS,
+        help=f"Concurrent embed/write workers (default: {DEFAULT_WRITE_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Ignore checkpoints and re-import completed files",
+    )
+
     parser.add_argument(
         "--raw-path",
         type=Path,
@@ -774,7 +1002,12 @@ Examples:
         sys.exit(1)
 
     # Create importer
-    importer = BulkImporter(args.raw_path)
+    importer = BulkImporter(
+        args.raw_path,
+        workers=args.workers,
+        writers=args.writers,
+        resume=not args.no_resume,
+    )
 
     try:
         # List folders only
@@ -816,14 +1049,7 @@ Examples:
                     total_failed += 1
 
                 # Reset stats for next folder
-                importer.stats = {
-                    "total_files": 0,
-                    "processed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                    "total_chunks": 0,
-                    "errors": [],
-                }
+                importer.reset_stats()
 
             print("\n" + "=" * 60)
             print(
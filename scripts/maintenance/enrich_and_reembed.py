@@ -3,12 +3,14 @@
 Enrich and Re-embed Existing Chunks
 
 Takes existing chunk JSONL files, enriches them, and re-embeds with 1536 dims.
+Re-embedding is incremental: chunk text whose vector already exists (same
+text, model and dimension) is reused, and only orphaned rows are deleted.
 """
 
 import argparse
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import json
 
 # Add project root to path
@@ -20,11 +22,15 @@ load_dotenv()
 
 from src.preprocessing.enrichment import ChunkEnricher
 from src.config.models import settings
+from src.config.embedding_provider import get_embedding_dimension
+from src.embedding.store.bulk_writer import BulkChunkWriter, ChunkRow
+from src.embedding.store.incremental_reindex import IncrementalReindexer
+from src.api.services.document_catalog import refresh_document_catalog
 from langchain_openai import OpenAIEmbeddings
-from langchain_postgres import PGVector
 from langchain_core.documents import Document
 from tqdm import tqdm
 from sqlalchemy import create_engine, text
+import hashlib
 import time
 
 
@@ -154,60 +160,85 @@ def chunk_to_document(chunk: Dict[str, Any]) -> Document:
     return Document(page_content=text, metadata=metadata)
 
 
+def chunk_to_row(chunk: Dict[str, Any]) -> ChunkRow:
+    """Convert chunk dict to an embedding row keyed by chunk_id."""
+    doc = chunk_to_document(chunk)
+    chunk_id = doc.metadata.get("chunk_id")
+    if chunk_id in (None, "", "unknown"):
+        # Stable id from content so re-runs upsert the same row
+        digest = hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()[:16]
+        chunk_id = f"{doc.metadata.get('document_id', 'chunk')}_{digest}"
+    return ChunkRow(
+        chunk_id=str(chunk_id), content=doc.page_content, metadata=doc.metadata
+    )
+
+
 def import_with_embeddings(
     chunks: List[Dict[str, Any]],
     collection_name: str,
     db_url: str,
     embed_model: str,
     batch_size: int = 30,
-) -> int:
+    remove_orphans: bool = True,
+) -> Tuple[int, Dict[str, Any]]:
     """
     Import chunks with embeddings at native 3072 dimensions.
 
+    Vectors are reused by content hash (text + model + dimension), so only
+    new or changed chunk text is sent to the embedding API.
+
+    Args:
+        remove_orphans: Delete collection rows not written by this run
+            (skipped if any batch failed)
+
     Returns:
-        Number of chunks imported
+        (number of chunks imported, diff report dict)
     """
-    print(f"\n📥 Importing {len(chunks):,} chunks to database...")
+    dimension = get_embedding_dimension(embed_model)
+    print(f"\n📥 Importing {len(chunks):,} chunks (incremental)...")
     print(f"   Model: {embed_model}")
-    print(f"   Dimensions: 3072 (native)")
+    print(f"   Dimensions: {dimension}")
     print(f"   Collection: {collection_name}")
     print(f"   Batch size: {batch_size}")
 
-    # Initialize embeddings with native dimensions
-    embeddings = OpenAIEmbeddings(
-        model=embed_model,
-        # No dimensions parameter = native 3072 dims
-    )
-
-    # Initialize vector store
-    vector_store = PGVector(
-        embeddings=embeddings,
+    embeddings = OpenAIEmbeddings(model=embed_model)
+    reindexer = IncrementalReindexer(
+        embeddings,
+        model_name=embed_model,
+        dimension=dimension,
         collection_name=collection_name,
-        connection=db_url,
-        use_jsonb=True,
     )
+    writer = BulkChunkWriter(collection_name=collection_name)
 
     # Import in batches
     total_imported = 0
+    failed_batches = 0
+    written_chunk_ids = []
     num_batches = (len(chunks) + batch_size - 1) // batch_size
 
     with tqdm(total=len(chunks), desc="Embedding & Importing", unit="chunks") as pbar:
         for i in range(0, len(chunks), batch_size):
             batch = chunks[i : i + batch_size]
+            rows = [chunk_to_row(chunk) for chunk in batch]
 
-            # Convert to Documents
-            documents = [chunk_to_document(chunk) for chunk in batch]
-
-            # Add to vector store (embeds + stores)
+            # Reuse or embed, then upsert by deterministic id
             try:
-                vector_store.add_documents(documents)
-                total_imported += len(documents)
-                pbar.update(len(documents))
+                reindexer.attach_embeddings(rows)
+                writer.write_embeddings(rows)
+                total_imported += len(rows)
+                written_chunk_ids.extend(row.chunk_id for row in rows)
             except Exception as e:
+                failed_batches += 1
                 print(f"\n❌ Error in batch {i//batch_size + 1}/{num_batches}: {e}")
-                pbar.update(len(documents))
+            pbar.update(len(rows))
 
-    return total_imported
+    if remove_orphans and failed_batches == 0:
+        reindexer.remove_orphans(written_chunk_ids)
+    elif remove_orphans:
+        print(f"\n⚠️  {failed_batches} batches failed - skipping orphan removal")
+
+    print(f"\n{reindexer.diff.format_report()}")
+    return total_imported, reindexer.diff.to_dict()
 
 
 def main():
@@ -232,7 +263,12 @@ def main():
     parser.add_argument(
         "--no-clear",
         action="store_true",
-        help="Don't clear existing embeddings before import",
+        help="Keep embeddings not produced by this run (skip orphan removal)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Clear the collection first and re-embed everything (no reuse)",
     )
     parser.add_argument("--batch-size", type=int, default=50, help="Import batch size")
     parser.add_argument(
@@ -304,19 +340,35 @@ def main():
             print(f"  Document focus: {metadata.get('document_focus', 'unknown')}")
         return
 
-    # Step 4: Clear existing embeddings (if not skipped)
-    if not args.no_clear:
+    # Step 4: Clear existing embeddings (full rebuild only)
+    if args.full:
         clear_collection(settings.collection, settings.database_url)
 
-    # Step 5: Import with new 1536-dim embeddings
-    imported = import_with_embeddings(
+    # Step 5: Import, embedding only new/changed chunk text
+    imported, diff = import_with_embeddings(
         enriched_chunks,
         settings.collection,
         settings.database_url,
         settings.embed_model,
         args.batch_size,
+        remove_orphans=not args.no_clear,
     )
 
+    # Step 6: Refresh the document catalog. Clearing or sweeping the
+    # collection can drop any document, so those runs rebuild it fully.
+    if args.full or not args.no_clear:
+        refresh_document_catalog()
+    else:
+        refresh_document_catalog(
+            sorted(
+                {
+                    chunk["metadata"]["document_id"]
+                    for chunk in enriched_chunks
+                    if chunk.get("metadata", {}).get("document_id")
+                }
+            )
+        )
+
     elapsed = time.time() - start_time
 
     # Summary
@@ -326,6 +378,10 @@ def main():
     print(f"Chunks processed: {len(chunks):,}")
     print(f"Chunks enriched: {len(enriched_chunks):,}")
     print(f"Chunks imported: {imported:,}")
+    print(
+        f"Diff: {diff['added']:,} added, {diff['reused']:,} reused, "
+        f"{diff['removed']:,} removed"
+    )
     print(f"Time: {elapsed/60:.1f} minutes")
     print(f"Output: {output_file}")
     print(f"Embedding dimensions: 1536 (reduced from 3072)")
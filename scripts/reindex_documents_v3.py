@@ -6,14 +6,20 @@ This script:
 1. Reads all chunks from data/processed/chunks/
 2. Creates/updates Document records in PostgreSQL
 3. Creates DocumentChunk records for tracking
-4. Generates embeddings using text-embedding-3-small (1536 dim)
-5. Stores embeddings in langchain_pg_embedding
+4. Generates embeddings using text-embedding-3-small (1536 dim), reusing
+   existing vectors for chunk text that did not change (content hash)
+5. Stores embeddings in langchain_pg_embedding and deletes chunks that
+   no longer exist in the processed documents
+6. Prints a diff report (added / reused / removed)
 
 Usage:
-    python scripts/reindex_documents_v3.py [--clear] [--dry-run] [--limit N]
+    python scripts/reindex_documents_v3.py [--clear] [--prune-collection] [--dry-run] [--limit N]
 
 Options:
-    --clear     Clear existing embeddings before re-indexing
+    --clear     Clear existing embeddings first (full re-embed, no reuse)
+    --prune-collection
+                Also delete every collection embedding this run did not
+                write, including documents uploaded through the API
     --dry-run   Only show what would be done, don't write
     --limit N   Only process first N documents (for testing)
 """
@@ -32,12 +38,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from langchain_core.documents import Document as LCDocument
 
+from src.api.services.document_catalog import refresh_document_catalog
 from src.models.base import SessionLocal
 from src.models.documents import Document
-from src.models.document_chunks import DocumentChunk
 from src.config.models import settings
+from src.embedding.store.bulk_writer import BulkChunkWriter, ChunkRow
+from src.embedding.store.incremental_reindex import IncrementalReindexer
 
 # Setup logging
 logging.basicConfig(
@@ -181,14 +188,13 @@ def get_or_create_document(
     return doc
 
 
-def create_document_chunk(
-    db: Session,
+def build_chunk_row(
     document: Document,
     chunk_data: Dict[str, Any],
     chunk_index: int,
     file_prefix: str = "",
-) -> DocumentChunk:
-    """Create document chunk record"""
+) -> ChunkRow:
+    """Build document chunk row (written in bulk by BulkChunkWriter)"""
     # Use file_prefix to ensure unique chunk_id across files with same document_id
     original_chunk_id = chunk_data.get(
         "chunk_id", f"{document.document_id}_{chunk_index}"
@@ -197,25 +203,10 @@ def create_document_chunk(
         f"{file_prefix}_{original_chunk_id}" if file_prefix else original_chunk_id
     )
 
-    chunk = DocumentChunk(
-        id=uuid4(),
-        document_id=document.id,
-        chunk_id=unique_chunk_id,
-        content=chunk_data["content"],
-        chunk_index=chunk_index,
-        section_title=chunk_data.get("section_title"),
-        hierarchy_path=chunk_data.get("hierarchy"),
-        char_count=chunk_data.get("char_count", len(chunk_data["content"])),
-        has_table=chunk_data.get("has_table", False),
-        has_list=chunk_data.get("has_list", False),
-        keywords=chunk_data.get("extra_metadata", {}).get("keywords"),
-        concepts=chunk_data.get("extra_metadata", {}).get("concepts"),
-        entities=chunk_data.get("extra_metadata", {}).get("entities"),
+    return ChunkRow.from_dict(
+        {**chunk_data, "chunk_index": chunk_index}, chunk_id=unique_chunk_id
     )
 
-    db.add(chunk)
-    return chunk
-
 
 def clear_existing_embeddings(db: Session):
     """Clear all existing embeddings"""
@@ -258,15 +249,24 @@ def verify_embedding_model():
 
 
 def reindex_documents(
-    clear: bool = False, dry_run: bool = False, limit: Optional[int] = None
+    clear: bool = False,
+    dry_run: bool = False,
+    limit: Optional[int] = None,
+    prune_collection: bool = False,
 ):
     """
     Main re-indexing function
 
+    Stale chunks are removed per processed document. The collection-wide
+    sweep also drops documents that are not in data/processed/chunks
+    (e.g. API uploads), so it only runs with prune_collection.
+
     Args:
         clear: Whether to clear existing embeddings first
         dry_run: If True, only show what would be done
         limit: Limit number of documents to process
+        prune_collection: Delete every collection embedding not written by
+            this run (full runs only)
     """
     logger.info("=" * 60)
     logger.info("Starting Document Re-indexing for Schema v3")
@@ -302,12 +302,16 @@ def reindex_documents(
             clear_existing_embeddings(db)
 
         # Import embedding components (after verification)
-        from src.embedding.store.pgvector_store import PGVectorStore
+        from src.config.embedding_provider import get_default_embeddings
 
-        vector_store = PGVectorStore()
+        reindexer = IncrementalReindexer(get_default_embeddings())
+        chunk_writer = BulkChunkWriter()
+        written_chunk_ids = []
 
         total_chunks = 0
         total_documents = 0
+        write_rows = 0
+        write_seconds = 0.0
 
         for chunk_file in chunk_files:
             doc_name = chunk_file.stem
@@ -344,21 +348,21 @@ def reindex_documents(
             # Update total_chunks
             document.total_chunks = len(chunks)
 
-            # Create document chunks and prepare for embedding
-            lc_documents = []
+            # Commit document so the bulk writer's connection sees it
+            db.commit()
+
+            # Build chunk rows with the cmetadata used for retrieval filtering
+            chunk_rows = []
+            chunk_metadatas = []
 
             for i, chunk_data in enumerate(chunks):
-                # Create chunk record with file prefix for uniqueness
-                doc_chunk = create_document_chunk(
-                    db, document, chunk_data, i, file_prefix
-                )
-
-                # Prepare LangChain document for embedding
-                lc_doc = LCDocument(
-                    page_content=chunk_data["content"],
-                    metadata={
+                # Chunk row with file prefix for uniqueness
+                chunk_row = build_chunk_row(document, chunk_data, i, file_prefix)
+                chunk_rows.append(chunk_row)
+                chunk_metadatas.append(
+                    {
                         "document_id": doc_id,
-                        "chunk_id": doc_chunk.chunk_id,
+                        "chunk_id": chunk_row.chunk_id,
                         "document_type": chunk_data.get("document_type", "other"),
                         "section_title": chunk_data.get("section_title"),
                         "hierarchy": chunk_data.get("hierarchy", []),
@@ -366,28 +370,50 @@ def reindex_documents(
                         # Add more metadata as needed for retrieval filtering
                         "category": document.category,
                         "document_name": document.document_name,
-                    },
+                    }
                 )
-                lc_documents.append(lc_doc)
 
-            # Commit document and chunks
-            db.commit()
+            # Reuse vectors for unchanged text, embed the rest
+            logger.info(f"  Resolving embeddings for {len(chunk_rows)} chunks...")
+            reindexer.attach_embeddings(chunk_rows, chunk_metadatas)
+
+            # Upsert chunks + embeddings with chunk_id FK (COPY, one transaction)
+            write_result = chunk_writer.write(document.id, chunk_rows)
+            write_rows += write_result.chunks_written + write_result.embeddings_written
+            write_seconds += write_result.duration_s
 
-            # Add to vector store (generates embeddings)
-            logger.info(f"  Generating embeddings for {len(lc_documents)} chunks...")
-            vector_store.add_documents(lc_documents)
+            # Chunks of this document that no longer exist
+            chunk_ids = [row.chunk_id for row in chunk_rows]
+            reindexer.remove_orphans(chunk_ids, document_uuids=[document.id])
+            written_chunk_ids.extend(chunk_ids)
 
             total_chunks += len(chunks)
             total_documents += 1
 
             logger.info(f"  ✅ Indexed {len(chunks)} chunks")
 
+        # Embeddings of chunk files that disappeared (opt-in, full runs only)
+        if prune_collection and not dry_run and not limit and not clear:
+            reindexer.remove_orphans(written_chunk_ids)
+        elif prune_collection and not dry_run:
+            logger.warning("⚠️  --prune-collection skipped (needs a full run without --clear)")
+
+        if not dry_run:
+            refresh_document_catalog()
+
         # Final summary
         logger.info("\n" + "=" * 60)
         logger.info("Re-indexing Complete!")
         logger.info("=" * 60)
         logger.info(f"Documents processed: {total_documents}")
         logger.info(f"Chunks indexed: {total_chunks}")
+        if write_seconds > 0:
+            logger.info(
+                f"DB write throughput: {write_rows} rows, "
+                f"{write_rows / write_seconds:.0f} rows/s"
+            )
+        if not dry_run:
+            logger.info(reindexer.diff.format_report())
 
         if not dry_run:
             # Verify counts
@@ -427,7 +453,16 @@ def main():
     parser.add_argument(
         "--clear",
         action="store_true",
-        help="Clear existing embeddings before re-indexing",
+        help="Clear existing embeddings first (full re-embed, no vector reuse)",
+    )
+
+    parser.add_argument(
+        "--prune-collection",
+        action="store_true",
+        help=(
+            "Delete every collection embedding this run did not write "
+            "(also removes documents uploaded through the API)"
+        ),
     )
 
     parser.add_argument(
@@ -442,7 +477,12 @@ def main():
 
     args = parser.parse_args()
 
-    reindex_documents(clear=args.clear, dry_run=args.dry_run, limit=args.limit)
+    reindex_documents(
+        clear=args.clear,
+        dry_run=args.dry_run,
+        limit=args.limit,
+        prune_collection=args.prune_collection,
+    )
 
 
 if __name__ == "__main__":
@@ -11,7 +11,16 @@ from src.config.logging_config import setup_logging
 from src.config.models import settings
 from src.config.database import init_database, startup_database, shutdown_database
 from src.embedding.store.pgvector_store import bootstrap
-from src.generation.chains.qa_chain import answer
+from src.generation.chains.qa_chain import answer, astream_answer
+from src.api.services.pipeline_executor import (
+    PipelineOverloadedError,
+    run_in_pipeline,
+    shutdown_pipeline_executor,
+)
+from src.api.services.streaming import sse_response
+from src.api.services.summary_worker import shutdown_summary_worker
+from src.retrieval.document_status import shutdown_document_status_map
+from src.retrieval.semantic_cache_v2 import shutdown_semantic_cache_v2
 from src.retrieval.query_processing.query_enhancer import (
     EnhancementStrategy,
     QueryEnhancer,
@@ -70,6 +79,7 @@ async def lifespan(app: FastAPI):
     - Bootstrap vector store
     - Pre-load BGEReranker model (CUDA)
     - Pre-load QueryEnhancer (GPT-4o-mini)
+    - Warm up retriever registry (fast/balanced/quality)
 
     Shutdown:
     - Close database connections
@@ -178,6 +188,24 @@ async def lifespan(app: FastAPI):
         with worker_lock:
             logger.error(f"❌ [Worker {worker_pid}] Failed to load QueryEnhancer: {e}")
 
+    # 5. Warm up retriever registry (one shared retriever per mode)
+    with worker_lock:
+        logger.info(f"🔧 [Worker {worker_pid}] Warming up retrievers...")
+    try:
+        from src.retrieval.retrievers import warmup_retrievers
+
+        worker_config["retrievers"] = warmup_retrievers(
+            reranker_type=DEFAULT_RERANKER_TYPE
+        )
+        with worker_lock:
+            logger.info(
+                f"✅ [Worker {worker_pid}] Retrievers ready: {worker_config['retrievers']}"
+            )
+    except Exception as e:
+        worker_config["retrievers"] = {"error": str(e)}
+        with worker_lock:
+            logger.error(f"❌ [Worker {worker_pid}] Failed to warm up retrievers: {e}")
+
     # Register this worker as ready
     with worker_lock:
         worker_states[worker_pid] = {"status": "ready", "config": worker_config}
@@ -202,6 +230,10 @@ async def lifespan(app: FastAPI):
     with worker_lock:
         logger.info(f"👋 [Worker {worker_pid}] Shutting down...")
     await shutdown_database()
+    shutdown_pipeline_executor()
+    shutdown_summary_worker()
+    shutdown_document_status_map()
+    shutdown_semantic_cache_v2()
 
     # Unregister this worker
     with worker_lock:
@@ -408,9 +440,9 @@ class AskIn(BaseModel):
             "example": "Điều kiện để nhà thầu được tham gia đấu thầu là gì?"
         },
     )
-    mode: Literal["fast", "balanced", "quality"] = Field(
+    mode: Literal["fast", "hybrid", "balanced", "quality"] = Field(
         default="balanced",
-        description="RAG mode: fast (1s), balanced (2-3s), quality (3-5s)",
+        description="RAG mode: fast (1s), hybrid (1s, full-text + vector), balanced (2-3s), quality (3-5s)",
     )
     reranker: Literal["bge", "openai"] | None = Field(
         default=None,
@@ -490,7 +522,7 @@ def health():
 
 
 @app.post("/ask", response_model=AskResponse, tags=["System"])
-def ask(body: AskIn):
+async def ask(body: AskIn):
     """
     Quick Q&A endpoint (No authentication required)
 
@@ -507,7 +539,9 @@ def ask(body: AskIn):
         import time
 
         start_time = time.time()
-        result = answer(
+        # Blocking pipeline runs on the bounded executor, not the event loop
+        result = await run_in_pipeline(
+            answer,
             body.question,
             mode=body.mode,
             reranker_type=body.reranker,
@@ -515,5 +549,27 @@ def ask(body: AskIn):
         processing_time = int((time.time() - start_time) * 1000)
         result["processing_time_ms"] = processing_time
         return result
+    except PipelineOverloadedError as e:
+        raise HTTPException(503, detail=str(e), headers={"Retry-After": "5"})
     except Exception as e:
         raise HTTPException(500, detail=str(e))
+
+
+@app.post("/ask/stream", tags=["System"])
+async def ask_stream(body: AskIn):
+    """
+    Streaming Q&A endpoint (Server-Sent Events, no authentication required)
+
+    Events: `metadata` (retrieval xong), `token` (từng đoạn câu trả lời),
+    `done` (kết quả đầy đủ như `/ask` + `time_to_first_token_ms`).
+    """
+    if not body.question or not body.question.strip():
+        raise HTTPException(400, detail="question is required")
+    return sse_response(
+        astream_answer(
+            body.question,
+            mode=body.mode,
+            reranker_type=body.reranker,
+            run_blocking=run_in_pipeline,
+        )
+    )
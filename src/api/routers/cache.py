@@ -3,6 +3,7 @@ Cache Management Router
 
 Provides endpoints for monitoring and managing caches:
 - RAG Retrieval Cache (L1: Memory, L2: Redis)
+- Embedding Cache (L1: Memory, L2: Redis)
 - Answer Cache (L1: Memory, L2: Redis) - Phase 1
 - Semantic Cache (embeddings for similarity) - Phase 2
 - Context Window Cache (Redis)
@@ -12,6 +13,7 @@ Admin-only endpoints for cache management.
 """
 
 import logging
+import sys
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -21,6 +23,7 @@ from src.config.feature_flags import (
     ENABLE_REDIS_CACHE,
     ENABLE_L1_CACHE,
     CACHE_TTL_RETRIEVAL,
+    CACHE_TTL_EMBEDDINGS,
     ENABLE_ANSWER_CACHE,
     ANSWER_CACHE_TTL,
     ENABLE_SEMANTIC_CACHE,
@@ -40,6 +43,7 @@ async def get_cache_stats():
 
     Returns:
         - retrieval_cache: L1/L2 retrieval cache stats
+        - embedding_cache: L1/L2 query/document embedding cache stats
         - answer_cache: Answer-level cache stats (Phase 1)
         - semantic_cache: Semantic similarity cache stats (Phase 2)
         - context_cache: Conversation context cache stats
@@ -47,6 +51,7 @@ async def get_cache_stats():
     """
     stats = {
         "retrieval_cache": {},
+        "embedding_cache": {},
         "answer_cache": {},
         "semantic_cache": {},
         "context_cache": {},
@@ -54,6 +59,7 @@ async def get_cache_stats():
             "redis_enabled": ENABLE_REDIS_CACHE,
             "l1_enabled": ENABLE_L1_CACHE,
             "retrieval_ttl_seconds": CACHE_TTL_RETRIEVAL,
+            "embedding_ttl_seconds": CACHE_TTL_EMBEDDINGS,
             "answer_cache_enabled": ENABLE_ANSWER_CACHE,
             "answer_cache_ttl_seconds": ANSWER_CACHE_TTL,
             "semantic_cache_enabled": ENABLE_SEMANTIC_CACHE,
@@ -75,6 +81,21 @@ async def get_cache_stats():
     except Exception as e:
         stats["retrieval_cache"] = {"error": str(e)}
 
+    # Get embedding cache stats
+    try:
+        from src.config.embedding_provider import get_default_embeddings
+
+        embeddings = get_default_embeddings()
+        if hasattr(embeddings, "get_stats"):
+            stats["embedding_cache"] = embeddings.get_stats()
+        else:
+            stats["embedding_cache"] = {
+                "status": "disabled",
+                "reason": "CACHE_EMBEDDINGS=false",
+            }
+    except Exception as e:
+        stats["embedding_cache"] = {"error": str(e)}
+
     # Get answer cache stats (Phase 1)
     try:
         from src.retrieval.answer_cache import get_answer_cache
@@ -93,6 +114,24 @@ async def get_cache_stats():
     except Exception as e:
         stats["semantic_cache"] = {"error": str(e)}
 
+    # BGE reranker micro-batching stats (only if the local model is loaded)
+    bge_module = sys.modules.get("src.retrieval.ranking.bge_reranker")
+    bge_reranker = getattr(bge_module, "_reranker_instance", None)
+    if bge_reranker is not None:
+        stats["reranker_batching"] = bge_reranker.get_batching_stats()
+
+    # Background summary queue depth / lag (only once a summary was queued)
+    summary_module = sys.modules.get("src.api.services.summary_worker")
+    summary_worker = getattr(summary_module, "_summary_worker", None)
+    if summary_worker is not None:
+        stats["summary_worker"] = summary_worker.get_stats()
+
+    # Document status map (only once an answer needed statuses)
+    status_module = sys.modules.get("src.retrieval.document_status")
+    status_map = getattr(status_module, "_status_map", None)
+    if status_map is not None:
+        stats["document_status_map"] = status_map.get_stats()
+
     # Get context cache stats
     try:
         from src.retrieval.context_cache import get_context_cache
@@ -31,6 +31,8 @@ from src.api.schemas.conversation_schemas import (
 )
 from src.api.services.conversation_service import conversation_service
 from src.api.services.rate_limit_service import RateLimitExceededError
+from src.api.services.pipeline_executor import PipelineOverloadedError
+from src.api.services.streaming import sse_response
 
 import logging
 
@@ -330,7 +332,6 @@ async def send_message(
     conversation_id: UUID,
     request: SendMessageRequest,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
 ):
     """
     Send a message and get AI response via RAG pipeline
@@ -340,15 +341,12 @@ async def send_message(
     - **include_sources**: Whether to include source citations (default: true)
     """
     try:
-        user_msg, assistant_msg, sources, processing_time = (
-            conversation_service.send_message(
-                db=db,
-                conversation_id=conversation_id,
-                user_id=current_user.id,
-                content=request.content,
-                rag_mode=request.rag_mode.value if request.rag_mode else None,
-                include_sources=request.include_sources,
-            )
+        response = await conversation_service.asend_message(
+            conversation_id=conversation_id,
+            user_id=current_user.id,
+            content=request.content,
+            rag_mode=request.rag_mode.value if request.rag_mode else None,
+            include_sources=request.include_sources,
         )
     except RateLimitExceededError as e:
         # Return 429 Too Many Requests with rate limit info
@@ -366,39 +364,72 @@ async def send_message(
                 "X-RateLimit-Reset": e.result.reset_at,
             },
         )
+    except PipelineOverloadedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
 
-    if not user_msg or not assistant_msg:
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
         )
 
-    return MessageSentResponse(
-        conversation_id=conversation_id,
-        user_message=MessageResponse(
-            id=user_msg.id,
-            role=user_msg.role,
-            content=user_msg.content,
-            rag_mode=user_msg.rag_mode,
-            sources=None,
-            processing_time_ms=None,
-            tokens_total=None,
-            feedback_rating=None,
-            created_at=user_msg.created_at,
-        ),
-        assistant_message=MessageResponse(
-            id=assistant_msg.id,
-            role=assistant_msg.role,
-            content=assistant_msg.content,
-            rag_mode=assistant_msg.rag_mode,
-            sources=sources,
-            processing_time_ms=assistant_msg.processing_time_ms,
-            tokens_total=assistant_msg.tokens_total,
-            feedback_rating=None,
-            created_at=assistant_msg.created_at,
-        ),
-        sources=sources,
-        processing_time_ms=processing_time,
-    )
+    return response
+
+
+@router.post("/{conversation_id}/messages/stream")
+async def send_message_stream(
+    conversation_id: UUID,
+    request: SendMessageRequest,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Send a message and stream the AI response as Server-Sent Events
+
+    Events:
+    - **metadata**: retrieval finished (mode, docs_retrieved, retrieval_time_ms)
+    - **token**: answer text chunk
+    - **error**: RAG pipeline failed (fallback answer is still saved)
+    - **done**: same payload as `POST /messages` plus `time_to_first_token_ms`
+    """
+    try:
+        events = await conversation_service.astream_message(
+            conversation_id=conversation_id,
+            user_id=current_user.id,
+            content=request.content,
+            rag_mode=request.rag_mode.value if request.rag_mode else None,
+            include_sources=request.include_sources,
+        )
+    except RateLimitExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "message": str(e),
+                "limit": e.result.limit,
+                "remaining": e.result.remaining,
+                "reset_at": e.result.reset_at,
+            },
+            headers={
+                "X-RateLimit-Limit": str(e.result.limit),
+                "X-RateLimit-Remaining": str(e.result.remaining),
+                "X-RateLimit-Reset": e.result.reset_at,
+            },
+        )
+    except PipelineOverloadedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
+
+    if events is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
+        )
+
+    return sse_response(events)
 
 
 # =============================================================================
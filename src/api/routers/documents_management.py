@@ -10,18 +10,25 @@ Endpoints for managing DOCUMENTS (aggregated from chunks):
 This is different from /documents which returns individual CHUNKS.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import logging
 import json
 from pathlib import Path
+from urllib.parse import quote
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.database import get_db
+from src.api.services.document_catalog import (
+    decode_cursor,
+    encode_cursor,
+    page_etag,
+    refresh_document_catalog_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -290,10 +297,15 @@ async def list_documents(
 
 @router.get("/catalog", response_model=List[DocumentSummary])
 async def list_document_catalog(
+    request: Request,
+    response: Response,
     document_type: Optional[str] = Query(None, description="Filter by type"),
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(default=50, le=200),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, description="Ignored when cursor is set"),
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor header of the previous page"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -301,64 +313,81 @@ async def list_document_catalog(
 
     Returns one entry per document, NOT per chunk.
     Includes total chunk count, title, status, etc.
+
+    Served from the document_catalog table (see services/document_catalog),
+    so cost does not depend on the size of langchain_pg_embedding.
+    Pagination: pass the X-Next-Cursor response header as ?cursor=.
+    Responses carry an ETag; If-None-Match returns 304 when unchanged.
     """
     logger.info(
         f"📚 Catalog request: type={document_type}, status={status}, limit={limit}"
     )
     try:
-        # Build WHERE clause
         where_clauses = []
+        params: Dict[str, Any] = {"limit": limit + 1}
         if document_type:
-            where_clauses.append(f"cmetadata->>'document_type' = '{document_type}'")
+            where_clauses.append("document_type = :document_type")
+            params["document_type"] = document_type
+        if status:
+            where_clauses.append("status = :status")
+            params["status"] = status
+
+        if cursor:
+            try:
+                cursor_created_at, cursor_document_id = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            where_clauses.append(
+                "(created_at, document_id) < (:cursor_created_at, :cursor_document_id)"
+            )
+            params["cursor_created_at"] = cursor_created_at
+            params["cursor_document_id"] = cursor_document_id
+            offset_sql = ""
+        else:
+            offset_sql = "OFFSET :offset"
+            params["offset"] = offset
 
         where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
-        # Query to get unique documents with aggregated data
-        # JOIN with documents table to get status
         query = text(
             f"""
-            WITH document_groups AS (
-                SELECT 
-                    cmetadata->>'document_id' as document_id,
-                    cmetadata->>'document_type' as document_type,
-                    COUNT(*) as chunk_count,
-                    MIN((cmetadata->>'chunk_index')::int) as first_chunk_idx,
-                    MAX(CAST(cmetadata->>'created_at' AS TIMESTAMP)) as created_at,
-                    array_agg(id ORDER BY (cmetadata->>'chunk_index')::int) as chunk_ids,
-                    (array_agg(cmetadata ORDER BY (cmetadata->>'chunk_index')::int))[1] as first_chunk_metadata
-                FROM langchain_pg_embedding
-                {where_sql}
-                GROUP BY cmetadata->>'document_id', cmetadata->>'document_type'
-            )
-            SELECT 
-                dg.*,
-                COALESCE(d.status, 'active') as doc_status
-            FROM document_groups dg
-            LEFT JOIN documents d ON d.document_id = dg.document_id
-            ORDER BY dg.created_at DESC NULLS LAST, dg.document_id
-            LIMIT :limit OFFSET :offset
+            SELECT
+                document_id, document_type, status, chunk_count, chunk_ids,
+                first_chunk_metadata, created_at, refreshed_at
+            FROM document_catalog
+            {where_sql}
+            ORDER BY created_at DESC, document_id DESC
+            LIMIT :limit {offset_sql}
             """
         )
 
-        result = await db.execute(query, {"limit": limit, "offset": offset})
+        result = await db.execute(query, params)
         rows = result.fetchall()
 
-        logger.info(f"📊 Query returned {len(rows)} document groups")
+        # One extra row tells whether there is a next page
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        etag = page_etag(
+            (document_type, status, limit, offset, cursor),
+            [(row.document_id, row.refreshed_at) for row in rows],
+        )
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if has_more:
+            headers["X-Next-Cursor"] = encode_cursor(
+                rows[-1].created_at, rows[-1].document_id
+            )
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
 
         documents = []
         for row in rows:
-            metadata = row.first_chunk_metadata
+            metadata = row.first_chunk_metadata or {}
 
             # Extract title
             title = extract_title_from_metadata(metadata)
 
-            # Get status from documents table (via JOIN)
-            current_status = row.doc_status
-
-            # Filter by status if requested
-            if status and current_status != status:
-                continue
-
             # Extract hierarchy
             hierarchy = None
             if "hierarchy" in metadata:
@@ -382,9 +411,9 @@ async def list_document_catalog(
                 DocumentSummary(
                     document_id=row.document_id,
                     title=title,
-                    document_type=row.document_type,
+                    document_type=row.document_type or "unknown",
                     total_chunks=row.chunk_count,
-                    status=current_status,
+                    status=row.status,
                     published_date=published_date,
                     effective_date=effective_date,
                     last_modified=last_modified,
@@ -393,11 +422,11 @@ async def list_document_catalog(
                 )
             )
 
-        logger.info(
-            f"📚 Document catalog: Retrieved {len(documents)} documents (filtered)"
-        )
+        logger.info(f"📚 Document catalog: Retrieved {len(documents)} documents")
         return documents
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Failed to get document catalog: {e}")
         logger.exception("Full traceback:")
@@ -763,7 +792,8 @@ async def update_document_status(
             )
             updated_count += 1
 
-        # 6. Commit all changes
+        # 6. Refresh the catalog row (status), then commit all changes
+        await refresh_document_catalog_async(db, [document_id])
         await db.commit()
 
         logger.info(
@@ -771,30 +801,20 @@ async def update_document_status(
             f"(synced {updated_count} chunks)"
         )
 
-        # 7. Invalidate retrieval cache after status update
+        # 7. Invalidate cached entries containing this document
         try:
-            from src.embedding.store.pgvector_store import vector_store
+            from src.retrieval.cache_invalidation import invalidate_cache_for_document
 
+            cache_result = invalidate_cache_for_document(document_id, "status_change")
             logger.info(
-                f"🔄 Clearing retrieval cache after status update: "
-                f"{document_id} ({old_metadata_status} → {new_status})"
+                f"✅ Cache invalidated after status update: "
+                f"{document_id} ({old_metadata_status} → {new_status}), "
+                f"{cache_result.get('entries_evicted', 0)} entries evicted"
             )
-
-            cache_stats = vector_store.clear_cache()
-
-            if cache_stats:
-                logger.info(
-                    f"✅ Cache invalidated successfully: "
-                    f"L1={cache_stats['l1_cleared']} queries, "
-                    f"L2={cache_stats['l2_cleared']} Redis keys cleared"
-                )
-            else:
-                logger.info("ℹ️  Cache is disabled - no cache to clear")
-
         except Exception as cache_error:
             # Log warning but don't fail the status update
             logger.warning(
-                f"⚠️  Failed to clear cache after status update: {cache_error}",
+                f"⚠️  Failed to invalidate cache after status update: {cache_error}",
                 exc_info=True,
             )
 
@@ -894,24 +914,69 @@ async def get_document_stats(
 
 # ===== FILE PREVIEW ENDPOINT =====
 
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 from pathlib import Path as FilePath
 
+from src.config.storage_provider import iter_stream, resolve_storage_location
+
+
+def _parse_byte_range(range_header: Optional[str], size: int):
+    """
+    Parse a single "bytes=start-end" Range header.
+
+    Returns:
+        (start, end) inclusive, or None to send the whole file
+
+    Raises:
+        HTTPException 416 if the range cannot be satisfied
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+
+    spec = range_header[len("bytes="):].strip()
+    if "," in spec:
+        return None  # multipart ranges: serve the whole file
+
+    start_s, _, end_s = spec.partition("-")
+    try:
+        if start_s:
+            start = int(start_s)
+            end = int(end_s) if end_s else size - 1
+        else:
+            # Suffix range: last N bytes
+            start = max(size - int(end_s), 0)
+            end = size - 1
+    except ValueError:
+        return None
+
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
 
 @router.head("/{document_id}/file")
 @router.get("/{document_id}/file")
 async def get_document_file(
     document_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get original file for document preview.
 
-    Retrieves the source file from disk for documents in Library.
-    Uses source_file column from documents table (contains full path).
+    Retrieves the source file from local disk or GCS for documents in Library.
+    Uses source_file column from documents table (full path or gs:// URI).
+    Supports HTTP Range requests; content is streamed in chunks. Storage
+    calls (stat, open, reads) are blocking, so they run in the threadpool.
 
     Returns:
-        FileResponse with original document file for preview/download.
+        Streaming response with original document file for preview/download.
     """
     try:
         # Query document to get source_file
@@ -929,7 +994,7 @@ async def get_document_file(
             raise HTTPException(status_code=404, detail="Document not found")
 
         # source_file contains full path (e.g., /home/.../data/uploads/{id}/file.docx)
-        # filepath may also contain path (fallback)
+        # or gs://bucket/path; filepath may also contain path (fallback)
         file_path = row.source_file or row.filepath
 
         if not file_path:
@@ -938,16 +1003,18 @@ async def get_document_file(
                 detail="Source file path not found. Document may have been uploaded before file tracking was enabled."
             )
 
-        file_path_obj = FilePath(file_path)
+        provider, storage_path = resolve_storage_location(file_path)
 
-        if not file_path_obj.exists():
+        try:
+            size = await run_in_threadpool(provider.size, storage_path)
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=404,
-                detail=f"File not found on disk: {file_path}"
+                detail=f"File not found in storage: {file_path}"
             )
 
         # Determine content type based on extension
-        ext = file_path_obj.suffix.lower()
+        ext = FilePath(storage_path).suffix.lower()
         content_type_map = {
             ".pdf": "application/pdf",
             ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -958,11 +1025,32 @@ async def get_document_file(
         }
         content_type = content_type_map.get(ext, "application/octet-stream")
 
-        filename = row.filename or file_path_obj.name
+        filename = row.filename or FilePath(storage_path).name
 
-        return FileResponse(
-            path=str(file_path_obj),
-            filename=filename,
+        byte_range = _parse_byte_range(request.headers.get("range"), size)
+        start, end = byte_range or (0, size - 1)
+        length = end - start + 1 if size else 0
+
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Length": str(length),
+            "Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}",
+        }
+        status_code = 200
+        if byte_range:
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        if request.method == "HEAD":
+            return Response(
+                status_code=status_code, headers=headers, media_type=content_type
+            )
+
+        stream = await run_in_threadpool(provider.open_read, storage_path, start)
+        return StreamingResponse(
+            iterate_in_threadpool(iter_stream(stream, length)),
+            status_code=status_code,
+            headers=headers,
             media_type=content_type,
         )
 
@@ -971,4 +1059,3 @@ async def get_document_file(
     except Exception as e:
         logger.error(f"❌ Failed to get document file: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
-
@@ -31,6 +31,7 @@ class RAGMode(str, Enum):
     """RAG processing modes"""
 
     FAST = "fast"
+    HYBRID = "hybrid"
     BALANCED = "balanced"
     QUALITY = "quality"
     # NOTE: ADAPTIVE removed - use BALANCED as default
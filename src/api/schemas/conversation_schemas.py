@@ -25,6 +25,7 @@ class MessageRole(str, Enum):
 class RAGMode(str, Enum):
     """RAG processing modes"""
     FAST = "fast"
+    HYBRID = "hybrid"
     BALANCED = "balanced"
     QUALITY = "quality"
     # NOTE: ADAPTIVE removed - use BALANCED as default
@@ -4,9 +4,10 @@ Business logic for conversations, messages, and RAG integration
 """
 
 import time
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -24,7 +25,7 @@ from src.models.repositories import (
     QueryRepository,
     UserUsageMetricRepository,
 )
-from src.generation.chains.qa_chain import answer as rag_answer
+from src.generation.chains.qa_chain import answer as rag_answer, astream_answer
 from src.generation.intent_detector import (
     IntentDetector,
     QueryIntent,
@@ -33,14 +34,29 @@ from src.generation.intent_detector import (
 from src.retrieval.query_processing.complexity_analyzer import (
     QuestionComplexityAnalyzer,
 )
-from src.api.schemas.conversation_schemas import SourceInfo
+from src.api.schemas.conversation_schemas import (
+    MessageResponse,
+    MessageSentResponse,
+    SourceInfo,
+)
 from src.utils.token_counter import count_message_tokens, estimate_cost_usd
 from src.api.services.summary_service import SummaryService
+from src.api.services.summary_worker import get_summary_worker
 from src.api.services.rate_limit_service import RateLimitService, RateLimitExceededError
+from src.api.services.pipeline_executor import run_in_pipeline
+from src.config.feature_flags import ENABLE_ASYNC_SUMMARY
 from src.config.models import settings
+from src.models.base import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+RAG_NO_ANSWER_MESSAGE = "Xin lỗi, tôi không thể trả lời câu hỏi này."
+RAG_ERROR_MESSAGE = "Xin lỗi, đã xảy ra lỗi khi xử lý câu hỏi của bạn."
+RAG_ABORTED_SUFFIX = "\n\n[Câu trả lời bị gián đoạn]"
+
+# Turns saved after the client disconnected (kept referenced until done)
+_background_saves: set = set()
+
 # Singleton complexity analyzer for CoT triggering
 _complexity_analyzer: Optional[QuestionComplexityAnalyzer] = None
 
@@ -53,6 +69,12 @@ def _get_complexity_analyzer() -> QuestionComplexityAnalyzer:
     return _complexity_analyzer
 
 
+def _log_save_error(task: "asyncio.Future") -> None:
+    """Done-callback for background turn saves."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"❌ Failed to save interrupted turn: {task.exception()}")
+
+
 def _should_use_cot(query: str) -> bool:
     """
     Determine if Chain of Thought reasoning should be used.
@@ -329,6 +351,54 @@ class ConversationService:
         Returns:
             Tuple of (user_message, assistant_message, sources, processing_time_ms)
         """
+        pending = ConversationService._begin_message(
+            db, conversation_id, user_id, content, rag_mode
+        )
+        if "result" in pending:
+            return pending["result"]
+
+        # Call RAG pipeline with enhanced question
+        try:
+            rag_result = rag_answer(
+                question=pending["question"],
+                mode=pending["rag_mode"],
+                reranker_type=None,  # Use config default (DEFAULT_RERANKER_TYPE)
+                original_query=content,  # 🆕 Pass original query for cache key
+                use_cot=pending["use_cot"],  # 🧠 Enable CoT for complex queries
+            )
+
+            assistant_content = rag_result.get("answer", RAG_NO_ANSWER_MESSAGE)
+            # Use source_documents_raw for proper metadata extraction
+            raw_sources = rag_result.get("source_documents_raw", [])
+
+        except Exception as e:
+            logger.error(f"RAG pipeline error: {e}")
+            assistant_content = RAG_ERROR_MESSAGE
+            raw_sources = []
+
+        return ConversationService._complete_message(
+            db, pending, assistant_content, raw_sources, include_sources
+        )
+
+    @staticmethod
+    def _begin_message(
+        db: Session,
+        conversation_id: UUID,
+        user_id: UUID,
+        content: str,
+        rag_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        First stage of send_message (everything before the RAG call).
+
+        Checks rate limit and ownership, stores the user message, detects
+        intent and builds conversation context.
+
+        Returns:
+            {"result": tuple} if the request finished without RAG (not found,
+            gibberish, off-topic, casual), otherwise the pending state for
+            the RAG call and _complete_message
+        """
         start_time = time.time()
 
         # Check rate limit before processing
@@ -345,7 +415,7 @@ class ConversationService:
             db, conversation_id, user_id
         )
         if not conversation:
-            return None, None, [], 0
+            return {"result": (None, None, [], 0)}
 
         # Use conversation's rag_mode if not overridden
         effective_rag_mode = rag_mode or conversation.rag_mode or "balanced"
@@ -405,7 +475,7 @@ class ConversationService:
                 tokens_total=0,
             )
             ConversationRepository.update_last_message(db, conversation_id)
-            return user_message, assistant_message, [], processing_time
+            return {"result": (user_message, assistant_message, [], processing_time)}
 
         # Handle OFF_TOPIC: Skip RAG, redirect to domain
         if intent_result.intent == QueryIntent.OFF_TOPIC:
@@ -427,7 +497,7 @@ class ConversationService:
                 tokens_total=0,
             )
             ConversationRepository.update_last_message(db, conversation_id)
-            return user_message, assistant_message, [], processing_time
+            return {"result": (user_message, assistant_message, [], processing_time)}
 
         # Handle CASUAL: Skip RAG, return direct response
         if intent_result.intent == QueryIntent.CASUAL:
@@ -449,7 +519,7 @@ class ConversationService:
                 tokens_total=0,
             )
             ConversationRepository.update_last_message(db, conversation_id)
-            return user_message, assistant_message, [], processing_time
+            return {"result": (user_message, assistant_message, [], processing_time)}
 
         # 🆕 SMART CONTEXT: Only attach context for ON_TOPIC or CONTEXT_FOLLOW_UP
         enhanced_question = content
@@ -477,31 +547,43 @@ class ConversationService:
 {content}"""
                 logger.info("📎 Context attached for follow-up query")
 
-        # 🧠 Determine if Chain of Thought reasoning should be used
-        use_cot = _should_use_cot(content)
+        return {
+            "start_time": start_time,
+            "conversation_id": conversation_id,
+            "user_id": user_id,
+            "content": content,
+            "rag_mode": effective_rag_mode,
+            "user_message": user_message,
+            "user_message_id": user_message.id,
+            "question": enhanced_question,
+            "use_cot": _should_use_cot(content),
+        }
 
-        # Call RAG pipeline with enhanced question
-        try:
-            rag_result = rag_answer(
-                question=enhanced_question,
-                mode=effective_rag_mode,
-                reranker_type=None,  # Use config default (DEFAULT_RERANKER_TYPE)
-                original_query=content,  # 🆕 Pass original query for cache key
-                use_cot=use_cot,  # 🧠 Enable CoT for complex queries
-            )
-
-            assistant_content = rag_result.get(
-                "answer", "Xin lỗi, tôi không thể trả lời câu hỏi này."
-            )
-            # Use source_documents_raw for proper metadata extraction
-            raw_sources = rag_result.get("source_documents_raw", [])
-            rag_time = rag_result.get("processing_time_ms", 0)
+    @staticmethod
+    def _complete_message(
+        db: Session,
+        pending: Dict[str, Any],
+        assistant_content: str,
+        raw_sources: List[Dict],
+        include_sources: bool = True,
+    ) -> Tuple[Optional[Message], Optional[Message], List[SourceInfo], int]:
+        """
+        Last stage of send_message: persist the assistant message, tokens,
+        query log, citations, usage metrics and summary.
 
-        except Exception as e:
-            logger.error(f"RAG pipeline error: {e}")
-            assistant_content = "Xin lỗi, đã xảy ra lỗi khi xử lý câu hỏi của bạn."
-            raw_sources = []
-            rag_time = 0
+        Shared by the blocking and streaming paths so both persist the same data.
+        """
+        start_time = pending["start_time"]
+        conversation_id = pending["conversation_id"]
+        user_id = pending["user_id"]
+        content = pending["content"]
+        effective_rag_mode = pending["rag_mode"]
+        user_message = pending["user_message"]
+
+        # Re-load conversation in this session (streaming uses a fresh session)
+        conversation = ConversationService.get_conversation(
+            db, conversation_id, user_id
+        )
 
         processing_time = int((time.time() - start_time) * 1000)
 
@@ -600,12 +682,16 @@ class ConversationService:
         except Exception as e:
             logger.warning(f"Failed to update usage metrics: {e}")
 
-        # Generate/update conversation summary if needed (async-like, non-blocking)
+        # Queue conversation summary update if needed (written by the summary
+        # worker; the next turns use the previous summary until it lands)
         try:
             # Refresh conversation to get updated message_count
             db.refresh(conversation)
             if SummaryService.should_update_summary(conversation):
-                SummaryService.generate_summary(db, conversation_id)
+                if ENABLE_ASYNC_SUMMARY:
+                    get_summary_worker().enqueue(conversation_id)
+                else:
+                    SummaryService.generate_summary(db, conversation_id)
         except Exception as e:
             logger.warning(f"Failed to update summary: {e}")
 
@@ -615,6 +701,238 @@ class ConversationService:
 
         return user_message, assistant_message, sources_info, processing_time
 
+    @staticmethod
+    async def asend_message(
+        conversation_id: UUID,
+        user_id: UUID,
+        content: str,
+        rag_mode: Optional[str] = None,
+        include_sources: bool = True,
+    ) -> Optional[MessageSentResponse]:
+        """
+        Async send_message for ``async def`` endpoints.
+
+        Runs the blocking pipeline (DB writes, RAG, LLM calls) on the bounded
+        pipeline executor so the event loop keeps serving other requests.
+        Sessions are not thread-safe, so the worker opens its own session
+        instead of borrowing the request-scoped one; only plain ids go in
+        and a built response comes out.
+
+        Returns:
+            MessageSentResponse, or None if the conversation was not found
+
+        Raises:
+            RateLimitExceededError: If user exceeded daily limit
+            PipelineOverloadedError: If the executor queue is full
+        """
+
+        def send() -> Optional[MessageSentResponse]:
+            session = SessionLocal()
+            try:
+                result = ConversationService.send_message(
+                    session,
+                    conversation_id=conversation_id,
+                    user_id=user_id,
+                    content=content,
+                    rag_mode=rag_mode,
+                    include_sources=include_sources,
+                )
+                if result[0] is None or result[1] is None:
+                    return None
+                return ConversationService.build_sent_response(conversation_id, *result)
+            finally:
+                session.close()
+
+        return await run_in_pipeline(send)
+
+    @staticmethod
+    async def astream_message(
+        conversation_id: UUID,
+        user_id: UUID,
+        content: str,
+        rag_mode: Optional[str] = None,
+        include_sources: bool = True,
+    ) -> Optional[AsyncIterator[Tuple[str, Dict[str, Any]]]]:
+        """
+        Streaming send_message.
+
+        The first stage (rate limit, ownership, user message, intent) runs
+        before this returns, so RateLimitExceededError and "not found"
+        surface as normal HTTP errors instead of mid-stream failures. Each
+        stage runs on the pipeline executor with its own session.
+
+        Returns:
+            None if the conversation was not found, otherwise an async
+            iterator of ("metadata" | "token" | "error" | "done", data)
+            events. The "done" payload is a MessageSentResponse dict plus
+            time_to_first_token_ms; the persisted assistant message, token
+            counts and citations match send_message.
+        """
+
+        def begin() -> Dict[str, Any]:
+            session = SessionLocal()
+            try:
+                pending = ConversationService._begin_message(
+                    session, conversation_id, user_id, content, rag_mode
+                )
+                if "result" in pending:
+                    if pending["result"][0] is None:
+                        return {"not_found": True}
+                    # Finished without RAG (gibberish / off-topic / casual)
+                    return {
+                        "response": ConversationService._dump_sent_response(
+                            conversation_id, pending["result"]
+                        )
+                    }
+                # ORM objects stay with this session; complete() reloads by id
+                pending.pop("user_message", None)
+                return pending
+            finally:
+                session.close()
+
+        pending = await run_in_pipeline(begin)
+        if pending.get("not_found"):
+            return None
+        return ConversationService._message_events(
+            conversation_id, pending, include_sources, pending.get("response")
+        )
+
+    @staticmethod
+    async def _message_events(
+        conversation_id: UUID,
+        pending: Dict[str, Any],
+        include_sources: bool,
+        ready_response: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Event stream for astream_message (RAG tokens, then persisted result).
+
+        If the client disconnects mid-stream (CancelledError / GeneratorExit
+        at a yield), the turn is still completed in the background with the
+        partial answer plus RAG_ABORTED_SUFFIX, so the user message never
+        stays without a reply, usage or latency record.
+        """
+        if ready_response is not None:
+            yield "token", {"text": ready_response["assistant_message"]["content"]}
+            yield "done", {
+                **ready_response,
+                "time_to_first_token_ms": ready_response["processing_time_ms"],
+            }
+            return
+
+        # The request-scoped session may already be closed once streaming
+        # starts, so persist with a dedicated session
+        def complete(content: str, sources: List[Dict]) -> Dict[str, Any]:
+            session = SessionLocal()
+            try:
+                state = {
+                    **pending,
+                    "user_message": session.get(Message, pending["user_message_id"]),
+                }
+                result = ConversationService._complete_message(
+                    session, state, content, sources, include_sources
+                )
+                return ConversationService._dump_sent_response(conversation_id, result)
+            finally:
+                session.close()
+
+        assistant_content = None
+        raw_sources: List[Dict] = []
+        streamed: List[str] = []
+        time_to_first_token_ms = None
+        save = None
+        try:
+            try:
+                async for event, data in astream_answer(
+                    question=pending["question"],
+                    mode=pending["rag_mode"],
+                    reranker_type=None,  # Use config default (DEFAULT_RERANKER_TYPE)
+                    original_query=pending["content"],
+                    use_cot=pending["use_cot"],
+                    run_blocking=run_in_pipeline,
+                ):
+                    if event == "done":
+                        assistant_content = data.get("answer", RAG_NO_ANSWER_MESSAGE)
+                        raw_sources = data.get("source_documents_raw", [])
+                        time_to_first_token_ms = data.get("time_to_first_token_ms")
+                    else:
+                        if event == "token":
+                            streamed.append(data.get("text", ""))
+                        yield event, data
+            except Exception as e:
+                logger.error(f"RAG pipeline error: {e}")
+
+            if assistant_content is None:
+                assistant_content = RAG_ERROR_MESSAGE
+                raw_sources = []
+                yield "error", {"message": assistant_content}
+
+            # Shielded: a disconnect while saving must not save the turn twice
+            save = asyncio.ensure_future(
+                run_in_pipeline(complete, assistant_content, raw_sources)
+            )
+            response = await asyncio.shield(save)
+            yield "done", {**response, "time_to_first_token_ms": time_to_first_token_ms}
+        finally:
+            if save is None:
+                if assistant_content is None:
+                    assistant_content = "".join(streamed).strip() + RAG_ABORTED_SUFFIX
+                    raw_sources = []
+                logger.warning(
+                    f"⚠️ Client disconnected from conversation {conversation_id}, "
+                    "saving the interrupted turn"
+                )
+                save = asyncio.ensure_future(
+                    run_in_pipeline(complete, assistant_content, raw_sources)
+                )
+                _background_saves.add(save)
+                save.add_done_callback(_background_saves.discard)
+                save.add_done_callback(_log_save_error)
+
+    @staticmethod
+    def _dump_sent_response(conversation_id: UUID, result: Tuple) -> Dict[str, Any]:
+        """JSON-ready MessageSentResponse (loads ORM attributes in-session)."""
+        return ConversationService.build_sent_response(
+            conversation_id, *result
+        ).model_dump(mode="json")
+
+    @staticmethod
+    def build_sent_response(
+        conversation_id: UUID,
+        user_msg: Message,
+        assistant_msg: Message,
+        sources: List[SourceInfo],
+        processing_time: int,
+    ) -> MessageSentResponse:
+        """Build the API response for a sent message."""
+        return MessageSentResponse(
+            conversation_id=conversation_id,
+            user_message=MessageResponse(
+                id=user_msg.id,
+                role=user_msg.role,
+                content=user_msg.content,
+                rag_mode=user_msg.rag_mode,
+                sources=None,
+                processing_time_ms=None,
+                tokens_total=None,
+                feedback_rating=None,
+                created_at=user_msg.created_at,
+            ),
+            assistant_message=MessageResponse(
+                id=assistant_msg.id,
+                role=assistant_msg.role,
+                content=assistant_msg.content,
+                rag_mode=assistant_msg.rag_mode,
+                sources=sources,
+                processing_time_ms=assistant_msg.processing_time_ms,
+                tokens_total=assistant_msg.tokens_total,
+                feedback_rating=None,
+                created_at=assistant_msg.created_at,
+            ),
+            sources=sources,
+            processing_time_ms=processing_time,
+        )
+
     @staticmethod
     def _save_citations(
         db: Session, message_id: UUID, raw_sources: List[Dict]
@@ -0,0 +1,116 @@
+"""
+Document Catalog - Maintained per-document summary for GET /documents/catalog
+
+The catalog used to be a GROUP BY over langchain_pg_embedding on every
+request. The document_catalog table (alembic add_document_catalog) keeps one
+row per document and is refreshed only for the documents a write touched:
+
+- Upload Stage 2 / bulk import: after chunks + embeddings are written
+- Status update: after documents.status and chunk metadata change
+- Reindex: full refresh at the end (also drops documents without chunks)
+- Maintenance re-embed scripts: full refresh after a clear/orphan sweep,
+  otherwise only the re-imported documents
+
+Refreshing is done by the SQL function refresh_document_catalog(text[]);
+NULL rebuilds every row. Listing uses keyset pagination on
+(created_at, document_id) and a page ETag.
+
+Usage:
+    from src.api.services.document_catalog import refresh_document_catalog
+
+    refresh_document_catalog([document_id])
+"""
+
+import base64
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+REFRESH_SQL = "SELECT refresh_document_catalog(%(document_ids)s::text[])"
+
+REFRESH_SQL_ASYNC = text(
+    "SELECT refresh_document_catalog(CAST(:document_ids AS text[]))"
+)
+
+
+def refresh_document_catalog(
+    document_ids: Optional[Sequence[str]] = None,
+    connection_factory: Optional[Callable[[], Any]] = None,
+) -> int:
+    """
+    Refresh catalog rows for the given documents (None = all), psycopg 3.
+
+    Failures are logged, not raised: the write that triggered the refresh
+    has already been committed.
+
+    Returns:
+        Number of catalog rows written
+    """
+    if connection_factory is None:
+        from src.config.database import get_db_sync
+
+        connection_factory = get_db_sync
+
+    ids = list(document_ids) if document_ids is not None else None
+    if ids is not None and not ids:
+        return 0
+
+    conn = None
+    try:
+        conn = connection_factory()
+        with conn.cursor() as cursor:
+            cursor.execute(REFRESH_SQL, {"document_ids": ids})
+            refreshed = cursor.fetchone()[0]
+        conn.commit()
+        logger.info(f"📚 Document catalog refreshed: {refreshed} rows")
+        return refreshed
+    except Exception as e:
+        logger.warning(f"⚠️  Document catalog refresh failed for {ids or 'all'}: {e}")
+        if conn:
+            conn.rollback()
+        return 0
+    finally:
+        if conn:
+            conn.close()
+
+
+async def refresh_document_catalog_async(db, document_ids: Sequence[str]) -> int:
+    """Same as refresh_document_catalog, on an AsyncSession (caller commits)."""
+    result = await db.execute(REFRESH_SQL_ASYNC, {"document_ids": list(document_ids)})
+    return result.scalar() or 0
+
+
+# ===== KEYSET PAGINATION / ETAG =====
+
+
+def encode_cursor(created_at: datetime, document_id: str) -> str:
+    """Opaque cursor for the row a page ended on."""
+    raw = f"{created_at.isoformat()}|{document_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Raises:
+        ValueError: Malformed cursor
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    created_at, _, document_id = (
+        base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").partition("|")
+    )
+    if not document_id:
+        raise ValueError("Invalid catalog cursor")
+    return datetime.fromisoformat(created_at), document_id
+
+
+def page_etag(params: Sequence[Any], rows: Sequence[Tuple[str, datetime]]) -> str:
+    """Weak ETag from the query and each row's (document_id, refreshed_at)."""
+    digest = hashlib.sha1(repr(tuple(params)).encode("utf-8"))
+    for document_id, refreshed_at in rows:
+        digest.update(f"{document_id}@{refreshed_at.isoformat()};".encode("utf-8"))
+    return f'W/"{digest.hexdigest()}"'
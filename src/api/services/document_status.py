@@ -145,30 +145,25 @@ class DocumentStatusService:
                         f"{old_status} → {request.new_status.value} ({updated_count} chunks)"
                     )
 
-                    # 6. Invalidate retrieval cache
-                    # Document status change affects many queries -> clear all cache
+                    # 6. Invalidate cached entries containing this document
+                    # (retrieval, answer, semantic, rerank scores)
                     try:
-                        from src.embedding.store.pgvector_store import vector_store
+                        from src.retrieval.cache_invalidation import (
+                            invalidate_cache_for_document,
+                        )
 
+                        cache_result = invalidate_cache_for_document(
+                            request.document_id, "status_change"
+                        )
                         logger.info(
-                            f"🔄 Clearing retrieval cache after status update: "
-                            f"{request.document_id} ({old_status} → {request.new_status.value})"
+                            f"✅ Cache invalidated after status update: "
+                            f"{request.document_id} ({old_status} → {request.new_status.value}), "
+                            f"{cache_result.get('entries_evicted', 0)} entries evicted"
                         )
-
-                        cache_stats = vector_store.clear_cache()
-
-                        if cache_stats:
-                            logger.info(
-                                f"✅ Cache invalidated successfully: "
-                                f"L1={cache_stats['l1_cleared']} queries, "
-                                f"L2={cache_stats['l2_cleared']} Redis keys cleared"
-                            )
-                        else:
-                            logger.info("ℹ️  Cache is disabled - no cache to clear")
                     except Exception as cache_error:
                         # Log warning but don't fail the status update
                         logger.warning(
-                            f"⚠️  Failed to clear cache after status update: {cache_error}",
+                            f"⚠️  Failed to invalidate cache after status update: {cache_error}",
                             exc_info=True,
                         )
 
@@ -0,0 +1,129 @@
+"""
+Duplicate Registry - Content-addressed lookup of existing documents
+
+Checks an upload's ContentFingerprint against the documents table before
+any chunking or embedding happens:
+- Exact duplicate: same raw bytes (file_hash) or same normalized text
+  (text_hash) as an existing document → upload is short-circuited
+- Near duplicate: MinHash similarity >= threshold with a document sharing
+  an LSH band → flagged for admin review
+
+Documents imported before fingerprints existed have NULL fingerprints and
+are never matched.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from ...preprocessing.utils.content_fingerprint import (
+    NEAR_DUPLICATE_THRESHOLD,
+    ContentFingerprint,
+    estimate_similarity,
+)
+
+logger = logging.getLogger(__name__)
+
+NEAR_CANDIDATE_LIMIT = 200
+
+FIND_EXACT_SQL = """
+    SELECT document_id, document_name, file_hash = %(file_hash)s AS same_file
+    FROM documents
+    WHERE status <> 'deleted'
+    AND (file_hash = %(file_hash)s OR text_hash = %(text_hash)s)
+    ORDER BY same_file DESC
+    LIMIT 1
+"""
+
+FIND_NEAR_CANDIDATES_SQL = """
+    SELECT document_id, document_name, minhash_signature
+    FROM documents
+    WHERE status <> 'deleted'
+    AND minhash_bands && %(bands)s::text[]
+    LIMIT %(limit)s
+"""
+
+
+@dataclass
+class DuplicateCheck:
+    """Result of checking one fingerprint."""
+
+    exact: Optional[Dict[str, Any]] = None  # {document_id, document_name, match}
+    near: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_exact(self) -> bool:
+        return self.exact is not None
+
+
+class DuplicateRegistry:
+    """Look up fingerprints in the documents table."""
+
+    def __init__(
+        self,
+        connection_factory: Optional[Callable[[], Any]] = None,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    ):
+        if connection_factory is None:
+            from ...config.database import get_db_sync
+
+            connection_factory = get_db_sync
+        self._connection_factory = connection_factory
+        self.threshold = threshold
+
+    def check(
+        self, fingerprint: ContentFingerprint, near: bool = True
+    ) -> DuplicateCheck:
+        """Exact match first; near duplicates only if there is none."""
+        conn = self._connection_factory()
+        try:
+            with conn.cursor() as cursor:
+                exact = self._find_exact(cursor, fingerprint)
+                if exact or not near:
+                    return DuplicateCheck(exact=exact)
+                return DuplicateCheck(near=self._find_near(cursor, fingerprint))
+        finally:
+            conn.close()
+
+    def _find_exact(
+        self, cursor, fingerprint: ContentFingerprint
+    ) -> Optional[Dict[str, Any]]:
+        cursor.execute(
+            FIND_EXACT_SQL,
+            # No text_hash (empty text) → NULL, which never matches
+            {
+                "file_hash": fingerprint.file_hash,
+                "text_hash": fingerprint.text_hash or None,
+            },
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return {
+            "document_id": row[0],
+            "document_name": row[1],
+            "match": "file" if row[2] else "text",
+        }
+
+    def _find_near(
+        self, cursor, fingerprint: ContentFingerprint
+    ) -> List[Dict[str, Any]]:
+        if not fingerprint.minhash:
+            return []
+        cursor.execute(
+            FIND_NEAR_CANDIDATES_SQL,
+            {"bands": fingerprint.bands, "limit": NEAR_CANDIDATE_LIMIT},
+        )
+        matches = []
+        for document_id, document_name, signature in cursor.fetchall():
+            similarity = estimate_similarity(fingerprint.minhash, signature or [])
+            if similarity >= self.threshold:
+                matches.append(
+                    {
+                        "document_id": document_id,
+                        "document_name": document_name,
+                        "similarity": round(similarity, 3),
+                    }
+                )
+        matches.sort(key=lambda m: m["similarity"], reverse=True)
+        return matches[:5]
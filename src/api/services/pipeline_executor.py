@@ -0,0 +1,156 @@
+"""
+Pipeline Executor - Bounded thread pool for the blocking RAG pipeline
+
+The chat and /ask pipelines (rate limiting, intent detection, retrieval,
+LLM calls, citation writes) are synchronous. Running them directly inside
+``async def`` endpoints stalls the event loop, so one slow LLM call blocks
+every other request on the worker.
+
+This module offloads them to a dedicated, bounded executor:
+- RAG_EXECUTOR_MAX_WORKERS pipelines run concurrently per worker
+- Up to RAG_EXECUTOR_MAX_PENDING more wait in the queue
+- Beyond that, requests are rejected (PipelineOverloadedError → HTTP 503)
+  instead of piling up unbounded latency
+
+Usage:
+    from src.api.services.pipeline_executor import run_in_pipeline
+
+    result = await run_in_pipeline(answer, question, mode="balanced")
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from src.config.feature_flags import RAG_EXECUTOR_MAX_WORKERS, RAG_EXECUTOR_MAX_PENDING
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PipelineOverloadedError(Exception):
+    """Raised when the pipeline executor queue is full."""
+
+    def __init__(self, in_flight: int, capacity: int):
+        self.in_flight = in_flight
+        self.capacity = capacity
+        super().__init__(
+            f"RAG pipeline overloaded ({in_flight}/{capacity} requests in flight)"
+        )
+
+
+class PipelineExecutor:
+    """Bounded executor with admission control (backpressure)."""
+
+    def __init__(
+        self,
+        max_workers: int = RAG_EXECUTOR_MAX_WORKERS,
+        max_pending: int = RAG_EXECUTOR_MAX_PENDING,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.capacity = max_workers + max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rag-pipeline"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+    def _release(self, future):
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled() or future.exception() is not None:
+                self.stats["failed"] += 1
+            else:
+                self.stats["completed"] += 1
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable on the pool and await its result.
+
+        Raises:
+            PipelineOverloadedError: If running + queued jobs exceed capacity
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.stats["rejected"] += 1
+                logger.warning(
+                    f"⚠️ RAG pipeline overloaded: {self._in_flight}/{self.capacity} in flight"
+                )
+                raise PipelineOverloadedError(self._in_flight, self.capacity)
+            self._in_flight += 1
+            self.stats["submitted"] += 1
+
+        # Keep context vars (request id, tracing) inside the worker thread
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        try:
+            future = self._executor.submit(call)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        # Slot is freed when the job finishes, even if the client disconnects
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics."""
+        with self._lock:
+            return {
+                **self.stats,
+                "in_flight": self._in_flight,
+                "running": min(self._in_flight, self.max_workers),
+                "queued": max(0, self._in_flight - self.max_workers),
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+            }
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait)
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_pipeline_executor: Optional[PipelineExecutor] = None
+_pipeline_executor_lock = threading.Lock()
+
+
+def get_pipeline_executor() -> PipelineExecutor:
+    """Get singleton PipelineExecutor (thread-safe lazy initialization)."""
+    global _pipeline_executor
+
+    if _pipeline_executor is not None:
+        return _pipeline_executor
+
+    with _pipeline_executor_lock:
+        if _pipeline_executor is None:
+            _pipeline_executor = PipelineExecutor()
+            logger.info(
+                f"✅ RAG pipeline executor initialized: "
+                f"workers={_pipeline_executor.max_workers}, "
+                f"max_pending={_pipeline_executor.max_pending}"
+            )
+        return _pipeline_executor
+
+
+async def run_in_pipeline(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking RAG pipeline stage on the shared bounded executor."""
+    return await get_pipeline_executor().run(func, *args, **kwargs)
+
+
+def shutdown_pipeline_executor(wait: bool = False):
+    """Shut down the executor (application shutdown / tests)."""
+    global _pipeline_executor
+    with _pipeline_executor_lock:
+        if _pipeline_executor is not None:
+            _pipeline_executor.shutdown(wait=wait)
+        _pipeline_executor = None
@@ -0,0 +1,54 @@
+"""
+Server-Sent Events helpers for streaming RAG answers
+
+Event stream format (``text/event-stream``):
+
+    event: metadata
+    data: {"mode": "balanced", "docs_retrieved": 5, "retrieval_time_ms": 812}
+
+    event: token
+    data: {"text": "Theo Điều 5 "}
+
+    event: done
+    data: {... full result, "time_to_first_token_ms": 1240}
+
+Errors raised while streaming are sent as an ``error`` event, since the
+HTTP status has already been committed.
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Tuple
+
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one SSE frame."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def _encode_events(
+    events: AsyncIterator[Tuple[str, Dict[str, Any]]],
+) -> AsyncIterator[str]:
+    try:
+        async for event, data in events:
+            yield format_sse(event, data)
+    except Exception as e:
+        logger.error(f"❌ Streaming error: {e}")
+        yield format_sse("error", {"message": str(e)})
+
+
+def sse_response(events: AsyncIterator[Tuple[str, Dict[str, Any]]]) -> StreamingResponse:
+    """Wrap an async iterator of (event, data) tuples in an SSE response."""
+    return StreamingResponse(
+        _encode_events(events),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        },
+    )
@@ -83,7 +83,8 @@ class SummaryService:
         Build context string for RAG pipeline.
 
         Uses hybrid approach:
-        - Include conversation summary (if exists)
+        - Include conversation summary (if exists; the latest one written
+          by the summary worker, which may lag a few messages behind)
         - Include last N messages (from cache or DB)
         - Format for LLM consumption
 
@@ -0,0 +1,327 @@
+"""
+Summary Worker - Background conversation summarization
+
+ConversationService used to call SummaryService.generate_summary inline at
+the end of every Nth message, adding a whole LLM call to that request's
+latency. Summaries are now queued and written by a background worker:
+
+- Queue: Redis sorted set (shared by all API workers) when
+  ENABLE_REDIS_CACHE is on, in-process otherwise or if Redis fails
+- Coalescing: one queue entry per conversation; repeated requests while it
+  is pending are dropped (the worker summarizes the latest messages anyway)
+- build_context_for_rag keeps using the last stored summary until the new
+  one is written
+
+Metrics (get_stats): queue depth, oldest pending age, summary lag
+(enqueue → summary written), processed/failed/coalesced counts.
+
+Usage:
+    from src.api.services.summary_worker import get_summary_worker
+
+    get_summary_worker().enqueue(conversation_id)
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.config.feature_flags import (
+    ENABLE_REDIS_CACHE,
+    REDIS_HOST,
+    REDIS_PORT,
+    SUMMARY_QUEUE_REDIS_DB,
+    SUMMARY_WORKER_THREADS,
+)
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_QUEUE_KEY = "summary:queue"
+POLL_INTERVAL_SECONDS = 1.0
+
+QueueItem = Tuple[str, float]  # (conversation_id, enqueued_at)
+
+
+class InMemorySummaryQueue:
+    """Per-process queue; insertion ordered, one entry per conversation."""
+
+    backend = "memory"
+
+    def __init__(self):
+        self._items: "OrderedDict[str, float]" = OrderedDict()
+        self._cond = threading.Condition()
+
+    def push(self, conversation_id: str, enqueued_at: float) -> bool:
+        """Returns False if the conversation was already pending (coalesced)."""
+        with self._cond:
+            if conversation_id in self._items:
+                return False
+            self._items[conversation_id] = enqueued_at
+            self._cond.notify()
+            return True
+
+    def pop(self, timeout: float) -> Optional[QueueItem]:
+        with self._cond:
+            if not self._items and timeout > 0:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            return self._items.popitem(last=False)
+
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+    def oldest_enqueued_at(self) -> Optional[float]:
+        with self._cond:
+            return next(iter(self._items.values()), None)
+
+
+class RedisSummaryQueue:
+    """Sorted set scored by first enqueue time; ZADD NX coalesces."""
+
+    backend = "redis"
+
+    def __init__(self, client: Any, key: str = SUMMARY_QUEUE_KEY):
+        self.redis = client
+        self.key = key
+
+    def push(self, conversation_id: str, enqueued_at: float) -> bool:
+        return bool(self.redis.zadd(self.key, {conversation_id: enqueued_at}, nx=True))
+
+    def pop(self, timeout: float) -> Optional[QueueItem]:
+        if timeout > 0:
+            result = self.redis.bzpopmin(self.key, timeout=math.ceil(timeout))
+            if not result:
+                return None
+            _, member, score = result
+        else:
+            result = self.redis.zpopmin(self.key)
+            if not result:
+                return None
+            member, score = result[0]
+        return member, float(score)
+
+    def depth(self) -> int:
+        return int(self.redis.zcard(self.key))
+
+    def oldest_enqueued_at(self) -> Optional[float]:
+        oldest = self.redis.zrange(self.key, 0, 0, withscores=True)
+        return float(oldest[0][1]) if oldest else None
+
+
+def _create_queue():
+    """Redis queue if enabled and reachable, else in-process."""
+    if ENABLE_REDIS_CACHE:
+        try:
+            import redis
+
+            client = redis.Redis(
+                host=REDIS_HOST,
+                port=REDIS_PORT,
+                db=SUMMARY_QUEUE_REDIS_DB,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=POLL_INTERVAL_SECONDS + 5,  # > blocking pop
+            )
+            client.ping()
+            logger.info(f"✅ Summary queue: Redis DB {SUMMARY_QUEUE_REDIS_DB}")
+            return RedisSummaryQueue(client)
+        except Exception as e:
+            logger.warning(f"⚠️ Summary queue Redis unavailable ({e}), using in-process")
+    return InMemorySummaryQueue()
+
+
+def _generate_summary(conversation_id: UUID) -> Optional[str]:
+    """Default job: summarize in a fresh DB session."""
+    from src.api.services.summary_service import SummaryService
+    from src.models.base import SessionLocal
+
+    db = SessionLocal()
+    try:
+        # Enqueueing already decided it is due; message_count may have moved
+        # past the should_update_summary boundary since then
+        return SummaryService.generate_summary(db, conversation_id, force=True)
+    finally:
+        db.close()
+
+
+class SummaryWorker:
+    """Background threads draining the summary queue."""
+
+    def __init__(
+        self,
+        summarize_fn: Callable[[UUID], Any] = _generate_summary,
+        queue: Any = None,
+        threads: int = SUMMARY_WORKER_THREADS,
+        autostart: bool = True,
+        clock: Callable[[], float] = time.time,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+    ):
+        self.summarize_fn = summarize_fn
+        self.queue = queue if queue is not None else _create_queue()
+        self.threads = max(1, threads)
+        self.autostart = autostart
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._fallback = InMemorySummaryQueue()  # used if Redis fails at runtime
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._workers: List[threading.Thread] = []
+        self.stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "processed": 0,
+            "failed": 0,
+            "queue_errors": 0,
+        }
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+
+    def enqueue(self, conversation_id: UUID) -> bool:
+        """
+        Request a summary for a conversation (non-blocking).
+
+        Returns:
+            True if queued, False if one was already pending (coalesced)
+        """
+        now = self._clock()
+        try:
+            added = self.queue.push(str(conversation_id), now)
+        except Exception as e:
+            logger.warning(f"⚠️ Summary queue push failed ({e}), queued in-process")
+            with self._lock:
+                self.stats["queue_errors"] += 1
+            added = self._fallback.push(str(conversation_id), now)
+
+        with self._lock:
+            self.stats["enqueued" if added else "coalesced"] += 1
+        if self.autostart:
+            self.start()
+        return added
+
+    def start(self):
+        """Start worker threads (idempotent)."""
+        with self._lock:
+            if self._workers or self._stop.is_set():
+                return
+            for i in range(self.threads):
+                thread = threading.Thread(
+                    target=self._run, name=f"summary-worker-{i}", daemon=True
+                )
+                thread.start()
+                self._workers.append(thread)
+        logger.info(f"✅ Summary worker started ({self.threads} threads, {self.queue.backend})")
+
+    def _next(self, timeout: float) -> Optional[QueueItem]:
+        item = self._fallback.pop(0)
+        if item is not None:
+            return item
+        try:
+            return self.queue.pop(timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ Summary queue pop failed: {e}")
+            with self._lock:
+                self.stats["queue_errors"] += 1
+            self._stop.wait(timeout)
+            return None
+
+    def _run(self):
+        while not self._stop.is_set():
+            item = self._next(self.poll_interval)
+            if item is not None:
+                self._process(*item)
+
+    def run_pending(self) -> int:
+        """Process everything queued now in the calling thread (tests, scripts)."""
+        processed = 0
+        while True:
+            item = self._next(0)
+            if item is None:
+                return processed
+            self._process(*item)
+            processed += 1
+
+    def _process(self, conversation_id: str, enqueued_at: float):
+        try:
+            self.summarize_fn(UUID(conversation_id))
+            ok = True
+        except Exception as e:
+            logger.error(f"❌ Summary failed for conversation {conversation_id}: {e}")
+            ok = False
+
+        lag = max(0.0, self._clock() - enqueued_at)
+        with self._lock:
+            self.stats["processed" if ok else "failed"] += 1
+            self._last_lag = lag
+            self._max_lag = max(self._max_lag, lag)
+            self._total_lag += lag
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and summary lag metrics."""
+        try:
+            depth = self.queue.depth()
+            oldest = self.queue.oldest_enqueued_at()
+        except Exception:
+            depth, oldest = None, None
+        depth = (depth or 0) + self._fallback.depth()
+        fallback_oldest = self._fallback.oldest_enqueued_at()
+        if fallback_oldest is not None:
+            oldest = min(oldest, fallback_oldest) if oldest else fallback_oldest
+
+        with self._lock:
+            done = self.stats["processed"] + self.stats["failed"]
+            return {
+                **self.stats,
+                "backend": self.queue.backend,
+                "threads": len(self._workers),
+                "queue_depth": depth,
+                "oldest_pending_age_s": (
+                    round(self._clock() - oldest, 3) if oldest else 0.0
+                ),
+                "summary_lag_s": {
+                    "last": round(self._last_lag, 3),
+                    "avg": round(self._total_lag / done, 3) if done else 0.0,
+                    "max": round(self._max_lag, 3),
+                },
+            }
+
+    def shutdown(self, wait: bool = False):
+        self._stop.set()
+        if wait:
+            for thread in self._workers:
+                thread.join(timeout=self.poll_interval + 1)
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_summary_worker: Optional[SummaryWorker] = None
+_summary_worker_lock = threading.Lock()
+
+
+def get_summary_worker() -> SummaryWorker:
+    """Get singleton SummaryWorker (thread-safe lazy initialization)."""
+    global _summary_worker
+
+    if _summary_worker is not None:
+        return _summary_worker
+
+    with _summary_worker_lock:
+        if _summary_worker is None:
+            _summary_worker = SummaryWorker()
+        return _summary_worker
+
+
+def shutdown_summary_worker(wait: bool = False):
+    """Stop the worker (application shutdown / tests)."""
+    global _summary_worker
+    with _summary_worker_lock:
+        if _summary_worker is not None:
+            _summary_worker.shutdown(wait=wait)
+        _summary_worker = None
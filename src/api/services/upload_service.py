@@ -5,7 +5,7 @@ Upload Processing Service - 2-Stage Workflow
 Stage 1: Upload & Extract
 - Receive files
 - Save to permanent storage (data/uploads/{upload_id}/)
-- Extract text and auto-classify
+- Extract text (in executor, cached next to the file for Stage 2) and auto-classify
 - Save to document_upload_jobs with status='pending_review'
 
 Stage 2: Admin Review & Confirm
@@ -17,6 +17,7 @@ Stage 2: Admin Review & Confirm
 
 import uuid
 import asyncio
+import functools
 import time
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -36,9 +37,27 @@ from ..schemas.upload_schemas import (
 from .document_classifier import DocumentClassifier
 from ...preprocessing.upload_pipeline import WorkingUploadPipeline
 from ...preprocessing.loaders import DocxLoader, PdfLoader, TxtLoader
+from ...preprocessing.loaders.doc_loader import DocLoader
+from ...preprocessing.extraction_cache import (
+    ExtractedDocument,
+    extraction_cache_path,
+    load_extraction,
+    save_extraction,
+)
+from ...preprocessing.utils.content_fingerprint import (
+    ContentFingerprint,
+    fingerprint_document,
+)
+from .duplicate_registry import DuplicateCheck, DuplicateRegistry
+from .document_catalog import refresh_document_catalog
 from ...preprocessing.utils.document_id_generator import DocumentIDGenerator
-from ...embedding.store.pgvector_store import PGVectorStore
+from ...embedding.store.bulk_writer import (
+    BulkChunkWriter,
+    ChunkRow,
+    attach_embeddings,
+)
 from ...config.models import settings
+from ...config.storage_provider import write_stream
 from ...config.database import get_db_sync
 from ...config.embedding_provider import get_default_embeddings
 
@@ -46,6 +65,15 @@ logger = logging.getLogger(__name__)
 
 # Base path for permanent file storage
 UPLOAD_STORAGE_BASE = Path(__file__).parent.parent.parent.parent / "data" / "uploads"
+MAX_UPLOAD_FILE_BYTES = 50 * 1024 * 1024
+
+
+class DuplicateUploadError(Exception):
+    """File content already exists as a document."""
+
+    def __init__(self, duplicate_of: Dict[str, Any]):
+        self.duplicate_of = duplicate_of
+        super().__init__(f"Duplicate of document {duplicate_of.get('document_id')}")
 
 
 class UploadJobRepository:
@@ -396,16 +424,18 @@ class UploadProcessingService:
         self.embedder = (
             get_default_embeddings()
         )  # Uses provider factory (OpenAI or Vertex AI)
-        self.vector_store = PGVectorStore()
         self.doc_id_generator = DocumentIDGenerator()
         self.job_repo = UploadJobRepository()
+        self.duplicate_registry = DuplicateRegistry()
         self.executor = ThreadPoolExecutor(max_workers=4)
 
         # Initialize working pipeline
         self.working_pipeline = WorkingUploadPipeline(enable_enrichment=True)
 
         # Loader mapping by file extension
+        # (.doc/.docx are extracted by the working pipeline's loaders)
         self.loaders = {
+            ".doc": DocLoader,
             ".docx": DocxLoader,
             ".pdf": PdfLoader,
             ".txt": TxtLoader,
@@ -440,7 +470,8 @@ class UploadProcessingService:
 
             # Save files and extract metadata
             files_data = []
-            extracted_metadata = {"files": []}
+            extracted_metadata = {"files": [], "duplicates": []}
+            batch_hashes: Dict[str, str] = {}  # hash -> filename within upload
 
             for file in validated_files:
                 file_id = str(uuid.uuid4())
@@ -448,40 +479,58 @@ class UploadProcessingService:
                 ext = Path(filename).suffix.lower()
                 file_path = storage_path / filename
 
-                # Save file content
-                content = await file.read()
-                file_path.write_bytes(content)
+                # Stream to disk in chunks (hashed on the fly), off the event loop
+                loop = asyncio.get_event_loop()
+                await file.seek(0)
+                size_bytes, content_sha256 = await loop.run_in_executor(
+                    self.executor,
+                    lambda: write_stream(
+                        file.file, file_path, max_bytes=MAX_UPLOAD_FILE_BYTES
+                    ),
+                )
                 await file.seek(0)
 
-                # Extract text preview and classify
-                text_preview = ""
-                doc_type = DocumentType.OTHER
-                confidence = 0.0
+                # Extract once (off the event loop), cache for Stage 2, classify
+                text_preview, doc_type, confidence, fingerprint = (
+                    await loop.run_in_executor(
+                        self.executor,
+                        self._extract_and_classify,
+                        file_path,
+                        filename,
+                        content_sha256,
+                    )
+                )
 
-                try:
-                    loader_class = self.loaders.get(ext)
-                    if loader_class:
-                        loader = loader_class()
-                        loaded_content = loader.load(str(file_path))
-                        full_text = (
-                            loaded_content.content
-                            if hasattr(loaded_content, "content")
-                            else str(loaded_content)
-                        )
-                        text_preview = full_text[:1000]  # First 1000 chars as preview
+                # Duplicate detection before anything is chunked or embedded
+                duplicate = await loop.run_in_executor(
+                    self.executor, self._check_duplicates, fingerprint, batch_hashes
+                )
+                if duplicate.is_exact:
+                    # Exact duplicate: short-circuit, keep nothing
+                    file_path.unlink(missing_ok=True)
+                    extraction_cache_path(file_path).unlink(missing_ok=True)
+                    extracted_metadata["duplicates"].append(
+                        {
+                            "filename": filename,
+                            "size_bytes": size_bytes,
+                            "duplicate_of": duplicate.exact,
+                        }
+                    )
+                    logger.info(
+                        f"⏭️  {filename} is a duplicate of {duplicate.exact}, skipped"
+                    )
+                    continue
 
-                        # Auto-classify
-                        doc_type, confidence, reasoning = (
-                            self.classifier.classify_document(filename, full_text)
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to extract text from {filename}: {e}")
+                batch_hashes[fingerprint.file_hash] = filename
+                if fingerprint.text_hash:
+                    batch_hashes[fingerprint.text_hash] = filename
 
                 file_info = {
                     "file_id": file_id,
                     "filename": filename,
                     "file_path": str(file_path),
-                    "size_bytes": len(content),
+                    "size_bytes": size_bytes,
+                    "sha256": content_sha256,
                     "content_type": file.content_type,
                     "extension": ext,
                 }
@@ -498,9 +547,20 @@ class UploadProcessingService:
                         ),
                         "confidence": confidence,
                         "text_preview": text_preview,
+                        "fingerprint": fingerprint.to_dict(),
+                        "near_duplicates": duplicate.near,
                     }
                 )
 
+            if not files_data:
+                raise HTTPException(
+                    status_code=409,
+                    detail={
+                        "message": "All files duplicate existing documents",
+                        "duplicates": extracted_metadata["duplicates"],
+                    },
+                )
+
             # Prepare options dict
             options_dict = None
             if options:
@@ -540,9 +600,14 @@ class UploadProcessingService:
                     for f in files_data
                 ],
                 "extracted_metadata": extracted_metadata,
+                "duplicates_skipped": extracted_metadata["duplicates"],
                 "message": "Files uploaded successfully. Awaiting admin review and confirmation.",
             }
 
+        except HTTPException:
+            if storage_path.exists():
+                shutil.rmtree(storage_path, ignore_errors=True)
+            raise
         except Exception as e:
             # Cleanup on failure
             if storage_path.exists():
@@ -583,6 +648,7 @@ class UploadProcessingService:
                     "extracted_text_preview": extracted.get("text_preview"),
                     "auto_detected_type": extracted.get("detected_type"),
                     "confidence": extracted.get("confidence"),
+                    "near_duplicates": extracted.get("near_duplicates", []),
                 }
             )
 
@@ -602,6 +668,10 @@ class UploadProcessingService:
                     extracted_files[0].get("confidence") if extracted_files else None
                 ),
             },
+            "duplicates_skipped": extracted_metadata.get("duplicates", []),
+            "has_near_duplicates": any(
+                ef.get("near_duplicates") for ef in extracted_files
+            ),
             "admin_metadata": job.get("admin_metadata", {}),
             "uploaded_by": job.get("uploaded_by"),
             "uploader_email": job.get("uploader_email"),
@@ -759,6 +829,17 @@ class UploadProcessingService:
                         "detected_type", "other"
                     )
 
+                    # Re-check exact duplicates (another upload may have been
+                    # confirmed since Stage 1) before chunking + embedding
+                    fingerprint = None
+                    if file_metadata.get("fingerprint"):
+                        fingerprint = ContentFingerprint.from_dict(
+                            file_metadata["fingerprint"]
+                        )
+                        duplicate = self._check_duplicates(fingerprint, near=False)
+                        if duplicate.is_exact:
+                            raise DuplicateUploadError(duplicate.exact)
+
                     # Process file
                     file_progress["progress_percent"] = 20
                     self.job_repo.update_progress(
@@ -776,29 +857,24 @@ class UploadProcessingService:
                         upload_id, progress_data, completed, failed
                     )
 
-                    # Convert chunks to LangChain Documents and store
-                    from langchain_core.documents import Document
-
                     if not chunks:
                         raise Exception("No chunks generated from document")
 
-                    documents = []
-                    for chunk in chunks:
-                        chunk_metadata = chunk.to_dict()
-                        chunk_metadata.pop("content", None)
-                        doc = Document(
-                            page_content=chunk.content, metadata=chunk_metadata
-                        )
-                        documents.append(doc)
+                    # Embed all chunks in one batched call; vectors are
+                    # written together with the chunk rows below. The job
+                    # runner blocks on rate limits and retry backoff, so it
+                    # runs in the executor, not on the event loop
+                    chunk_rows = [ChunkRow.from_chunk(chunk) for chunk in chunks]
+                    loop = asyncio.get_event_loop()
+                    await loop.run_in_executor(
+                        self.executor, attach_embeddings, chunk_rows, self.embedder
+                    )
 
                     file_progress["progress_percent"] = 70
                     self.job_repo.update_progress(
                         upload_id, progress_data, completed, failed
                     )
 
-                    # Store embeddings
-                    self.vector_store.add_documents(documents)
-
                     file_progress["progress_percent"] = 90
 
                     # Insert into documents table
@@ -833,21 +909,27 @@ class UploadProcessingService:
                             "category"
                         ) or category_mapping.get(doc_type, "Khác")
 
-                        doc_uuid = self._insert_into_documents_table(
-                            document_id=document_id,
-                            document_name=document_name,
-                            document_type=doc_type,
-                            category=category,
-                            filename=file_info["filename"],
-                            source_file=file_info["file_path"],
-                            total_chunks=len(chunks),
+                        # Document row + chunks + embeddings in one
+                        # transaction: a failed chunk write must not leave a
+                        # fingerprinted document that blocks re-uploads
+                        await loop.run_in_executor(
+                            self.executor,
+                            functools.partial(
+                                self._store_document,
+                                chunk_rows,
+                                document_id=document_id,
+                                document_name=document_name,
+                                document_type=doc_type,
+                                category=category,
+                                filename=file_info["filename"],
+                                source_file=file_info["file_path"],
+                                total_chunks=len(chunks),
+                                fingerprint=fingerprint,
+                            ),
+                        )
+                        await loop.run_in_executor(
+                            self.executor, refresh_document_catalog, [document_id]
                         )
-
-                        # Insert chunks into document_chunks table
-                        chunk_id_map = self._insert_chunks_to_db(doc_uuid, chunks)
-
-                        # Link embeddings to chunks
-                        self._link_embeddings_to_chunks(chunk_id_map)
 
                         file_progress["document_id"] = document_id
 
@@ -856,6 +938,13 @@ class UploadProcessingService:
                     file_progress["chunks_created"] = len(chunks)
                     completed += 1
 
+                except DuplicateUploadError as e:
+                    logger.info(f"⏭️  {file_info['filename']}: {e}, skipped")
+                    file_progress["status"] = "duplicate"
+                    file_progress["progress_percent"] = 100
+                    file_progress["document_id"] = e.duplicate_of.get("document_id")
+                    file_progress["error_message"] = str(e)
+
                 except Exception as e:
                     logger.error(f"Failed to process file {file_info['filename']}: {e}")
                     file_progress["status"] = "failed"
@@ -901,7 +990,7 @@ class UploadProcessingService:
         validated = []
         for file in files:
             filename = file.filename or f"unknown_file"
-            if hasattr(file, "size") and file.size and file.size > 50 * 1024 * 1024:
+            if hasattr(file, "size") and file.size and file.size > MAX_UPLOAD_FILE_BYTES:
                 raise ValueError(f"File {filename} exceeds 50MB limit")
 
             ext = Path(filename).suffix.lower()
@@ -912,14 +1001,98 @@ class UploadProcessingService:
 
         return validated
 
+    def _extract_file(self, file_path: Path) -> ExtractedDocument:
+        """Extract text with the same loaders Stage 2 chunks from."""
+        ext = file_path.suffix.lower()
+        if ext in (".doc", ".docx"):
+            return self.working_pipeline.extract(file_path)
+
+        loaded_content = self.loaders[ext]().load(str(file_path))
+        # RawPdfContent has .text, RawTxtContent has .content
+        text = getattr(loaded_content, "text", None)
+        if text is None:
+            text = getattr(loaded_content, "content", str(loaded_content))
+        return ExtractedDocument(
+            text=text,
+            extraction_method=f"{ext.lstrip('.')}_loader",
+            metadata=getattr(loaded_content, "metadata", None) or {},
+        )
+
+    def _extract_and_classify(self, file_path: Path, filename: str, file_hash: str):
+        """
+        Stage 1 extraction (runs in executor).
+
+        Returns:
+            (text_preview, doc_type, confidence, fingerprint)
+        """
+        try:
+            extracted = self._extract_file(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to extract text from {filename}: {e}")
+            # Raw bytes can still be matched exactly
+            return "", DocumentType.OTHER, 0.0, ContentFingerprint(file_hash, "")
+
+        try:
+            save_extraction(file_path, extracted)
+        except Exception as e:
+            logger.warning(f"Failed to cache extraction for {filename}: {e}")
+
+        doc_type, confidence = DocumentType.OTHER, 0.0
+        try:
+            doc_type, confidence, reasoning = self.classifier.classify_document(
+                filename, extracted.text
+            )
+        except Exception as e:
+            logger.warning(f"Failed to classify {filename}: {e}")
+
+        fingerprint = fingerprint_document(extracted.text, file_hash)
+        return extracted.text[:1000], doc_type, confidence, fingerprint  # 1000-char preview
+
+    def _check_duplicates(
+        self,
+        fingerprint: ContentFingerprint,
+        batch_hashes: Optional[Dict[str, str]] = None,
+        near: bool = True,
+    ) -> DuplicateCheck:
+        """
+        Match against files earlier in this upload, then existing documents.
+
+        Empty text has no text_hash, so only its file hash can match.
+        """
+        for content_hash, match in (
+            (fingerprint.file_hash, "file"),
+            (fingerprint.text_hash, "text"),
+        ):
+            if batch_hashes and content_hash and content_hash in batch_hashes:
+                return DuplicateCheck(
+                    exact={
+                        "document_id": None,
+                        "document_name": batch_hashes[content_hash],
+                        "match": f"{match} (same upload)",
+                    }
+                )
+
+        try:
+            return self.duplicate_registry.check(fingerprint, near=near)
+        except Exception as e:
+            # Never block uploads on the registry
+            logger.warning(f"Duplicate check failed: {e}")
+            return DuplicateCheck()
+
     async def _run_working_pipeline(
         self, file_path: str, document_type: str, batch_name: Optional[str] = None
     ):
-        """Run document through working pipeline."""
+        """Run document through working pipeline (reusing Stage 1 extraction)."""
 
         def _sync_pipeline():
+            extracted = load_extraction(Path(file_path))
+            if extracted is None:
+                logger.info(f"Extraction cache miss, parsing {Path(file_path).name}")
             success, chunks, error_msg = self.working_pipeline.process_file(
-                Path(file_path), document_type=document_type, batch_name=batch_name
+                Path(file_path),
+                document_type=document_type,
+                batch_name=batch_name,
+                extracted=extracted,
             )
             if not success:
                 raise Exception(f"Pipeline failed: {error_msg}")
@@ -928,8 +1101,39 @@ class UploadProcessingService:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self.executor, _sync_pipeline)
 
+    def _store_document(self, chunk_rows: List[ChunkRow], **document) -> Any:
+        """
+        Insert the documents row and its chunks + embeddings in one transaction.
+
+        Args:
+            chunk_rows: Chunk rows (with vectors) of the document
+            **document: Arguments of _insert_into_documents_table
+
+        Returns:
+            Document UUID
+
+        Raises:
+            Exception: Database errors; nothing is committed
+        """
+        conn = get_db_sync()
+        try:
+            doc_uuid = self._insert_into_documents_table(conn, **document)
+            self._insert_chunks_to_db(doc_uuid, chunk_rows, conn)
+            conn.commit()
+            logger.info(
+                f"✅ Inserted document: {document['document_id']} "
+                f"({len(chunk_rows)} chunks)"
+            )
+            return doc_uuid
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
     def _insert_into_documents_table(
         self,
+        conn,
         document_id: str,
         document_name: str,
         document_type: str,
@@ -937,13 +1141,14 @@ class UploadProcessingService:
         filename: str,
         source_file: str,
         total_chunks: int,
+        fingerprint: Optional[ContentFingerprint] = None,
     ):
-        """Insert document record into documents table and return document UUID."""
-        conn = None
-        try:
-            conn = get_db_sync()
-            cursor = conn.cursor()
+        """
+        Insert document record into documents table and return document UUID.
 
+        Runs on the caller's connection; the caller commits or rolls back.
+        """
+        with conn.cursor() as cursor:
             # Validate document_name length (database limit is 500 chars)
             if len(document_name) > 500:
                 logger.warning(
@@ -958,15 +1163,25 @@ class UploadProcessingService:
                 INSERT INTO documents (
                     document_id, document_name, document_type, category,
                     filename, source_file, total_chunks, status,
+                    file_hash, text_hash, minhash_signature, minhash_bands,
                     created_at, updated_at
                 ) VALUES (
                     %(document_id)s, %(document_name)s, %(document_type)s, %(category)s,
                     %(filename)s, %(source_file)s, %(total_chunks)s, 'active',
+                    %(file_hash)s, %(text_hash)s, %(minhash_signature)s, %(minhash_bands)s,
                     NOW(), NOW()
                 )
                 ON CONFLICT (document_id) DO UPDATE SET
                     document_name = EXCLUDED.document_name,
                     total_chunks = EXCLUDED.total_chunks,
+                    file_hash = COALESCE(EXCLUDED.file_hash, documents.file_hash),
+                    text_hash = COALESCE(EXCLUDED.text_hash, documents.text_hash),
+                    minhash_signature = COALESCE(
+                        EXCLUDED.minhash_signature, documents.minhash_signature
+                    ),
+                    minhash_bands = COALESCE(
+                        EXCLUDED.minhash_bands, documents.minhash_bands
+                    ),
                     updated_at = NOW()
                 RETURNING id
             """,
@@ -978,127 +1193,42 @@ class UploadProcessingService:
                     "filename": filename,
                     "source_file": source_file,
                     "total_chunks": total_chunks,
+                    "file_hash": fingerprint.file_hash if fingerprint else None,
+                    "text_hash": (fingerprint.text_hash or None) if fingerprint else None,
+                    "minhash_signature": (
+                        fingerprint.minhash or None if fingerprint else None
+                    ),
+                    "minhash_bands": (
+                        fingerprint.bands or None
+                        if fingerprint and fingerprint.minhash
+                        else None
+                    ),
                 },
             )
             result = cursor.fetchone()
-            doc_uuid = result[0] if result else None
-            conn.commit()
-            logger.info(f"✅ Inserted document: {document_id} ({total_chunks} chunks)")
-            return doc_uuid
-        except Exception as e:
-            logger.error(f"❌ Failed to insert document: {e}")
-            if conn:
-                conn.rollback()
-            return None
-        finally:
-            if conn:
-                conn.close()
+        if not result:
+            raise Exception("Failed to insert document record")
+        return result[0]
 
-    def _insert_chunks_to_db(self, doc_uuid, chunks: list) -> dict:
+    def _insert_chunks_to_db(self, doc_uuid, chunk_rows: List[ChunkRow], conn) -> dict:
         """
-        Insert chunks into document_chunks table and return mapping chunk_id -> uuid.
+        Bulk upsert chunks into document_chunks and their embeddings into
+        langchain_pg_embedding (chunk_id FK set at insert time), on the
+        caller's connection.
 
         Returns:
             Dict mapping chunk_id string -> chunk UUID
-        """
-        if not doc_uuid:
-            return {}
-
-        conn = None
-        chunk_id_map = {}
-
-        try:
-            conn = get_db_sync()
-            cursor = conn.cursor()
-
-            for chunk in chunks:
-                chunk_dict = chunk.to_dict()
-                chunk_id = (
-                    chunk_dict.get("chunk_id")
-                    or f"{chunk_dict.get('document_id')}_{chunk_dict.get('chunk_index', 0)}"
-                )
 
-                cursor.execute(
-                    """
-                    INSERT INTO document_chunks (
-                        document_id, chunk_id, content, chunk_index,
-                        section_title, hierarchy_path, keywords,
-                        char_count, created_at, updated_at
-                    ) VALUES (
-                        %(document_id)s, %(chunk_id)s, %(content)s, %(chunk_index)s,
-                        %(section_title)s, %(hierarchy_path)s, %(keywords)s,
-                        %(char_count)s, NOW(), NOW()
-                    )
-                    ON CONFLICT (chunk_id) DO UPDATE SET
-                        content = EXCLUDED.content,
-                        updated_at = NOW()
-                    RETURNING id
-                """,
-                    {
-                        "document_id": doc_uuid,
-                        "chunk_id": chunk_id,
-                        "content": chunk.content,
-                        "chunk_index": chunk_dict.get("chunk_index", 0),
-                        "section_title": chunk_dict.get("section_title"),
-                        "hierarchy_path": chunk_dict.get("hierarchy_path"),
-                        "keywords": chunk_dict.get("keywords"),
-                        "char_count": len(chunk.content),
-                    },
-                )
-
-                result = cursor.fetchone()
-                if result:
-                    chunk_id_map[chunk_id] = result[0]
-
-            conn.commit()
-            logger.info(f"✅ Inserted {len(chunk_id_map)} chunks into document_chunks")
-            return chunk_id_map
-
-        except Exception as e:
-            logger.error(f"❌ Failed to insert chunks: {e}")
-            if conn:
-                conn.rollback()
-            return {}
-        finally:
-            if conn:
-                conn.close()
-
-    def _link_embeddings_to_chunks(self, chunk_id_map: dict):
+        Raises:
+            Exception: Database errors, so the file is marked failed instead
+                of completing without searchable embeddings
         """
-        Update langchain_pg_embedding to set chunk_id references.
-        """
-        if not chunk_id_map:
-            return
-
-        conn = None
         try:
-            conn = get_db_sync()
-            cursor = conn.cursor()
-
-            updated = 0
-            for chunk_id_str, chunk_uuid in chunk_id_map.items():
-                cursor.execute(
-                    """
-                    UPDATE langchain_pg_embedding 
-                    SET chunk_id = %(chunk_uuid)s
-                    WHERE cmetadata->>'chunk_id' = %(chunk_id)s
-                    AND chunk_id IS NULL
-                """,
-                    {"chunk_uuid": chunk_uuid, "chunk_id": chunk_id_str},
-                )
-                updated += cursor.rowcount
-
-            conn.commit()
-            if updated > 0:
-                logger.info(f"✅ Linked {updated} embeddings to chunks")
-
+            result = BulkChunkWriter().write(doc_uuid, chunk_rows, conn=conn)
+            return result.chunk_id_map
         except Exception as e:
-            logger.error(f"❌ Failed to link embeddings to chunks: {e}")
-            if conn:
-                conn.rollback()
-        finally:
-            if conn:
-                conn.close()
+            logger.error(f"❌ Failed to insert chunks: {e}")
+            raise
 
     # Legacy method for backward compatibility
     async def get_processing_status(self, upload_id: str) -> Dict[str, Any]:
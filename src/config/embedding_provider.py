@@ -24,7 +24,7 @@ Switching providers requires re-embedding all documents in PGVector!
 import os
 import logging
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 
 from langchain_core.embeddings import Embeddings
 
@@ -98,6 +98,24 @@ def get_embedding_dimension(model: str) -> int:
     return EMBEDDING_DIMENSIONS.get(model, 768)
 
 
+def get_default_embedding_identity() -> Tuple[str, int]:
+    """
+    Model name and output dimension of the default embeddings client.
+
+    Used wherever vectors must be keyed by what produced them
+    (embedding cache, incremental re-indexing).
+
+    Returns:
+        (model, dimension)
+    """
+    from src.config.models import settings
+
+    if settings.embed_provider == "openai":
+        model = settings.embed_model
+        return model, get_embedding_dimension(model)
+    return settings.vertex_embed_model, settings.embed_dimensions
+
+
 def get_embeddings(
     provider: Optional[str] = None,
     model: Optional[str] = None,
@@ -203,7 +221,8 @@ def get_default_embeddings() -> Embeddings:
     Get or create default embeddings client (singleton pattern).
     
     Thread-safe singleton that creates embeddings client based on 
-    EMBED_PROVIDER environment variable.
+    EMBED_PROVIDER environment variable. When CACHE_EMBEDDINGS is enabled
+    the client is wrapped with CachedEmbeddings (L1 memory + L2 Redis).
     
     Returns:
         Embeddings: The default embedding client
@@ -219,17 +238,35 @@ def get_default_embeddings() -> Embeddings:
             # Double-check locking pattern
             if _default_embeddings is None:
                 from src.config.models import settings
-                _default_embeddings = get_embeddings()
-                model = (
-                    settings.embed_model 
-                    if settings.embed_provider == "openai" 
-                    else settings.vertex_embed_model
-                )
+                embeddings = get_embeddings()
+                model, dimension = get_default_embedding_identity()
+                
+                # Wrap with L1/L2 embedding cache (CACHE_EMBEDDINGS env var)
+                if settings.cache_embeddings:
+                    from src.embedding.embedders.cached_embedder import (
+                        CachedEmbeddings,
+                    )
+                    
+                    # OpenAI and gemini (fixed task_type) embed queries and
+                    # documents identically, so query batches can share one call
+                    symmetric = (
+                        settings.embed_provider == "openai"
+                        or "gemini" in model.lower()
+                    )
+                    embeddings = CachedEmbeddings(
+                        embeddings,
+                        model=model,
+                        dimension=dimension,
+                        symmetric=symmetric,
+                    )
+                
+                _default_embeddings = embeddings
                 logger.info(
                     f"✅ Initialized default embeddings: "
                     f"provider={settings.embed_provider}, "
                     f"model={model}, "
-                    f"dimensions={get_embedding_dimension(model)}"
+                    f"dimensions={get_embedding_dimension(model)}, "
+                    f"cached={settings.cache_embeddings}"
                 )
     
     return _default_embeddings
@@ -81,6 +81,33 @@ CACHE_TTL_SESSIONS = 3600  # 1 hour (chat sessions)
 # L1 cache size (in-memory)
 L1_CACHE_MAXSIZE = 500  # Max 500 queries in memory (~50MB)
 
+# Embedding cache (wraps get_default_embeddings, toggled by CACHE_EMBEDDINGS)
+# L1 is per-worker memory, L2 reuses REDIS_DB_CACHE with CACHE_TTL_EMBEDDINGS
+EMBEDDING_CACHE_L1_SIZE = int(
+    os.getenv("EMBEDDING_CACHE_L1_SIZE", "2000")
+)  # ~12MB at 1536 dims
+
+# Ingestion embedding jobs: concurrent, token-packed batches under the
+# provider's rate limits (see src/embedding/embedders/embedding_jobs.py)
+EMBEDDING_JOB_MAX_CONCURRENCY = int(
+    os.getenv("EMBEDDING_JOB_MAX_CONCURRENCY", "4")
+)  # In-flight embedding requests
+EMBEDDING_JOB_TPM_LIMIT = int(
+    os.getenv("EMBEDDING_JOB_TPM_LIMIT", "1000000")
+)  # Tokens per minute budget (0 = unlimited)
+EMBEDDING_JOB_RPM_LIMIT = int(
+    os.getenv("EMBEDDING_JOB_RPM_LIMIT", "3000")
+)  # Requests per minute budget (0 = unlimited)
+EMBEDDING_JOB_BATCH_MAX_TOKENS = int(
+    os.getenv("EMBEDDING_JOB_BATCH_MAX_TOKENS", "50000")
+)  # Texts are packed into a request until this many tokens
+EMBEDDING_JOB_BATCH_MAX_SIZE = int(
+    os.getenv("EMBEDDING_JOB_BATCH_MAX_SIZE", "256")
+)  # ... or this many texts
+EMBEDDING_JOB_MAX_RETRIES = int(
+    os.getenv("EMBEDDING_JOB_MAX_RETRIES", "5")
+)  # Exponential backoff retries per batch before splitting it
+
 
 # ========================================
 # ANSWER CACHE CONFIGURATION (Phase 1)
@@ -105,7 +132,15 @@ SEMANTIC_CACHE_DB = int(
 )  # Redis DB 3 for embeddings
 MAX_SEMANTIC_SEARCH = int(
     os.getenv("MAX_SEMANTIC_SEARCH", "100")
-)  # Max queries to scan
+)  # Legacy SCAN cap (deprecated, pre-filter now uses the in-memory index)
+
+# In-memory embedding index (replaces Redis SCAN in the cosine pre-filter)
+SEMANTIC_CACHE_INDEX_SYNC_INTERVAL = float(
+    os.getenv("SEMANTIC_CACHE_INDEX_SYNC_INTERVAL", "30")
+)  # Seconds between incremental syncs with Redis (entries from other workers)
+SEMANTIC_CACHE_ANN_MIN_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_ANN_MIN_SIZE", "20000")
+)  # Switch to HNSW (hnswlib, optional) above this many cached queries
 
 # V2 Hybrid Cache Configuration (Cosine pre-filter + BGE rerank)
 # Cosine pre-filter: Fast O(n) scan to find candidates
@@ -139,6 +174,17 @@ ENABLE_REDIS_SESSIONS = os.getenv("ENABLE_REDIS_SESSIONS", "false").lower() == "
 SESSION_TTL_SECONDS = 3600  # 1 hour
 SESSION_MAX_MESSAGES = 100  # Max messages per session
 
+# Conversation summaries are generated off the request path by a background
+# worker (see src/api/services/summary_worker.py). Queue lives in Redis
+# (shared by all workers) when ENABLE_REDIS_CACHE is on, else in-process.
+ENABLE_ASYNC_SUMMARY = os.getenv("ENABLE_ASYNC_SUMMARY", "true").lower() == "true"
+SUMMARY_QUEUE_REDIS_DB = int(
+    os.getenv("SUMMARY_QUEUE_REDIS_DB", str(REDIS_DB_SESSIONS))
+)  # Conversation-scoped data, shares the sessions DB by default
+SUMMARY_WORKER_THREADS = int(
+    os.getenv("SUMMARY_WORKER_THREADS", "1")
+)  # Concurrent summary LLM calls per process
+
 
 # ========================================
 # RERANKING CONFIGURATION
@@ -155,6 +201,28 @@ DEFAULT_RERANKER_TYPE: Literal["bge", "openai", "vertex"] = (
 BGE_MODEL_NAME = "BAAI/bge-reranker-v2-m3"
 BGE_DEVICE = "auto"  # auto-detect GPU/CPU
 
+# BGE micro-batching: pairs from concurrent requests share one predict() call
+BGE_MICRO_BATCH_ENABLED = os.getenv("BGE_MICRO_BATCH_ENABLED", "true").lower() == "true"
+BGE_MICRO_BATCH_MAX_WAIT_MS = float(
+    os.getenv("BGE_MICRO_BATCH_MAX_WAIT_MS", "5")
+)  # Max time the first request waits for others to join
+BGE_MICRO_BATCH_MAX_PAIRS = int(
+    os.getenv("BGE_MICRO_BATCH_MAX_PAIRS", "64")
+)  # Flush as soon as this many pairs are queued
+BGE_MICRO_BATCH_TIMEOUT_S = float(
+    os.getenv("BGE_MICRO_BATCH_TIMEOUT_S", "30")
+)  # Max time a rerank request waits for its micro-batch result
+
+# Rerank score cache: (query, chunk, model) → score, shared by BGE/OpenAI
+# L2 reuses REDIS_DB_CACHE when ENABLE_REDIS_CACHE is on
+ENABLE_RERANK_SCORE_CACHE = (
+    os.getenv("ENABLE_RERANK_SCORE_CACHE", "true").lower() == "true"
+)
+RERANK_SCORE_CACHE_L1_SIZE = int(os.getenv("RERANK_SCORE_CACHE_L1_SIZE", "20000"))
+RERANK_SCORE_CACHE_TTL = int(
+    os.getenv("RERANK_SCORE_CACHE_TTL", "86400")
+)  # 24 hours, chunk edits miss via content hash
+
 # OpenAI Reranker settings
 OPENAI_RERANKER_MODEL = "gpt-4o-mini"
 OPENAI_RERANKER_USE_PARALLEL = True  # Parallel API calls (8.38x faster)
@@ -172,6 +240,39 @@ DEFAULT_ENHANCEMENT_STRATEGIES = ["multi_query", "step_back"]  # balanced mode
 DEFAULT_RETRIEVAL_K = 10  # Top-k documents to retrieve
 DEFAULT_RERANK_TOP_N = 5  # Top-n after reranking
 
+# Concurrent vector searches per request (Multi-Query / Fusion variants)
+PARALLEL_RETRIEVAL_MAX_WORKERS = int(os.getenv("PARALLEL_RETRIEVAL_MAX_WORKERS", "5"))
+
+# Metadata-filtered vector search pushed into SQL on promoted columns
+# (src/embedding/store/filtered_search.py) instead of over-fetch + slice
+ENABLE_FILTERED_VECTOR_SEARCH = (
+    os.getenv("ENABLE_FILTERED_VECTOR_SEARCH", "true").lower() == "true"
+)
+FILTERED_SEARCH_EF_SEARCH = int(
+    os.getenv("FILTERED_SEARCH_EF_SEARCH", "100")
+)  # hnsw.ef_search for filtered queries
+FILTERED_SEARCH_MAX_SCAN_TUPLES = int(
+    os.getenv("FILTERED_SEARCH_MAX_SCAN_TUPLES", "20000")
+)  # Iterative scan budget (pgvector >= 0.8)
+
+# In-memory document status map kept current by LISTEN/NOTIFY on documents
+# (src/retrieval/document_status.py) instead of a documents query per answer
+ENABLE_DOCUMENT_STATUS_MAP = (
+    os.getenv("ENABLE_DOCUMENT_STATUS_MAP", "true").lower() == "true"
+)
+DEMOTE_INACTIVE_DOCUMENTS = (
+    os.getenv("DEMOTE_INACTIVE_DOCUMENTS", "true").lower() == "true"
+)  # Move expired/superseded chunks after active ones in retrieval results
+DOCUMENT_STATUS_MAP_MAX_AGE_SECONDS = int(
+    os.getenv("DOCUMENT_STATUS_MAP_MAX_AGE_SECONDS", "300")
+)  # Full reload interval while no LISTEN connection is up (e.g. PgBouncer)
+
+# Bounded executor for the blocking RAG pipeline (chat /messages and /ask)
+RAG_EXECUTOR_MAX_WORKERS = int(os.getenv("RAG_EXECUTOR_MAX_WORKERS", "16"))
+RAG_EXECUTOR_MAX_PENDING = int(
+    os.getenv("RAG_EXECUTOR_MAX_PENDING", "64")
+)  # Queued requests before rejecting with 503
+
 # ========================================
 # RATE LIMITING CONFIGURATION
 # ========================================
@@ -234,6 +335,20 @@ def get_feature_status() -> dict:
                 "✅ Production ready" if ENABLE_REDIS_CACHE else "⚠️ Development mode"
             ),
         },
+        "embedding_cache": {
+            "l1_size": EMBEDDING_CACHE_L1_SIZE,
+            "ttl_seconds": CACHE_TTL_EMBEDDINGS,
+            "redis_db": REDIS_DB_CACHE,
+            "l2_enabled": ENABLE_REDIS_CACHE,
+        },
+        "embedding_jobs": {
+            "max_concurrency": EMBEDDING_JOB_MAX_CONCURRENCY,
+            "tpm_limit": EMBEDDING_JOB_TPM_LIMIT,
+            "rpm_limit": EMBEDDING_JOB_RPM_LIMIT,
+            "batch_max_tokens": EMBEDDING_JOB_BATCH_MAX_TOKENS,
+            "batch_max_size": EMBEDDING_JOB_BATCH_MAX_SIZE,
+            "max_retries": EMBEDDING_JOB_MAX_RETRIES,
+        },
         "answer_cache": {
             "enabled": ENABLE_ANSWER_CACHE,
             "ttl_seconds": ANSWER_CACHE_TTL,
@@ -248,7 +363,10 @@ def get_feature_status() -> dict:
             "enabled": ENABLE_SEMANTIC_CACHE,
             "version": "V2 (Hybrid Cosine + BGE)",
             "redis_db": SEMANTIC_CACHE_DB,
-            "max_scan": MAX_SEMANTIC_SEARCH,
+            "index": {
+                "sync_interval_seconds": SEMANTIC_CACHE_INDEX_SYNC_INTERVAL,
+                "ann_min_size": SEMANTIC_CACHE_ANN_MIN_SIZE,
+            },
             "config": {
                 "cosine_threshold": SEMANTIC_CACHE_COSINE_THRESHOLD,
                 "cosine_top_k": SEMANTIC_CACHE_COSINE_TOP_K,
@@ -272,14 +390,37 @@ def get_feature_status() -> dict:
                 "✅ Production ready" if ENABLE_REDIS_SESSIONS else "⚠️ Development mode"
             ),
         },
+        "summary_worker": {
+            "enabled": ENABLE_ASYNC_SUMMARY,
+            "queue": "Redis" if ENABLE_REDIS_CACHE else "In-Memory",
+            "redis_db": SUMMARY_QUEUE_REDIS_DB,
+            "threads": SUMMARY_WORKER_THREADS,
+        },
         "reranking": {
             "default_type": DEFAULT_RERANKER_TYPE,
             "bge_singleton": "✅ Enabled",
+            "bge_micro_batching": (
+                f"✅ Enabled (max_wait={BGE_MICRO_BATCH_MAX_WAIT_MS}ms, "
+                f"max_pairs={BGE_MICRO_BATCH_MAX_PAIRS}, "
+                f"timeout={BGE_MICRO_BATCH_TIMEOUT_S}s)"
+                if BGE_MICRO_BATCH_ENABLED
+                else "❌ Disabled"
+            ),
             "openai_parallel": (
                 "✅ Enabled" if OPENAI_RERANKER_USE_PARALLEL else "❌ Sequential"
             ),
             "status": "✅ Production ready",
         },
+        "filtered_vector_search": {
+            "enabled": ENABLE_FILTERED_VECTOR_SEARCH,
+            "ef_search": FILTERED_SEARCH_EF_SEARCH,
+            "max_scan_tuples": FILTERED_SEARCH_MAX_SCAN_TUPLES,
+        },
+        "document_status_map": {
+            "enabled": ENABLE_DOCUMENT_STATUS_MAP,
+            "demote_inactive": DEMOTE_INACTIVE_DOCUMENTS,
+            "max_age_seconds": DOCUMENT_STATUS_MAP_MAX_AGE_SECONDS,
+        },
     }
 
 
@@ -150,6 +150,17 @@ class RAGPresets:
             "parallel_processing": True,
         }
 
+    @staticmethod
+    def get_hybrid_mode() -> Dict[str, object]:
+        # Lexical + vector search with RRF replaces LLM query enhancement
+        return {
+            "enable_query_enhancement": False,
+            "enable_reranking": False,
+            "enable_answer_validation": False,
+            "retrieval_k": 5,
+            "parallel_processing": True,
+        }
+
     @staticmethod
     def get_quality_mode() -> Dict[str, object]:
         return {
@@ -179,6 +190,7 @@ def apply_preset(preset_name: str) -> None:
     """Apply configuration preset to global settings."""
     presets = {
         "fast": RAGPresets.get_fast_mode(),
+        "hybrid": RAGPresets.get_hybrid_mode(),
         "balanced": RAGPresets.get_balanced_mode(),
         "quality": RAGPresets.get_quality_mode(),
         # NOTE: adaptive removed - use balanced as default
@@ -186,7 +198,7 @@ def apply_preset(preset_name: str) -> None:
 
     if preset_name not in presets:
         raise ValueError(
-            f"Unknown preset: {preset_name}. Available: fast, balanced, quality"
+            f"Unknown preset: {preset_name}. Available: fast, hybrid, balanced, quality"
         )
 
     settings.rag_mode = preset_name
@@ -6,18 +6,109 @@ Provides unified interface for file storage operations across:
 - Google Cloud Storage (production environment)
 
 Auto-switches based on USE_GCS_STORAGE environment variable.
+
+Large files should use the streaming methods (upload_stream / open_read):
+content moves in STREAM_CHUNK_SIZE blocks and is SHA-256 hashed on the
+fly, so memory stays bounded regardless of file size.
 """
 
 import os
+import hashlib
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Protocol, runtime_checkable
+from typing import BinaryIO, Iterator, Optional, Protocol, Tuple, runtime_checkable
 
 from .models import settings
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MB (multiple of GCS's 256 KB chunk unit)
+
+
+@dataclass
+class StoredFile:
+    """Result of a streamed upload."""
+    
+    location: str  # local path or gs:// URI
+    size_bytes: int
+    sha256: str
+
+
+class HashingReader:
+    """File-like wrapper that hashes and counts bytes as they are read."""
+    
+    def __init__(self, stream: BinaryIO, max_bytes: Optional[int] = None):
+        self._stream = stream
+        self._max_bytes = max_bytes
+        self._hash = hashlib.sha256()
+        self.size_bytes = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self.size_bytes += len(data)
+        if self._max_bytes is not None and self.size_bytes > self._max_bytes:
+            raise ValueError(f"Stream exceeds {self._max_bytes} bytes")
+        self._hash.update(data)
+        return data
+    
+    def tell(self) -> int:
+        return self.size_bytes
+    
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+
+def write_stream(
+    stream: BinaryIO,
+    file_path: Path,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    max_bytes: Optional[int] = None,
+) -> Tuple[int, str]:
+    """
+    Copy a stream to a local file block by block (atomic rename).
+    
+    Returns:
+        (size_bytes, sha256)
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(file_path.name + ".part")
+    reader = HashingReader(stream, max_bytes=max_bytes)
+    
+    try:
+        with open(tmp_path, "wb") as f:
+            for block in iter(lambda: reader.read(chunk_size), b""):
+                f.write(block)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    
+    return reader.size_bytes, reader.sha256
+
+
+def iter_stream(
+    stream: BinaryIO,
+    length: Optional[int] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield up to `length` bytes (all if None) from a stream, then close it."""
+    try:
+        remaining = length
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            block = stream.read(size)
+            if not block:
+                break
+            if remaining is not None:
+                remaining -= len(block)
+            yield block
+    finally:
+        stream.close()
+
 
 @runtime_checkable
 class StorageProvider(Protocol):
@@ -31,6 +122,24 @@ class StorageProvider(Protocol):
         """Download content from storage."""
         ...
     
+    def upload_stream(
+        self,
+        path: str,
+        stream: BinaryIO,
+        content_type: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Upload a stream in chunks, hashing on the fly."""
+        ...
+    
+    def open_read(self, path: str, start: int = 0) -> BinaryIO:
+        """Open a binary reader positioned at byte `start`."""
+        ...
+    
+    def size(self, path: str) -> int:
+        """Size of the stored file in bytes."""
+        ...
+    
     def delete(self, path: str) -> bool:
         """Delete file from storage. Returns True if successful."""
         ...
@@ -79,6 +188,41 @@ class LocalStorageProvider:
         
         return file_path.read_bytes()
     
+    def upload_stream(
+        self,
+        path: str,
+        stream: BinaryIO,
+        content_type: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Stream content to local filesystem."""
+        file_path = self._resolve_path(path)
+        size_bytes, sha256 = write_stream(stream, file_path, max_bytes=max_bytes)
+        logger.info(f"Uploaded to local storage: {file_path} ({size_bytes} bytes)")
+        
+        return StoredFile(location=str(file_path), size_bytes=size_bytes, sha256=sha256)
+    
+    def open_read(self, path: str, start: int = 0) -> BinaryIO:
+        """Open local file for reading at `start`."""
+        file_path = self._resolve_path(path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        f = open(file_path, "rb")
+        if start:
+            f.seek(start)
+        return f
+    
+    def size(self, path: str) -> int:
+        """Size of local file."""
+        file_path = self._resolve_path(path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        return file_path.stat().st_size
+    
     def delete(self, path: str) -> bool:
         """Delete file from local filesystem."""
         file_path = self._resolve_path(path)
@@ -161,6 +305,49 @@ class GCSStorageProvider:
         
         return blob.download_as_bytes()
     
+    def upload_stream(
+        self,
+        path: str,
+        stream: BinaryIO,
+        content_type: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Resumable chunked upload to GCS, hashing on the fly."""
+        blob = self.bucket.blob(path, chunk_size=STREAM_CHUNK_SIZE)
+        reader = HashingReader(stream, max_bytes=max_bytes)
+        
+        blob.upload_from_file(reader, content_type=content_type)
+        logger.info(
+            f"Uploaded to GCS: gs://{self.bucket_name}/{path} ({reader.size_bytes} bytes)"
+        )
+        
+        return StoredFile(
+            location=f"gs://{self.bucket_name}/{path}",
+            size_bytes=reader.size_bytes,
+            sha256=reader.sha256,
+        )
+    
+    def open_read(self, path: str, start: int = 0) -> BinaryIO:
+        """Open a chunked GCS reader at `start` (ranged downloads)."""
+        blob = self.bucket.blob(path)
+        
+        if not blob.exists():
+            raise FileNotFoundError(f"File not found in GCS: gs://{self.bucket_name}/{path}")
+        
+        reader = blob.open("rb", chunk_size=STREAM_CHUNK_SIZE)
+        if start:
+            reader.seek(start)
+        return reader
+    
+    def size(self, path: str) -> int:
+        """Size of GCS object."""
+        blob = self.bucket.get_blob(path)
+        
+        if blob is None:
+            raise FileNotFoundError(f"File not found in GCS: gs://{self.bucket_name}/{path}")
+        
+        return blob.size
+    
     def delete(self, path: str) -> bool:
         """Delete file from GCS bucket."""
         blob = self.bucket.blob(path)
@@ -228,6 +415,27 @@ def get_storage_provider() -> StorageProvider:
     return _storage_provider
 
 
+def resolve_storage_location(location: str) -> Tuple[StorageProvider, str]:
+    """
+    Map a stored location (gs:// URI or local path) to (provider, path).
+    
+    Lets readers serve files written by either backend, e.g. documents
+    uploaded before switching USE_GCS_STORAGE.
+    """
+    if location.startswith("gs://"):
+        bucket_name, _, path = location[len("gs://"):].partition("/")
+        provider = get_storage_provider()
+        if not (isinstance(provider, GCSStorageProvider) and provider.bucket_name == bucket_name):
+            provider = GCSStorageProvider(bucket_name=bucket_name)
+        return provider, path
+    
+    file_path = Path(location)
+    provider = get_storage_provider()
+    if isinstance(provider, LocalStorageProvider) and file_path.is_absolute():
+        return provider, str(file_path)
+    return LocalStorageProvider(base_path=str(file_path.parent)), file_path.name
+
+
 def reset_storage_provider():
     """Reset singleton for testing purposes."""
     global _storage_provider
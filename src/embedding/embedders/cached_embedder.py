@@ -0,0 +1,350 @@
+"""
+Cached Embeddings - Two-tier cache in front of the embedding provider
+
+Wraps any LangChain ``Embeddings`` instance so repeated texts (the original
+query, Multi-Query / Step-Back variants, semantic cache lookups, re-uploaded
+chunks) do not pay the embedding API round-trip again.
+
+Cache Strategy:
+- Key: rag:embedding:{sha256(model|dimension|kind|normalized_text)}
+- Value: Raw float32 bytes (np.float32.tobytes())
+- TTL: CACHE_TTL_EMBEDDINGS (24 hours, embeddings are immutable)
+- Layers: L1 (in-memory LRU, per worker) → L2 (Redis, shared)
+
+Text normalization only applies Unicode NFC and collapses whitespace.
+Case is preserved because embedding models are case-sensitive. Query and
+document vectors are keyed separately (``kind``) since some providers embed
+them with different task types.
+
+Usage:
+    from src.embedding.embedders.cached_embedder import CachedEmbeddings
+
+    embeddings = CachedEmbeddings(get_embeddings(), model="gemini-embedding-001",
+                                  dimension=1536)
+    vector = embeddings.embed_query("Điều kiện tham gia đấu thầu?")
+    stats = embeddings.get_stats()
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import redis
+from langchain_core.embeddings import Embeddings
+
+from src.config.feature_flags import (
+    ENABLE_REDIS_CACHE,
+    REDIS_HOST,
+    REDIS_PORT,
+    REDIS_DB_CACHE,
+    CACHE_TTL_EMBEDDINGS,
+    EMBEDDING_CACHE_L1_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Normalize text for cache keys (NFC + collapsed whitespace)."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper with L1 (memory) + L2 (Redis) caching.
+
+    - embed_query: single lookup, computes on miss
+    - embed_documents: batched lookup (L1 → Redis MGET), only misses are
+      sent to the underlying provider in one embed_documents call
+    - embed_queries: batched query lookup; misses are embedded in one
+      embed_documents call when the provider is symmetric
+    """
+
+    def __init__(
+        self,
+        base_embeddings: Embeddings,
+        model: str,
+        dimension: int,
+        enable_l2_cache: bool = ENABLE_REDIS_CACHE,
+        redis_host: str = REDIS_HOST,
+        redis_port: int = REDIS_PORT,
+        redis_db: int = REDIS_DB_CACHE,
+        ttl: int = CACHE_TTL_EMBEDDINGS,
+        l1_size: int = EMBEDDING_CACHE_L1_SIZE,
+        symmetric: bool = False,
+    ):
+        """
+        Initialize cached embeddings.
+
+        Args:
+            base_embeddings: Underlying embeddings provider
+            model: Embedding model name (part of cache key)
+            dimension: Embedding dimension (part of cache key)
+            enable_l2_cache: Enable Redis L2 cache
+            redis_host: Redis server host
+            redis_port: Redis server port
+            redis_db: Redis database number
+            ttl: L2 cache TTL in seconds
+            l1_size: Max vectors in L1 memory cache
+            symmetric: Provider embeds queries and documents identically,
+                so query misses can be batched through embed_documents
+        """
+        self._base = base_embeddings
+        self.model = model
+        self.dimension = dimension
+        self.ttl = ttl
+        self.l1_size = l1_size
+        self.symmetric = symmetric
+
+        # L1: In-memory LRU cache
+        self._l1_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._l1_lock = threading.Lock()
+
+        # L2: Redis cache
+        self._redis: Optional[redis.Redis] = None
+        if enable_l2_cache:
+            try:
+                self._redis = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                )
+                self._redis.ping()
+                logger.info(
+                    f"✅ Embedding cache initialized: "
+                    f"Redis={redis_host}:{redis_port}/db{redis_db}, "
+                    f"TTL={ttl}s, L1_size={l1_size}"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Redis connection failed: {e}. Embedding cache is L1-only."
+                )
+                self._redis = None
+
+        # Statistics
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "total_texts": 0,
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "provider_calls": 0,
+            "errors": 0,
+        }
+
+    @property
+    def base_embeddings(self) -> Embeddings:
+        """Underlying (uncached) embeddings provider."""
+        return self._base
+
+    def _generate_key(self, text: str, kind: str = "document") -> str:
+        """Generate cache key from model, dimension, kind and normalized text."""
+        key_string = (
+            f"{self.model}|{self.dimension}|{kind}|{normalize_embedding_text(text)}"
+        )
+        text_hash = hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+        return f"rag:embedding:{text_hash}"
+
+    def _incr(self, name: str, value: int = 1):
+        with self._stats_lock:
+            self.stats[name] += value
+
+    # ----- L1 helpers -----
+
+    def _get_l1(self, cache_key: str) -> Optional[List[float]]:
+        with self._l1_lock:
+            vector = self._l1_cache.get(cache_key)
+            if vector is not None:
+                self._l1_cache.move_to_end(cache_key)
+            return vector
+
+    def _set_l1(self, cache_key: str, vector: List[float]):
+        with self._l1_lock:
+            self._l1_cache[cache_key] = vector
+            self._l1_cache.move_to_end(cache_key)
+            while len(self._l1_cache) > self.l1_size:
+                self._l1_cache.popitem(last=False)
+
+    # ----- L2 helpers -----
+
+    def _get_l2_many(self, cache_keys: List[str]) -> List[Optional[List[float]]]:
+        if not self._redis or not cache_keys:
+            return [None] * len(cache_keys)
+        try:
+            raw_values = self._redis.mget(cache_keys)
+        except Exception as e:
+            self._incr("errors")
+            logger.warning(f"⚠️ Redis mget error: {e}")
+            return [None] * len(cache_keys)
+
+        return [
+            np.frombuffer(raw, dtype=np.float32).tolist() if raw else None
+            for raw in raw_values
+        ]
+
+    def _set_l2_many(self, items: Dict[str, List[float]]):
+        if not self._redis or not items:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for cache_key, vector in items.items():
+                pipe.setex(
+                    cache_key, self.ttl, np.asarray(vector, dtype=np.float32).tobytes()
+                )
+            pipe.execute()
+        except Exception as e:
+            self._incr("errors")
+            logger.warning(f"⚠️ Redis set error: {e}")
+
+    # ----- Embeddings interface -----
+
+    def _embed_many(
+        self,
+        texts: List[str],
+        kind: str,
+        compute: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """Batched L1 → L2 lookup; ``compute`` embeds unique misses in one call."""
+        if not texts:
+            return []
+
+        self._incr("total_texts", len(texts))
+        keys = [self._generate_key(text, kind=kind) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+
+        # L1 lookup
+        l2_positions = []
+        for i, cache_key in enumerate(keys):
+            vector = self._get_l1(cache_key)
+            if vector is not None:
+                results[i] = vector
+                self._incr("l1_hits")
+            else:
+                l2_positions.append(i)
+
+        # L2 lookup (single MGET round-trip)
+        miss_positions = []
+        if l2_positions:
+            l2_vectors = self._get_l2_many([keys[i] for i in l2_positions])
+            for i, vector in zip(l2_positions, l2_vectors):
+                if vector is not None:
+                    results[i] = vector
+                    self._set_l1(keys[i], vector)
+                    self._incr("l2_hits")
+                else:
+                    miss_positions.append(i)
+
+        # Compute misses once per unique key
+        if miss_positions:
+            unique_positions: Dict[str, int] = {}
+            for i in miss_positions:
+                unique_positions.setdefault(keys[i], i)
+
+            self._incr("misses", len(miss_positions))
+            self._incr("provider_calls")
+            computed = compute([texts[i] for i in unique_positions.values()])
+            new_items = dict(zip(unique_positions.keys(), computed))
+
+            for cache_key, vector in new_items.items():
+                self._set_l1(cache_key, vector)
+            self._set_l2_many(new_items)
+
+            for i in miss_positions:
+                results[i] = new_items[keys[i]]
+
+        return results  # type: ignore[return-value]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, computing only cache misses in a single batch."""
+        return self._embed_many(texts, "document", self._base.embed_documents)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several queries at once (Multi-Query / Fusion variants).
+
+        Vectors are keyed as queries, so they are shared with embed_query.
+        Misses go out in a single embed_documents call when the provider is
+        symmetric; otherwise each miss is embedded with embed_query.
+        """
+        if self.symmetric:
+            compute = self._base.embed_documents
+        else:
+            compute = lambda batch: [self._base.embed_query(t) for t in batch]
+        return self._embed_many(texts, "query", compute)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed query, served from cache when possible."""
+        self._incr("total_texts")
+        cache_key = self._generate_key(text, kind="query")
+
+        vector = self._get_l1(cache_key)
+        if vector is not None:
+            self._incr("l1_hits")
+            return vector
+
+        vector = self._get_l2_many([cache_key])[0]
+        if vector is not None:
+            self._incr("l2_hits")
+            self._set_l1(cache_key, vector)
+            return vector
+
+        self._incr("misses")
+        self._incr("provider_calls")
+        vector = self._base.embed_query(text)
+        self._set_l1(cache_key, vector)
+        self._set_l2_many({cache_key: vector})
+        return vector
+
+    # ----- Management -----
+
+    def clear_all(self) -> Dict[str, int]:
+        """Clear L1 and L2 embedding caches."""
+        with self._l1_lock:
+            l1_count = len(self._l1_cache)
+            self._l1_cache.clear()
+
+        l2_count = 0
+        if self._redis:
+            try:
+                for key in self._redis.scan_iter(match="rag:embedding:*", count=500):
+                    self._redis.delete(key)
+                    l2_count += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Redis clear error: {e}")
+
+        logger.info(f"🗑️ Embedding cache cleared: L1={l1_count}, L2={l2_count}")
+        return {"l1_cleared": l1_count, "l2_cleared": l2_count}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit rates and counts
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+
+        total = stats["total_texts"]
+        hits = stats["l1_hits"] + stats["l2_hits"]
+        return {
+            **stats,
+            "cache_hits": hits,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "l1_hit_rate": round(stats["l1_hits"] / max(total, 1), 4),
+            "l2_hit_rate": round(stats["l2_hits"] / max(total, 1), 4),
+            "l1_size": len(self._l1_cache),
+            "l2_enabled": self._redis is not None,
+            "model": self.model,
+            "dimension": self.dimension,
+            "ttl": self.ttl,
+        }
@@ -0,0 +1,501 @@
+"""
+Embedding Jobs - Concurrent, rate-limit-aware embedding for ingestion
+
+Ingestion used to embed a document in one ``embed_documents`` call (or
+fixed 50-document batches one after another with a sleep in between), so
+a large bidding dossier left most of the provider quota idle and a single
+failed request dropped its chunks silently.
+
+EmbeddingJobRunner:
+1. Counts tokens per text (src/utils/token_counter) and packs texts into
+   requests up to EMBEDDING_JOB_BATCH_MAX_TOKENS / _BATCH_MAX_SIZE
+2. Sends up to EMBEDDING_JOB_MAX_CONCURRENCY requests at once
+3. Waits on a process-wide sliding-window budget (tokens + requests per
+   minute) before each request, so concurrent jobs share one quota
+4. Retries retryable failures (429, 5xx, timeouts, connection errors)
+   with exponential backoff + jitter; a batch that still fails is split in
+   half to isolate the chunks that cannot embed. Other errors (bad
+   request, auth) fail the whole batch at once
+5. Returns per-text vectors (None for failures) and the failed chunks,
+   optionally appended to a JSONL log for inspection
+
+Usage:
+    from src.embedding.embedders.embedding_jobs import EmbeddingJobRunner
+
+    runner = EmbeddingJobRunner(get_default_embeddings())
+    job = runner.run(texts, ids=chunk_ids)
+    logger.info(job.to_dict())
+    retry_ids = job.failed_ids
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from src.config.feature_flags import (
+    EMBEDDING_JOB_BATCH_MAX_SIZE,
+    EMBEDDING_JOB_BATCH_MAX_TOKENS,
+    EMBEDDING_JOB_MAX_CONCURRENCY,
+    EMBEDDING_JOB_MAX_RETRIES,
+    EMBEDDING_JOB_RPM_LIMIT,
+    EMBEDDING_JOB_TPM_LIMIT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _estimate_tokens(text: str) -> int:
+    # Conservative for Vietnamese (~2-3 chars per cl100k token)
+    return len(text) // 2 + 1
+
+
+def default_token_counter(model: Optional[str] = None) -> Callable[[str], int]:
+    """count_tokens for the embedding model, or a char estimate without tiktoken."""
+    try:
+        from src.utils.token_counter import count_tokens
+    except ImportError:
+        logger.warning("⚠️  tiktoken not installed - estimating tokens from length")
+        return _estimate_tokens
+
+    if model is None:
+        from src.config.embedding_provider import get_default_embedding_identity
+
+        model = get_default_embedding_identity()[0]
+    return lambda text: max(count_tokens(text, model), 1)
+
+
+# ===== Error classification =====
+
+# Provider exception class names (OpenAI, Google) that are worth retrying
+_RETRYABLE_ERROR_NAMES = (
+    "RateLimit",
+    "Timeout",
+    "Connection",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "TooManyRequests",
+    "ResourceExhausted",
+    "DeadlineExceeded",
+)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    for candidate in (error, getattr(error, "response", None)):
+        for attr in ("status_code", "code"):
+            value = getattr(candidate, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """True for 429 / 5xx / timeouts / connection errors."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(error)
+    if status is not None:
+        return status == 429 or 500 <= status < 600
+    return any(
+        name in cls.__name__
+        for cls in type(error).__mro__
+        for name in _RETRYABLE_ERROR_NAMES
+    )
+
+
+# ===== Rate limiting =====
+
+
+class RateLimiter:
+    """Sliding-window tokens-per-minute / requests-per-minute budget (thread-safe)."""
+
+    def __init__(
+        self,
+        tokens_per_minute: int = 0,
+        requests_per_minute: int = 0,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            tokens_per_minute: Token budget per window (0 = unlimited)
+            requests_per_minute: Request budget per window (0 = unlimited)
+            window_seconds: Window length
+        """
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._events: deque = deque()  # (timestamp, tokens)
+        self._tokens_in_window = 0
+        self._lock = threading.Lock()
+        self.total_wait_s = 0.0
+
+    def _prune(self, now: float):
+        while self._events and self._events[0][0] <= now - self.window_seconds:
+            _, tokens = self._events.popleft()
+            self._tokens_in_window -= tokens
+
+    def wait_time(self, tokens: int) -> float:
+        """Seconds until a request of this size fits the budget (0 = now)."""
+        now = self._clock()
+        self._prune(now)
+
+        def fits(requests: int, used: int) -> bool:
+            if self.requests_per_minute and requests + 1 > self.requests_per_minute:
+                return False
+            # An oversized request is allowed once the window is empty
+            if self.tokens_per_minute and requests and used + tokens > self.tokens_per_minute:
+                return False
+            return True
+
+        requests, used = len(self._events), self._tokens_in_window
+        if fits(requests, used):
+            return 0.0
+        for timestamp, event_tokens in self._events:
+            requests -= 1
+            used -= event_tokens
+            if fits(requests, used):
+                return max(timestamp + self.window_seconds - now, 0.0)
+        return 0.0
+
+    def acquire(self, tokens: int) -> float:
+        """Block until the request fits, then record it. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                delay = self.wait_time(tokens)
+                if delay <= 0:
+                    self._events.append((self._clock(), tokens))
+                    self._tokens_in_window += tokens
+                    self.total_wait_s += waited
+                    return waited
+            self._sleep(delay)
+            waited += delay
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_embedding_rate_limiter() -> RateLimiter:
+    """Process-wide embedding budget shared by all jobs (singleton)."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter(
+                    tokens_per_minute=EMBEDDING_JOB_TPM_LIMIT,
+                    requests_per_minute=EMBEDDING_JOB_RPM_LIMIT,
+                )
+    return _rate_limiter
+
+
+def reset_embedding_rate_limiter():
+    """Reset the shared budget (for testing)."""
+    global _rate_limiter
+    _rate_limiter = None
+
+
+# ===== Results =====
+
+
+@dataclass
+class FailedChunk:
+    """A text that could not be embedded after retries."""
+
+    index: int
+    chunk_id: Optional[str]
+    error: str
+    attempts: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "chunk_id": self.chunk_id,
+            "error": self.error,
+            "attempts": self.attempts,
+        }
+
+
+@dataclass
+class EmbeddingJobResult:
+    """Vectors (None where embedding failed) plus job metrics."""
+
+    vectors: List[Optional[List[float]]] = field(default_factory=list)
+    failed: List[FailedChunk] = field(default_factory=list)
+    requests: int = 0
+    retries: int = 0
+    tokens: int = 0
+    rate_limited_s: float = 0.0
+    duration_s: float = 0.0
+
+    @property
+    def embedded(self) -> int:
+        return sum(v is not None for v in self.vectors)
+
+    @property
+    def success_rate(self) -> float:
+        return self.embedded / len(self.vectors) if self.vectors else 1.0
+
+    @property
+    def failed_ids(self) -> List[Optional[str]]:
+        return [f.chunk_id for f in self.failed]
+
+    @property
+    def tokens_per_minute(self) -> float:
+        return self.tokens * 60 / self.duration_s if self.duration_s > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "texts": len(self.vectors),
+            "embedded": self.embedded,
+            "failed": len(self.failed),
+            "success_rate": round(self.success_rate, 4),
+            "requests": self.requests,
+            "retries": self.retries,
+            "tokens": self.tokens,
+            "tokens_per_minute": round(self.tokens_per_minute),
+            "rate_limited_s": round(self.rate_limited_s, 2),
+            "duration_s": round(self.duration_s, 2),
+        }
+
+
+class EmbeddingJobError(Exception):
+    """Raised by callers that need every text embedded."""
+
+    def __init__(self, result: EmbeddingJobResult):
+        self.result = result
+        errors = {f.error for f in result.failed}
+        super().__init__(
+            f"{len(result.failed)}/{len(result.vectors)} texts failed to embed: "
+            f"{'; '.join(sorted(errors))[:300]}"
+        )
+
+
+def record_failures(
+    path: Union[str, Path], failed: Sequence[FailedChunk], job: Optional[str] = None
+):
+    """Append failed chunks (chunk_id, error, attempts) to a JSONL log."""
+    if not failed:
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().isoformat()
+    with open(path, "a", encoding="utf-8") as f:
+        for chunk in failed:
+            entry = {**chunk.to_dict(), "job": job, "failed_at": timestamp}
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+# ===== Runner =====
+
+
+class EmbeddingJobRunner:
+    """Embed many texts with token-packed, concurrent, budgeted requests."""
+
+    def __init__(
+        self,
+        embedder: Any,
+        max_concurrency: Optional[int] = None,
+        batch_max_tokens: Optional[int] = None,
+        batch_max_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            embedder: LangChain Embeddings (embed_documents)
+            max_concurrency: In-flight requests (default: EMBEDDING_JOB_MAX_CONCURRENCY)
+            batch_max_tokens: Token cap per request (default: flag)
+            batch_max_size: Text cap per request (default: flag)
+            max_retries: Backoff retries per batch (default: flag)
+            base_delay: First backoff delay in seconds (doubles per retry)
+            max_delay: Backoff cap in seconds
+            rate_limiter: Budget to wait on (default: shared process budget)
+            token_counter: text → tokens (default: token_counter / estimate)
+        """
+        self.embedder = embedder
+        self.max_concurrency = max(1, max_concurrency or EMBEDDING_JOB_MAX_CONCURRENCY)
+        self.batch_max_tokens = batch_max_tokens or EMBEDDING_JOB_BATCH_MAX_TOKENS
+        self.batch_max_size = batch_max_size or EMBEDDING_JOB_BATCH_MAX_SIZE
+        self.max_retries = EMBEDDING_JOB_MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limiter = rate_limiter or get_embedding_rate_limiter()
+        self._token_counter = token_counter
+        self._sleep = sleep
+        self._stats_lock = threading.Lock()
+
+    def count_tokens(self, text: str) -> int:
+        if self._token_counter is None:
+            self._token_counter = default_token_counter()
+        return self._token_counter(text)
+
+    def plan_batches(self, token_counts: Sequence[int]) -> List[List[int]]:
+        """Greedy packing of text indices by token count and batch size."""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, tokens in enumerate(token_counts):
+            if current and (
+                current_tokens + tokens > self.batch_max_tokens
+                or len(current) >= self.batch_max_size
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def run(
+        self,
+        texts: Sequence[str],
+        ids: Optional[Sequence[Optional[str]]] = None,
+        failure_log: Optional[Union[str, Path]] = None,
+    ) -> EmbeddingJobResult:
+        """
+        Embed all texts.
+
+        Args:
+            texts: Texts to embed
+            ids: chunk_id per text (for failure records)
+            failure_log: Append failed chunks to this JSONL file
+
+        Returns:
+            EmbeddingJobResult with vectors aligned to texts
+        """
+        start = time.perf_counter()
+        result = EmbeddingJobResult(vectors=[None] * len(texts))
+        if not texts:
+            return result
+
+        counts = [self.count_tokens(text) for text in texts]
+        batches = self.plan_batches(counts)
+
+        def run_batch(indices: List[int]):
+            self._run_batch(indices, texts, counts, ids, result, self.max_retries)
+
+        if len(batches) == 1 or self.max_concurrency == 1:
+            for batch in batches:
+                run_batch(batch)
+        else:
+            workers = min(self.max_concurrency, len(batches))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="embed-job"
+            ) as pool:
+                for future in [pool.submit(run_batch, b) for b in batches]:
+                    future.result()
+
+        result.failed.sort(key=lambda f: f.index)
+        result.duration_s = time.perf_counter() - start
+        if failure_log:
+            record_failures(failure_log, result.failed)
+
+        log = logger.warning if result.failed else logger.info
+        log(
+            f"{'⚠️ ' if result.failed else '✅'} Embedded {result.embedded}/{len(texts)} "
+            f"texts in {result.requests} requests ({len(batches)} batches, "
+            f"{result.retries} retries, {result.tokens_per_minute:.0f} tokens/min, "
+            f"{result.rate_limited_s:.1f}s rate-limited)"
+        )
+        return result
+
+    async def arun(
+        self,
+        texts: Sequence[str],
+        ids: Optional[Sequence[Optional[str]]] = None,
+        failure_log: Optional[Union[str, Path]] = None,
+    ) -> EmbeddingJobResult:
+        """run() off the event loop."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.run, texts, ids, failure_log)
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _run_batch(
+        self,
+        indices: List[int],
+        texts: Sequence[str],
+        counts: Sequence[int],
+        ids: Optional[Sequence[Optional[str]]],
+        result: EmbeddingJobResult,
+        max_retries: int,
+    ):
+        batch_tokens = sum(counts[i] for i in indices)
+        attempts = 0
+        while True:
+            attempts += 1
+            waited = self.rate_limiter.acquire(batch_tokens)
+            try:
+                vectors = self.embedder.embed_documents([texts[i] for i in indices])
+                if len(vectors) != len(indices):
+                    raise ValueError(
+                        f"Embedder returned {len(vectors)} vectors for {len(indices)} texts"
+                    )
+            except Exception as e:
+                with self._stats_lock:
+                    result.requests += 1
+                    result.rate_limited_s += waited
+                retryable = is_retryable_error(e)
+                if retryable and attempts <= max_retries:
+                    with self._stats_lock:
+                        result.retries += 1
+                    delay = self._backoff(attempts)
+                    logger.warning(
+                        f"⚠️  Embedding batch of {len(indices)} failed "
+                        f"(attempt {attempts}): {e} - retrying in {delay:.1f}s"
+                    )
+                    self._sleep(delay)
+                    continue
+
+                if retryable and len(indices) > 1:
+                    # Isolate the texts that cannot be embedded
+                    mid = len(indices) // 2
+                    for half in (indices[:mid], indices[mid:]):
+                        self._run_batch(half, texts, counts, ids, result, 0)
+                    return
+
+                if not retryable:
+                    logger.warning(
+                        f"⚠️  Embedding batch of {len(indices)} failed with a "
+                        f"non-retryable error: {type(e).__name__}: {e}"
+                    )
+                with self._stats_lock:
+                    result.failed.extend(
+                        FailedChunk(
+                            index=index,
+                            chunk_id=ids[index] if ids is not None else None,
+                            error=f"{type(e).__name__}: {e}",
+                            attempts=attempts,
+                        )
+                        for index in indices
+                    )
+                return
+
+            with self._stats_lock:
+                result.requests += 1
+                result.tokens += batch_tokens
+                result.rate_limited_s += waited
+                for index, vector in zip(indices, vectors):
+                    result.vectors[index] = list(vector)
+            return
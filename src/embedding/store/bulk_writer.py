@@ -0,0 +1,482 @@
+"""
+Bulk Chunk Writer - COPY-based ingestion for document_chunks
+
+Upload, bulk import and reindex used to insert chunks with one
+``INSERT ... RETURNING`` per chunk, then link embeddings with one
+``UPDATE langchain_pg_embedding ... WHERE cmetadata->>'chunk_id' = ...``
+per chunk. For documents with thousands of chunks that is thousands of
+round-trips.
+
+This writer does the whole document in one transaction:
+1. COPY chunk rows into a temp staging table (ON COMMIT DROP)
+2. Upsert staging → document_chunks with one INSERT ... SELECT
+3. Insert embeddings (vector, text, cmetadata, chunk FK) with one
+   INSERT ... SELECT, using ids derived from chunk_id so re-ingestion
+   overwrites instead of duplicating
+4. Link embeddings written elsewhere (e.g. PGVector.add_documents) with
+   one UPDATE ... FROM staging join, only for rows staged without a vector
+
+Usage:
+    from src.embedding.store.bulk_writer import BulkChunkWriter, ChunkRow
+
+    writer = BulkChunkWriter()
+    rows = [ChunkRow.from_chunk(c) for c in chunks]
+    attach_embeddings(rows, embedder)  # optional: write vectors natively
+    result = writer.write(doc_uuid, rows)
+    logger.info(f"{result.chunks_written} chunks, {result.rows_per_sec:.0f} rows/s")
+"""
+
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+STAGE_TABLE = "_stage_document_chunks"
+
+# Namespace for deterministic langchain_pg_embedding ids
+EMBEDDING_ID_NAMESPACE = uuid.UUID("6f1f4a5e-2c55-4d0b-9a51-0c7f5e3b8d21")
+
+CREATE_STAGE_SQL = f"""
+    CREATE TEMP TABLE {STAGE_TABLE} (
+        seq integer,
+        chunk_id varchar(255),
+        content text,
+        chunk_index integer,
+        section_title varchar(500),
+        hierarchy_path text[],
+        keywords text[],
+        concepts text[],
+        entities jsonb,
+        char_count integer,
+        has_table boolean,
+        has_list boolean,
+        embedding_id varchar,
+        embedding text,
+        cmetadata jsonb
+    ) ON COMMIT DROP
+"""
+
+COPY_STAGE_SQL = f"""
+    COPY {STAGE_TABLE} (
+        seq, chunk_id, content, chunk_index, section_title,
+        hierarchy_path, keywords, concepts, entities,
+        char_count, has_table, has_list,
+        embedding_id, embedding, cmetadata
+    ) FROM STDIN
+"""
+
+# DISTINCT ON keeps the last row per chunk_id (same as sequential upserts)
+UPSERT_CHUNKS_SQL = f"""
+    INSERT INTO document_chunks (
+        document_id, chunk_id, content, chunk_index,
+        section_title, hierarchy_path, keywords, concepts, entities,
+        char_count, has_table, has_list, created_at, updated_at
+    )
+    SELECT DISTINCT ON (chunk_id)
+        %(document_id)s, chunk_id, content, chunk_index,
+        section_title, hierarchy_path, keywords, concepts, entities,
+        char_count, has_table, has_list, NOW(), NOW()
+    FROM {STAGE_TABLE}
+    ORDER BY chunk_id, seq DESC
+    ON CONFLICT (chunk_id) DO UPDATE SET
+        content = EXCLUDED.content,
+        chunk_index = EXCLUDED.chunk_index,
+        section_title = EXCLUDED.section_title,
+        hierarchy_path = EXCLUDED.hierarchy_path,
+        keywords = EXCLUDED.keywords,
+        concepts = EXCLUDED.concepts,
+        entities = EXCLUDED.entities,
+        char_count = EXCLUDED.char_count,
+        has_table = EXCLUDED.has_table,
+        has_list = EXCLUDED.has_list,
+        updated_at = NOW()
+    RETURNING chunk_id, id
+"""
+
+ENSURE_COLLECTION_SQL = """
+    INSERT INTO langchain_pg_collection (uuid, name, cmetadata)
+    VALUES (gen_random_uuid(), %(collection)s, '{}'::jsonb)
+    ON CONFLICT (name) DO NOTHING
+"""
+
+# Rows from earlier ingestions (random PGVector ids) for re-staged chunks in
+# this collection: linked through the chunk FK, or not linked yet and found
+# by the document_id/chunk_id PGVector wrote into cmetadata
+DELETE_STALE_EMBEDDINGS_SQL = f"""
+    DELETE FROM langchain_pg_embedding e
+    USING {STAGE_TABLE} s
+    JOIN document_chunks c ON c.chunk_id = s.chunk_id
+    WHERE e.collection_id = (
+        SELECT uuid FROM langchain_pg_collection WHERE name = %(collection)s
+    )
+    AND (
+        e.chunk_id = c.id
+        OR (
+            e.cmetadata->>'document_id' = s.cmetadata->>'document_id'
+            AND e.cmetadata->>'chunk_id' = s.chunk_id
+        )
+    )
+    AND s.embedding IS NOT NULL
+    AND e.id NOT IN (
+        SELECT embedding_id FROM {STAGE_TABLE} WHERE embedding IS NOT NULL
+    )
+"""
+
+INSERT_EMBEDDINGS_SQL = f"""
+    INSERT INTO langchain_pg_embedding (
+        id, collection_id, embedding, document, cmetadata, chunk_id, created_at
+    )
+    SELECT DISTINCT ON (s.chunk_id)
+        s.embedding_id,
+        (SELECT uuid FROM langchain_pg_collection WHERE name = %(collection)s),
+        s.embedding::vector, s.content, s.cmetadata, c.id, NOW()
+    FROM {STAGE_TABLE} s
+    JOIN document_chunks c ON c.chunk_id = s.chunk_id
+    WHERE s.embedding IS NOT NULL
+    ORDER BY s.chunk_id, s.seq DESC
+    ON CONFLICT (id) DO UPDATE SET
+        collection_id = EXCLUDED.collection_id,
+        embedding = EXCLUDED.embedding,
+        document = EXCLUDED.document,
+        cmetadata = EXCLUDED.cmetadata,
+        chunk_id = EXCLUDED.chunk_id
+"""
+
+# Embeddings without document_chunks rows (maintenance re-embeds); an
+# existing chunk FK is kept so a later link pass is not undone
+UPSERT_EMBEDDINGS_ONLY_SQL = f"""
+    INSERT INTO langchain_pg_embedding (
+        id, collection_id, embedding, document, cmetadata, created_at
+    )
+    SELECT DISTINCT ON (s.embedding_id)
+        s.embedding_id,
+        (SELECT uuid FROM langchain_pg_collection WHERE name = %(collection)s),
+        s.embedding::vector, s.content, s.cmetadata, NOW()
+    FROM {STAGE_TABLE} s
+    WHERE s.embedding IS NOT NULL
+    ORDER BY s.embedding_id, s.seq DESC
+    ON CONFLICT (id) DO UPDATE SET
+        collection_id = EXCLUDED.collection_id,
+        embedding = EXCLUDED.embedding,
+        document = EXCLUDED.document,
+        cmetadata = EXCLUDED.cmetadata
+"""
+
+LINK_EMBEDDINGS_SQL = f"""
+    UPDATE langchain_pg_embedding e
+    SET chunk_id = c.id
+    FROM {STAGE_TABLE} s
+    JOIN document_chunks c ON c.chunk_id = s.chunk_id
+    WHERE e.cmetadata->>'chunk_id' = s.chunk_id
+    AND s.embedding IS NULL
+    AND e.chunk_id IS NULL
+"""
+
+
+def embedding_id_for(chunk_id: str, collection: str) -> str:
+    """Deterministic langchain_pg_embedding.id for a chunk in a collection."""
+    return str(uuid.uuid5(EMBEDDING_ID_NAMESPACE, f"{collection}:{chunk_id}"))
+
+
+def vector_literal(vector: Sequence[float]) -> str:
+    """pgvector text form ('[0.1,0.2,...]') for COPY into a text column."""
+    return "[" + ",".join(repr(float(x)) for x in vector) + "]"
+
+
+def attach_embeddings(
+    rows: Sequence["ChunkRow"],
+    embedder: Any,
+    metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+    runner: Optional[Any] = None,
+) -> int:
+    """
+    Embed row contents and attach the vectors.
+
+    Texts go through an EmbeddingJobRunner (token-packed, concurrent
+    requests under the shared rate-limit budget, retried with backoff).
+
+    Args:
+        rows: Rows to embed (modified in place)
+        embedder: LangChain Embeddings (e.g. get_default_embeddings())
+        metadatas: cmetadata per row; defaults to the row's existing metadata
+        runner: EmbeddingJobRunner to use (default: one for ``embedder``)
+
+    Returns:
+        Number of rows that received a vector
+
+    Raises:
+        EmbeddingJobError: Some texts still failed after retries
+    """
+    from src.embedding.embedders.embedding_jobs import (
+        EmbeddingJobError,
+        EmbeddingJobRunner,
+    )
+
+    if not rows:
+        return 0
+    runner = runner or EmbeddingJobRunner(embedder)
+    job = runner.run([row.content for row in rows], ids=[row.chunk_id for row in rows])
+    if job.failed:
+        raise EmbeddingJobError(job)
+    for i, (row, vector) in enumerate(zip(rows, job.vectors)):
+        row.embedding = vector
+        if metadatas is not None:
+            row.metadata = metadatas[i]
+    return len(rows)
+
+
+@dataclass
+class ChunkRow:
+    """One document_chunks row to be written."""
+
+    chunk_id: str
+    content: str
+    chunk_index: int = 0
+    section_title: Optional[str] = None
+    hierarchy_path: Optional[List[str]] = None
+    keywords: Optional[List[str]] = None
+    concepts: Optional[List[str]] = None
+    entities: Optional[Dict[str, Any]] = None
+    char_count: Optional[int] = None
+    has_table: bool = False
+    has_list: bool = False
+    # Set to write langchain_pg_embedding natively (see attach_embeddings)
+    embedding: Optional[List[float]] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_chunk(cls, chunk: Any) -> "ChunkRow":
+        """Build from a pipeline UniversalChunk (or anything with to_dict())."""
+        data = chunk.to_dict()
+        row = cls.from_dict(data)
+        row.metadata = {k: v for k, v in data.items() if k != "content"}
+        return row
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], chunk_id: Optional[str] = None) -> "ChunkRow":
+        """Build from a chunk dict (pipeline output or processed JSONL line)."""
+        extra = data.get("extra_metadata") or {}
+        keywords = extra.get("keywords")
+        concepts = extra.get("concepts")
+        content = data["content"]
+        return cls(
+            chunk_id=chunk_id
+            or data.get("chunk_id")
+            or f"{data.get('document_id')}_{data.get('chunk_index', 0)}",
+            content=content,
+            chunk_index=data.get("chunk_index", 0) or 0,
+            section_title=(data.get("section_title") or None),
+            hierarchy_path=data.get("hierarchy") or data.get("hierarchy_path") or None,
+            keywords=list(keywords) if isinstance(keywords, (list, tuple)) else None,
+            concepts=list(concepts) if isinstance(concepts, (list, tuple)) else None,
+            entities=extra.get("entities") or None,
+            char_count=data.get("char_count") or len(content),
+            has_table=bool(data.get("has_table", False)),
+            has_list=bool(data.get("has_list", False)),
+        )
+
+    def as_copy_row(self, seq: int, collection: str = "") -> tuple:
+        has_vector = self.embedding is not None
+        section_title = self.section_title[:500] if self.section_title else None
+        return (
+            seq,
+            self.chunk_id,
+            self.content,
+            self.chunk_index,
+            section_title,
+            self.hierarchy_path,
+            self.keywords,
+            self.concepts,
+            json.dumps(self.entities, ensure_ascii=False) if self.entities else None,
+            self.char_count if self.char_count is not None else len(self.content),
+            self.has_table,
+            self.has_list,
+            embedding_id_for(self.chunk_id, collection) if has_vector else None,
+            vector_literal(self.embedding) if has_vector else None,
+            json.dumps(self.metadata or {}, ensure_ascii=False, default=str)
+            if has_vector
+            else None,
+        )
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of one bulk write."""
+
+    chunks_written: int = 0
+    embeddings_written: int = 0
+    embeddings_linked: int = 0
+    duration_s: float = 0.0
+    chunk_id_map: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def rows_per_sec(self) -> float:
+        rows = self.chunks_written + self.embeddings_written + self.embeddings_linked
+        return rows / self.duration_s if self.duration_s > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chunks_written": self.chunks_written,
+            "embeddings_written": self.embeddings_written,
+            "embeddings_linked": self.embeddings_linked,
+            "duration_s": round(self.duration_s, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+        }
+
+
+class BulkChunkWriter:
+    """Set-based writer for document_chunks + embeddings (psycopg 3)."""
+
+    def __init__(
+        self,
+        connection_factory: Optional[Callable[[], Any]] = None,
+        collection_name: Optional[str] = None,
+    ):
+        """
+        Args:
+            connection_factory: Returns a psycopg connection (default: get_db_sync)
+            collection_name: PGVector collection for native embedding writes
+                (default: settings.collection)
+        """
+        if connection_factory is None:
+            from src.config.database import get_db_sync
+
+            connection_factory = get_db_sync
+        if collection_name is None:
+            from src.config.models import settings
+
+            collection_name = settings.collection
+        self._connection_factory = connection_factory
+        self.collection_name = collection_name
+
+    def write(
+        self,
+        document_uuid: Any,
+        rows: Sequence[ChunkRow],
+        link_embeddings: bool = True,
+        conn: Optional[Any] = None,
+    ) -> BulkWriteResult:
+        """
+        Upsert chunks of one document and write or link their embeddings.
+
+        Rows carrying a vector are inserted into langchain_pg_embedding with
+        chunk_id already set; rows without one fall back to linking.
+
+        Args:
+            document_uuid: documents.id the chunks belong to
+            rows: Chunk rows to upsert
+            link_embeddings: Set langchain_pg_embedding.chunk_id for
+                embeddings whose cmetadata chunk_id matches a staged row
+                that has no vector
+            conn: Existing connection; the caller then owns commit/close
+
+        Returns:
+            BulkWriteResult with chunk_id → uuid map and throughput
+
+        Raises:
+            Exception: Database errors (the transaction is rolled back)
+        """
+        result = BulkWriteResult()
+        if not document_uuid or not rows:
+            return result
+
+        start = time.perf_counter()
+        with self._cursor(conn) as cursor:
+            self._stage(cursor, rows)
+
+            cursor.execute(UPSERT_CHUNKS_SQL, {"document_id": document_uuid})
+            result.chunk_id_map = {
+                chunk_id: chunk_uuid for chunk_id, chunk_uuid in cursor.fetchall()
+            }
+            result.chunks_written = len(result.chunk_id_map)
+
+            if any(row.embedding is not None for row in rows):
+                params = {"collection": self.collection_name}
+                cursor.execute(ENSURE_COLLECTION_SQL, params)
+                cursor.execute(DELETE_STALE_EMBEDDINGS_SQL, params)
+                cursor.execute(INSERT_EMBEDDINGS_SQL, params)
+                result.embeddings_written = max(cursor.rowcount, 0)
+
+            if link_embeddings and any(row.embedding is None for row in rows):
+                cursor.execute(LINK_EMBEDDINGS_SQL)
+                result.embeddings_linked = max(cursor.rowcount, 0)
+
+        result.duration_s = time.perf_counter() - start
+        logger.info(
+            f"✅ Bulk wrote {result.chunks_written} chunks, "
+            f"{result.embeddings_written} embeddings, linked "
+            f"{result.embeddings_linked} embeddings in "
+            f"{result.duration_s * 1000:.0f}ms ({result.rows_per_sec:.0f} rows/s)"
+        )
+        return result
+
+    def write_embeddings(
+        self, rows: Sequence[ChunkRow], conn: Optional[Any] = None
+    ) -> BulkWriteResult:
+        """
+        Upsert embeddings only (no document_chunks rows), by deterministic id.
+
+        Rows without a vector are skipped.
+
+        Args:
+            rows: Rows with embedding (and metadata) attached
+            conn: Existing connection; the caller then owns commit/close
+
+        Returns:
+            BulkWriteResult with embeddings_written and throughput
+        """
+        result = BulkWriteResult()
+        rows = [row for row in rows if row.embedding is not None]
+        if not rows:
+            return result
+
+        start = time.perf_counter()
+        with self._cursor(conn) as cursor:
+            self._stage(cursor, rows)
+            params = {"collection": self.collection_name}
+            cursor.execute(ENSURE_COLLECTION_SQL, params)
+            cursor.execute(UPSERT_EMBEDDINGS_ONLY_SQL, params)
+            result.embeddings_written = max(cursor.rowcount, 0)
+
+        result.duration_s = time.perf_counter() - start
+        logger.info(
+            f"✅ Bulk wrote {result.embeddings_written} embeddings in "
+            f"{result.duration_s * 1000:.0f}ms ({result.rows_per_sec:.0f} rows/s)"
+        )
+        return result
+
+    def _stage(self, cursor, rows: Sequence[ChunkRow]):
+        cursor.execute(CREATE_STAGE_SQL)
+        with cursor.copy(COPY_STAGE_SQL) as copy:
+            for seq, row in enumerate(rows):
+                copy.write_row(row.as_copy_row(seq, self.collection_name))
+
+    @contextmanager
+    def _cursor(self, conn: Optional[Any] = None):
+        """Cursor in one transaction; commits/closes only connections it opened."""
+        owns_conn = conn is None
+        if owns_conn:
+            conn = self._connection_factory()
+
+        try:
+            with conn.cursor() as cursor:
+                yield cursor
+                if not owns_conn:
+                    # Staging table is ON COMMIT DROP; drop it now so the
+                    # caller can write several documents in one transaction
+                    cursor.execute(f"DROP TABLE IF EXISTS {STAGE_TABLE}")
+
+            if owns_conn:
+                conn.commit()
+        except Exception:
+            if owns_conn:
+                conn.rollback()
+            raise
+        finally:
+            if owns_conn:
+                conn.close()
@@ -0,0 +1,249 @@
+"""
+Filtered Vector Search - metadata filters evaluated inside the ANN query
+
+PGVector applies JSONB filters after the HNSW scan has produced its
+candidates, so a selective filter (one document_type, one dieu) returns
+fewer than k rows; BaseVectorRetriever papered over that by fetching k*2
+and slicing. This module runs the search itself:
+
+- document_type / document_id / status are typed columns on
+  langchain_pg_embedding (alembic promote_embedding_filters) with btree
+  indexes; other keys compare cmetadata ->> key as text
+- pgvector >= 0.8: hnsw.iterative_scan = strict_order keeps scanning the
+  HNSW graph until k rows pass the filter (bounded by max_scan_tuples)
+- older pgvector: if the index scan returns fewer than k rows and the
+  filter includes a promoted (btree-indexed) column, the query is re-run
+  with index scans disabled, i.e. an exact scan of the rows that column
+  selects. Filters on cmetadata keys only would rescan the whole
+  collection, so those keep the (possibly short) HNSW result
+
+Usage:
+    from src.embedding.store.filtered_search import get_filtered_vector_search
+
+    search = get_filtered_vector_search()
+    if search.supports(filter_dict):
+        docs = search.search(query_vector, k=5, filter_dict=filter_dict)
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+from sqlalchemy import text
+
+from src.config.feature_flags import (
+    FILTERED_SEARCH_EF_SEARCH,
+    FILTERED_SEARCH_MAX_SCAN_TUPLES,
+)
+from src.embedding.store.bulk_writer import vector_literal
+
+logger = logging.getLogger(__name__)
+
+PROMOTED_FILTER_COLUMNS = ("document_type", "document_id", "status")
+
+ITERATIVE_SCAN_MIN_VERSION = (0, 8)
+
+FILTERED_SEARCH_SQL = """
+    SELECT e.id, e.document, e.cmetadata
+    FROM langchain_pg_embedding e
+    WHERE e.collection_id = (
+        SELECT uuid FROM langchain_pg_collection WHERE name = :collection
+    )
+    {where_sql}
+    ORDER BY e.embedding <=> CAST(:embedding AS vector)
+    LIMIT :k
+"""
+
+PGVECTOR_VERSION_SQL = "SELECT extversion FROM pg_extension WHERE extname = 'vector'"
+
+
+def _filter_text(value: Any) -> str:
+    """Scalar as it reads from cmetadata ->> key."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def translate_filter(
+    filter_dict: Dict[str, Any],
+) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+    """
+    PGVector filter → (SQL conditions, bind params).
+
+    Supports scalar equality, {"$eq": v} and {"$in": [...]} per key.
+    Returns None for anything else ($and/$or, ranges), which the caller
+    leaves to PGVector.
+    """
+    clauses: List[str] = []
+    params: Dict[str, Any] = {}
+
+    for i, (key, value) in enumerate(filter_dict.items()):
+        if key.startswith("$"):
+            return None
+
+        values: Optional[Sequence[Any]] = None
+        if isinstance(value, dict):
+            if len(value) != 1:
+                return None
+            op, operand = next(iter(value.items()))
+            if op == "$eq":
+                value = operand
+            elif op == "$in" and isinstance(operand, (list, tuple)):
+                values = operand
+            else:
+                return None
+        if values is None and isinstance(value, (dict, list, tuple)):
+            return None
+
+        if key in PROMOTED_FILTER_COLUMNS:
+            column = f"e.{key}"
+        else:
+            column = f"(e.cmetadata ->> :key_{i})"
+            params[f"key_{i}"] = key
+
+        if values is not None:
+            clauses.append(f"{column} = ANY(:value_{i})")
+            params[f"value_{i}"] = [_filter_text(v) for v in values]
+        else:
+            clauses.append(f"{column} = :value_{i}")
+            params[f"value_{i}"] = _filter_text(value)
+
+    return clauses, params
+
+
+class FilteredVectorSearch:
+    """Top-k cosine search with metadata filters in the same SQL query."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        collection_name: Optional[str] = None,
+        ef_search: int = FILTERED_SEARCH_EF_SEARCH,
+        max_scan_tuples: int = FILTERED_SEARCH_MAX_SCAN_TUPLES,
+    ):
+        if session_factory is None:
+            from src.models.base import SessionLocal
+
+            session_factory = SessionLocal
+        if collection_name is None:
+            from src.config.models import settings
+
+            collection_name = settings.collection
+        self._session_factory = session_factory
+        self.collection_name = collection_name
+        self.ef_search = ef_search
+        self.max_scan_tuples = max_scan_tuples
+        self._iterative_scan: Optional[bool] = None  # detected on first search
+        self.stats = {"searches": 0, "exact_rescans": 0, "rescans_skipped": 0}
+
+    @staticmethod
+    def supports(filter_dict: Optional[Dict[str, Any]]) -> bool:
+        return bool(filter_dict) and translate_filter(filter_dict) is not None
+
+    def search(
+        self, embedding: Sequence[float], k: int, filter_dict: Dict[str, Any]
+    ) -> List[Document]:
+        """
+        Exact filtered top-k (see module docstring).
+
+        Raises:
+            ValueError: filter_dict is not supported (check supports() first)
+        """
+        translated = translate_filter(filter_dict)
+        if translated is None:
+            raise ValueError(f"Unsupported filter: {filter_dict}")
+        clauses, params = translated
+
+        sql = text(
+            FILTERED_SEARCH_SQL.format(
+                where_sql="".join(f"AND {clause}\n" for clause in clauses)
+            )
+        )
+        params.update(
+            {
+                "collection": self.collection_name,
+                "embedding": vector_literal(embedding),
+                "k": k,
+            }
+        )
+
+        db = self._session_factory()
+        try:
+            self._configure_scan(db)
+            rows = db.execute(sql, params).fetchall()
+
+            if len(rows) < k and not self._iterative_scan:
+                # HNSW candidates ran out before k rows passed the filter
+                if any(key in PROMOTED_FILTER_COLUMNS for key in filter_dict):
+                    logger.info(
+                        f"🔁 Filtered search returned {len(rows)}/{k} rows, "
+                        f"exact rescan for filter {filter_dict}"
+                    )
+                    db.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+                    rows = db.execute(sql, params).fetchall()
+                    self.stats["exact_rescans"] += 1
+                else:
+                    logger.info(
+                        f"⚠️ Filtered search returned {len(rows)}/{k} rows; no exact "
+                        f"rescan for unindexed filter {filter_dict}"
+                    )
+                    self.stats["rescans_skipped"] += 1
+        finally:
+            db.close()
+
+        self.stats["searches"] += 1
+        return [
+            Document(
+                id=str(row.id),
+                page_content=row.document or "",
+                metadata=row.cmetadata or {},
+            )
+            for row in rows
+        ]
+
+    def _configure_scan(self, db):
+        """Transaction-local HNSW settings for this query."""
+        if self._iterative_scan is None:
+            version = db.execute(text(PGVECTOR_VERSION_SQL)).scalar() or "0"
+            parts = tuple(int(p) for p in version.split(".")[:2] if p.isdigit())
+            self._iterative_scan = parts >= ITERATIVE_SCAN_MIN_VERSION
+            logger.info(
+                f"🔍 pgvector {version}: iterative HNSW scans "
+                f"{'enabled' if self._iterative_scan else 'unavailable, exact rescan fallback'}"
+            )
+
+        db.execute(
+            text("SELECT set_config('hnsw.ef_search', :value, true)"),
+            {"value": str(self.ef_search)},
+        )
+        if self._iterative_scan:
+            db.execute(text("SELECT set_config('hnsw.iterative_scan', 'strict_order', true)"))
+            db.execute(
+                text("SELECT set_config('hnsw.max_scan_tuples', :value, true)"),
+                {"value": str(self.max_scan_tuples)},
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "iterative_scan": self._iterative_scan}
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_filtered_search: Optional[FilteredVectorSearch] = None
+_filtered_search_lock = threading.Lock()
+
+
+def get_filtered_vector_search() -> FilteredVectorSearch:
+    """Get singleton FilteredVectorSearch (thread-safe lazy initialization)."""
+    global _filtered_search
+
+    if _filtered_search is not None:
+        return _filtered_search
+
+    with _filtered_search_lock:
+        if _filtered_search is None:
+            _filtered_search = FilteredVectorSearch()
+        return _filtered_search
@@ -0,0 +1,340 @@
+"""
+Incremental Re-index - Reuse vectors for unchanged chunk text
+
+Re-chunking or re-enriching a corpus usually leaves most chunk texts
+unchanged, yet the reprocess/reindex scripts used to clear the collection
+and re-embed everything. This engine keys every vector by
+
+    sha256(model : dimension : embedded text)
+
+stored in cmetadata["embedding_hash"]. On the next run:
+1. Hash each row's text and look up existing vectors by hash (batched)
+2. Embed only the misses (identical texts embedded once) through an
+   EmbeddingJobRunner
+3. After writing, delete only orphaned rows (chunks that no longer exist)
+
+A different model or dimension changes every hash, so switching models
+still re-embeds the whole corpus. Rows written before this engine have no
+hash and are re-embedded once.
+
+Usage:
+    from src.embedding.store.incremental_reindex import IncrementalReindexer
+
+    reindexer = IncrementalReindexer(get_default_embeddings())
+    reindexer.attach_embeddings(rows, metadatas)    # reuse or embed
+    writer.write(doc_uuid, rows)                    # BulkChunkWriter
+    reindexer.remove_orphans(kept_chunk_ids)        # collection sweep
+    print(reindexer.diff.format_report())
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from src.embedding.embedders.embedding_jobs import (
+    EmbeddingJobError,
+    EmbeddingJobRunner,
+)
+
+from .bulk_writer import ChunkRow, embedding_id_for
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_HASH_KEY = "embedding_hash"
+LOOKUP_BATCH_SIZE = 1000
+
+LOOKUP_BY_HASH_SQL = """
+    SELECT DISTINCT ON (e.cmetadata->>'embedding_hash')
+        e.cmetadata->>'embedding_hash', e.embedding::text
+    FROM langchain_pg_embedding e
+    JOIN langchain_pg_collection c ON c.uuid = e.collection_id
+    WHERE c.name = %(collection)s
+    AND e.cmetadata->>'embedding_hash' = ANY(%(hashes)s)
+"""
+
+# Orphans of specific documents: chunks that were not re-staged, and their
+# embeddings (deleted first, the FK would only SET NULL)
+DELETE_DOCUMENT_ORPHAN_EMBEDDINGS_SQL = """
+    DELETE FROM langchain_pg_embedding e
+    USING document_chunks c
+    WHERE e.chunk_id = c.id
+    AND c.document_id = ANY(%(document_uuids)s)
+    AND NOT (c.chunk_id = ANY(%(keep_chunk_ids)s))
+"""
+
+DELETE_DOCUMENT_ORPHAN_CHUNKS_SQL = """
+    DELETE FROM document_chunks
+    WHERE document_id = ANY(%(document_uuids)s)
+    AND NOT (chunk_id = ANY(%(keep_chunk_ids)s))
+"""
+
+# Whole-collection sweep: every embedding not written by this run
+DELETE_COLLECTION_ORPHANS_SQL = """
+    DELETE FROM langchain_pg_embedding e
+    USING langchain_pg_collection c
+    WHERE c.uuid = e.collection_id
+    AND c.name = %(collection)s
+    AND NOT (e.id = ANY(%(keep_ids)s))
+"""
+
+
+def embedding_hash(text: str, model: str, dimension: int) -> str:
+    """Content hash identifying a vector: same text + model + dimension."""
+    payload = f"{model}:{dimension}:{text}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def parse_vector(value: Any) -> List[float]:
+    """pgvector text form ('[0.1,0.2]') or sequence → list of floats."""
+    if isinstance(value, str):
+        return [float(x) for x in json.loads(value)]
+    return [float(x) for x in value]
+
+
+@dataclass
+class ReindexDiff:
+    """What a re-index run changed."""
+
+    added: int = 0  # rows whose text had no vector yet (embedded)
+    reused: int = 0  # rows that got an existing vector by hash
+    removed: int = 0  # orphaned embeddings deleted
+    chunks_removed: int = 0  # orphaned document_chunks deleted
+    texts_embedded: int = 0  # embedding API inputs (misses deduplicated)
+    embed_seconds: float = 0.0
+
+    def merge(self, other: "ReindexDiff") -> "ReindexDiff":
+        self.added += other.added
+        self.reused += other.reused
+        self.removed += other.removed
+        self.chunks_removed += other.chunks_removed
+        self.texts_embedded += other.texts_embedded
+        self.embed_seconds += other.embed_seconds
+        return self
+
+    @property
+    def reuse_rate(self) -> float:
+        total = self.added + self.reused
+        return self.reused / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": self.added,
+            "reused": self.reused,
+            "removed": self.removed,
+            "chunks_removed": self.chunks_removed,
+            "texts_embedded": self.texts_embedded,
+            "reuse_rate": round(self.reuse_rate, 4),
+            "embed_seconds": round(self.embed_seconds, 2),
+        }
+
+    def format_report(self) -> str:
+        return "\n".join(
+            [
+                "Re-index diff:",
+                f"  Added (embedded):  {self.added:,}",
+                f"  Reused (by hash):  {self.reused:,} ({self.reuse_rate:.1%})",
+                f"  Removed (orphans): {self.removed:,} embeddings, "
+                f"{self.chunks_removed:,} chunks",
+                f"  Embedding calls:   {self.texts_embedded:,} texts "
+                f"in {self.embed_seconds:.1f}s",
+            ]
+        )
+
+
+class IncrementalReindexer:
+    """Attach vectors to ChunkRows, embedding only text not seen before."""
+
+    def __init__(
+        self,
+        embedder: Any,
+        model_name: Optional[str] = None,
+        dimension: Optional[int] = None,
+        collection_name: Optional[str] = None,
+        connection_factory: Optional[Callable[[], Any]] = None,
+        batch_size: int = LOOKUP_BATCH_SIZE,
+        runner: Optional[EmbeddingJobRunner] = None,
+    ):
+        """
+        Args:
+            embedder: LangChain Embeddings used for misses
+            model_name: Model in the hash (default: default embeddings model)
+            dimension: Dimension in the hash (default: default embeddings dim)
+            collection_name: PGVector collection (default: settings.collection)
+            connection_factory: Returns a psycopg connection (default: get_db_sync)
+            batch_size: Hashes per lookup query
+            runner: Embedding job runner for misses (default: one for embedder)
+        """
+        if model_name is None or dimension is None:
+            from src.config.embedding_provider import get_default_embedding_identity
+
+            default_model, default_dimension = get_default_embedding_identity()
+            model_name = model_name or default_model
+            dimension = dimension or default_dimension
+        if collection_name is None:
+            from src.config.models import settings
+
+            collection_name = settings.collection
+        if connection_factory is None:
+            from src.config.database import get_db_sync
+
+            connection_factory = get_db_sync
+
+        self.embedder = embedder
+        self.model_name = model_name
+        self.dimension = dimension
+        self.collection_name = collection_name
+        self.batch_size = batch_size
+        self.runner = runner or EmbeddingJobRunner(embedder)
+        self._connection_factory = connection_factory
+        self.diff = ReindexDiff()
+
+    def hash_for(self, text: str) -> str:
+        return embedding_hash(text, self.model_name, self.dimension)
+
+    def attach_embeddings(
+        self,
+        rows: Sequence[ChunkRow],
+        metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+    ) -> ReindexDiff:
+        """
+        Set row.embedding (reused or freshly embedded) and row.metadata.
+
+        cmetadata gets the embedding hash so the next run can reuse it.
+
+        Args:
+            rows: Rows to prepare (modified in place)
+            metadatas: cmetadata per row; defaults to the row's metadata
+
+        Returns:
+            Diff for these rows (also merged into self.diff)
+        """
+        diff = ReindexDiff()
+        if not rows:
+            return diff
+
+        hashes = [self.hash_for(row.content) for row in rows]
+        vectors = self.lookup(set(hashes))
+
+        missing: Dict[str, str] = {}
+        missing_rows: Dict[str, List[int]] = {}
+        for i, (row, content_hash) in enumerate(zip(rows, hashes)):
+            if content_hash not in vectors:
+                missing.setdefault(content_hash, row.content)
+                missing_rows.setdefault(content_hash, []).append(i)
+
+        if missing:
+            miss_hashes = list(missing)
+            job = self.runner.run(
+                [missing[h] for h in miss_hashes],
+                ids=[rows[missing_rows[h][0]].chunk_id for h in miss_hashes],
+            )
+            if job.failed:
+                # A text shared by several chunks failed for all of them
+                job.failed = [
+                    replace(failure, index=i, chunk_id=rows[i].chunk_id)
+                    for failure in job.failed
+                    for i in missing_rows[miss_hashes[failure.index]]
+                ]
+                raise EmbeddingJobError(job)
+            vectors.update(zip(miss_hashes, job.vectors))
+            diff.texts_embedded = len(missing)
+            diff.embed_seconds = job.duration_s
+
+        for i, (row, content_hash) in enumerate(zip(rows, hashes)):
+            base = metadatas[i] if metadatas is not None else row.metadata
+            row.metadata = {**(base or {}), EMBEDDING_HASH_KEY: content_hash}
+            row.embedding = vectors[content_hash]
+            if content_hash in missing:
+                diff.added += 1
+            else:
+                diff.reused += 1
+
+        self.diff.merge(diff)
+        logger.info(
+            f"♻️  Reindex: {diff.reused} reused, {diff.added} embedded "
+            f"({diff.texts_embedded} unique texts)"
+        )
+        return diff
+
+    def lookup(self, hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """Existing vectors in the collection for these hashes."""
+        hashes = list(hashes)
+        found: Dict[str, List[float]] = {}
+        if not hashes:
+            return found
+
+        conn = self._connection_factory()
+        try:
+            with conn.cursor() as cursor:
+                for i in range(0, len(hashes), self.batch_size):
+                    cursor.execute(
+                        LOOKUP_BY_HASH_SQL,
+                        {
+                            "collection": self.collection_name,
+                            "hashes": hashes[i : i + self.batch_size],
+                        },
+                    )
+                    for content_hash, vector in cursor.fetchall():
+                        found[content_hash] = parse_vector(vector)
+        finally:
+            conn.close()
+        return found
+
+    def remove_orphans(
+        self,
+        keep_chunk_ids: Iterable[str],
+        document_uuids: Optional[Sequence[Any]] = None,
+    ) -> int:
+        """
+        Delete rows this run did not (re)write.
+
+        Args:
+            keep_chunk_ids: chunk_ids written by this run
+            document_uuids: Limit to chunks of these documents.id values
+                (document_chunks + their embeddings). None sweeps the whole
+                collection by deterministic embedding id.
+
+        Returns:
+            Number of embeddings deleted
+        """
+        keep_chunk_ids = sorted(set(keep_chunk_ids))
+        if not keep_chunk_ids and document_uuids is None:
+            # An empty run must never wipe the collection
+            logger.warning("⚠️  No chunks written; skipping orphan sweep")
+            return 0
+
+        conn = self._connection_factory()
+        try:
+            with conn.cursor() as cursor:
+                if document_uuids is not None:
+                    params = {
+                        "document_uuids": list(document_uuids),
+                        "keep_chunk_ids": keep_chunk_ids,
+                    }
+                    cursor.execute(DELETE_DOCUMENT_ORPHAN_EMBEDDINGS_SQL, params)
+                    removed = max(cursor.rowcount, 0)
+                    cursor.execute(DELETE_DOCUMENT_ORPHAN_CHUNKS_SQL, params)
+                    self.diff.chunks_removed += max(cursor.rowcount, 0)
+                else:
+                    keep_ids = [
+                        embedding_id_for(chunk_id, self.collection_name)
+                        for chunk_id in keep_chunk_ids
+                    ]
+                    cursor.execute(
+                        DELETE_COLLECTION_ORPHANS_SQL,
+                        {"collection": self.collection_name, "keep_ids": keep_ids},
+                    )
+                    removed = max(cursor.rowcount, 0)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        self.diff.removed += removed
+        if removed:
+            logger.info(f"🗑️  Removed {removed} orphaned embeddings")
+        return removed
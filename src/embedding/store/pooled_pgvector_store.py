@@ -21,6 +21,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...config.models import settings
 from ...config.database import get_db, get_db_config
+from ..embedders.embedding_jobs import (
+    EmbeddingJobResult,
+    EmbeddingJobRunner,
+    FailedChunk,
+    record_failures,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +47,12 @@ class PooledPGVectorStore:
         self.collection_name = collection_name or settings.collection
         self._sync_connection_string = None
         self._langchain_store = None
+        self._job_runner: Optional[EmbeddingJobRunner] = None
+        self.last_embedding_job: Optional[EmbeddingJobResult] = None
         self.stats = {
             "documents_added": 0,
+            "documents_failed": 0,
+            "embedding_retries": 0,
             "queries_executed": 0,
             "batch_operations": 0,
             "errors": 0,
@@ -97,70 +107,93 @@ class PooledPGVectorStore:
         return self._langchain_store
 
     async def add_documents_batch(
-        self, documents: List[Document], batch_size: int = 50
+        self,
+        documents: List[Document],
+        batch_size: int = 50,
+        failure_log: Optional[str] = None,
     ) -> List[str]:
         """
-        Add documents in optimized batches để improve performance
+        Embed documents with an EmbeddingJobRunner, then store them in batches
+
+        Embedding runs as concurrent, token-packed requests under the shared
+        TPM/RPM budget with retries; storing uses precomputed vectors.
+        Documents that still fail are recorded in self.last_embedding_job
+        (and failure_log, if given) instead of being dropped silently.
 
         Args:
             documents: List of documents to add
-            batch_size: Size of each batch (optimized for connection pool)
+            batch_size: Documents per database insert
+            failure_log: JSONL file to append failed chunks to
 
         Returns:
-            List[str]: Document IDs
+            List[str]: IDs of stored documents
         """
         if not documents:
             return []
 
-        logger.info(f"Adding {len(documents)} documents in batches of {batch_size}")
+        logger.info(f"Adding {len(documents)} documents (embedding job + batched insert)")
 
-        document_ids = []
-        error_count = 0
+        texts = [doc.page_content for doc in documents]
+        chunk_ids = [
+            doc.metadata.get("chunk_id") or getattr(doc, "id", None)
+            for doc in documents
+        ]
 
         try:
-            # Process in batches to avoid overwhelming connection pool
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i : i + batch_size]
-                batch_num = i // batch_size + 1
-                total_batches = (len(documents) + batch_size - 1) // batch_size
+            job = await self._get_job_runner().arun(texts, ids=chunk_ids)
+        except Exception as e:
+            logger.error(f"Batch document addition failed: {e}")
+            self.stats["errors"] += 1
+            raise
 
-                logger.debug(
-                    f"Processing batch {batch_num}/{total_batches}: {len(batch)} documents"
+        document_ids = []
+        embedded = [i for i, vector in enumerate(job.vectors) if vector is not None]
+
+        for start in range(0, len(embedded), batch_size):
+            batch = embedded[start : start + batch_size]
+            batch_docs = [documents[i] for i in batch]
+            doc_ids = [getattr(doc, "id", None) for doc in batch_docs]
+
+            try:
+                batch_ids = self._langchain_store.add_embeddings(
+                    texts=[texts[i] for i in batch],
+                    embeddings=[job.vectors[i] for i in batch],
+                    metadatas=[doc.metadata for doc in batch_docs],
+                    ids=doc_ids if all(doc_ids) else None,
+                )
+                document_ids.extend(batch_ids)
+                self.stats["documents_added"] += len(batch)
+                self.stats["batch_operations"] += 1
+            except Exception as e:
+                logger.error(f"Storing batch of {len(batch)} embeddings failed: {e}")
+                self.stats["errors"] += 1
+                job.failed.extend(
+                    FailedChunk(
+                        index=i,
+                        chunk_id=chunk_ids[i],
+                        error=f"store: {type(e).__name__}: {e}",
+                        attempts=1,
+                    )
+                    for i in batch
                 )
 
-                try:
-                    # Use sync store for batch processing
-                    batch_ids = self._langchain_store.add_documents(batch)
-                    document_ids.extend(batch_ids)
-
-                    self.stats["documents_added"] += len(batch)
-                    self.stats["batch_operations"] += 1
-
-                    # Small delay between batches to prevent connection exhaustion
-                    if i + batch_size < len(documents):
-                        await asyncio.sleep(0.05)  # 50ms delay
-
-                except Exception as e:
-                    logger.error(f"Batch {batch_num} failed: {e}")
-                    error_count += 1
-                    self.stats["errors"] += 1
-
-                    # Continue with next batch instead of failing completely
-                    continue
-
-            success_rate = (
-                (len(documents) - error_count * batch_size) / len(documents)
-            ) * 100
-            logger.info(
-                f"Document addition completed. Success rate: {success_rate:.1f}%"
-            )
+        self.stats["documents_failed"] += len(job.failed)
+        self.stats["embedding_retries"] += job.retries
+        self.last_embedding_job = job
+        if failure_log:
+            record_failures(failure_log, job.failed, job=self.collection_name)
 
-            return document_ids
+        success_rate = len(document_ids) / len(documents) * 100
+        logger.info(
+            f"Document addition completed: {len(document_ids)}/{len(documents)} "
+            f"stored ({success_rate:.1f}%), {len(job.failed)} failed"
+        )
+        return document_ids
 
-        except Exception as e:
-            logger.error(f"Batch document addition failed: {e}")
-            self.stats["errors"] += 1
-            raise
+    def _get_job_runner(self) -> EmbeddingJobRunner:
+        if self._job_runner is None:
+            self._job_runner = EmbeddingJobRunner(self.embeddings)
+        return self._job_runner
 
     async def similarity_search_with_score(
         self,
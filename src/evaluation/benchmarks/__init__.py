@@ -0,0 +1,25 @@
+"""
+Offline RAG benchmarks
+
+Reproducible latency/throughput benchmarks for fast / balanced / quality
+modes on deterministic stand-in providers and an in-memory vector index
+seeded from data/raw. See harness.py for usage and baseline gating.
+"""
+
+from .harness import (
+    BenchmarkConfig,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+from .queries import BENCHMARK_QUERIES
+
+__all__ = [
+    "BENCHMARK_QUERIES",
+    "BenchmarkConfig",
+    "compare_to_baseline",
+    "load_baseline",
+    "run_benchmark",
+    "save_baseline",
+]
@@ -0,0 +1,5 @@
+"""python -m src.evaluation.benchmarks"""
+
+from .harness import main
+
+raise SystemExit(main())
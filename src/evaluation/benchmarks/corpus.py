@@ -0,0 +1,122 @@
+"""
+Benchmark corpus from data/raw
+
+Reads paragraph text straight from the .docx XML (zipfile + ElementTree,
+no python-docx) so the benchmark needs nothing beyond the repo checkout.
+.doc / .pdf / .xlsx files are skipped. Paragraphs are packed into chunks
+of roughly chunk_chars characters; files are read in sorted order so the
+corpus is identical across runs and machines.
+
+Usage:
+    from src.evaluation.benchmarks.corpus import load_corpus
+
+    chunks = load_corpus(max_chunks=1500)
+"""
+
+import logging
+import zipfile
+from pathlib import Path
+from typing import Iterator, List, Optional
+from xml.etree import ElementTree
+
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS_DIR = Path(__file__).resolve().parents[3] / "data" / "raw"
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# data/raw top-level folder → document_type (api upload_schemas.DocumentType)
+FOLDER_DOCUMENT_TYPES = {
+    "Luat chinh": "law",
+    "Nghi dinh": "decree",
+    "Thong tu": "circular",
+    "Quyet dinh": "decision",
+    "Ho so moi thau": "bidding",
+    "Mau bao cao": "report",
+    "Cau hoi thi": "exam",
+}
+
+
+def docx_paragraphs(path: Path) -> Iterator[str]:
+    """Non-empty paragraph texts of a .docx file, in document order."""
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    for paragraph in root.iter(f"{_W_NS}p"):
+        text = "".join(node.text or "" for node in paragraph.iter(f"{_W_NS}t")).strip()
+        if text:
+            yield text
+
+
+def _chunk_paragraphs(paragraphs: Iterator[str], chunk_chars: int) -> Iterator[str]:
+    buffer: List[str] = []
+    size = 0
+    for paragraph in paragraphs:
+        buffer.append(paragraph)
+        size += len(paragraph)
+        if size >= chunk_chars:
+            yield "\n".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "\n".join(buffer)
+
+
+def load_corpus(
+    root: Optional[Path] = None,
+    max_chunks: int = 1500,
+    chunk_chars: int = 800,
+) -> List[Document]:
+    """
+    Chunks from every .docx under root (default data/raw).
+
+    Chunks are taken round-robin across files so a capped corpus still
+    covers every document.
+
+    Raises:
+        FileNotFoundError: root has no readable .docx files
+    """
+    root = Path(root) if root else DEFAULT_CORPUS_DIR
+    files = sorted(root.rglob("*.docx"))
+
+    per_file: List[List[Document]] = []
+    for path in files:
+        relative = path.relative_to(root)
+        folder = relative.parts[0] if len(relative.parts) > 1 else ""
+        try:
+            texts = list(_chunk_paragraphs(docx_paragraphs(path), chunk_chars))
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+            logger.warning(f"⚠️ Skipping unreadable {relative}: {e}")
+            continue
+        per_file.append(
+            [
+                Document(
+                    id=f"{relative.with_suffix('')}#{i}",
+                    page_content=text,
+                    metadata={
+                        "document_id": str(relative.with_suffix("")),
+                        "document_type": FOLDER_DOCUMENT_TYPES.get(folder, "other"),
+                        "chunk_index": i,
+                        "source_file": str(relative),
+                    },
+                )
+                for i, text in enumerate(texts)
+            ]
+        )
+
+    if not per_file:
+        raise FileNotFoundError(f"No readable .docx files under {root}")
+
+    # Round-robin across files so max_chunks does not exhaust the first folder
+    chunks: List[Document] = []
+    position = 0
+    while len(chunks) < max_chunks and any(position < len(f) for f in per_file):
+        for file_chunks in per_file:
+            if position < len(file_chunks):
+                chunks.append(file_chunks[position])
+                if len(chunks) >= max_chunks:
+                    break
+        position += 1
+
+    logger.info(f"📚 Benchmark corpus: {len(chunks)} chunks from {len(per_file)} files")
+    return chunks
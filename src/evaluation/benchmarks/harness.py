@@ -0,0 +1,285 @@
+"""
+Offline RAG Benchmark Harness
+
+Runs BENCHMARK_QUERIES through fast / balanced / quality pipelines on
+stand-in providers (providers.py) and an in-memory vector index seeded from
+data/raw (corpus.py). No API server, keys or database are needed, so it can
+run in CI.
+
+Reports per-stage p50/p95/p99/mean latency and throughput per mode, and
+compares them against a stored baseline:
+
+- a stage regresses when its p50 or p95 exceeds baseline * (1 + tolerance)
+  + slack_ms (p99 over a few dozen questions is too noisy to gate on)
+- throughput regresses when it drops below baseline * (1 - tolerance)
+
+Usage:
+    python -m src.evaluation.benchmarks                     # compare with baseline
+    python -m src.evaluation.benchmarks --update-baseline   # record new baseline
+    python -m src.evaluation.benchmarks --profile zero --modes fast quality
+"""
+
+import argparse
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from .corpus import load_corpus
+from .pipeline import MODES, STAGES, OfflineRAGPipeline
+from .providers import LATENCY_PROFILES, FakeEmbeddings, make_providers
+from .queries import BENCHMARK_QUERIES
+from .vector_store import InMemoryVectorIndex
+
+logger = logging.getLogger(__name__)
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+# Config fields that must match for a baseline comparison to be meaningful
+COMPARABLE_FIELDS = ("profile", "k", "concurrency", "max_chunks", "iterations")
+
+
+@dataclass
+class BenchmarkConfig:
+    modes: Tuple[str, ...] = ("fast", "balanced", "quality")
+    profile: str = "default"
+    k: int = 5
+    iterations: int = 1  # passes over the question set per mode
+    concurrency: int = 1  # questions in flight
+    warmup: int = 2  # untimed questions per mode
+    max_chunks: int = 1500
+    corpus_dir: Optional[str] = None
+
+
+def benchmark_questions() -> List[str]:
+    return [q for queries in BENCHMARK_QUERIES.values() for q in queries]
+
+
+def build_vector_store(chunks: List[Document], dimensions: int) -> InMemoryVectorIndex:
+    """Seed the index without injected latency (seeding is not measured)."""
+    return InMemoryVectorIndex(chunks, FakeEmbeddings(dimensions=dimensions))
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99/mean in ms."""
+    values = np.asarray(samples, dtype=float)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50": round(float(p50), 2),
+        "p95": round(float(p95), 2),
+        "p99": round(float(p99), 2),
+        "mean": round(float(values.mean()), 2),
+    }
+
+
+def run_mode(
+    pipeline: OfflineRAGPipeline, questions: List[str], config: BenchmarkConfig
+) -> Dict[str, Any]:
+    """Time every question of one mode; returns per-stage stats + throughput."""
+    for question in questions[: config.warmup]:
+        pipeline.run(question)
+
+    workload = questions * config.iterations
+
+    def run_one(question: str) -> Dict[str, float]:
+        start = time.perf_counter()
+        result = pipeline.run(question)
+        return {**result.stage_ms, "total": (time.perf_counter() - start) * 1000}
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=config.concurrency, thread_name_prefix="benchmark-request"
+    ) as pool:
+        timings = list(pool.map(run_one, workload))
+    wall_s = time.perf_counter() - start
+
+    return {
+        "questions": len(workload),
+        "throughput_qps": round(len(workload) / wall_s, 2),
+        "stages": {
+            stage: summarize([t[stage] for t in timings])
+            for stage in (*STAGES, "total")
+        },
+    }
+
+
+def run_benchmark(
+    config: BenchmarkConfig, chunks: Optional[List[Document]] = None
+) -> Dict[str, Any]:
+    """Run all configured modes; chunks defaults to load_corpus(config)."""
+    if config.profile not in LATENCY_PROFILES:
+        raise ValueError(
+            f"Unknown latency profile: {config.profile}. "
+            f"Available: {', '.join(LATENCY_PROFILES)}"
+        )
+    if chunks is None:
+        chunks = load_corpus(
+            Path(config.corpus_dir) if config.corpus_dir else None,
+            max_chunks=config.max_chunks,
+        )
+
+    providers = make_providers(LATENCY_PROFILES[config.profile])
+    store = build_vector_store(chunks, providers["embeddings"].dimensions)
+    questions = benchmark_questions()
+
+    report: Dict[str, Any] = {
+        "config": asdict(config),
+        "corpus_chunks": len(chunks),
+        "modes": {},
+    }
+    for mode in config.modes:
+        pipeline = OfflineRAGPipeline(store, providers, mode=mode, k=config.k)
+        logger.info(f"⏱️ Benchmarking mode={mode} ({len(questions)} questions)")
+        report["modes"][mode] = run_mode(pipeline, questions, config)
+    return report
+
+
+# =============================================================================
+# Baselines
+# =============================================================================
+
+
+def baseline_path(profile: str) -> Path:
+    return BASELINE_DIR / f"offline_{profile}.json"
+
+
+def save_baseline(report: Dict[str, Any], path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.25,
+    slack_ms: float = 5.0,
+) -> List[str]:
+    """
+    Regressions of report against baseline (empty list = pass).
+
+    Raises:
+        ValueError: the runs are not comparable (different profile, k, ...)
+    """
+    for name in COMPARABLE_FIELDS:
+        if report["config"].get(name) != baseline["config"].get(name):
+            raise ValueError(
+                f"Baseline not comparable: {name}={baseline['config'].get(name)!r}, "
+                f"run has {report['config'].get(name)!r}"
+            )
+
+    regressions = []
+    for mode, current in report["modes"].items():
+        base = baseline["modes"].get(mode)
+        if base is None:
+            continue
+        for stage, stats in current["stages"].items():
+            base_stats = base["stages"].get(stage)
+            if base_stats is None:
+                continue
+            for quantile in ("p50", "p95"):
+                limit = base_stats[quantile] * (1 + tolerance) + slack_ms
+                if stats[quantile] > limit:
+                    regressions.append(
+                        f"{mode}/{stage} {quantile}: {stats[quantile]:.1f}ms "
+                        f"> {limit:.1f}ms (baseline {base_stats[quantile]:.1f}ms)"
+                    )
+        floor = base["throughput_qps"] * (1 - tolerance)
+        if current["throughput_qps"] < floor:
+            regressions.append(
+                f"{mode} throughput: {current['throughput_qps']:.2f} q/s "
+                f"< {floor:.2f} q/s (baseline {base['throughput_qps']:.2f} q/s)"
+            )
+    return regressions
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Corpus: {report['corpus_chunks']} chunks | "
+        f"profile={report['config']['profile']} | "
+        f"concurrency={report['config']['concurrency']}"
+    ]
+    header = f"{'mode':<10} {'stage':<14} {'p50':>9} {'p95':>9} {'p99':>9} {'mean':>9}"
+    for mode, result in report["modes"].items():
+        lines += ["", f"{header}", "-" * len(header)]
+        for stage, stats in result["stages"].items():
+            lines.append(
+                f"{mode:<10} {stage:<14} {stats['p50']:>9.2f} {stats['p95']:>9.2f} "
+                f"{stats['p99']:>9.2f} {stats['mean']:>9.2f}"
+            )
+        lines.append(
+            f"{mode:<10} {'throughput':<14} {result['throughput_qps']:>9.2f} q/s "
+            f"({result['questions']} questions)"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline RAG benchmark")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--profile", default="default", choices=list(LATENCY_PROFILES))
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--max-chunks", type=int, default=1500)
+    parser.add_argument("--corpus-dir", default=None)
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline JSON path")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--slack-ms", type=float, default=5.0)
+    parser.add_argument("--output", type=Path, default=None, help="Write report JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    config = BenchmarkConfig(
+        modes=tuple(args.modes),
+        profile=args.profile,
+        k=args.k,
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        max_chunks=args.max_chunks,
+        corpus_dir=args.corpus_dir,
+    )
+    report = run_benchmark(config)
+    print(format_report(report))
+
+    if args.output:
+        save_baseline(report, args.output)
+
+    path = args.baseline or baseline_path(config.profile)
+    if args.update_baseline:
+        save_baseline(report, path)
+        print(f"\n💾 Baseline written to {path}")
+        return 0
+
+    baseline = load_baseline(path)
+    if baseline is None:
+        print(f"\n⚠️ No baseline at {path} (run with --update-baseline)")
+        return 0
+
+    regressions = compare_to_baseline(
+        report, baseline, tolerance=args.tolerance, slack_ms=args.slack_ms
+    )
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) vs {path}:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+    print(f"\n✅ No regressions vs {path}")
+    return 0
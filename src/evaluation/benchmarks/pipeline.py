@@ -0,0 +1,142 @@
+"""
+Offline RAG pipeline for benchmarks
+
+Builds the production retriever for a mode with create_retriever and
+injects the stand-in providers and the in-memory vector index, so the
+measured path is the real one (BaseVectorRetriever, QueryEnhancer,
+EnhancedRetriever / FusionRetriever, shared thread pools). Stages are timed
+by wrapping the injected providers (timing.py):
+
+    enhancement   QueryEnhancer.enhance (one LLM call per strategy)
+    embedding     query embedding (one batched call for all variants)
+    vector_search per-variant search, concurrent (retrieve_many)
+    fusion        rest of the retrieval call: dedupe / RRF and plumbing
+    rerank        cross-encoder stand-in over the fused candidates
+    generation    answer LLM call over the formatted context
+
+Each stage's wall time is recorded per question.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from src.retrieval.retrievers import create_retriever
+
+from .providers import FakeLLM, FakeReranker
+from .timing import StageClock, TimedEmbeddings, TimedEnhancer, TimedReranker, TimedVectorStore
+from .vector_store import InMemoryVectorIndex
+
+STAGES = (
+    "enhancement",
+    "embedding",
+    "vector_search",
+    "fusion",
+    "rerank",
+    "generation",
+)
+
+# Modes create_retriever builds on the vector index alone (hybrid also
+# needs the PostgreSQL full-text index)
+MODES = ("fast", "balanced", "quality")
+
+RERANKING_MODES = ("balanced", "quality")
+
+
+@dataclass
+class PipelineResult:
+    documents: List[Document]
+    answer: str
+    stage_ms: Dict[str, float] = field(default_factory=dict)
+
+
+class OfflineRAGPipeline:
+    """One mode's retrieval + generation over stand-in providers."""
+
+    def __init__(
+        self,
+        vector_store: InMemoryVectorIndex,
+        providers: Dict[str, object],
+        mode: str = "balanced",
+        k: int = 5,
+        reranking: Optional[bool] = None,
+    ):
+        """reranking overrides the mode's default (None = as create_retriever)."""
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}. Available: {', '.join(MODES)}")
+        self.vector_store = vector_store
+        self.embeddings = providers["embeddings"]
+        self.enhancement_llm: FakeLLM = providers["enhancement_llm"]
+        self.generation_llm: FakeLLM = providers["generation_llm"]
+        self.reranker: FakeReranker = providers["reranker"]
+        self.mode = mode
+        self.k = k
+        self.reranking = mode in RERANKING_MODES if reranking is None else reranking
+        # One retriever per in-flight question: a retriever's stage clock
+        # must only see its own question's calls
+        self._idle: List[Tuple[BaseRetriever, StageClock]] = []
+        self._idle_lock = threading.Lock()
+
+    def run(self, question: str) -> PipelineResult:
+        """Retrieval + generation."""
+        result = self.retrieve(question)
+        start = time.perf_counter()
+        result.answer = self._generate(question, result.documents)
+        result.stage_ms["generation"] = (time.perf_counter() - start) * 1000
+        return result
+
+    def retrieve(self, question: str) -> PipelineResult:
+        """Retrieval stages only (answer is empty)."""
+        retriever, clock = self._acquire()
+        try:
+            clock.reset()
+            start = time.perf_counter()
+            documents = retriever.invoke(question)
+            total = (time.perf_counter() - start) * 1000
+            measured = clock.stage_ms()
+        finally:
+            self._release(retriever, clock)
+
+        stage_ms = {
+            stage: measured.get(stage, 0.0)
+            for stage in ("enhancement", "embedding", "vector_search", "rerank")
+        }
+        stage_ms["fusion"] = max(0.0, total - sum(stage_ms.values()))
+        return PipelineResult(documents=documents, answer="", stage_ms=stage_ms)
+
+    def _acquire(self) -> Tuple[BaseRetriever, StageClock]:
+        with self._idle_lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._build_retriever()
+
+    def _release(self, retriever: BaseRetriever, clock: StageClock):
+        with self._idle_lock:
+            self._idle.append((retriever, clock))
+
+    def _build_retriever(self) -> Tuple[BaseRetriever, StageClock]:
+        clock = StageClock()
+        embeddings = TimedEmbeddings(self.embeddings, clock)
+        reranker = TimedReranker(self.reranker, clock) if self.reranking else None
+        retriever = create_retriever(
+            mode=self.mode,
+            enable_reranking=reranker is not None,
+            reranker=reranker,
+            k=self.k,
+            embeddings=embeddings,
+            vector_store=TimedVectorStore(self.vector_store, embeddings, clock),
+            llm_client=self.enhancement_llm,
+        )
+        if getattr(retriever, "query_enhancer", None) is not None:
+            retriever.query_enhancer = TimedEnhancer(retriever.query_enhancer, clock)
+        return retriever, clock
+
+    def _generate(self, question: str, documents: List[Document]) -> str:
+        context = "\n".join(
+            f"[#{i}]\n{doc.page_content}\n" for i, doc in enumerate(documents, 1)
+        )
+        return self.generation_llm.invoke(f"{context}\n\nCâu hỏi: {question}").content
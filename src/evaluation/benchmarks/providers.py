@@ -0,0 +1,183 @@
+"""
+Deterministic stand-in providers for offline benchmarks
+
+Embeddings, LLM and reranker with the same call shapes as the production
+providers, but computed locally from hashes of the input text. Every call
+sleeps for a configured latency (fixed + per item + jitter derived from
+the input), so a run measures this code's own overhead on top of a known,
+repeatable provider cost instead of network noise.
+
+Usage:
+    from src.evaluation.benchmarks.providers import LATENCY_PROFILES, FakeEmbeddings
+
+    profile = LATENCY_PROFILES["default"]
+    embeddings = FakeEmbeddings(latency=profile.embedding)
+"""
+
+import hashlib
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage, BaseMessage
+
+from src.retrieval.ranking import BaseReranker
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens (Vietnamese diacritics kept)."""
+    return _WORD_RE.findall(text.lower())
+
+
+def _stable_hash(text: str) -> int:
+    """Process-independent 64-bit hash (built-in hash() is salted per run)."""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Injected latency: base_ms + per_item_ms * items + jitter in [0, jitter_ms)."""
+
+    base_ms: float = 0.0
+    per_item_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def delay_ms(self, key: str, items: int = 1) -> float:
+        jitter = 0.0
+        if self.jitter_ms:
+            jitter = (_stable_hash(key) % 10_000) / 10_000 * self.jitter_ms
+        return self.base_ms + self.per_item_ms * items + jitter
+
+    def sleep(self, key: str, items: int = 1):
+        delay = self.delay_ms(key, items)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Latency for each provider used by the pipeline."""
+
+    embedding: LatencyModel = field(default_factory=LatencyModel)
+    enhancement_llm: LatencyModel = field(default_factory=LatencyModel)
+    generation_llm: LatencyModel = field(default_factory=LatencyModel)
+    reranker: LatencyModel = field(default_factory=LatencyModel)
+
+
+LATENCY_PROFILES: Dict[str, LatencyProfile] = {
+    # Only in-process overhead (vector search, fusion, plumbing)
+    "zero": LatencyProfile(),
+    # Scaled-down provider costs: keeps the relative weight of stages while
+    # a CI run stays within seconds
+    "default": LatencyProfile(
+        embedding=LatencyModel(base_ms=15, per_item_ms=0.5, jitter_ms=5),
+        enhancement_llm=LatencyModel(base_ms=60, per_item_ms=0.2, jitter_ms=20),
+        generation_llm=LatencyModel(base_ms=80, per_item_ms=0.5, jitter_ms=30),
+        reranker=LatencyModel(base_ms=20, per_item_ms=1.0, jitter_ms=5),
+    ),
+}
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Feature-hashed bag of words + bigrams, L2 normalized.
+
+    Texts sharing words get high cosine similarity, so retrieval over a
+    real corpus returns plausible neighbours.
+    """
+
+    def __init__(self, dimensions: int = 256, latency: LatencyModel = LatencyModel()):
+        self.dimensions = dimensions
+        self.latency = latency
+
+    def _vector(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        tokens = tokenize(text)
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            h = _stable_hash(feature)
+            vector[h % self.dimensions] += 1.0 if (h >> 32) & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.latency.sleep("|".join(texts[:1]), items=len(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """One batched call, like CachedEmbedder.embed_queries."""
+        return self.embed_documents(texts)
+
+
+class FakeLLM:
+    """
+    Chat-model stand-in: returns deterministic text built from the
+    prompt's words, line_words words per line (so list-parsing strategies
+    such as Multi-Query get several variants).
+    """
+
+    def __init__(
+        self,
+        latency: LatencyModel = LatencyModel(),
+        output_words: int = 60,
+        line_words: int = 8,
+    ):
+        self.latency = latency
+        self.output_words = output_words
+        self.line_words = line_words
+
+    def invoke(self, prompt: Union[str, Sequence[BaseMessage]]) -> AIMessage:
+        if not isinstance(prompt, str):
+            prompt = "\n".join(str(message.content) for message in prompt)
+        words = tokenize(prompt) or ["trống"]
+        seed = _stable_hash(prompt)
+        output = [words[(seed + i * 7919) % len(words)] for i in range(self.output_words)]
+        lines = [
+            " ".join(output[i : i + self.line_words])
+            for i in range(0, len(output), self.line_words)
+        ]
+        # per_item_ms is per output word (decode time)
+        self.latency.sleep(prompt, items=self.output_words)
+        return AIMessage(content="\n".join(lines))
+
+
+class FakeReranker(BaseReranker):
+    """Scores by query/document word overlap (Jaccard)."""
+
+    def __init__(self, latency: LatencyModel = LatencyModel()):
+        self.latency = latency
+
+    def rerank(
+        self, query: str, documents: List[Document], top_k: int = 5
+    ) -> List[Tuple[Document, float]]:
+        self.latency.sleep(query, items=len(documents))
+        query_tokens = set(tokenize(query))
+        scored = []
+        for doc in documents:
+            doc_tokens = set(tokenize(doc.page_content))
+            union = query_tokens | doc_tokens
+            scored.append((doc, len(query_tokens & doc_tokens) / len(union) if union else 0.0))
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        return scored[:top_k]
+
+
+def make_providers(profile: LatencyProfile) -> Dict[str, object]:
+    """Providers for one benchmark run."""
+    return {
+        "embeddings": FakeEmbeddings(latency=profile.embedding),
+        "enhancement_llm": FakeLLM(latency=profile.enhancement_llm, output_words=24),
+        "generation_llm": FakeLLM(latency=profile.generation_llm, output_words=120),
+        "reranker": FakeReranker(latency=profile.reranker),
+    }
+
@@ -0,0 +1,144 @@
+"""
+Stage timing wrappers
+
+Delegating wrappers around the providers a retriever calls (query
+enhancer, embeddings, vector store, reranker). Each call records its wall
+time on a StageClock, so a retriever built by create_retriever can be
+timed per stage without changing its code.
+
+A stage's time is the span from its first call's start to its last call's
+end, so concurrent calls (per-variant vector searches) count once, not
+once per thread.
+
+Usage:
+    clock = StageClock()
+    reranker = TimedReranker(get_reranker(), clock)
+    ...
+    clock.reset()
+    retriever.invoke(question)
+    clock.stage_ms()  # {"enhancement": 61.2, "rerank": 20.4, ...}
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from src.retrieval.ranking import BaseReranker
+
+
+class StageClock:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: Dict[str, Tuple[float, float]] = {}
+
+    def reset(self):
+        with self._lock:
+            self._spans = {}
+
+    def add(self, stage: str, started: float):
+        """Record a call to stage that started at started (perf_counter)."""
+        ended = time.perf_counter()
+        with self._lock:
+            first, last = self._spans.get(stage, (started, ended))
+            self._spans[stage] = (min(first, started), max(last, ended))
+
+    def stage_ms(self) -> Dict[str, float]:
+        with self._lock:
+            return {stage: (end - start) * 1000 for stage, (start, end) in self._spans.items()}
+
+
+class TimedReranker(BaseReranker):
+    """Delegates to a reranker, recording its time under "rerank"."""
+
+    def __init__(self, inner: BaseReranker, clock: StageClock):
+        self.inner = inner
+        self.clock = clock
+
+    def rerank(self, query: str, documents: List[Document], top_k: int = 5):
+        started = time.perf_counter()
+        try:
+            return self.inner.rerank(query, documents, top_k=top_k)
+        finally:
+            self.clock.add("rerank", started)
+
+
+class TimedEnhancer:
+    """Delegates enhance() to a QueryEnhancer, recording "enhancement"."""
+
+    def __init__(self, inner, clock: StageClock):
+        self.inner = inner
+        self.clock = clock
+
+    def enhance(self, query: str) -> List[str]:
+        # Drop the enhancer's cached variants so LLM time is measured
+        if getattr(self.inner, "cache", None) is not None:
+            self.inner.cache.pop(query.strip(), None)
+        started = time.perf_counter()
+        try:
+            return self.inner.enhance(query)
+        finally:
+            self.clock.add("enhancement", started)
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+
+class TimedEmbeddings(Embeddings):
+    """Delegates query embedding, recording "embedding"."""
+
+    def __init__(self, inner: Embeddings, clock: StageClock):
+        self.inner = inner
+        self.clock = clock
+        # Batched query embedding only if the wrapped provider has it
+        # (BaseVectorRetriever.retrieve_many checks for the attribute)
+        if hasattr(inner, "embed_queries"):
+            self.embed_queries = self._embed_queries
+
+    def _timed(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.clock.add("embedding", started)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._timed(self.inner.embed_documents, texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._timed(self.inner.embed_query, text)
+
+    def _embed_queries(self, texts: List[str]) -> List[List[float]]:
+        return self._timed(self.inner.embed_queries, texts)
+
+
+class TimedVectorStore:
+    """
+    Delegates vector search, recording "vector_search".
+
+    similarity_search embeds the query with the given (timed) embeddings
+    first, as PGVector does with its embedding function.
+    """
+
+    def __init__(self, inner, embeddings: Embeddings, clock: StageClock):
+        self.inner = inner
+        self.embeddings = embeddings
+        self.clock = clock
+
+    def similarity_search_by_vector(
+        self, embedding: Sequence[float], k: int = 4, filter: Optional[dict] = None
+    ) -> List[Document]:
+        started = time.perf_counter()
+        try:
+            return self.inner.similarity_search_by_vector(embedding, k=k, filter=filter)
+        finally:
+            self.clock.add("vector_search", started)
+
+    def similarity_search(
+        self, query: str, k: int = 4, filter: Optional[dict] = None
+    ) -> List[Document]:
+        return self.similarity_search_by_vector(
+            self.embeddings.embed_query(query), k=k, filter=filter
+        )
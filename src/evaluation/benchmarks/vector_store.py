@@ -0,0 +1,44 @@
+"""
+In-memory vector index for offline benchmarks
+
+Exact cosine top-k over a normalized float32 matrix built once at seeding
+(langchain's InMemoryVectorStore rebuilds the matrix on every query, which
+would dominate the measured search time). Same search-by-vector
+signature as the PGVector store used by BaseVectorRetriever.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+
+class InMemoryVectorIndex:
+    def __init__(self, documents: List[Document], embeddings: Embeddings):
+        self.documents = list(documents)
+        vectors = np.asarray(
+            embeddings.embed_documents([doc.page_content for doc in self.documents]),
+            dtype=np.float32,
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        self._matrix = vectors / np.where(norms == 0, 1, norms)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def similarity_search_by_vector(
+        self, embedding: Sequence[float], k: int = 4, filter: Optional[dict] = None
+    ) -> List[Document]:
+        if filter:
+            raise NotImplementedError("Metadata filters are not supported offline")
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0 or not self.documents:
+            return []
+        scores = self._matrix @ (query / norm)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        # argpartition is unordered; stable tie-break on corpus position
+        order = top[np.lexsort((top, -scores[top]))]
+        return [self.documents[i] for i in order]
@@ -0,0 +1,100 @@
+"""
+Retrieval quality metrics
+
+Rank metrics over retrieved chunk ids vs. the expected (relevant) chunk ids
+of a golden question. Retrieved ids are de-duplicated keeping the first
+occurrence, so a chunk returned twice is neither rewarded nor penalised
+twice. Relevance is binary unless graded gains are passed to ndcg_at_k.
+
+Usage:
+    from src.evaluation.metrics.retrieval_metrics import evaluate_ranking
+
+    evaluate_ranking(["c3", "c1", "c9"], {"c1", "c2"}, k=3)
+    # {"recall@3": 0.5, "precision@3": 0.333, "mrr": 0.5, "ndcg@3": 0.387, "hit@3": 1.0}
+"""
+
+import math
+from typing import Collection, Dict, List, Mapping, Optional, Sequence
+
+
+def _unique(retrieved: Sequence[str]) -> List[str]:
+    return list(dict.fromkeys(retrieved))
+
+
+def recall_at_k(retrieved: Sequence[str], relevant: Collection[str], k: int) -> float:
+    """Fraction of relevant chunks found in the top k."""
+    if not relevant:
+        return 0.0
+    hits = sum(1 for chunk_id in _unique(retrieved)[:k] if chunk_id in relevant)
+    return hits / len(relevant)
+
+
+def precision_at_k(retrieved: Sequence[str], relevant: Collection[str], k: int) -> float:
+    """Fraction of the top k that is relevant (divides by k, not by len(retrieved))."""
+    if k <= 0:
+        return 0.0
+    hits = sum(1 for chunk_id in _unique(retrieved)[:k] if chunk_id in relevant)
+    return hits / k
+
+
+def hit_at_k(retrieved: Sequence[str], relevant: Collection[str], k: int) -> float:
+    """1.0 if any relevant chunk is in the top k."""
+    return 1.0 if any(chunk_id in relevant for chunk_id in _unique(retrieved)[:k]) else 0.0
+
+
+def reciprocal_rank(
+    retrieved: Sequence[str], relevant: Collection[str], k: Optional[int] = None
+) -> float:
+    """1 / rank of the first relevant chunk (0 if none in the top k); mean over questions = MRR."""
+    for rank, chunk_id in enumerate(_unique(retrieved)[:k], start=1):
+        if chunk_id in relevant:
+            return 1.0 / rank
+    return 0.0
+
+
+def ndcg_at_k(
+    retrieved: Sequence[str],
+    relevant: Collection[str],
+    k: int,
+    gains: Optional[Mapping[str, float]] = None,
+) -> float:
+    """
+    Normalised DCG with log2 discount.
+
+    gains maps chunk id → graded relevance; defaults to 1.0 for every
+    relevant chunk.
+    """
+    if gains is None:
+        gains = {chunk_id: 1.0 for chunk_id in relevant}
+
+    dcg = sum(
+        gains.get(chunk_id, 0.0) / math.log2(rank + 1)
+        for rank, chunk_id in enumerate(_unique(retrieved)[:k], start=1)
+    )
+    ideal = sorted(gains.values(), reverse=True)[:k]
+    idcg = sum(gain / math.log2(rank + 1) for rank, gain in enumerate(ideal, start=1))
+    return dcg / idcg if idcg > 0 else 0.0
+
+
+def evaluate_ranking(
+    retrieved: Sequence[str], relevant: Collection[str], k: int
+) -> Dict[str, float]:
+    """All metrics for one question, keyed like "recall@5"."""
+    relevant = set(relevant)
+    return {
+        f"recall@{k}": recall_at_k(retrieved, relevant, k),
+        f"precision@{k}": precision_at_k(retrieved, relevant, k),
+        "mrr": reciprocal_rank(retrieved, relevant, k),
+        f"ndcg@{k}": ndcg_at_k(retrieved, relevant, k),
+        f"hit@{k}": hit_at_k(retrieved, relevant, k),
+    }
+
+
+def mean_metrics(per_question: Sequence[Dict[str, float]]) -> Dict[str, float]:
+    """Average each metric over questions."""
+    if not per_question:
+        return {}
+    return {
+        name: sum(metrics[name] for metrics in per_question) / len(per_question)
+        for name in per_question[0]
+    }
@@ -0,0 +1,438 @@
+"""
+Retrieval Evaluator - quality vs. latency over golden sets
+
+Runs a golden set (question → expected chunk ids) through retrieval
+configurations and reports recall@k, precision@k, MRR, nDCG@k, hit@k and
+per-stage latency, so a faster path (smaller k, cheaper reranker, no query
+enhancement) can be checked for what it costs in accuracy.
+
+- Backends: "production" builds retrievers with create_retriever (needs the
+  database and provider keys); "offline" uses the benchmark pipeline
+  (src/evaluation/benchmarks): the same create_retriever path with
+  stand-in providers injected
+- Stages: enhancement and rerank are timed by wrapping the retriever's
+  query enhancer / reranker; "search" is the rest of the retrieval call
+- Caching: each config's result is stored under a key of (backend, config,
+  golden set contents), so re-running a sweep only computes new or changed
+  configs
+- Pareto table: configs sorted by latency; ★ marks configs no other config
+  beats on both quality and latency
+
+Golden set JSON:
+    {"name": "...", "items": [
+        {"question": "...", "category": "law", "expected_chunk_ids": ["..."]}
+    ]}
+
+A golden set is started from BENCHMARK_QUERIES with --bootstrap, which
+lists a reference config's top chunks per question as candidates to label.
+
+Usage:
+    python -m src.evaluation.retrieval_evaluator --bootstrap golden.json
+    python -m src.evaluation.retrieval_evaluator --golden golden.json \\
+        --modes fast balanced quality --rerankers bge vertex --k-values 3 5
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+from src.evaluation.benchmarks.harness import summarize
+from src.evaluation.benchmarks.queries import BENCHMARK_QUERIES
+from src.evaluation.benchmarks.timing import StageClock, TimedEnhancer, TimedReranker
+from src.evaluation.metrics.retrieval_metrics import evaluate_ranking, mean_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "outputs" / "retrieval_eval_cache"
+
+# retrieve(question) → (documents, stage_ms)
+RetrieveFn = Callable[[str], Tuple[List[Document], Dict[str, float]]]
+
+
+@dataclass(frozen=True)
+class EvalConfig:
+    mode: str = "balanced"
+    reranker_type: Optional[str] = None  # None = no reranking
+    k: int = 5
+    # Settings applied outside the factory (env overrides, index version...);
+    # only part of the cache key
+    extra: Tuple[Tuple[str, Any], ...] = ()
+
+    @property
+    def name(self) -> str:
+        reranker = self.reranker_type or "none"
+        suffix = "".join(f",{key}={value}" for key, value in self.extra)
+        return f"{self.mode}/{reranker}/k={self.k}{suffix}"
+
+
+@dataclass
+class GoldenItem:
+    question: str
+    expected_chunk_ids: List[str]
+    category: str = ""
+
+
+@dataclass
+class GoldenSet:
+    name: str
+    items: List[GoldenItem] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: Path) -> "GoldenSet":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        items = [
+            GoldenItem(
+                question=item["question"],
+                expected_chunk_ids=list(item.get("expected_chunk_ids") or []),
+                category=item.get("category", ""),
+            )
+            for item in data["items"]
+        ]
+        return cls(name=data.get("name", Path(path).stem), items=items)
+
+    def labelled(self) -> List[GoldenItem]:
+        return [item for item in self.items if item.expected_chunk_ids]
+
+    def fingerprint(self) -> str:
+        payload = json.dumps(
+            [(i.question, sorted(i.expected_chunk_ids)) for i in self.labelled()],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def chunk_key(doc: Document) -> str:
+    """Chunk identity used by golden sets (same as the PGVector store ids)."""
+    return str(doc.metadata.get("chunk_id") or doc.id or "")
+
+
+# =============================================================================
+# Retriever factories
+# =============================================================================
+
+
+def production_retriever(config: EvalConfig) -> RetrieveFn:
+    """create_retriever for config, instrumented per stage."""
+    from src.config.reranker_provider import get_reranker
+    from src.retrieval.retrievers import create_retriever
+
+    clock = StageClock()
+    reranker = None
+    if config.reranker_type and config.mode not in ("fast", "hybrid"):
+        reranker = TimedReranker(get_reranker(provider=config.reranker_type), clock)
+
+    retriever = create_retriever(
+        mode=config.mode,
+        enable_reranking=reranker is not None,
+        reranker=reranker,
+        k=config.k,
+    )
+    if getattr(retriever, "query_enhancer", None) is not None:
+        retriever.query_enhancer = TimedEnhancer(retriever.query_enhancer, clock)
+
+    def retrieve(question: str) -> Tuple[List[Document], Dict[str, float]]:
+        clock.reset()
+        started = time.perf_counter()
+        docs = retriever.invoke(question)
+        total = (time.perf_counter() - started) * 1000
+        measured = clock.stage_ms()
+        stage_ms = {
+            "enhancement": measured.get("enhancement", 0.0),
+            "rerank": measured.get("rerank", 0.0),
+        }
+        stage_ms["search"] = max(0.0, total - sum(stage_ms.values()))
+        stage_ms["total"] = total
+        return docs, stage_ms
+
+    return retrieve
+
+
+def offline_retriever_factory(
+    chunks: Optional[List[Document]] = None, profile: str = "default"
+) -> Callable[[EvalConfig], RetrieveFn]:
+    """Factory over the offline benchmark pipeline (stand-in providers)."""
+    from src.evaluation.benchmarks.corpus import load_corpus
+    from src.evaluation.benchmarks.harness import build_vector_store
+    from src.evaluation.benchmarks.pipeline import OfflineRAGPipeline
+    from src.evaluation.benchmarks.providers import LATENCY_PROFILES, make_providers
+
+    providers = make_providers(LATENCY_PROFILES[profile])
+    store = build_vector_store(
+        chunks if chunks is not None else load_corpus(), providers["embeddings"].dimensions
+    )
+
+    def factory(config: EvalConfig) -> RetrieveFn:
+        pipeline = OfflineRAGPipeline(
+            store,
+            providers,
+            mode=config.mode,
+            k=config.k,
+            reranking=config.reranker_type is not None,
+        )
+
+        def retrieve(question: str) -> Tuple[List[Document], Dict[str, float]]:
+            started = time.perf_counter()
+            result = pipeline.retrieve(question)
+            return result.documents, {
+                **result.stage_ms,
+                "total": (time.perf_counter() - started) * 1000,
+            }
+
+        return retrieve
+
+    return factory
+
+
+# =============================================================================
+# Evaluation + cache
+# =============================================================================
+
+
+class RetrievalEvaluator:
+    """Evaluates configs on one golden set, caching results per config."""
+
+    def __init__(
+        self,
+        golden_set: GoldenSet,
+        retriever_factory: Callable[[EvalConfig], RetrieveFn] = production_retriever,
+        backend: str = "production",
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    ):
+        self.golden_set = golden_set
+        self.retriever_factory = retriever_factory
+        self.backend = backend
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def cache_key(self, config: EvalConfig) -> str:
+        payload = json.dumps(
+            {
+                "backend": self.backend,
+                "config": asdict(config),
+                "golden": self.golden_set.fingerprint(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, config: EvalConfig) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{self.cache_key(config)}.json"
+
+    def evaluate(self, config: EvalConfig, force: bool = False) -> Dict[str, Any]:
+        """Metrics + latency for one config (from cache unless force)."""
+        path = self._cache_path(config)
+        if path is not None and path.exists() and not force:
+            result = json.loads(path.read_text(encoding="utf-8"))
+            result["cached"] = True
+            return result
+
+        items = self.golden_set.labelled()
+        if not items:
+            raise ValueError(f"Golden set {self.golden_set.name!r} has no labelled items")
+
+        logger.info(f"🧪 Evaluating {config.name} on {len(items)} golden questions")
+        retrieve = self.retriever_factory(config)
+        per_question = []
+        timings: List[Dict[str, float]] = []
+        for item in items:
+            docs, stage_ms = retrieve(item.question)
+            per_question.append(
+                evaluate_ranking([chunk_key(d) for d in docs], item.expected_chunk_ids, config.k)
+            )
+            timings.append(stage_ms)
+
+        result = {
+            "name": config.name,
+            "config": asdict(config),
+            "backend": self.backend,
+            "golden_set": self.golden_set.name,
+            "questions": len(items),
+            "metrics": {name: round(value, 4) for name, value in mean_metrics(per_question).items()},
+            "latency": {
+                stage: summarize([t.get(stage, 0.0) for t in timings])
+                for stage in timings[0]
+            },
+        }
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+        result["cached"] = False
+        return result
+
+    def evaluate_many(
+        self, configs: Sequence[EvalConfig], force: bool = False
+    ) -> List[Dict[str, Any]]:
+        results = [self.evaluate(config, force=force) for config in configs]
+        computed = sum(not r["cached"] for r in results)
+        logger.info(f"✅ {len(results)} configs evaluated ({computed} computed, {len(results) - computed} cached)")
+        return results
+
+
+def build_configs(
+    modes: Sequence[str], rerankers: Sequence[Optional[str]], k_values: Sequence[int]
+) -> List[EvalConfig]:
+    """Cartesian sweep; modes without reranking get a single no-reranker config."""
+    configs: List[EvalConfig] = []
+    for mode in modes:
+        mode_rerankers = [None] if mode in ("fast", "hybrid") else rerankers
+        for reranker in mode_rerankers:
+            for k in k_values:
+                config = EvalConfig(mode=mode, reranker_type=reranker, k=k)
+                if config not in configs:
+                    configs.append(config)
+    return configs
+
+
+# =============================================================================
+# Pareto table
+# =============================================================================
+
+
+def _quality(result: Dict[str, Any], metric: str) -> float:
+    k = result["config"]["k"]
+    return result["metrics"].get(metric.format(k=k), 0.0)
+
+
+def pareto_frontier(
+    results: Sequence[Dict[str, Any]],
+    quality_metric: str = "ndcg@{k}",
+    latency_stat: str = "p95",
+) -> List[str]:
+    """Names of configs not dominated on (higher quality, lower latency)."""
+    points = [
+        (r["name"], _quality(r, quality_metric), r["latency"]["total"][latency_stat])
+        for r in results
+    ]
+    frontier = []
+    for name, quality, latency in points:
+        dominated = any(
+            q >= quality and l <= latency and (q > quality or l < latency)
+            for other, q, l in points
+            if other != name
+        )
+        if not dominated:
+            frontier.append(name)
+    return frontier
+
+
+def format_pareto_table(
+    results: Sequence[Dict[str, Any]],
+    quality_metric: str = "ndcg@{k}",
+    latency_stat: str = "p95",
+) -> str:
+    frontier = set(pareto_frontier(results, quality_metric, latency_stat))
+    header = (
+        f"  {'config':<28} {'recall@k':>9} {'mrr':>7} {'ndcg@k':>7} "
+        f"{'p50 ms':>9} {'p95 ms':>9}  stages p50 (ms)"
+    )
+    lines = [header, "-" * len(header)]
+    for r in sorted(results, key=lambda r: r["latency"]["total"][latency_stat]):
+        k = r["config"]["k"]
+        stages = ", ".join(
+            f"{stage}={stats['p50']:.0f}"
+            for stage, stats in r["latency"].items()
+            if stage != "total"
+        )
+        lines.append(
+            f"{'★' if r['name'] in frontier else ' '} {r['name']:<28} "
+            f"{r['metrics'][f'recall@{k}']:>9.3f} {r['metrics']['mrr']:>7.3f} "
+            f"{r['metrics'][f'ndcg@{k}']:>7.3f} "
+            f"{r['latency']['total']['p50']:>9.1f} {r['latency']['total']['p95']:>9.1f}  {stages}"
+        )
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Golden set bootstrap
+# =============================================================================
+
+
+def bootstrap_golden_set(
+    retrieve: RetrieveFn, name: str = "benchmark_queries", candidates: int = 10
+) -> Dict[str, Any]:
+    """
+    Golden set skeleton from BENCHMARK_QUERIES.
+
+    expected_chunk_ids is left empty; each item lists the reference
+    retriever's top chunks as candidates for a reviewer to label.
+    """
+    items = []
+    for category, questions in BENCHMARK_QUERIES.items():
+        for question in questions:
+            docs, _ = retrieve(question)
+            items.append(
+                {
+                    "question": question,
+                    "category": category,
+                    "expected_chunk_ids": [],
+                    "candidates": [
+                        {
+                            "chunk_id": chunk_key(doc),
+                            "document_id": doc.metadata.get("document_id"),
+                            "preview": doc.page_content[:200],
+                        }
+                        for doc in docs[:candidates]
+                    ],
+                }
+            )
+    return {"name": name, "items": items}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Retrieval quality vs latency evaluation")
+    parser.add_argument("--golden", type=Path, help="Golden set JSON")
+    parser.add_argument("--bootstrap", type=Path, help="Write a golden set skeleton here")
+    parser.add_argument("--backend", choices=["production", "offline"], default="production")
+    parser.add_argument("--modes", nargs="+", default=["fast", "balanced", "quality"])
+    parser.add_argument(
+        "--rerankers", nargs="+", default=["bge"], help='Reranker types; "none" disables'
+    )
+    parser.add_argument("--k-values", nargs="+", type=int, default=[5])
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--force", action="store_true", help="Ignore cached results")
+    parser.add_argument("--quality-metric", default="ndcg@{k}")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    factory = production_retriever if args.backend == "production" else offline_retriever_factory()
+
+    if args.bootstrap:
+        reference = EvalConfig(mode="quality", reranker_type="bge", k=10)
+        skeleton = bootstrap_golden_set(factory(reference))
+        args.bootstrap.write_text(json.dumps(skeleton, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"💾 Golden set skeleton ({len(skeleton['items'])} questions) → {args.bootstrap}")
+        return 0
+
+    if not args.golden:
+        parser.error("--golden is required (or --bootstrap to create one)")
+
+    evaluator = RetrievalEvaluator(
+        GoldenSet.load(args.golden),
+        retriever_factory=factory,
+        backend=args.backend,
+        cache_dir=args.cache_dir,
+    )
+    rerankers = [None if r == "none" else r for r in args.rerankers]
+    results = evaluator.evaluate_many(
+        build_configs(args.modes, rerankers, args.k_values), force=args.force
+    )
+    print(format_pareto_table(results, quality_metric=args.quality_metric))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,8 @@
+import asyncio
 import os
+import re
 import time
-from typing import Dict, Literal
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Tuple
 from src.config.llm_provider import get_default_llm
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -14,10 +16,11 @@ from src.generation.prompts.qa_prompts import (
     SYSTEM_PROMPT_DETAILED,
     USER_TEMPLATE,
 )
-from src.retrieval.retrievers import create_retriever
+from src.retrieval.retrievers import get_retriever
 from src.retrieval.answer_cache import get_answer_cache
 from src.retrieval.semantic_cache_v2 import get_semantic_cache_v2
 from src.config.models import settings, apply_preset
+from src.config.feature_flags import ENABLE_DOCUMENT_STATUS_MAP
 
 
 # Use LLM from provider factory (supports OpenAI, Vertex AI, Gemini)
@@ -203,7 +206,9 @@ def _get_document_statuses(docs) -> Dict[str, str]:
     Get document statuses from documents table.
 
     This enriches retrieved documents with their validity status
-    (active/expired/superseded) from the documents table.
+    (active/expired/superseded) from the documents table. With
+    ENABLE_DOCUMENT_STATUS_MAP the in-memory status map is used instead
+    (no query per answer).
 
     Args:
         docs: List of LangChain Documents with document_id in metadata
@@ -228,6 +233,14 @@ def _get_document_statuses(docs) -> Dict[str, str]:
     if not doc_ids:
         return statuses
 
+    if ENABLE_DOCUMENT_STATUS_MAP:
+        from src.retrieval.document_status import get_document_status_map
+
+        try:
+            return get_document_status_map().statuses(doc_ids)
+        except Exception as e:
+            logger.warning(f"Document status map unavailable, querying documents: {e}")
+
     # Query documents table for statuses
     try:
         db = SessionLocal()
@@ -334,53 +347,40 @@ def format_document_reference(doc, index: int, doc_status: str | None = None) ->
     )
 
 
-def answer(
-    question: str,
-    mode: str | None = None,
-    reranker_type: Literal["bge", "openai"] | None = None,  # None = use config default
-    use_cache: bool = True,  # 🆕 Enable/disable answer cache
-    original_query: (
-        str | None
-    ) = None,  # 🆕 Original query for cache key (without context)
-    use_cot: bool = False,  # 🆕 Enable Chain of Thought reasoning
-) -> Dict:
-    """
-    Answer a question using RAG pipeline.
+EXPIRED_DOCS_WARNING = "\n\n⚠️ **Lưu ý**: Một số tài liệu tham khảo đã hết hiệu lực hoặc được thay thế. Vui lòng kiểm tra văn bản hiện hành."
 
-    Args:
-        question: User's question (may include conversation context)
-        mode: RAG mode (fast/balanced/quality)
-        reranker_type: Reranker to use ("bge" or "openai")
-        use_cache: Enable answer caching (default: True)
-        original_query: Original user query for cache key (without conversation context).
-                       If None, uses question as cache key.
-        use_cot: Enable 2-step Chain of Thought reasoning (default: False).
-                 Adds ~1s latency but improves quality for complex queries.
-
-    Returns:
-        Dict with answer, sources, and metadata
-    """
-    # 🔧 Resolve reranker_type from config if not specified
-    from src.config.feature_flags import DEFAULT_RERANKER_TYPE
 
-    if reranker_type is None:
-        reranker_type = DEFAULT_RERANKER_TYPE
+def _format_cached_sources(cached_sources_raw) -> list:
+    """Convert cached sources (list of dicts) to the List[str] API format."""
+    src_lines = []
+    for i, src in enumerate(cached_sources_raw, 1):
+        if isinstance(src, dict):
+            doc_name = src.get("document_name", "Tài liệu")
+            section = src.get("section", "")
+            if section:
+                src_lines.append(f"[#{i}] {section} - {doc_name}")
+            else:
+                src_lines.append(f"[#{i}] {doc_name}")
+        else:
+            # Already a string
+            src_lines.append(src if isinstance(src, str) else str(src))
+    return src_lines
 
-    # 🆕 CoT: If enabled, delegate to reasoning chain
-    if use_cot:
-        from .reasoning_chain import answer_with_reasoning
 
-        return answer_with_reasoning(
-            query=original_query or question,
-            mode=mode or "balanced",
-            context=question if original_query else None,
-        )
-    # 🆕 Use original_query for cache operations if provided
-    cache_key_query = original_query or question
+def _early_answer(
+    question: str,
+    original_query: str | None,
+    use_cache: bool,
+    start_time: float,
+) -> Dict | None:
+    """
+    Answer without running retrieval + LLM: casual queries, answer cache
+    hits and semantic cache hits. Returns None when the full pipeline is needed.
+    """
     import logging
 
     logger = logging.getLogger(__name__)
-    start_time = time.time()
+    cache_key_query = original_query or question
 
     # ✅ EARLY EXIT: Check if query is casual/conversational (no RAG needed)
     # 🔧 FIX: Use original_query (without context) for casual check
@@ -406,117 +406,106 @@ def answer(
             "document_statuses": {},
         }
 
+    if not use_cache:
+        return None
+
     # ✅ CHECK ANSWER CACHE (before running expensive RAG pipeline)
     # 🆕 Use cache_key_query (original query without context) for cache lookup
     answer_cache = get_answer_cache()
-    if use_cache:
-        cached_result = answer_cache.get(cache_key_query)
-        if cached_result:
+    cached_result = answer_cache.get(cache_key_query)
+    if cached_result:
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"⚡ Answer cache HIT - returning cached result in {processing_time_ms}ms"
+        )
+
+        cached_sources_raw = cached_result.get("sources", [])
+
+        # Return cached result with updated timing and proper format
+        return {
+            "answer": cached_result.get("answer", ""),
+            "sources": _format_cached_sources(cached_sources_raw),
+            "detailed_sources": cached_result.get("detailed_sources", []),
+            "source_documents_raw": cached_sources_raw,  # Original format for frontend
+            "adaptive_retrieval": {
+                "mode": cached_result.get("rag_mode", "unknown"),
+                "docs_retrieved": len(cached_sources_raw),
+                "enhancement_enabled": True,
+                "has_expired_docs": False,
+                "from_cache": True,
+                "cache_hit_time_ms": processing_time_ms,
+                "original_processing_time_ms": cached_result.get(
+                    "processing_time_ms", 0
+                ),
+            },
+            "enhanced_features": ["Answer Cache HIT"],
+            "document_statuses": {},
+        }
+
+    # 🆕 SEMANTIC CACHE V2: Hybrid Cosine + BGE reranker
+    semantic_cache = get_semantic_cache_v2()
+    similar_match = semantic_cache.find_similar(cache_key_query)
+
+    if similar_match:
+        # Found a semantically similar query - get its cached answer
+        similar_cached = answer_cache.get(similar_match.original_query)
+
+        if similar_cached:
             processing_time_ms = int((time.time() - start_time) * 1000)
             logger.info(
-                f"⚡ Answer cache HIT - returning cached result in {processing_time_ms}ms"
+                f"🔍 Semantic cache V2 HIT - bge_score={similar_match.bge_score:.4f}, "
+                f"cosine={similar_match.cosine_similarity:.4f}, "
+                f"original='{similar_match.original_query[:50]}...'"
             )
 
-            # Reconstruct sources in proper format for API response
-            # The API expects List[str] for 'sources' field
-            cached_sources_raw = cached_result.get("sources", [])
-
-            # Convert cached sources (list of dicts) to simple string format
-            src_lines = []
-            for i, src in enumerate(cached_sources_raw, 1):
-                if isinstance(src, dict):
-                    doc_name = src.get("document_name", "Tài liệu")
-                    section = src.get("section", "")
-                    if section:
-                        src_lines.append(f"[#{i}] {section} - {doc_name}")
-                    else:
-                        src_lines.append(f"[#{i}] {doc_name}")
-                else:
-                    # Already a string
-                    src_lines.append(src if isinstance(src, str) else str(src))
-
-            # Return cached result with updated timing and proper format
+            cached_sources_raw = similar_cached.get("sources", [])
+
             return {
-                "answer": cached_result.get("answer", ""),
-                "sources": src_lines,  # List[str] for API compatibility
-                "detailed_sources": cached_result.get("detailed_sources", []),
-                "source_documents_raw": cached_sources_raw,  # Original format for frontend
+                "answer": similar_cached.get("answer", ""),
+                "sources": _format_cached_sources(cached_sources_raw),
+                "detailed_sources": similar_cached.get("detailed_sources", []),
+                "source_documents_raw": cached_sources_raw,
                 "adaptive_retrieval": {
-                    "mode": cached_result.get("rag_mode", "unknown"),
+                    "mode": similar_cached.get("rag_mode", "unknown"),
                     "docs_retrieved": len(cached_sources_raw),
                     "enhancement_enabled": True,
                     "has_expired_docs": False,
                     "from_cache": True,
+                    "cache_type": "semantic_v2",
+                    "bge_score": round(similar_match.bge_score, 4),
+                    "cosine_similarity": round(similar_match.cosine_similarity, 4),
+                    "similar_query": similar_match.original_query[:100],
                     "cache_hit_time_ms": processing_time_ms,
-                    "original_processing_time_ms": cached_result.get(
+                    "original_processing_time_ms": similar_cached.get(
                         "processing_time_ms", 0
                     ),
                 },
-                "enhanced_features": ["Answer Cache HIT"],
+                "enhanced_features": [
+                    f"Semantic Cache V2 HIT (bge={similar_match.bge_score:.2%})"
+                ],
                 "document_statuses": {},
             }
-        else:
-            # 🆕 SEMANTIC CACHE V2: Hybrid Cosine + BGE reranker
-            semantic_cache = get_semantic_cache_v2()
-            similar_match = semantic_cache.find_similar(cache_key_query)
-
-            if similar_match:
-                # Found a semantically similar query - get its cached answer
-                similar_cached = answer_cache.get(similar_match.original_query)
-
-                if similar_cached:
-                    processing_time_ms = int((time.time() - start_time) * 1000)
-                    logger.info(
-                        f"🔍 Semantic cache V2 HIT - bge_score={similar_match.bge_score:.4f}, "
-                        f"cosine={similar_match.cosine_similarity:.4f}, "
-                        f"original='{similar_match.original_query[:50]}...'"
-                    )
-
-                    # Reconstruct sources in proper format
-                    cached_sources_raw = similar_cached.get("sources", [])
-                    src_lines = []
-                    for i, src in enumerate(cached_sources_raw, 1):
-                        if isinstance(src, dict):
-                            doc_name = src.get("document_name", "Tài liệu")
-                            section = src.get("section", "")
-                            if section:
-                                src_lines.append(f"[#{i}] {section} - {doc_name}")
-                            else:
-                                src_lines.append(f"[#{i}] {doc_name}")
-                        else:
-                            src_lines.append(src if isinstance(src, str) else str(src))
-
-                    return {
-                        "answer": similar_cached.get("answer", ""),
-                        "sources": src_lines,
-                        "detailed_sources": similar_cached.get("detailed_sources", []),
-                        "source_documents_raw": cached_sources_raw,
-                        "adaptive_retrieval": {
-                            "mode": similar_cached.get("rag_mode", "unknown"),
-                            "docs_retrieved": len(cached_sources_raw),
-                            "enhancement_enabled": True,
-                            "has_expired_docs": False,
-                            "from_cache": True,
-                            "cache_type": "semantic_v2",
-                            "bge_score": round(similar_match.bge_score, 4),
-                            "cosine_similarity": round(
-                                similar_match.cosine_similarity, 4
-                            ),
-                            "similar_query": similar_match.original_query[:100],
-                            "cache_hit_time_ms": processing_time_ms,
-                            "original_processing_time_ms": similar_cached.get(
-                                "processing_time_ms", 0
-                            ),
-                        },
-                        "enhanced_features": [
-                            f"Semantic Cache V2 HIT (bge={similar_match.bge_score:.2%})"
-                        ],
-                        "document_statuses": {},
-                    }
 
-            logger.info(
-                f"❌ Answer cache MISS (exact + semantic) - running full RAG pipeline"
-            )
+    logger.info(f"❌ Answer cache MISS (exact + semantic) - running full RAG pipeline")
+    return None
+
+
+def _prepare_generation(
+    question: str,
+    mode: str | None,
+    reranker_type: str,
+) -> Dict:
+    """
+    Select mode/prompt and retrieve documents (everything before the LLM call).
+
+    Returns:
+        Dict with selected_mode, enhancement_enabled, prompt, context,
+        question, source_documents and retrieval_time_ms
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
+    retrieval_start = time.time()
 
     selected_mode = mode or settings.rag_mode or "balanced"
     apply_preset(selected_mode)
@@ -530,7 +519,7 @@ def answer(
         f"reranker={reranker_type}"
     )
 
-    # ✅ Create retriever dynamically based on selected_mode and reranker_type
+    # ✅ Get shared retriever for selected_mode and reranker_type (built once)
     enable_reranking = settings.enable_reranking and selected_mode != "fast"
 
     logger.info(
@@ -540,7 +529,7 @@ def answer(
         f"reranker_type={reranker_type if enable_reranking else 'N/A'}"
     )
 
-    retriever = create_retriever(
+    retriever = get_retriever(
         mode=selected_mode,
         enable_reranking=enable_reranking,
         reranker_type=reranker_type,
@@ -559,39 +548,45 @@ def answer(
         [("system", system_prompt), ("user", USER_TEMPLATE)]
     )
 
-    # Build chain - retrieve docs ONCE, reuse for context AND source_documents
-    # BUG FIX: Previously retriever was called twice (once in rag_chain, once in RunnableParallel)
-    def retrieve_and_format(question: str):
-        """Retrieve docs once, return both formatted context and raw docs."""
-        docs = retriever.invoke(question)
-        context = fmt_docs(docs)
-        return {"context": context, "source_documents": docs, "question": question}
-
-    # Chain that uses pre-retrieved docs
-    answer_chain = prompt | model | StrOutputParser()
+    # Retrieve docs ONCE, reuse for context AND source_documents
+    docs = retriever.invoke(question)
 
-    # Retrieve once, then generate answer
-    retrieved = retrieve_and_format(question)
+    if ENABLE_DOCUMENT_STATUS_MAP:
+        # Status from the in-memory map; inactive documents ranked last
+        from src.retrieval.document_status import get_document_status_map
 
-    logger.info(
-        f"📄 Retrieved {len(retrieved['source_documents'])} documents (single call)"
-    )
-
-    answer = answer_chain.invoke(
-        {"context": retrieved["context"], "question": retrieved["question"]}
-    )
+        try:
+            docs = get_document_status_map().annotate(docs)
+        except Exception as e:
+            logger.warning(f"⚠️ Document status annotation skipped: {e}")
+
+    logger.info(f"📄 Retrieved {len(docs)} documents (single call)")
+
+    return {
+        "selected_mode": selected_mode,
+        # Query enhancement runs in balanced/quality (not fast or hybrid)
+        "enhancement_enabled": selected_mode not in ("fast", "hybrid"),
+        "prompt": prompt,
+        "context": fmt_docs(docs),
+        "question": question,
+        "source_documents": docs,
+        "retrieval_time_ms": int((time.time() - retrieval_start) * 1000),
+    }
 
-    result = {"answer": answer, "source_documents": retrieved["source_documents"]}
 
+def _build_final_result(
+    raw_answer: str, source_documents, selected_mode: str, enhancement_enabled: bool
+) -> Dict:
+    """Build the API result (sources, statuses, features) for a generated answer."""
     # Enrich source documents with status from documents table
-    doc_statuses = _get_document_statuses(result["source_documents"])
+    doc_statuses = _get_document_statuses(source_documents)
 
     # Tạo detailed source references
     src_lines = []
     detailed_sources = []
     has_expired_docs = False
 
-    for i, d in enumerate(result["source_documents"], 1):
+    for i, d in enumerate(source_documents, 1):
         # Get status from documents table (default to "active" if not found)
         doc_id = d.metadata.get("document_id", "")
         doc_status = doc_statuses.get(doc_id, "active")
@@ -628,6 +623,8 @@ def answer(
     if selected_mode == "fast":
         # Fast mode: no enhancement
         pass
+    elif selected_mode == "hybrid":
+        enhanced_features.append("Hybrid Search (Full-Text + Vector, RRF)")
     elif selected_mode == "balanced":
         enhanced_features.append("Query Enhancement (Multi-Query, Step-Back)")
     elif selected_mode == "quality":
@@ -644,12 +641,11 @@ def answer(
         enhanced_features.append("Document Reranking (BGE)")
 
     # Add warning about expired documents in answer if needed
-    answer_text = result["answer"].strip()
+    answer_text = raw_answer.strip()
     if has_expired_docs:
-        answer_text += "\n\n⚠️ **Lưu ý**: Một số tài liệu tham khảo đã hết hiệu lực hoặc được thay thế. Vui lòng kiểm tra văn bản hiện hành."
+        answer_text += EXPIRED_DOCS_WARNING
 
-    # Build final result
-    final_result = {
+    return {
         "answer": answer_text,
         "sources": src_lines,
         "detailed_sources": detailed_sources,
@@ -670,12 +666,12 @@ def answer(
                 "diem": d.metadata.get("diem"),
                 "status": doc_statuses.get(d.metadata.get("document_id", ""), "active"),
             }
-            for d in result["source_documents"]
+            for d in source_documents
         ],
         "adaptive_retrieval": {
             "mode": selected_mode,
-            "docs_retrieved": len(result["source_documents"]),
-            "enhancement_enabled": selected_mode != "fast",
+            "docs_retrieved": len(source_documents),
+            "enhancement_enabled": enhancement_enabled,
             "has_expired_docs": has_expired_docs,
             "from_cache": False,
         },
@@ -683,46 +679,271 @@ def answer(
         "document_statuses": doc_statuses,
     }
 
+
+def _cache_answer(
+    cache_key_query: str,
+    answer_text: str,
+    source_documents,
+    selected_mode: str,
+    processing_time_ms: int,
+):
+    """Store answer in answer cache + query embedding in semantic cache."""
+    import logging
+
+    logger = logging.getLogger(__name__)
+    try:
+        # Prepare sources for caching (simplified format)
+        cache_sources = [
+            {
+                "document_id": d.metadata.get("document_id", ""),
+                "document_name": d.metadata.get(
+                    "document_name", d.metadata.get("title", "")
+                ),
+                "chunk_id": d.metadata.get("chunk_id", ""),
+                "citation_text": d.page_content[:500],
+                "section": d.metadata.get("section_title", ""),
+            }
+            for d in source_documents
+        ]
+        get_answer_cache().set(
+            query=cache_key_query,  # 🆕 Use original query for cache key
+            answer=answer_text,
+            sources=cache_sources,
+            rag_mode=selected_mode,
+            processing_time_ms=processing_time_ms,
+        )
+
+        # 🆕 Store embedding for semantic cache V2 (Hybrid Cosine + BGE)
+        try:
+            semantic_cache = get_semantic_cache_v2()
+            semantic_cache.store_embedding(
+                query=cache_key_query,  # 🆕 Use original query for semantic cache
+                answer_cache_key=f"rag:answer:{cache_key_query}",  # Reference to answer cache
+                document_ids=[src["document_id"] for src in cache_sources],
+            )
+        except Exception as e:
+            logger.debug(f"⚠️ Failed to store semantic embedding: {e}")
+
+        logger.info(
+            f"📦 Answer cached for future requests (processing_time={processing_time_ms}ms, cache_key='{cache_key_query[:50]}...')"
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to cache answer: {e}")
+
+
+def answer(
+    question: str,
+    mode: str | None = None,
+    reranker_type: Literal["bge", "openai"] | None = None,  # None = use config default
+    use_cache: bool = True,  # 🆕 Enable/disable answer cache
+    original_query: (
+        str | None
+    ) = None,  # 🆕 Original query for cache key (without context)
+    use_cot: bool = False,  # 🆕 Enable Chain of Thought reasoning
+) -> Dict:
+    """
+    Answer a question using RAG pipeline.
+
+    Args:
+        question: User's question (may include conversation context)
+        mode: RAG mode (fast/balanced/quality)
+        reranker_type: Reranker to use ("bge" or "openai")
+        use_cache: Enable answer caching (default: True)
+        original_query: Original user query for cache key (without conversation context).
+                       If None, uses question as cache key.
+        use_cot: Enable 2-step Chain of Thought reasoning (default: False).
+                 Adds ~1s latency but improves quality for complex queries.
+
+    Returns:
+        Dict with answer, sources, and metadata
+    """
+    # 🔧 Resolve reranker_type from config if not specified
+    from src.config.feature_flags import DEFAULT_RERANKER_TYPE
+
+    if reranker_type is None:
+        reranker_type = DEFAULT_RERANKER_TYPE
+
+    # 🆕 CoT: If enabled, delegate to reasoning chain
+    if use_cot:
+        from .reasoning_chain import answer_with_reasoning
+
+        return answer_with_reasoning(
+            query=original_query or question,
+            mode=mode or "balanced",
+            context=question if original_query else None,
+        )
+    # 🆕 Use original_query for cache operations if provided
+    cache_key_query = original_query or question
+    start_time = time.time()
+
+    early_result = _early_answer(question, original_query, use_cache, start_time)
+    if early_result is not None:
+        return early_result
+
+    generation = _prepare_generation(question, mode, reranker_type)
+
+    # Chain that uses pre-retrieved docs
+    answer_chain = generation["prompt"] | model | StrOutputParser()
+    raw_answer = answer_chain.invoke(
+        {"context": generation["context"], "question": generation["question"]}
+    )
+
+    final_result = _build_final_result(
+        raw_answer,
+        generation["source_documents"],
+        generation["selected_mode"],
+        generation["enhancement_enabled"],
+    )
+
     # ✅ CACHE THE RESULT (for future requests with same query)
     # 🆕 Use cache_key_query (original query without context) for cache storage
     processing_time_ms = int((time.time() - start_time) * 1000)
     if use_cache:
-        try:
-            # Prepare sources for caching (simplified format)
-            cache_sources = [
-                {
-                    "document_id": d.metadata.get("document_id", ""),
-                    "document_name": d.metadata.get(
-                        "document_name", d.metadata.get("title", "")
-                    ),
-                    "chunk_id": d.metadata.get("chunk_id", ""),
-                    "citation_text": d.page_content[:500],
-                    "section": d.metadata.get("section_title", ""),
-                }
-                for d in result["source_documents"]
-            ]
-            answer_cache.set(
-                query=cache_key_query,  # 🆕 Use original query for cache key
-                answer=answer_text,
-                sources=cache_sources,
-                rag_mode=selected_mode,
-                processing_time_ms=processing_time_ms,
-            )
+        _cache_answer(
+            cache_key_query,
+            final_result["answer"],
+            generation["source_documents"],
+            generation["selected_mode"],
+            processing_time_ms,
+        )
 
-            # 🆕 Store embedding for semantic cache V2 (Hybrid Cosine + BGE)
-            try:
-                semantic_cache = get_semantic_cache_v2()
-                semantic_cache.store_embedding(
-                    query=cache_key_query,  # 🆕 Use original query for semantic cache
-                    answer_cache_key=f"rag:answer:{cache_key_query}",  # Reference to answer cache
-                )
-            except Exception as e:
-                logger.debug(f"⚠️ Failed to store semantic embedding: {e}")
+    return final_result
 
-            logger.info(
-                f"📦 Answer cached for future requests (processing_time={processing_time_ms}ms, cache_key='{cache_key_query[:50]}...')"
-            )
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to cache answer: {e}")
 
-    return final_result
+def _replay_chunks(text: str, chunk_size: int = 24) -> List[str]:
+    """Split a finished answer into word-aligned chunks for stream replay."""
+    chunks, current = [], ""
+    for word in re.split(r"(\s+)", text):
+        current += word
+        if len(current) >= chunk_size:
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def astream_answer(
+    question: str,
+    mode: str | None = None,
+    reranker_type: Literal["bge", "openai"] | None = None,
+    use_cache: bool = True,
+    original_query: str | None = None,
+    use_cot: bool = False,
+    run_blocking: Callable[..., Awaitable[Any]] | None = None,
+) -> AsyncIterator[Tuple[str, Dict]]:
+    """
+    Streaming variant of answer().
+
+    Yields ``(event, data)`` tuples:
+    - ("metadata", {...}): retrieval finished (mode, docs_retrieved, timings)
+    - ("token", {"text": ...}): answer text as it is generated
+    - ("done", result): same dict as answer(), plus processing_time_ms and
+      time_to_first_token_ms
+
+    Cache hits, casual answers and CoT answers are replayed as a token stream.
+    The final result, caching and status enrichment are identical to answer().
+
+    Args:
+        run_blocking: Awaitable runner for blocking stages (retrieval, DB,
+                      cache writes). Defaults to asyncio.to_thread.
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
+    from src.config.feature_flags import DEFAULT_RERANKER_TYPE
+
+    if reranker_type is None:
+        reranker_type = DEFAULT_RERANKER_TYPE
+    run_blocking = run_blocking or asyncio.to_thread
+    cache_key_query = original_query or question
+    start_time = time.time()
+
+    def elapsed_ms() -> int:
+        return int((time.time() - start_time) * 1000)
+
+    # Answers that are complete before the first token: replay them
+    if use_cot:
+        ready_result = await run_blocking(
+            answer,
+            question,
+            mode=mode,
+            reranker_type=reranker_type,
+            use_cache=use_cache,
+            original_query=original_query,
+            use_cot=True,
+        )
+    else:
+        ready_result = await run_blocking(
+            _early_answer, question, original_query, use_cache, start_time
+        )
+
+    if ready_result is not None:
+        yield "metadata", {
+            **ready_result.get("adaptive_retrieval", {}),
+            "retrieval_time_ms": elapsed_ms(),
+        }
+        time_to_first_token_ms = None
+        for chunk in _replay_chunks(ready_result.get("answer", "")):
+            if time_to_first_token_ms is None:
+                time_to_first_token_ms = elapsed_ms()
+            yield "token", {"text": chunk}
+        yield "done", {
+            **ready_result,
+            "processing_time_ms": elapsed_ms(),
+            "time_to_first_token_ms": time_to_first_token_ms,
+        }
+        return
+
+    generation = await run_blocking(_prepare_generation, question, mode, reranker_type)
+    yield "metadata", {
+        "mode": generation["selected_mode"],
+        "docs_retrieved": len(generation["source_documents"]),
+        "enhancement_enabled": generation["enhancement_enabled"],
+        "from_cache": False,
+        "retrieval_time_ms": generation["retrieval_time_ms"],
+    }
+
+    answer_chain = generation["prompt"] | model | StrOutputParser()
+    parts: List[str] = []
+    time_to_first_token_ms = None
+    async for chunk in answer_chain.astream(
+        {"context": generation["context"], "question": generation["question"]}
+    ):
+        if not chunk:
+            continue
+        if time_to_first_token_ms is None:
+            time_to_first_token_ms = elapsed_ms()
+        parts.append(chunk)
+        yield "token", {"text": chunk}
+
+    final_result = await run_blocking(
+        _build_final_result,
+        "".join(parts),
+        generation["source_documents"],
+        generation["selected_mode"],
+        generation["enhancement_enabled"],
+    )
+    if final_result["adaptive_retrieval"]["has_expired_docs"]:
+        yield "token", {"text": EXPIRED_DOCS_WARNING}
+
+    processing_time_ms = elapsed_ms()
+    if use_cache:
+        await run_blocking(
+            _cache_answer,
+            cache_key_query,
+            final_result["answer"],
+            generation["source_documents"],
+            generation["selected_mode"],
+            processing_time_ms,
+        )
+
+    logger.info(
+        f"⏱️ Streamed answer: ttft={time_to_first_token_ms}ms, "
+        f"total={processing_time_ms}ms, retrieval={generation['retrieval_time_ms']}ms"
+    )
+    yield "done", {
+        **final_result,
+        "processing_time_ms": processing_time_ms,
+        "time_to_first_token_ms": time_to_first_token_ms,
+    }
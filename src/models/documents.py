@@ -4,7 +4,7 @@ Represents the documents table - PRIMARY table for document management
 """
 
 from sqlalchemy import Column, String, Integer, Text, TIMESTAMP, Index, BigInteger, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from typing import Optional, TYPE_CHECKING
@@ -104,6 +104,25 @@ class Document(Base):
         comment="SHA-256 hash for deduplication"
     )
 
+    # Content fingerprints for duplicate-upload detection
+    text_hash = Column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 of normalized extracted text for deduplication"
+    )
+
+    minhash_signature = Column(
+        ARRAY(BigInteger),
+        nullable=True,
+        comment="MinHash signature over word shingles (near-duplicates)"
+    )
+
+    minhash_bands = Column(
+        ARRAY(Text),
+        nullable=True,
+        comment="LSH band hashes of minhash_signature for near-duplicate lookup"
+    )
+
     file_size_bytes = Column(
         BigInteger,
         nullable=True,
@@ -165,6 +184,9 @@ class Document(Base):
     __table_args__ = (
         Index("idx_documents_status_type", "status", "document_type"),
         Index("idx_documents_category_status", "category", "status"),
+        Index("idx_documents_file_hash", "file_hash"),
+        Index("idx_documents_text_hash", "text_hash"),
+        Index("idx_documents_minhash_bands", "minhash_bands", postgresql_using="gin"),
         {"comment": "Application-level document management table (v3)"},
     )
 
@@ -184,6 +206,7 @@ class Document(Base):
             "source_file": self.source_file,
             "uploaded_by": str(self.uploaded_by) if self.uploaded_by else None,
             "file_hash": self.file_hash,
+            "text_hash": self.text_hash,
             "file_size_bytes": self.file_size_bytes,
             "total_chunks": self.total_chunks,
             "metadata": self.extra_metadata,
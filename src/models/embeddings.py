@@ -135,6 +135,8 @@ class LangchainPGEmbedding(Base):
         # B-tree indexes for frequently queried metadata fields
         Index("idx_embedding_document_id", cmetadata["document_id"].astext),
         Index("idx_embedding_document_type", cmetadata["document_type"].astext),
+        # Content-hash lookup for incremental re-indexing (vector reuse)
+        Index("idx_embedding_hash", cmetadata["embedding_hash"].astext),
         # Vector index will be created separately (HNSW or IVFFlat)
         # CREATE INDEX ON langchain_pg_embedding USING hnsw (embedding vector_cosine_ops);
         {"comment": "Vector embeddings storage with metadata (v3 - 1536 dim)"},
@@ -0,0 +1,109 @@
+"""
+Extraction Cache - Parse each upload once
+
+Stage 1 of the upload workflow extracts text to classify a file; Stage 2
+(after admin confirmation) used to parse the same file again from disk.
+For .doc files this meant two LibreOffice conversions.
+
+Stage 1 now saves the extracted representation next to the upload:
+
+    data/uploads/{upload_id}/{filename}.extracted.json.gz
+
+and Stage 2 passes it to WorkingUploadPipeline.process_file(extracted=...).
+The cache stores the source size and SHA-256; a modified or replaced
+source file is a cache miss and is parsed again.
+
+Usage:
+    from src.preprocessing.extraction_cache import save_extraction, load_extraction
+
+    extracted = pipeline.extract(file_path)
+    save_extraction(file_path, extracted)
+    ...
+    pipeline.process_file(file_path, extracted=load_extraction(file_path))
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_CACHE_VERSION = 1
+EXTRACTION_CACHE_SUFFIX = ".extracted.json.gz"
+
+
+@dataclass
+class ExtractedDocument:
+    """Loader output needed to chunk a document without re-parsing it."""
+
+    text: str
+    extraction_method: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    structure: List[Dict[str, Any]] = field(default_factory=list)
+    source_size: int = 0
+    source_sha256: str = ""
+
+
+def file_sha256(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extraction_cache_path(file_path: Path) -> Path:
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.name + EXTRACTION_CACHE_SUFFIX)
+
+
+def save_extraction(file_path: Path, extracted: ExtractedDocument) -> Path:
+    """
+    Write the extraction next to its source file (gzip JSON, atomic).
+
+    Returns:
+        Path of the cache file
+    """
+    file_path = Path(file_path)
+    extracted.source_size = file_path.stat().st_size
+    extracted.source_sha256 = file_sha256(file_path)
+
+    cache_path = extraction_cache_path(file_path)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    payload = {"version": EXTRACTION_CACHE_VERSION, **asdict(extracted)}
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def load_extraction(file_path: Path) -> Optional[ExtractedDocument]:
+    """
+    Cached extraction for file_path, or None if missing, stale or unreadable.
+    """
+    file_path = Path(file_path)
+    cache_path = extraction_cache_path(file_path)
+    if not cache_path.exists() or not file_path.exists():
+        return None
+
+    try:
+        with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.pop("version", None) != EXTRACTION_CACHE_VERSION:
+            return None
+        extracted = ExtractedDocument(**payload)
+    except Exception as e:
+        logger.warning(f"⚠️  Unreadable extraction cache {cache_path.name}: {e}")
+        return None
+
+    if extracted.source_size != file_path.stat().st_size or (
+        extracted.source_sha256 != file_sha256(file_path)
+    ):
+        logger.info(f"♻️  Extraction cache stale for {file_path.name}")
+        return None
+    return extracted
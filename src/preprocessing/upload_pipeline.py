@@ -19,6 +19,7 @@ from .base.models import ProcessedDocument
 from .chunking.chunk_factory import create_chunker
 from .chunking.base_chunker import UniversalChunk
 from .enrichment import ChunkEnricher
+from .extraction_cache import ExtractedDocument
 from .utils.document_id_generator import DocumentIDGenerator
 
 logger = logging.getLogger(__name__)
@@ -58,11 +59,48 @@ class WorkingUploadPipeline:
                 "⚠️  .doc file support disabled (install antiword or libreoffice)"
             )
 
+    def extract(self, file_path: Path) -> ExtractedDocument:
+        """
+        Step 1 of process_file: load text (+ structure) from disk.
+
+        Split out so upload Stage 1 can extract once and cache the result
+        for Stage 2 (see extraction_cache).
+
+        Raises:
+            ValueError: .doc converters are not installed
+        """
+        file_path = Path(file_path)
+
+        # Choose loader based on file extension
+        if file_path.suffix.lower() == ".doc":
+            # Old Word format - use DocLoader
+            if not self.doc_loader.can_process():
+                raise ValueError(
+                    "Cannot process .doc files (install antiword or libreoffice)"
+                )
+
+            content, doc_metadata = self.doc_loader.load(str(file_path))
+            return ExtractedDocument(
+                text=content,
+                extraction_method=doc_metadata.get("extraction_method", "doc_loader"),
+                metadata=doc_metadata,
+            )
+
+        # Modern DOCX format - use DocxLoader
+        raw_content = self.docx_loader.load(str(file_path))
+        return ExtractedDocument(
+            text=raw_content.text,
+            extraction_method="docx_loader",
+            metadata=raw_content.metadata,
+            structure=raw_content.structure,
+        )
+
     def process_file(
         self,
         file_path: Path,
         document_type: str = "law",
         batch_name: Optional[str] = None,
+        extracted: Optional[ExtractedDocument] = None,
     ) -> Tuple[bool, Optional[List[UniversalChunk]], Optional[str]]:
         """
         Process a single file through the working pipeline.
@@ -71,6 +109,7 @@ class WorkingUploadPipeline:
             file_path: Path to the file to process
             document_type: Type of document (law, decree, circular, etc.)
             batch_name: Optional batch identifier
+            extracted: Previously extracted content (skips loading the file)
 
         Returns:
             (success, chunks, error_message)
@@ -79,29 +118,24 @@ class WorkingUploadPipeline:
 
         try:
             # Step 1: Extract content
-            try:
-                # Choose loader based on file extension
-                if file_path.suffix.lower() == ".doc":
-                    # Old Word format - use DocLoader
-                    if not self.doc_loader.can_process():
-                        return (
-                            False,
-                            None,
-                            "Cannot process .doc files (install antiword or libreoffice)",
-                        )
-
-                    content, doc_metadata = self.doc_loader.load(str(file_path))
-                    extraction_method = doc_metadata.get(
-                        "extraction_method", "doc_loader"
+            if extracted is None:
+                if (
+                    file_path.suffix.lower() == ".doc"
+                    and not self.doc_loader.can_process()
+                ):
+                    return (
+                        False,
+                        None,
+                        "Cannot process .doc files (install antiword or libreoffice)",
                     )
-                else:
-                    # Modern DOCX format - use DocxLoader
-                    raw_content = self.docx_loader.load(str(file_path))
-                    content = raw_content.text
-                    extraction_method = "docx_loader"
+                try:
+                    extracted = self.extract(file_path)
+                except Exception as e:
+                    return False, None, f"Extraction failed: {str(e)}"
 
-            except Exception as e:
-                return False, None, f"Extraction failed: {str(e)}"
+            content = extracted.text
+            extraction_method = extracted.extraction_method
+            doc_metadata = extracted.metadata
 
             if not content or len(content.strip()) < 50:
                 return False, None, "Empty or too short content"
@@ -0,0 +1,148 @@
+"""
+Content Fingerprints - Detect duplicate uploads before chunking/embedding
+
+Three fingerprints per document, stored in the documents table:
+- file_hash:  SHA-256 of the raw bytes (same file, any filename)
+- text_hash:  SHA-256 of the normalized extracted text (same content,
+              different container, e.g. .doc vs .docx re-save)
+- minhash:    MinHash signature over word shingles (near-duplicates, e.g.
+              an amended copy or a re-typed version)
+
+Near-duplicate candidates are found with LSH banding: the signature is cut
+into bands of BAND_ROWS values; two documents sharing any band hash are
+compared by estimated Jaccard similarity.
+
+Usage:
+    fp = fingerprint_document(extracted_text, file_sha256)
+    fp.text_hash, fp.minhash, fp.bands
+    estimate_similarity(fp.minhash, other_signature)  # 0.0 - 1.0
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Set
+
+import numpy as np
+
+NUM_PERMUTATIONS = 128
+BAND_ROWS = 4  # 32 bands: pairs above ~0.45 Jaccard become candidates
+SHINGLE_SIZE = 5  # words
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Fixed permutations so signatures stay comparable across processes/releases
+_rng = random.Random(1)
+_PERM_A = np.array(
+    [_rng.randint(1, (1 << 61) - 2) for _ in range(NUM_PERMUTATIONS)], dtype=np.uint64
+)
+_PERM_B = np.array(
+    [_rng.randint(0, (1 << 61) - 2) for _ in range(NUM_PERMUTATIONS)], dtype=np.uint64
+)
+
+
+def normalize_text(text: str) -> str:
+    """NFC, lowercase, punctuation → space, collapsed whitespace."""
+    text = unicodedata.normalize("NFC", text or "").lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Word n-grams of the normalized text."""
+    words = normalize_text(text).split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash_signature(shingle_set: Set[str]) -> List[int]:
+    """MinHash signature (NUM_PERMUTATIONS 32-bit values)."""
+    if not shingle_set:
+        return [int(_MAX_HASH)] * NUM_PERMUTATIONS
+
+    hashes = np.array(
+        [
+            int.from_bytes(
+                hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little"
+            )
+            for s in shingle_set
+        ],
+        dtype=np.uint64,
+    )
+    # uint64 arithmetic wraps; good enough as a universal hash family
+    with np.errstate(over="ignore"):
+        permuted = (
+            np.outer(hashes, _PERM_A) + _PERM_B
+        ) % _MERSENNE_PRIME & _MAX_HASH
+    return [int(v) for v in permuted.min(axis=0)]
+
+
+def lsh_bands(signature: Sequence[int], rows: int = BAND_ROWS) -> List[str]:
+    """Band hashes ("{band}:{digest}") for candidate lookup."""
+    bands = []
+    for i in range(0, len(signature), rows):
+        band = ",".join(str(v) for v in signature[i : i + rows])
+        digest = hashlib.sha1(band.encode("ascii")).hexdigest()[:16]
+        bands.append(f"{i // rows}:{digest}")
+    return bands
+
+
+def estimate_similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    if not sig_a or len(sig_a) != len(sig_b):
+        return 0.0
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / len(sig_a)
+
+
+@dataclass
+class ContentFingerprint:
+    """Fingerprints of one uploaded file."""
+
+    file_hash: str
+    text_hash: str
+    minhash: List[int] = field(default_factory=list)
+
+    @property
+    def bands(self) -> List[str]:
+        return lsh_bands(self.minhash)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file_hash": self.file_hash,
+            "text_hash": self.text_hash,
+            "minhash": self.minhash,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ContentFingerprint":
+        return cls(
+            file_hash=data.get("file_hash", ""),
+            text_hash=data.get("text_hash", ""),
+            minhash=list(data.get("minhash") or []),
+        )
+
+
+def fingerprint_document(text: str, file_hash: str) -> ContentFingerprint:
+    """
+    Fingerprints of one file's extracted text.
+
+    Text that normalizes to nothing (image-only PDF, empty file) gets an
+    empty text_hash and no minhash: every such file would otherwise share
+    one hash and be flagged as a duplicate of the others.
+    """
+    if not normalize_text(text):
+        return ContentFingerprint(file_hash=file_hash, text_hash="")
+    return ContentFingerprint(
+        file_hash=file_hash,
+        text_hash=text_sha256(text),
+        minhash=minhash_signature(shingles(text)),
+    )
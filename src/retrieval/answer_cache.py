@@ -10,6 +10,8 @@ Cache Strategy:
 - Value: Pickled dict with answer, sources, metadata
 - TTL: 24 hours (configurable)
 - Layers: L1 (in-memory) → L2 (Redis)
+- Reverse index: rag:docindex:answer:{document_id} → answer keys, so a
+  document change evicts only answers citing it (invalidate_documents)
 
 Usage:
     from src.retrieval.answer_cache import get_answer_cache
@@ -47,6 +49,7 @@ from src.config.feature_flags import (
     ANSWER_CACHE_TTL,
     ANSWER_CACHE_DB,
 )
+from src.retrieval.document_key_index import DocumentKeyIndex, delete_keys
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +130,9 @@ class AnswerCache:
         self._l1_order: List[str] = []
         self._l1_lock = threading.Lock()
 
+        # Reverse index document_id → answer keys (targeted invalidation)
+        self._doc_index = DocumentKeyIndex("answer")
+
         # L2: Redis cache
         self._redis: Optional[redis.Redis] = None
         if self.enabled:
@@ -164,6 +170,8 @@ class AnswerCache:
             "misses": 0,
             "cache_sets": 0,
             "errors": 0,
+            "invalidated_l1": 0,
+            "invalidated_l2": 0,
         }
 
     def _generate_key(self, query: str) -> str:
@@ -272,11 +280,16 @@ class AnswerCache:
         # L1: Store in memory
         self._set_l1(cache_key, cached_answer)
 
-        # L2: Store in Redis
+        # L2: Store in Redis (+ document index in the same round-trip)
         if self._redis:
             try:
                 cached_bytes = pickle.dumps(cached_answer.to_dict())
-                self._redis.setex(cache_key, self.ttl, cached_bytes)
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.setex(cache_key, self.ttl, cached_bytes)
+                self._doc_index.record(
+                    pipe, cache_key, self._document_ids(cached_answer), self.ttl
+                )
+                pipe.execute()
                 self.stats["cache_sets"] += 1
                 logger.info(f"📦 Answer cached: {query[:50]}... (TTL={self.ttl}s)")
                 return True
@@ -287,6 +300,10 @@ class AnswerCache:
 
         return True
 
+    @staticmethod
+    def _document_ids(cached_answer: CachedAnswer) -> set:
+        return {source.get("document_id") for source in cached_answer.sources}
+
     def _set_l1(self, cache_key: str, cached_answer: CachedAnswer):
         """Set entry in L1 cache with LRU eviction."""
         with self._l1_lock:
@@ -294,12 +311,14 @@ class AnswerCache:
             while len(self._l1_cache) >= self.l1_size and self._l1_order:
                 oldest = self._l1_order.pop(0)
                 self._l1_cache.pop(oldest, None)
+                self._doc_index.untrack(oldest)
 
             # Add new entry
             if cache_key in self._l1_cache:
                 self._l1_order.remove(cache_key)
             self._l1_cache[cache_key] = cached_answer
             self._l1_order.append(cache_key)
+        self._doc_index.track(cache_key, self._document_ids(cached_answer))
 
     def invalidate(self, query: str) -> bool:
         """
@@ -318,6 +337,7 @@ class AnswerCache:
             self._l1_cache.pop(cache_key, None)
             if cache_key in self._l1_order:
                 self._l1_order.remove(cache_key)
+        self._doc_index.untrack(cache_key)
 
         # Remove from L2
         if self._redis:
@@ -331,6 +351,41 @@ class AnswerCache:
 
         return True
 
+    def invalidate_documents(self, document_ids: List[str]) -> Dict[str, int]:
+        """
+        Evict only answers whose sources include these documents.
+
+        Args:
+            document_ids: Changed document ids
+
+        Returns:
+            Dict with number of L1 and L2 entries evicted
+        """
+        local_keys = self._doc_index.pop_local(document_ids)
+        l1_evicted = 0
+        with self._l1_lock:
+            for cache_key in local_keys:
+                if self._l1_cache.pop(cache_key, None) is not None:
+                    self._l1_order.remove(cache_key)
+                    l1_evicted += 1
+
+        l2_evicted = 0
+        if self._redis:
+            try:
+                shared_keys = self._doc_index.pop_shared(self._redis, document_ids)
+                l2_evicted = delete_keys(self._redis, shared_keys)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"⚠️ Redis invalidation error: {e}")
+
+        self.stats["invalidated_l1"] += l1_evicted
+        self.stats["invalidated_l2"] += l2_evicted
+        logger.info(
+            f"🗑️ Answer cache invalidated for {len(document_ids)} document(s): "
+            f"L1={l1_evicted}, L2={l2_evicted}"
+        )
+        return {"l1_evicted": l1_evicted, "l2_evicted": l2_evicted}
+
     def clear_all(self) -> Dict[str, int]:
         """
         Clear all cached answers.
@@ -343,6 +398,7 @@ class AnswerCache:
             l1_count = len(self._l1_cache)
             self._l1_cache.clear()
             self._l1_order.clear()
+        self._doc_index.clear()
 
         # Clear L2
         l2_count = 0
@@ -32,12 +32,19 @@ class CacheInvalidationService:
         self._affected_doc_ids: Set[str] = set()
         self._invalidation_count: int = 0
         self._last_invalidation: Optional[datetime] = None
+        self._evicted: Dict[str, int] = {}
+        self._last_evicted: int = 0
 
     def invalidate_on_document_change(
         self, document_id: str, change_type: str = "status_change"
     ) -> Dict[str, Any]:
         """
-        Invalidate all caches when a document changes.
+        Invalidate cached entries that contain a changed document.
+
+        Retrieval results, answers and semantic-cache entries are indexed
+        by the document_ids they contain, so only those entries are evicted;
+        the rest of the warm cache is kept. Newly added chunks that should
+        appear in other queries are covered by invalidate_on_reindex().
 
         Args:
             document_id: The document that was modified
@@ -47,6 +54,8 @@ class CacheInvalidationService:
             Dictionary with invalidation result details
         """
         from src.embedding.store.pgvector_store import vector_store
+        from src.retrieval.answer_cache import get_answer_cache
+        from src.retrieval.semantic_cache_v2 import get_semantic_cache_v2
 
         start_time = datetime.now()
         result: Dict[str, Any] = {
@@ -63,27 +72,44 @@ class CacheInvalidationService:
             self._invalidation_count += 1
             self._last_invalidation = start_time
 
-            # Clear all retrieval caches
-            # Because any cached query might have included this document
-            if hasattr(vector_store, "clear_all_caches"):
-                cache_result = vector_store.clear_all_caches()
-                result["caches_cleared"]["retrieval"] = cache_result
-                logger.info(
-                    f"🗑️ [CACHE_INVALIDATION] Document change invalidation completed | "
-                    f"doc_id={document_id} | change_type={change_type} | "
-                    f"retrieval_cleared={cache_result} | "
-                    f"total_invalidations={self._invalidation_count} | "
-                    f"duration_ms={(datetime.now() - start_time).total_seconds() * 1000:.2f}"
+            cleared = result["caches_cleared"]
+            if hasattr(vector_store, "invalidate_documents"):
+                cleared["retrieval"] = self._evict(
+                    "retrieval", lambda: vector_store.invalidate_documents([document_id])
                 )
             else:
                 logger.warning(
-                    f"⚠️ [CACHE_INVALIDATION] Cache not enabled or clear_all_caches not available | "
+                    f"⚠️ [CACHE_INVALIDATION] Retrieval cache not enabled | "
                     f"doc_id={document_id} | change_type={change_type}"
                 )
-                result["caches_cleared"]["retrieval"] = "not_available"
+                cleared["retrieval"] = "not_available"
+            cleared["answer"] = self._evict(
+                "answer", lambda: get_answer_cache().invalidate_documents([document_id])
+            )
+            cleared["semantic"] = self._evict(
+                "semantic",
+                lambda: get_semantic_cache_v2().invalidate_documents([document_id]),
+            )
+
+            # Drop cross-encoder scores of this document's chunks only
+            cleared["rerank_scores"] = self._invalidate_rerank_scores(document_id)
 
+            evicted = sum(
+                counts.get("l1_evicted", 0) + counts.get("l2_evicted", 0)
+                for counts in cleared.values()
+                if isinstance(counts, dict)
+            )
+            self._last_evicted = evicted
+            result["entries_evicted"] = evicted
             result["success"] = True
             result["duration_ms"] = (datetime.now() - start_time).total_seconds() * 1000
+            logger.info(
+                f"🗑️ [CACHE_INVALIDATION] Document change invalidation completed | "
+                f"doc_id={document_id} | change_type={change_type} | "
+                f"entries_evicted={evicted} | caches={cleared} | "
+                f"total_invalidations={self._invalidation_count} | "
+                f"duration_ms={result['duration_ms']:.2f}"
+            )
             return result
 
         except Exception as e:
@@ -96,6 +122,51 @@ class CacheInvalidationService:
             result["error"] = str(e)
             return result
 
+    def _evict(self, cache_name: str, invalidate) -> Any:
+        """Run one cache's targeted invalidation and accumulate eviction stats."""
+        try:
+            counts = invalidate()
+        except Exception as e:
+            logger.warning(
+                f"⚠️ [CACHE_INVALIDATION] {cache_name} invalidation failed | error={str(e)}"
+            )
+            return {"error": str(e)}
+        self._evicted[cache_name] = self._evicted.get(cache_name, 0) + sum(
+            counts.values()
+        )
+        return counts
+
+    def _invalidate_rerank_scores(self, document_id: str) -> Any:
+        """Invalidate rerank pair scores for every chunk of a document."""
+        from src.retrieval.ranking.score_cache import get_rerank_score_cache
+
+        score_cache = get_rerank_score_cache()
+        if score_cache is None:
+            return "not_available"
+
+        chunk_ids: list = []
+        try:
+            from src.models.base import SessionLocal
+            from src.models.document_chunks import DocumentChunk
+            from src.models.documents import Document
+
+            with SessionLocal() as db:
+                rows = (
+                    db.query(DocumentChunk.chunk_id)
+                    .join(Document, DocumentChunk.document_id == Document.id)
+                    .filter(Document.document_id == document_id)
+                    .all()
+                )
+                chunk_ids = [row.chunk_id for row in rows]
+        except Exception as e:
+            # The cache also tracks the chunks it has seen per document
+            logger.warning(
+                f"⚠️ [CACHE_INVALIDATION] Chunk lookup failed, using cache index | "
+                f"doc_id={document_id} | error={str(e)}"
+            )
+
+        return {"chunks": score_cache.invalidate_document(document_id, chunk_ids)}
+
     def invalidate_on_reindex(self) -> Dict[str, Any]:
         """
         Invalidate all caches after reindexing documents.
@@ -152,6 +223,8 @@ class CacheInvalidationService:
             "last_invalidation": (
                 self._last_invalidation.isoformat() if self._last_invalidation else None
             ),
+            "entries_evicted": dict(self._evicted),
+            "last_invalidation_evicted": self._last_evicted,
         }
 
 
@@ -5,11 +5,14 @@ Implements multi-layer caching for vector search optimization.
 
 import hashlib
 import pickle
+import threading
 from typing import List, Dict, Any, Optional
 import redis
 from langchain_core.documents import Document
 from langchain_postgres import PGVector
 
+from src.retrieval.document_key_index import DocumentKeyIndex, delete_keys
+
 
 class CachedVectorStore:
     """
@@ -19,6 +22,9 @@ class CachedVectorStore:
     - L1: In-memory cache (Python dict) - fastest, limited size
     - L2: Redis cache - fast, persistent, shared across processes
     - L3: PostgreSQL + pgvector - slowest, authoritative source
+
+    Entries are indexed by the document_ids they contain, so a document
+    change only evicts the queries that returned it (invalidate_documents).
     """
 
     def __init__(
@@ -59,6 +65,10 @@ class CachedVectorStore:
         self.l1_cache_size = l1_cache_size
         self.l1_cache: Dict[str, List[Document]] = {}
         self.l1_cache_order: List[str] = []  # LRU tracking
+        self._l1_lock = threading.Lock()  # Concurrent multi-query searches
+
+        # Reverse index document_id → cache keys (targeted invalidation)
+        self._doc_index = DocumentKeyIndex("retrieval")
 
         # Statistics
         self.stats = {
@@ -66,8 +76,14 @@ class CachedVectorStore:
             "l1_hits": 0,
             "l2_hits": 0,
             "l3_hits": 0,
+            "invalidated_l1": 0,
+            "invalidated_l2": 0,
         }
 
+    @staticmethod
+    def _document_ids(docs: List[Document]) -> set:
+        return {doc.metadata.get("document_id") for doc in docs}
+
     def _generate_cache_key(
         self, query: str, k: int, filters: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -107,11 +123,12 @@ class CachedVectorStore:
         if not self.enable_l1_cache:
             return None
 
-        if cache_key in self.l1_cache:
-            # Move to end (most recently used)
-            self.l1_cache_order.remove(cache_key)
-            self.l1_cache_order.append(cache_key)
-            return self.l1_cache[cache_key]
+        with self._l1_lock:
+            if cache_key in self.l1_cache:
+                # Move to end (most recently used)
+                self.l1_cache_order.remove(cache_key)
+                self.l1_cache_order.append(cache_key)
+                return self.l1_cache[cache_key]
 
         return None
 
@@ -120,13 +137,18 @@ class CachedVectorStore:
         if not self.enable_l1_cache:
             return
 
-        # Evict oldest if cache full
-        if len(self.l1_cache) >= self.l1_cache_size:
-            oldest_key = self.l1_cache_order.pop(0)
-            del self.l1_cache[oldest_key]
+        with self._l1_lock:
+            if cache_key in self.l1_cache:
+                self.l1_cache_order.remove(cache_key)
+            # Evict oldest if cache full
+            elif len(self.l1_cache) >= self.l1_cache_size:
+                oldest_key = self.l1_cache_order.pop(0)
+                del self.l1_cache[oldest_key]
+                self._doc_index.untrack(oldest_key)
 
-        self.l1_cache[cache_key] = docs
-        self.l1_cache_order.append(cache_key)
+            self.l1_cache[cache_key] = docs
+            self.l1_cache_order.append(cache_key)
+        self._doc_index.track(cache_key, self._document_ids(docs))
 
     def _get_from_l2_cache(self, cache_key: str) -> Optional[List[Document]]:
         """Get from L2 (Redis) cache."""
@@ -141,10 +163,13 @@ class CachedVectorStore:
         return None
 
     def _set_to_l2_cache(self, cache_key: str, docs: List[Document]):
-        """Set to L2 (Redis) cache."""
+        """Set to L2 (Redis) cache, indexed by document_id."""
         try:
             docs_bytes = pickle.dumps(docs)
-            self.redis.setex(cache_key, self.ttl, docs_bytes)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.setex(cache_key, self.ttl, docs_bytes)
+            self._doc_index.record(pipe, cache_key, self._document_ids(docs), self.ttl)
+            pipe.execute()
         except Exception as e:
             print(f"⚠️  Redis set error: {e}")
 
@@ -163,10 +188,47 @@ class CachedVectorStore:
         Returns:
             List of documents
         """
-        self.stats["total_queries"] += 1
+        cache_key = self._generate_cache_key(query, k, filter)
+        return self._search_through_cache(
+            cache_key,
+            lambda: self.vector_store.similarity_search(
+                query, k=k, filter=filter, **kwargs
+            ),
+        )
 
-        # Generate cache key
+    def search_with_vector(
+        self,
+        query: str,
+        embedding: List[float],
+        k: int = 5,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Similarity search with a pre-computed query embedding.
+
+        Uses the same cache key as similarity_search(query) so batched
+        multi-query retrieval shares cache entries with single queries.
+
+        Args:
+            query: Search query (cache key only)
+            embedding: Query embedding
+            k: Number of results
+            filter: Metadata filters
+
+        Returns:
+            List of documents
+        """
         cache_key = self._generate_cache_key(query, k, filter)
+        return self._search_through_cache(
+            cache_key,
+            lambda: self.vector_store.similarity_search_by_vector(
+                embedding, k=k, filter=filter
+            ),
+        )
+
+    def _search_through_cache(self, cache_key: str, fetch) -> List[Document]:
+        """Look up L1 → L2, fall back to fetch() (L3) and backfill caches."""
+        self.stats["total_queries"] += 1
 
         # Try L1 cache (memory)
         docs = self._get_from_l1_cache(cache_key)
@@ -183,7 +245,7 @@ class CachedVectorStore:
             return docs
 
         # L3: Query vector store (PostgreSQL)
-        docs = self.vector_store.similarity_search(query, k=k, filter=filter, **kwargs)
+        docs = fetch()
         self.stats["l3_hits"] += 1
 
         # Update caches
@@ -219,6 +281,7 @@ class CachedVectorStore:
         # Clear L1
         self.l1_cache.clear()
         self.l1_cache_order.clear()
+        self._doc_index.clear()
 
         # Clear L2 (only keys with our prefix)
         try:
@@ -246,6 +309,7 @@ class CachedVectorStore:
             l1_size = len(self.l1_cache)
             self.l1_cache.clear()
             self.l1_cache_order.clear()
+            self._doc_index.clear()
 
             # Clear L2 (Redis)
             pattern = "rag:retrieval:*"
@@ -263,6 +327,46 @@ class CachedVectorStore:
             logger.error(f"❌ Failed to clear cache: {e}", exc_info=True)
             raise
 
+    def invalidate_documents(self, document_ids: List[str]) -> Dict[str, int]:
+        """
+        Evict only the cached queries whose results contain these documents.
+
+        Use this when a document's status or content changes; unrelated
+        queries stay warm.
+
+        Args:
+            document_ids: Changed document ids (metadata document_id)
+
+        Returns:
+            Dict with number of L1 and L2 entries evicted
+        """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        local_keys = self._doc_index.pop_local(document_ids)
+        l1_evicted = 0
+        with self._l1_lock:
+            for cache_key in local_keys:
+                if self.l1_cache.pop(cache_key, None) is not None:
+                    self.l1_cache_order.remove(cache_key)
+                    l1_evicted += 1
+
+        l2_evicted = 0
+        try:
+            shared_keys = self._doc_index.pop_shared(self.redis, document_ids)
+            l2_evicted = delete_keys(self.redis, shared_keys)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis invalidation error: {e}")
+
+        self.stats["invalidated_l1"] += l1_evicted
+        self.stats["invalidated_l2"] += l2_evicted
+        logger.info(
+            f"🗑️ Retrieval cache invalidated for {len(document_ids)} document(s): "
+            f"L1={l1_evicted}, L2={l2_evicted}"
+        )
+        return {"l1_evicted": l1_evicted, "l2_evicted": l2_evicted}
+
     def invalidate_query(
         self, query: str, k: int = 5, filters: Optional[Dict[str, Any]] = None
     ):
@@ -280,6 +384,7 @@ class CachedVectorStore:
         if cache_key in self.l1_cache:
             self.l1_cache_order.remove(cache_key)
             del self.l1_cache[cache_key]
+            self._doc_index.untrack(cache_key)
 
         # Remove from L2
         try:
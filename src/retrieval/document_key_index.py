@@ -0,0 +1,130 @@
+"""
+Document Key Index - Reverse index document_id → cache keys
+
+Retrieval results, answers and semantic-cache entries are all built from
+retrieved chunks. Each cache records which documents an entry contains,
+so a document change deletes only those entries instead of wiping the
+whole warm cache.
+
+Layout:
+- Local: in-process maps (document_id → keys, key → document_ids) that
+  mirror the cache's own L1
+- Shared: Redis set rag:docindex:{namespace}:{document_id} → cache keys,
+  written in the same pipeline as the entry and expiring with it
+
+Usage:
+    index = DocumentKeyIndex("answer")
+    index.track(cache_key, ["DOC-1", "DOC-2"])         # L1 write
+    index.record(pipe, cache_key, ["DOC-1"], ttl)       # L2 write (pipeline)
+
+    local_keys = index.pop_local(["DOC-1"])
+    shared_keys = index.pop_shared(redis_client, ["DOC-1"])
+    deleted = delete_keys(redis_client, shared_keys)
+"""
+
+import threading
+from typing import Any, Dict, Iterable, Optional, Set
+
+DOC_INDEX_PREFIX = "rag:docindex:"
+DELETE_BATCH_SIZE = 500
+
+
+def _normalize_ids(document_ids: Iterable[Any]) -> Set[str]:
+    return {str(d) for d in document_ids if d not in (None, "")}
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def delete_keys(redis_client, keys: Iterable[Any]) -> int:
+    """Pipelined DEL in batches. Returns the number of keys that existed."""
+    keys = list(keys)
+    deleted = 0
+    for start in range(0, len(keys), DELETE_BATCH_SIZE):
+        pipe = redis_client.pipeline(transaction=False)
+        for key in keys[start : start + DELETE_BATCH_SIZE]:
+            pipe.delete(key)
+        deleted += sum(int(n or 0) for n in pipe.execute())
+    return deleted
+
+
+class DocumentKeyIndex:
+    """Reverse index from document ids to the cache keys that contain them."""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._doc_keys: Dict[str, Set[str]] = {}
+        self._key_docs: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def redis_key(self, document_id: str) -> str:
+        return f"{DOC_INDEX_PREFIX}{self.namespace}:{document_id}"
+
+    # ----- Local (L1) -----
+
+    def track(self, cache_key: str, document_ids: Iterable[Any]):
+        """Record that a local entry contains these documents."""
+        doc_ids = _normalize_ids(document_ids)
+        if not doc_ids:
+            return
+        with self._lock:
+            self._key_docs.setdefault(cache_key, set()).update(doc_ids)
+            for document_id in doc_ids:
+                self._doc_keys.setdefault(document_id, set()).add(cache_key)
+
+    def untrack(self, cache_key: str):
+        """Forget a local entry (L1 eviction / explicit delete)."""
+        with self._lock:
+            for document_id in self._key_docs.pop(cache_key, ()):
+                keys = self._doc_keys.get(document_id)
+                if keys is not None:
+                    keys.discard(cache_key)
+                    if not keys:
+                        del self._doc_keys[document_id]
+
+    def pop_local(self, document_ids: Iterable[Any]) -> Set[str]:
+        """Local keys containing any of the documents (removed from the index)."""
+        keys: Set[str] = set()
+        with self._lock:
+            for document_id in _normalize_ids(document_ids):
+                keys |= self._doc_keys.pop(document_id, set())
+        for cache_key in keys:
+            self.untrack(cache_key)
+        return keys
+
+    # ----- Shared (L2) -----
+
+    def record(
+        self,
+        pipe,
+        cache_key: str,
+        document_ids: Iterable[Any],
+        ttl: Optional[int] = None,
+    ):
+        """Queue SADD (+ EXPIRE) of the entry into each document's Redis set."""
+        for document_id in _normalize_ids(document_ids):
+            name = self.redis_key(document_id)
+            pipe.sadd(name, cache_key)
+            if ttl:
+                pipe.expire(name, ttl)
+
+    def pop_shared(self, redis_client, document_ids: Iterable[Any]) -> Set[str]:
+        """Redis keys containing any of the documents (index sets are deleted)."""
+        names = [self.redis_key(d) for d in _normalize_ids(document_ids)]
+        if not names:
+            return set()
+        pipe = redis_client.pipeline(transaction=False)
+        for name in names:
+            pipe.smembers(name)
+        pipe.delete(*names)
+        members = pipe.execute()[:-1]
+        return {_decode(key) for keys in members for key in (keys or ())}
+
+    def clear(self):
+        with self._lock:
+            self._doc_keys.clear()
+            self._key_docs.clear()
+
+    def __len__(self) -> int:
+        return len(self._doc_keys)
@@ -0,0 +1,280 @@
+"""
+Document Status Map - in-memory document_id → status for retrieval
+
+qa_chain used to open a session and query the documents table on every
+answer to find out which retrieved chunks were expired or superseded. Each
+process now keeps the whole (small) documents status table in memory:
+
+- Full load of documents.status / metadata->>'valid_until' on first use
+- LISTEN document_status: the trigger from alembic add_document_status_notify
+  sends one notification per insert / delete / status or valid_until change,
+  applied to the map by a daemon thread; the map is reloaded after every
+  (re)connect so nothing is missed while disconnected
+- No LISTEN connection (e.g. DATABASE_URL points at PgBouncer in transaction
+  mode): the map is reloaded when older than DOCUMENT_STATUS_MAP_MAX_AGE_SECONDS
+
+Effective status is the stored status, or "expired" once an active
+document's valid_until (YYYY-MM-DD) has passed. annotate() writes it to
+chunk metadata["status"] (what MetadataFilter reads) and moves inactive
+chunks after active ones, in one pass and without a DB round-trip.
+
+Usage:
+    from src.retrieval.document_status import get_document_status_map
+
+    docs = get_document_status_map().annotate(retriever.invoke(question))
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from langchain_core.documents import Document
+
+from src.config.feature_flags import (
+    DEMOTE_INACTIVE_DOCUMENTS,
+    DOCUMENT_STATUS_MAP_MAX_AGE_SECONDS,
+)
+from src.retrieval.filters.metadata_filter import MetadataFilter
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL = "document_status"
+LISTEN_TIMEOUT_SECONDS = 1.0
+RECONNECT_DELAY_SECONDS = 5.0
+
+LOAD_STATUSES_SQL = """
+    SELECT document_id, status, metadata ->> 'valid_until'
+    FROM documents
+    WHERE document_id IS NOT NULL
+"""
+
+StatusEntry = Tuple[str, Optional[date]]  # (stored status, valid_until)
+
+
+def _parse_valid_until(value: Optional[str]) -> Optional[date]:
+    """YYYY-MM-DD (optionally with a time part) → date; None if unparseable."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class DocumentStatusMap:
+    """Per-process document status table kept current by NOTIFY."""
+
+    def __init__(
+        self,
+        connection_factory: Optional[Callable[[], Any]] = None,
+        max_age_seconds: float = DOCUMENT_STATUS_MAP_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+        today: Callable[[], date] = date.today,
+    ):
+        if connection_factory is None:
+            from src.config.database import get_db_sync
+
+            connection_factory = get_db_sync
+        self._connection_factory = connection_factory
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._today = today
+
+        self._entries: Dict[str, StatusEntry] = {}
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._listening = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"loads": 0, "notifications": 0, "load_errors": 0}
+
+    # ------------------------------------------------------------------
+    # Loading / notifications
+    # ------------------------------------------------------------------
+
+    def load(self, conn=None):
+        """Replace the map with the current documents table."""
+        own_conn = conn is None
+        if own_conn:
+            conn = self._connection_factory()
+        try:
+            rows = conn.execute(LOAD_STATUSES_SQL).fetchall()
+        finally:
+            if own_conn:
+                conn.close()
+
+        entries = {
+            document_id: (status or "active", _parse_valid_until(valid_until))
+            for document_id, status, valid_until in rows
+        }
+        with self._lock:
+            self._entries = entries
+            self._loaded_at = self._clock()
+            self.stats["loads"] += 1
+        logger.info(f"📋 Document status map loaded: {len(entries)} documents")
+
+    def apply_notification(self, payload: Union[str, Dict[str, Any]]):
+        """Apply one document_status NOTIFY payload (JSON from the trigger)."""
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+
+        document_id = payload.get("document_id")
+        if not document_id:
+            return
+
+        with self._lock:
+            if payload.get("op") == "DELETE":
+                self._entries.pop(document_id, None)
+            else:
+                self._entries[document_id] = (
+                    payload.get("status") or "active",
+                    _parse_valid_until(payload.get("valid_until")),
+                )
+            self.stats["notifications"] += 1
+
+    def _ensure_fresh(self):
+        """Load on first use; reload when stale and no listener keeps it current."""
+        loaded_at = self._loaded_at
+        if loaded_at is not None and (
+            self._listening or self._clock() - loaded_at < self.max_age_seconds
+        ):
+            return
+        try:
+            self.load()
+        except Exception as e:
+            self.stats["load_errors"] += 1
+            logger.warning(f"⚠️ Document status map load failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def status_of(self, document_id: str) -> Optional[str]:
+        """Effective status, or None if the document is unknown."""
+        self._ensure_fresh()
+        entry = self._entries.get(document_id)
+        if entry is None:
+            return None
+        status, valid_until = entry
+        if status == "active" and valid_until is not None and valid_until < self._today():
+            return "expired"
+        return status
+
+    def statuses(self, document_ids: Iterable[str]) -> Dict[str, str]:
+        """document_id → effective status for the known ids."""
+        result = {}
+        for document_id in document_ids:
+            status = self.status_of(document_id)
+            if status is not None:
+                result[document_id] = status
+        return result
+
+    def annotate(
+        self, docs: List[Document], demote: bool = DEMOTE_INACTIVE_DOCUMENTS
+    ) -> List[Document]:
+        """
+        Set metadata["status"] on each chunk from the map and, if demote,
+        move inactive chunks after active ones (stable, so relevance order
+        is kept within each group).
+        """
+        for doc in docs:
+            document_id = doc.metadata.get("document_id")
+            status = self.status_of(document_id) if document_id else None
+            if status is not None:
+                doc.metadata["status"] = status
+
+        if not demote:
+            return docs
+        return sorted(docs, key=lambda doc: not MetadataFilter.is_active(doc))
+
+    # ------------------------------------------------------------------
+    # Listener
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the LISTEN thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen_loop, name="document-status-listener", daemon=True
+        )
+        self._thread.start()
+
+    def _listen_loop(self):
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connection_factory()
+                conn.autocommit = True
+                conn.execute(f"LISTEN {STATUS_CHANNEL}")
+                # Reload after LISTEN so changes made while disconnected are seen
+                self.load(conn)
+                self._listening = True
+                logger.info(f"👂 Listening for {STATUS_CHANNEL} notifications")
+
+                while not self._stop.is_set():
+                    for notify in conn.notifies(timeout=LISTEN_TIMEOUT_SECONDS):
+                        self.apply_notification(notify.payload)
+            except Exception as e:
+                self.stats["load_errors"] += 1
+                logger.warning(
+                    f"⚠️ Document status listener error, retrying in "
+                    f"{RECONNECT_DELAY_SECONDS:.0f}s: {e}"
+                )
+                self._stop.wait(RECONNECT_DELAY_SECONDS)
+            finally:
+                self._listening = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def shutdown(self, wait: bool = False):
+        self._stop.set()
+        if wait and self._thread is not None:
+            self._thread.join(timeout=LISTEN_TIMEOUT_SECONDS + 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        loaded_at = self._loaded_at
+        return {
+            **self.stats,
+            "documents": len(self._entries),
+            "listening": self._listening,
+            "age_s": round(self._clock() - loaded_at, 1) if loaded_at else None,
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_status_map: Optional[DocumentStatusMap] = None
+_status_map_lock = threading.Lock()
+
+
+def get_document_status_map() -> DocumentStatusMap:
+    """Get singleton DocumentStatusMap (thread-safe lazy initialization)."""
+    global _status_map
+
+    if _status_map is not None:
+        return _status_map
+
+    with _status_map_lock:
+        if _status_map is None:
+            _status_map = DocumentStatusMap()
+            _status_map.start()
+        return _status_map
+
+
+def shutdown_document_status_map(wait: bool = False):
+    """Stop the listener (application shutdown / tests)."""
+    global _status_map
+    with _status_map_lock:
+        if _status_map is not None:
+            _status_map.shutdown(wait=wait)
+        _status_map = None
@@ -23,7 +23,12 @@ class MetadataFilter:
 
     @staticmethod
     def is_active(doc: Document) -> bool:
-        """Check if document is active."""
+        """
+        Check if document is active.
+
+        metadata["status"] is set on retrieved chunks from the documents
+        table by DocumentStatusMap.annotate (src/retrieval/document_status.py).
+        """
         status = doc.metadata.get("status")
         if status:
             return status == "active"
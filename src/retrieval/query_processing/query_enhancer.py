@@ -2,8 +2,11 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Optional
 import os
+import time
+import asyncio
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import lru_cache
 
 from .strategies import (
@@ -38,12 +41,37 @@ class QueryEnhancerConfig:
     strategies: List[EnhancementStrategy] = None
     enable_caching: bool = True
     use_complexity: bool = False  # Enable adaptive strategy selection
+    # Run strategies concurrently (one LLM round-trip of latency instead of N)
+    parallel: bool = os.getenv("PARALLEL_ENHANCEMENT", "true").lower() == "true"
+    # Per-strategy deadline in seconds; strategies that miss it are dropped
+    strategy_timeout: float = float(os.getenv("ENHANCEMENT_STRATEGY_TIMEOUT", "8.0"))
 
     def __post_init__(self):
         if self.strategies is None:
             self.strategies = [EnhancementStrategy.MULTI_QUERY]
 
 
+# ===== SHARED EXECUTOR FOR PARALLEL STRATEGIES =====
+# Bounded pool shared by all enhancers so concurrent requests cannot spawn
+# unbounded LLM calls. Strategy calls are blocking (LLM client .invoke).
+ENHANCEMENT_MAX_WORKERS = int(os.getenv("ENHANCEMENT_MAX_WORKERS", "16"))
+_strategy_executor: Optional[ThreadPoolExecutor] = None
+_strategy_executor_lock = threading.Lock()
+
+
+def _get_strategy_executor() -> ThreadPoolExecutor:
+    """Get shared strategy executor (lazy, thread-safe)."""
+    global _strategy_executor
+    if _strategy_executor is None:
+        with _strategy_executor_lock:
+            if _strategy_executor is None:
+                _strategy_executor = ThreadPoolExecutor(
+                    max_workers=ENHANCEMENT_MAX_WORKERS,
+                    thread_name_prefix="query-enhancer",
+                )
+    return _strategy_executor
+
+
 # ===== SINGLETON CACHE FOR QUERY ENHANCERS =====
 _enhancer_cache: Dict[str, "QueryEnhancer"] = {}
 _enhancer_cache_lock = threading.Lock()
@@ -94,8 +122,15 @@ def clear_enhancer_cache():
 
 
 class QueryEnhancer:
-    def __init__(self, config: QueryEnhancerConfig):
+    def __init__(self, config: QueryEnhancerConfig, llm_client=None):
+        """
+        Args:
+            config: Strategies, max queries, parallelism and caching
+            llm_client: Chat client shared by all strategies (None = each
+                strategy gets one from the LLM provider factory)
+        """
         self.config = config
+        self.llm_client = llm_client
         self.analyzer = (
             QuestionComplexityAnalyzer() if hasattr(config, "use_complexity") else None
         )
@@ -103,6 +138,19 @@ class QueryEnhancer:
         self.cache = {} if config.enable_caching else None
 
         self.strategies = self._init_strategies()
+
+        # Per-strategy latency statistics
+        self._latency_lock = threading.Lock()
+        self.latency_stats: Dict[str, Dict[str, float]] = {
+            s.value: {
+                "calls": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "total_ms": 0.0,
+                "last_ms": 0.0,
+            }
+            for s in self.strategies.keys()
+        }
         logger.info(
             f"Initialized QueryEnhancer with strategies: {[s.value for s in self.strategies.keys()]}"
         )
@@ -116,17 +164,21 @@ class QueryEnhancer:
                         llm_model=self.config.llm_model,
                         temperature=0.7,
                         max_queries=self.config.max_queries,
+                        llm_client=self.llm_client,
                     )
 
                 elif strategy_type == EnhancementStrategy.HYDE:
                     strategies[strategy_type] = HyDEStrategy(
                         llm_model=self.config.llm_model,
                         temperature=0.3,  # Lower temp for factual
+                        llm_client=self.llm_client,
                     )
 
                 elif strategy_type == EnhancementStrategy.STEP_BACK:
                     strategies[strategy_type] = StepBackStrategy(
-                        llm_model=self.config.llm_model, temperature=0.5
+                        llm_model=self.config.llm_model,
+                        temperature=0.5,
+                        llm_client=self.llm_client,
                     )
 
                 elif strategy_type == EnhancementStrategy.DECOMPOSITION:
@@ -134,6 +186,7 @@ class QueryEnhancer:
                         llm_model=self.config.llm_model,
                         temperature=0.7,
                         max_subqueries=self.config.max_queries,
+                        llm_client=self.llm_client,
                     )
 
                 logger.info(f"Initialized {strategy_type.value} strategy")
@@ -168,27 +221,180 @@ class QueryEnhancer:
             logger.info("Cache hit for query")
             return self.cache[query]
 
-        all_queries = [query]
+        if self.config.parallel and len(self.strategies) > 1:
+            outputs = self._run_strategies_parallel(query)
+        else:
+            outputs = {
+                strategy_type: self._run_strategy(strategy_type, strategy, query)
+                for strategy_type, strategy in self.strategies.items()
+            }
 
-        for strategy_type, strategy in self.strategies.items():
-            try:
-                logger.debug(f"Applying {strategy_type.value} strategy")
-                enhanced = strategy.enhance(query)
-                all_queries.extend(enhanced)
-            except Exception as e:
-                logger.error(f"Error applying {strategy_type.value}: {e}")
+        return self._merge_outputs(query, outputs)
+
+    async def aenhance(self, query: str) -> List[str]:
+        """
+        Async enhancement: fires all strategies at once on the shared executor.
+
+        Same dedup/ordering semantics as enhance(). Each strategy is bounded
+        by config.strategy_timeout; late strategies are dropped.
+        """
+        if not query or not query.strip():
+            logger.warning("Received empty query for enhancement")
+            return [query]
+        query = query.strip()
+
+        if self.cache is not None and query in self.cache:
+            logger.info("Cache hit for query")
+            return self.cache[query]
+
+        loop = asyncio.get_running_loop()
+        executor = _get_strategy_executor()
+        items = list(self.strategies.items())
+
+        async def _run(strategy_type, strategy):
+            return await asyncio.wait_for(
+                loop.run_in_executor(
+                    executor, self._run_strategy, strategy_type, strategy, query
+                ),
+                timeout=self.config.strategy_timeout,
+            )
+
+        results = await asyncio.gather(
+            *(_run(st, strategy) for st, strategy in items), return_exceptions=True
+        )
+
+        outputs: Dict[EnhancementStrategy, Optional[List[str]]] = {}
+        for (strategy_type, _), res in zip(items, results):
+            if isinstance(res, asyncio.TimeoutError):
+                self._record_timeout(strategy_type)
+                outputs[strategy_type] = None
+            elif isinstance(res, BaseException):
+                outputs[strategy_type] = []
+            else:
+                outputs[strategy_type] = res
+
+        return self._merge_outputs(query, outputs)
+
+    def _run_strategy(
+        self,
+        strategy_type: EnhancementStrategy,
+        strategy: BaseEnhancementStrategy,
+        query: str,
+    ) -> List[str]:
+        """Run one strategy, recording its latency. Errors yield []."""
+        start = time.perf_counter()
+        error = False
+        try:
+            logger.debug(f"Applying {strategy_type.value} strategy")
+            return strategy.enhance(query)
+        except Exception as e:
+            error = True
+            logger.error(f"Error applying {strategy_type.value}: {e}")
+            return []
+        finally:
+            self._record_latency(
+                strategy_type, (time.perf_counter() - start) * 1000, error
+            )
+
+    def _run_strategies_parallel(
+        self, query: str
+    ) -> Dict[EnhancementStrategy, Optional[List[str]]]:
+        """
+        Submit all strategies to the shared executor and wait up to
+        config.strategy_timeout. Timed-out strategies map to None.
+        """
+        executor = _get_strategy_executor()
+        futures = {
+            strategy_type: executor.submit(
+                self._run_strategy, strategy_type, strategy, query
+            )
+            for strategy_type, strategy in self.strategies.items()
+        }
+        wait(futures.values(), timeout=self.config.strategy_timeout)
+
+        outputs: Dict[EnhancementStrategy, Optional[List[str]]] = {}
+        for strategy_type, future in futures.items():
+            if future.done():
+                outputs[strategy_type] = future.result()
+            else:
+                future.cancel()
+                self._record_timeout(strategy_type)
+                outputs[strategy_type] = None
+        return outputs
+
+    def _merge_outputs(
+        self,
+        query: str,
+        outputs: Dict[EnhancementStrategy, Optional[List[str]]],
+    ) -> List[str]:
+        """
+        Merge strategy outputs in configured strategy order, deduplicate,
+        truncate and cache (unless a strategy was dropped on timeout).
+        """
+        all_queries = [query]
+        timed_out = []
+        for strategy_type in self.strategies.keys():
+            enhanced = outputs.get(strategy_type)
+            if enhanced is None:
+                timed_out.append(strategy_type.value)
+                continue
+            all_queries.extend(enhanced)
 
         result = self._deduplicate(all_queries)
 
         max_total = self.config.max_queries * len(self.strategies)
         result = result[:max_total]
 
-        if self.cache is not None:
+        if timed_out:
+            # Don't cache degraded results - next call may complete in time
+            logger.warning(
+                f"⏱️ Dropped strategies after {self.config.strategy_timeout}s: {timed_out}"
+            )
+        elif self.cache is not None:
             self.cache[query] = result
 
         logger.info(f"Enhanced query to {len(result)} variations")
         return result
 
+    def _record_latency(
+        self, strategy_type: EnhancementStrategy, elapsed_ms: float, error: bool
+    ):
+        with self._latency_lock:
+            stats = self.latency_stats.setdefault(
+                strategy_type.value,
+                {"calls": 0, "errors": 0, "timeouts": 0, "total_ms": 0.0, "last_ms": 0.0},
+            )
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["last_ms"] = elapsed_ms
+            if error:
+                stats["errors"] += 1
+
+    def _record_timeout(self, strategy_type: EnhancementStrategy):
+        with self._latency_lock:
+            self.latency_stats[strategy_type.value]["timeouts"] += 1
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-strategy latency statistics.
+
+        Returns:
+            Dict mapping strategy name -> calls/errors/timeouts/avg_ms/last_ms
+        """
+        with self._latency_lock:
+            return {
+                name: {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "timeouts": stats["timeouts"],
+                    "avg_ms": round(stats["total_ms"] / stats["calls"], 2)
+                    if stats["calls"]
+                    else 0.0,
+                    "last_ms": round(stats["last_ms"], 2),
+                }
+                for name, stats in self.latency_stats.items()
+            }
+
     def _deduplicate(self, queries: List[str]) -> List[str]:
         """
         Remove duplicate queries while preserving order
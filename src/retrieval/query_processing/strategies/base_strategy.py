@@ -21,19 +21,21 @@ class BaseEnhancementStrategy(ABC):
     - Error handling & retries
     """
 
-    def __init__(self, llm_model: str, temperature: float = 0.7):
+    def __init__(self, llm_model: str, temperature: float = 0.7, llm_client=None):
         """
         Initialize strategy
 
         Args:
             llm_model: Model name (uses provider from settings)
             temperature: Sampling temperature (0.0-1.0)
+            llm_client: Chat client to use instead of the provider factory
+                (e.g. offline benchmark stand-ins)
         """
         self.llm_model = llm_model
         self.temperature = temperature
 
         # Use LLM provider factory (supports OpenAI, Vertex AI, Gemini)
-        self.client = get_llm_client(
+        self.client = llm_client or get_llm_client(
             temperature=temperature,
             max_tokens=500,
         )
@@ -15,8 +15,8 @@ class DecompositionStrategy(BaseEnhancementStrategy):
     ref: https://arxiv.org/abs/2205.10625
     """
 
-    def __init__(self, llm_model, temperature=0.7, max_subqueries=5):
-        super().__init__(llm_model, temperature)
+    def __init__(self, llm_model, temperature=0.7, max_subqueries=5, llm_client=None):
+        super().__init__(llm_model, temperature, llm_client=llm_client)
         self.max_subqueries = max_subqueries
 
     def enhance(self, query: str) -> List[str]:
@@ -27,8 +27,8 @@ class HyDEStrategy(BaseEnhancementStrategy):
     - Tăng khả năng hiểu ngữ cảnh và ý định của người dùng
     """
 
-    def __init__(self, llm_model, temperature=0.3):
-        super().__init__(llm_model, temperature)
+    def __init__(self, llm_model, temperature=0.3, llm_client=None):
+        super().__init__(llm_model, temperature, llm_client=llm_client)
         logger.info("Initialized HyDEStrategy")
 
     def enhance(self, query: str) -> str:
@@ -21,8 +21,8 @@ class MultiQueryStrategy(BaseEnhancementStrategy):
     - Đặc biệt hiệu quả với tiếng Việt (nhiều cách nói)
     """
 
-    def __init__(self, llm_model, temperature=0.7, max_queries=5):
-        super().__init__(llm_model, temperature)
+    def __init__(self, llm_model, temperature=0.7, max_queries=5, llm_client=None):
+        super().__init__(llm_model, temperature, llm_client=llm_client)
         self.max_queries = max_queries
         logger.info(f"MultiQueryStrategy initialized to generate {max_queries} queries")
 
@@ -29,8 +29,8 @@ class StepBackStrategy(BaseEnhancementStrategy):
     Reference: https://arxiv.org/abs/2310.06117
     """
 
-    def __init__(self, llm_model, temperature=0.5):
-        super().__init__(llm_model, temperature)
+    def __init__(self, llm_model, temperature=0.5, llm_client=None):
+        super().__init__(llm_model, temperature, llm_client=llm_client)
 
     def enhance(self, query) -> List[str]:
         try:
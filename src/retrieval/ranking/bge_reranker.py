@@ -13,7 +13,15 @@ import time
 import torch
 import threading
 
+from src.config.feature_flags import (
+    BGE_MICRO_BATCH_ENABLED,
+    BGE_MICRO_BATCH_MAX_WAIT_MS,
+    BGE_MICRO_BATCH_MAX_PAIRS,
+    BGE_MICRO_BATCH_TIMEOUT_S,
+)
 from .base_reranker import BaseReranker
+from .micro_batcher import MicroBatcher
+from .score_cache import get_rerank_score_cache
 
 logger = logging.getLogger(__name__)
 
@@ -181,6 +189,10 @@ class BGEReranker(BaseReranker):
         max_length: int = 512,  # ⭐ BGE supports 512 tokens
         batch_size: int = 32,  # ⭐ Increased for GPU
         cache_dir: Optional[str] = None,
+        micro_batching: bool = BGE_MICRO_BATCH_ENABLED,
+        max_wait_ms: float = BGE_MICRO_BATCH_MAX_WAIT_MS,
+        max_batch_pairs: int = BGE_MICRO_BATCH_MAX_PAIRS,
+        batch_timeout_s: float = BGE_MICRO_BATCH_TIMEOUT_S,
     ):
         """
         Args:
@@ -191,6 +203,10 @@ class BGEReranker(BaseReranker):
             max_length: Max tokens (BGE max = 512, PhoBERT max = 256)
             batch_size: Batch size for inference (32 for GPU, 16 for CPU)
             cache_dir: Model cache directory (default: ~/.cache/huggingface)
+            micro_batching: Share predict() calls across concurrent requests
+            max_wait_ms: Max micro-batch wait for other requests to join
+            max_batch_pairs: Flush micro-batch once this many pairs are queued
+            batch_timeout_s: Max wait for a micro-batch result
         """
         logger.info(f"🔧 Initializing reranker: {model_name}")
 
@@ -238,6 +254,70 @@ class BGEReranker(BaseReranker):
             logger.error(f"❌ Failed to load model: {e}")
             raise
 
+        # Micro-batcher: pairs from concurrent requests → one predict() call
+        self._batcher: Optional[MicroBatcher] = None
+        if micro_batching:
+            self._batcher = MicroBatcher(
+                self._predict,
+                max_wait_ms=max_wait_ms,
+                max_pairs=max_batch_pairs,
+                timeout_s=batch_timeout_s,
+                name="bge-micro-batcher",
+            )
+            logger.info(
+                f"📦 Micro-batching enabled: max_wait={max_wait_ms}ms, "
+                f"max_pairs={max_batch_pairs}"
+            )
+
+        # Pair-score cache: repeated (query, chunk) pairs skip the model
+        self._score_cache = get_rerank_score_cache()
+        self._cache_model_key = f"bge:{self.model_name}:{self.max_length}"
+
+    def _predict(self, pairs: List[List[str]]) -> List[float]:
+        """Run the cross-encoder on pairs (single call, internal batching)."""
+        return self.model.predict(
+            pairs, batch_size=self.batch_size, show_progress_bar=False
+        )
+
+    def score_pairs(
+        self, pairs: List[List[str]], show_progress_bar: bool = False
+    ) -> List[float]:
+        """
+        Score [query, text] pairs, through the micro-batcher when enabled.
+
+        Same interface as OpenAIReranker.score_pairs (used by semantic cache).
+        """
+        if not pairs:
+            return []
+        if self._batcher is not None:
+            return self._batcher.score(pairs)
+        return [float(s) for s in self._predict(pairs)]
+
+    def get_batching_stats(self) -> dict:
+        """Micro-batcher statistics (fill rate, queue wait)."""
+        if self._batcher is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._batcher.get_stats()}
+
+    def _build_pairs(self, query: str, documents: List[Document]) -> List[List[str]]:
+        """Build [query, truncated content] pairs for the cross-encoder."""
+        # BGE max 512 tokens, PhoBERT max 256 tokens
+        # Ước tính: 1 token ≈ 4 chars cho tiếng Việt
+        max_chars = (self.max_length - 50) * 4  # Reserve 50 tokens for query
+        return [[query, doc.page_content[:max_chars]] for doc in documents]
+
+    def _score_documents(self, query: str, documents: List[Document]) -> List[float]:
+        """Score documents for one query, computing only score-cache misses."""
+
+        def compute(docs: List[Document]) -> List[float]:
+            return self.score_pairs(self._build_pairs(query, docs))
+
+        if self._score_cache is None:
+            return compute(documents)
+        return self._score_cache.score_documents(
+            self._cache_model_key, query, documents, compute
+        )
+
     def rerank(
         self, query: str, documents: List[Document], top_k: int = 5
     ) -> List[Tuple[Document, float]]:
@@ -263,21 +343,10 @@ class BGEReranker(BaseReranker):
             logger.warning(f"⚠️  Too many docs ({len(documents)}), truncating to 50")
             documents = documents[:50]
 
-        # Chuẩn bị query-document pairs
-        pairs = []
-        for doc in documents:
-            # Truncate content nếu quá dài
-            # BGE max 512 tokens, PhoBERT max 256 tokens
-            # Ước tính: 1 token ≈ 4 chars cho tiếng Việt
-            max_chars = (self.max_length - 50) * 4  # Reserve 50 tokens for query
-            content = doc.page_content[:max_chars]
-            pairs.append([query, content])
-
-        # Predict relevance scores
+        # Predict relevance scores (cached pairs skipped, misses share a
+        # batch with concurrent requests)
         try:
-            scores = self.model.predict(
-                pairs, batch_size=self.batch_size, show_progress_bar=False
-            )
+            scores = self._score_documents(query, documents)
         except Exception as e:
             error_msg = str(e).lower()
             if "cuda out of memory" in error_msg or "out of memory" in error_msg:
@@ -336,19 +405,64 @@ class BGEReranker(BaseReranker):
         self, queries: List[str], documents_list: List[List[Document]], top_k: int = 5
     ) -> List[List[Tuple[Document, float]]]:
         """
-        Batch reranking (tối ưu hóa sau nếu cần)
+        Batch reranking: pairs của tất cả queries → một lần score_pairs()
 
-        Hiện tại: Gọi rerank() cho từng query
-        TODO: Implement true batch processing
-        Hiện tại API chỉ xử lý 1 query/request → không cần batch
+        Pairs already in the score cache are skipped. Scores are split back
+        per query and each list is sorted independently. Falls back to per-query rerank() (with its OOM handling) on error.
         """
         logger.info(f"🔄 Batch reranking {len(queries)} queries...")
+        start_time = time.time()
+
+        documents_list = [docs[:50] for docs in documents_list]
+
+        # Cached scores per query; only misses are sent to the model
+        if self._score_cache is not None:
+            cached = [
+                self._score_cache.get_many(self._cache_model_key, query, docs)
+                for query, docs in zip(queries, documents_list)
+            ]
+        else:
+            cached = [[None] * len(docs) for docs in documents_list]
+
+        pairs = []
+        for query, docs, doc_scores in zip(queries, documents_list, cached):
+            missing = [doc for doc, s in zip(docs, doc_scores) if s is None]
+            pairs.extend(self._build_pairs(query, missing))
+
+        try:
+            computed = iter(self.score_pairs(pairs))
+        except Exception as e:
+            logger.warning(f"⚠️ Batch scoring failed ({e}), reranking per query")
+            return [
+                self.rerank(query, docs, top_k)
+                for query, docs in zip(queries, documents_list)
+            ]
+
+        scores_list = []
+        for query, docs, doc_scores in zip(queries, documents_list, cached):
+            missing, new_scores = [], []
+            for i, score in enumerate(doc_scores):
+                if score is None:
+                    doc_scores[i] = float(next(computed))
+                    missing.append(docs[i])
+                    new_scores.append(doc_scores[i])
+            if self._score_cache is not None and missing:
+                self._score_cache.set_many(
+                    self._cache_model_key, query, missing, new_scores
+                )
+            scores_list.append(doc_scores)
 
         results = []
-        for query, docs in zip(queries, documents_list):
-            result = self.rerank(query, docs, top_k)
-            results.append(result)
+        for docs, scores in zip(documents_list, scores_list):
+            doc_scores = [(doc, float(score)) for doc, score in zip(docs, scores)]
+            doc_scores.sort(key=lambda x: x[1], reverse=True)
+            results.append(doc_scores[:top_k])
 
+        latency = (time.time() - start_time) * 1000
+        logger.info(
+            f"📊 Batch reranked {len(queries)} queries ({len(pairs)} pairs scored) "
+            f"in {latency:.1f}ms"
+        )
         return results
 
     def __del__(self):
@@ -0,0 +1,40 @@
+"""
+Reciprocal Rank Fusion
+
+Kept free of vector store imports so it can be used without a database
+(offline benchmarks).
+"""
+
+from collections import defaultdict
+from typing import List
+
+from langchain_core.documents import Document
+
+
+def reciprocal_rank_fusion(
+    doc_lists: List[List[Document]], rrf_k: int = 60
+) -> List[Document]:
+    """
+    Reciprocal Rank Fusion algorithm.
+
+    RRF Score = Σ 1 / (k + rank_i)
+    where rank_i is the rank in list i
+
+    Shared by FusionRetriever (query variants), HybridRetriever
+    (vector + lexical results) and the offline benchmark pipeline.
+    """
+    # Build document → RRF score mapping
+    doc_scores = defaultdict(float)
+    doc_map = {}  # Keep document objects
+
+    for doc_list in doc_lists:
+        for rank, doc in enumerate(doc_list, start=1):
+            doc_key = hash(doc.page_content)
+            doc_scores[doc_key] += 1 / (rrf_k + rank)
+            doc_map[doc_key] = doc
+
+    # Sort by RRF score (descending)
+    sorted_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
+
+    # Return documents in fused order
+    return [doc_map[doc_key] for doc_key, _ in sorted_docs]
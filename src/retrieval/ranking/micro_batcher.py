@@ -0,0 +1,232 @@
+"""
+Micro-batcher for cross-encoder scoring
+
+Concurrent requests on one worker each rerank ~10-50 (query, doc) pairs.
+Calling ``CrossEncoder.predict`` separately per request never fills the
+model's batches. The micro-batcher queues pairs from concurrent callers and
+flushes them in a single ``predict`` call when either:
+
+- ``max_pairs`` pairs are queued, or
+- ``max_wait_ms`` has passed since the oldest queued request arrived
+
+Scores are then scattered back to each caller's future. Callers wait at
+most ``timeout_s`` for their scores; ``close()`` fails every request still
+queued, so no caller blocks forever on a stopped worker.
+
+Usage:
+    batcher = MicroBatcher(lambda pairs: model.predict(pairs), max_wait_ms=5)
+    scores = batcher.score([[query, text], ...])  # blocks until flushed
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class _Job:
+    __slots__ = ("pairs", "future", "enqueued_at")
+
+    def __init__(self, pairs: List[Sequence[str]]):
+        self.pairs = pairs
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class MicroBatcher:
+    """
+    Collects scoring requests from concurrent threads into shared batches.
+
+    A single daemon thread owns the model call, so ``predict_fn`` never runs
+    concurrently with itself.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[List[Sequence[str]]], Sequence[float]],
+        max_wait_ms: float = 5.0,
+        max_pairs: int = 64,
+        timeout_s: float = 30.0,
+        name: str = "micro-batcher",
+    ):
+        """
+        Args:
+            predict_fn: Scores a list of [query, text] pairs
+            max_wait_ms: Max time to wait for more requests before flushing
+            max_pairs: Flush as soon as this many pairs are queued
+            timeout_s: Max time score() waits for its result
+            name: Worker thread name
+        """
+        self.predict_fn = predict_fn
+        self.max_wait = max_wait_ms / 1000
+        self.max_pairs = max_pairs
+        self.timeout_s = timeout_s
+
+        self._queue: "queue.Queue[_Job]" = queue.Queue()
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "batches": 0,
+            "pairs": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "total_fill_rate": 0.0,
+            "total_queue_wait_ms": 0.0,
+            "max_queue_wait_ms": 0.0,
+            "total_predict_ms": 0.0,
+        }
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def score(
+        self, pairs: List[Sequence[str]], timeout: Optional[float] = None
+    ) -> List[float]:
+        """
+        Score pairs, sharing a predict() call with concurrent callers.
+
+        Raises:
+            TimeoutError: No result within timeout (default: timeout_s)
+            RuntimeError: The batcher is closed
+        """
+        if not pairs:
+            return []
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+
+        job = _Job(list(pairs))
+        self._queue.put(job)
+        timeout = self.timeout_s if timeout is None else timeout
+        try:
+            return job.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # Still queued: drop it from the next batch
+            job.future.cancel()
+            with self._stats_lock:
+                self.stats["timeouts"] += 1
+            raise TimeoutError(
+                f"Micro-batch scoring timed out after {timeout:.1f}s"
+            ) from None
+
+    def _collect(self) -> List[_Job]:
+        """Block for the first job, then gather more until full or timed out."""
+        first = self._queue.get()
+        if first is None:
+            return []
+        jobs = [first]
+        queued_pairs = len(first.pairs)
+        deadline = first.enqueued_at + self.max_wait
+
+        while queued_pairs < self.max_pairs:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                job = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if job is None:
+                self._closed = True
+                break
+            jobs.append(job)
+            queued_pairs += len(job.pairs)
+        return jobs
+
+    def _run(self):
+        while not self._closed:
+            jobs = self._collect()
+            if not jobs:
+                break
+            self._flush(jobs)
+
+    def _flush(self, jobs: List[_Job]):
+        # Skip jobs whose caller timed out; the rest can no longer be cancelled
+        jobs = [job for job in jobs if job.future.set_running_or_notify_cancel()]
+        if not jobs:
+            return
+        flushed_at = time.perf_counter()
+        pairs = [pair for job in jobs for pair in job.pairs]
+
+        try:
+            scores = self.predict_fn(pairs)
+        except Exception as e:
+            with self._stats_lock:
+                self.stats["errors"] += 1
+            for job in jobs:
+                job.future.set_exception(e)
+            return
+
+        predict_ms = (time.perf_counter() - flushed_at) * 1000
+        offset = 0
+        for job in jobs:
+            end = offset + len(job.pairs)
+            job.future.set_result([float(s) for s in scores[offset:end]])
+            offset = end
+
+        waits_ms = [(flushed_at - job.enqueued_at) * 1000 for job in jobs]
+        with self._stats_lock:
+            self.stats["requests"] += len(jobs)
+            self.stats["batches"] += 1
+            self.stats["pairs"] += len(pairs)
+            self.stats["total_fill_rate"] += min(1.0, len(pairs) / self.max_pairs)
+            self.stats["total_queue_wait_ms"] += sum(waits_ms)
+            self.stats["max_queue_wait_ms"] = max(
+                self.stats["max_queue_wait_ms"], max(waits_ms)
+            )
+            self.stats["total_predict_ms"] += predict_ms
+
+        if len(jobs) > 1:
+            logger.debug(
+                f"📦 Micro-batch: {len(jobs)} requests, {len(pairs)} pairs, "
+                f"predict={predict_ms:.1f}ms"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch fill rate, queue wait and throughput statistics."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+
+        batches = max(stats["batches"], 1)
+        requests = max(stats["requests"], 1)
+        return {
+            "requests": stats["requests"],
+            "batches": stats["batches"],
+            "pairs": stats["pairs"],
+            "errors": stats["errors"],
+            "timeouts": stats["timeouts"],
+            "avg_requests_per_batch": round(stats["requests"] / batches, 2),
+            "avg_pairs_per_batch": round(stats["pairs"] / batches, 2),
+            "avg_fill_rate": round(stats["total_fill_rate"] / batches, 4),
+            "avg_queue_wait_ms": round(stats["total_queue_wait_ms"] / requests, 2),
+            "max_queue_wait_ms": round(stats["max_queue_wait_ms"], 2),
+            "avg_predict_ms": round(stats["total_predict_ms"] / batches, 2),
+            "config": {
+                "max_wait_ms": self.max_wait * 1000,
+                "max_pairs": self.max_pairs,
+                "timeout_s": self.timeout_s,
+            },
+        }
+
+    def close(self):
+        """Stop the worker thread and fail every request still queued."""
+        self._closed = True
+        self._fail_queued()
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        # Requests enqueued while the worker was stopping
+        self._fail_queued()
+
+    def _fail_queued(self):
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None and job.future.set_running_or_notify_cancel():
+                job.future.set_exception(RuntimeError("MicroBatcher is closed"))
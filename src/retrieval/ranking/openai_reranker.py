@@ -18,6 +18,7 @@ from langchain_core.documents import Document
 from openai import OpenAI, AsyncOpenAI
 
 from .base_reranker import BaseReranker
+from .score_cache import get_rerank_score_cache
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +99,11 @@ class OpenAIReranker(BaseReranker):
         logger.info(f"⚙️  Temperature: {temperature}, Max tokens: {max_tokens}")
         logger.info(f"⚡ Parallel mode: {'ENABLED' if use_parallel else 'DISABLED'}")
 
-    def _score_document(self, query: str, document_text: str) -> float:
+        # Pair-score cache: repeated (query, chunk) pairs skip the API call
+        self._score_cache = get_rerank_score_cache()
+        self._cache_model_key = f"openai:{model_name}"
+
+    def _score_document(self, query: str, document_text: str) -> Optional[float]:
         """
         Score a single document's relevance to query using OpenAI.
 
@@ -109,7 +114,7 @@ class OpenAIReranker(BaseReranker):
             document_text: Document content to score
 
         Returns:
-            Relevance score (0.0 to 1.0)
+            Relevance score (0.0 to 1.0), None on API error
         """
         # Truncate document to avoid token limits
         max_doc_chars = 2000  # ~500 tokens
@@ -160,9 +165,11 @@ Văn bản:
 
         except Exception as e:
             logger.error(f"❌ OpenAI API error: {e}")
-            return 0.0
+            return None
 
-    async def _score_document_async(self, query: str, document_text: str) -> float:
+    async def _score_document_async(
+        self, query: str, document_text: str
+    ) -> Optional[float]:
         """
         🆕 Async version: Score document using async OpenAI client.
 
@@ -173,7 +180,7 @@ Văn bản:
             document_text: Document content to score
 
         Returns:
-            Relevance score (0.0 to 1.0)
+            Relevance score (0.0 to 1.0), None on API error
         """
         # Truncate document to avoid token limits
         max_doc_chars = 2000  # ~500 tokens
@@ -224,7 +231,7 @@ Văn bản:
 
         except Exception as e:
             logger.error(f"❌ OpenAI API error: {e}")
-            return 0.0
+            return None
 
     async def _rerank_parallel(
         self, query: str, documents: List[Document]
@@ -301,7 +308,42 @@ Văn bản:
             f"📊 OpenAI scored {len(pairs)} pairs in {latency_ms:.1f}ms (parallel)"
         )
 
-        return list(scores)
+        return [s if s is not None else 0.0 for s in scores]
+
+    def _score_documents(
+        self, query: str, documents: List[Document]
+    ) -> List[Optional[float]]:
+        """Score documents (parallel or sequential); None marks API errors."""
+        if self.use_parallel:
+            # Parallel: Run async code safely in both sync and async contexts
+            try:
+                # Check if we're in an async context
+                loop = asyncio.get_running_loop()
+
+                # Running loop detected - use thread pool
+                import concurrent.futures
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(
+                        asyncio.run, self._rerank_parallel(query, documents)
+                    )
+                    doc_scores = future.result(timeout=30)
+
+            except RuntimeError:
+                # No running loop - safe to use asyncio.run()
+                doc_scores = asyncio.run(self._rerank_parallel(query, documents))
+
+            return [score for _, score in doc_scores]
+
+        # Sequential: Original implementation
+        scores = []
+        for i, doc in enumerate(documents):
+            scores.append(self._score_document(query, doc.page_content))
+
+            # Log progress
+            if (i + 1) % 5 == 0:
+                logger.debug(f"📊 Scored {i+1}/{len(documents)} documents")
+        return scores
 
     def rerank(
         self, query: str, documents: List[Document], top_k: int = 5
@@ -331,38 +373,21 @@ Văn bản:
             )
             documents = documents[:max_docs]
 
-        # 🆕 Use parallel or sequential processing
-        if self.use_parallel:
-            # Parallel: Run async code safely in both sync and async contexts
-            try:
-                # Check if we're in an async context
-                loop = asyncio.get_running_loop()
-
-                # Running loop detected - use thread pool
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(
-                        asyncio.run, self._rerank_parallel(query, documents)
-                    )
-                    doc_scores = future.result(timeout=30)
-
-            except RuntimeError:
-                # No running loop - safe to use asyncio.run()
-                doc_scores = asyncio.run(self._rerank_parallel(query, documents))
-
-            processing_mode = "PARALLEL"
+        # 🆕 Parallel or sequential API calls, only for score-cache misses
+        processing_mode = "PARALLEL" if self.use_parallel else "SEQUENTIAL"
+        if self._score_cache is not None:
+            scores = self._score_cache.score_documents(
+                self._cache_model_key,
+                query,
+                documents,
+                lambda docs: self._score_documents(query, docs),
+            )
         else:
-            # Sequential: Original implementation
-            doc_scores = []
-            for i, doc in enumerate(documents):
-                score = self._score_document(query, doc.page_content)
-                doc_scores.append((doc, score))
-
-                # Log progress
-                if (i + 1) % 5 == 0:
-                    logger.debug(f"📊 Scored {i+1}/{len(documents)} documents")
-            processing_mode = "SEQUENTIAL"
+            scores = [
+                s if s is not None else 0.0
+                for s in self._score_documents(query, documents)
+            ]
+        doc_scores = list(zip(documents, scores))
 
         # Sort by score descending
         doc_scores.sort(key=lambda x: x[1], reverse=True)
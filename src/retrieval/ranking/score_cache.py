@@ -0,0 +1,398 @@
+"""
+Rerank Score Cache - (query, chunk) → cross-encoder score
+
+Reranking dominates the latency of balanced/quality modes, and the same
+chunks keep coming back for the same (or Multi-Query variant) questions.
+A cross-encoder score only depends on the model, the query text and the
+chunk content, so it can be reused until the chunk changes.
+
+Cache Strategy:
+- Field: sha256(model_key|normalized_query|content_hash)
+- L1: In-memory LRU keyed by (chunk_key, field), per worker
+- L2: One Redis hash per chunk → rag:rerank:chunk:{chunk_key}
+  (HGET per pair in one pipeline, HSET + EXPIRE on write)
+- Document index: rag:rerank:doc:{document_id} → set of chunk keys
+- TTL: RERANK_SCORE_CACHE_TTL (refreshed on every write to the chunk)
+
+Because every chunk's scores live under a single key, invalidating a chunk
+(or every chunk of a document) is one DEL, no SCAN over the keyspace.
+The content hash in the field also makes edited chunks miss automatically.
+
+Usage:
+    from src.retrieval.ranking.score_cache import get_rerank_score_cache
+
+    cache = get_rerank_score_cache()
+    scores = cache.score_documents("bge:BAAI/bge-reranker-v2-m3:512",
+                                   query, documents, compute_fn)
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import redis
+from langchain_core.documents import Document
+
+from src.config.feature_flags import (
+    ENABLE_REDIS_CACHE,
+    ENABLE_RERANK_SCORE_CACHE,
+    REDIS_HOST,
+    REDIS_PORT,
+    REDIS_DB_CACHE,
+    RERANK_SCORE_CACHE_TTL,
+    RERANK_SCORE_CACHE_L1_SIZE,
+)
+from src.embedding.embedders.cached_embedder import normalize_embedding_text
+
+logger = logging.getLogger(__name__)
+
+CHUNK_KEY_PREFIX = "rag:rerank:chunk:"
+DOC_KEY_PREFIX = "rag:rerank:doc:"
+
+
+def content_hash(text: str) -> str:
+    """Short stable hash of chunk content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def chunk_key_for(document: Document) -> str:
+    """Chunk identity: metadata chunk_id, else the content hash."""
+    chunk_id = document.metadata.get("chunk_id")
+    if chunk_id not in (None, ""):
+        return str(chunk_id)
+    return f"content:{content_hash(document.page_content)}"
+
+
+class RerankScoreCache:
+    """Pair-score cache with L1 (memory) + optional L2 (Redis) layers."""
+
+    def __init__(
+        self,
+        enable_l2_cache: bool = ENABLE_REDIS_CACHE,
+        redis_host: str = REDIS_HOST,
+        redis_port: int = REDIS_PORT,
+        redis_db: int = REDIS_DB_CACHE,
+        ttl: int = RERANK_SCORE_CACHE_TTL,
+        l1_size: int = RERANK_SCORE_CACHE_L1_SIZE,
+    ):
+        """
+        Initialize rerank score cache.
+
+        Args:
+            enable_l2_cache: Share scores across workers through Redis
+            redis_host: Redis server host
+            redis_port: Redis server port
+            redis_db: Redis database number
+            ttl: L2 TTL in seconds (per chunk hash)
+            l1_size: Max scores in L1 memory cache
+        """
+        self.ttl = ttl
+        self.l1_size = l1_size
+
+        # L1: (chunk_key, field) → score, plus reverse indexes for invalidation
+        self._l1: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._chunk_fields: Dict[str, set] = {}
+        self._chunk_docs: Dict[str, str] = {}
+        self._doc_chunks: Dict[str, set] = {}
+        self._lock = threading.Lock()
+
+        self._redis: Optional[redis.Redis] = None
+        if enable_l2_cache:
+            try:
+                self._redis = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                )
+                self._redis.ping()
+                logger.info(
+                    f"✅ Rerank score cache initialized: "
+                    f"Redis={redis_host}:{redis_port}/db{redis_db}, "
+                    f"TTL={ttl}s, L1_size={l1_size}"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Redis connection failed: {e}. Rerank score cache is L1-only."
+                )
+                self._redis = None
+
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "lookups": 0,
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "invalidated_chunks": 0,
+            "errors": 0,
+        }
+
+    @staticmethod
+    def _field(model_key: str, query: str, document: Document) -> str:
+        key_string = (
+            f"{model_key}|{normalize_embedding_text(query)}|"
+            f"{content_hash(document.page_content)}"
+        )
+        return hashlib.sha256(key_string.encode("utf-8")).hexdigest()[:32]
+
+    def _incr(self, name: str, value: int = 1):
+        with self._stats_lock:
+            self.stats[name] += value
+
+    # ----- L1 helpers -----
+
+    def _forget_l1_locked(self, chunk_key: str, field: str):
+        fields = self._chunk_fields.get(chunk_key)
+        if fields is None:
+            return
+        fields.discard(field)
+        if not fields:
+            del self._chunk_fields[chunk_key]
+            document_id = self._chunk_docs.pop(chunk_key, None)
+            if document_id is not None:
+                chunks = self._doc_chunks.get(document_id)
+                if chunks is not None:
+                    chunks.discard(chunk_key)
+                    if not chunks:
+                        del self._doc_chunks[document_id]
+
+    def _set_l1(self, chunk_key: str, field: str, score: float, document_id: Optional[str]):
+        with self._lock:
+            self._l1[(chunk_key, field)] = score
+            self._l1.move_to_end((chunk_key, field))
+            self._chunk_fields.setdefault(chunk_key, set()).add(field)
+            if document_id:
+                self._chunk_docs[chunk_key] = document_id
+                self._doc_chunks.setdefault(document_id, set()).add(chunk_key)
+            while len(self._l1) > self.l1_size:
+                (old_chunk, old_field), _ = self._l1.popitem(last=False)
+                self._forget_l1_locked(old_chunk, old_field)
+
+    # ----- Public API -----
+
+    def get_many(
+        self, model_key: str, query: str, documents: Sequence[Document]
+    ) -> List[Optional[float]]:
+        """Cached scores aligned with ``documents`` (None for misses)."""
+        if not documents:
+            return []
+
+        self._incr("lookups", len(documents))
+        keys = [
+            (chunk_key_for(doc), self._field(model_key, query, doc))
+            for doc in documents
+        ]
+        results: List[Optional[float]] = [None] * len(documents)
+
+        l2_positions = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                score = self._l1.get(key)
+                if score is not None:
+                    self._l1.move_to_end(key)
+                    results[i] = score
+                else:
+                    l2_positions.append(i)
+        self._incr("l1_hits", len(documents) - len(l2_positions))
+
+        if l2_positions and self._redis:
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for i in l2_positions:
+                    chunk_key, field = keys[i]
+                    pipe.hget(f"{CHUNK_KEY_PREFIX}{chunk_key}", field)
+                raw_values = pipe.execute()
+            except Exception as e:
+                self._incr("errors")
+                logger.warning(f"⚠️ Redis rerank cache get error: {e}")
+                raw_values = [None] * len(l2_positions)
+
+            for i, raw in zip(l2_positions, raw_values):
+                if raw is None:
+                    continue
+                score = float(raw)
+                results[i] = score
+                self._set_l1(*keys[i], score, documents[i].metadata.get("document_id"))
+                self._incr("l2_hits")
+
+        self._incr("misses", sum(1 for s in results if s is None))
+        return results
+
+    def set_many(
+        self,
+        model_key: str,
+        query: str,
+        documents: Sequence[Document],
+        scores: Sequence[Optional[float]],
+    ):
+        """Store scores for documents (None scores are skipped)."""
+        writes: Dict[str, Dict[str, float]] = {}
+        doc_index: Dict[str, set] = {}
+        for doc, score in zip(documents, scores):
+            if score is None:
+                continue
+            chunk_key = chunk_key_for(doc)
+            field = self._field(model_key, query, doc)
+            document_id = doc.metadata.get("document_id")
+            self._set_l1(chunk_key, field, float(score), document_id)
+            writes.setdefault(chunk_key, {})[field] = float(score)
+            if document_id:
+                doc_index.setdefault(str(document_id), set()).add(chunk_key)
+
+        if not self._redis or not writes:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for chunk_key, mapping in writes.items():
+                name = f"{CHUNK_KEY_PREFIX}{chunk_key}"
+                pipe.hset(name, mapping=mapping)
+                pipe.expire(name, self.ttl)
+            for document_id, chunk_keys in doc_index.items():
+                name = f"{DOC_KEY_PREFIX}{document_id}"
+                pipe.sadd(name, *chunk_keys)
+                pipe.expire(name, self.ttl)
+            pipe.execute()
+        except Exception as e:
+            self._incr("errors")
+            logger.warning(f"⚠️ Redis rerank cache set error: {e}")
+
+    def score_documents(
+        self,
+        model_key: str,
+        query: str,
+        documents: Sequence[Document],
+        compute: Callable[[List[Document]], Sequence[Optional[float]]],
+    ) -> List[float]:
+        """
+        Scores for ``documents``; only cache misses are passed to ``compute``.
+
+        ``compute`` may return None for a document it failed to score; that
+        score is reported as 0.0 and not cached.
+        """
+        scores = self.get_many(model_key, query, documents)
+        miss_positions = [i for i, s in enumerate(scores) if s is None]
+        if miss_positions:
+            missing = [documents[i] for i in miss_positions]
+            computed = list(compute(missing))
+            self.set_many(model_key, query, missing, computed)
+            for i, score in zip(miss_positions, computed):
+                scores[i] = score
+        return [float(s) if s is not None else 0.0 for s in scores]
+
+    def invalidate_chunks(self, chunk_ids: Iterable[Any]) -> int:
+        """Drop every cached score for the given chunk ids (all queries, models)."""
+        chunk_keys = {str(c) for c in chunk_ids if c not in (None, "")}
+        if not chunk_keys:
+            return 0
+
+        # _chunk_fields indexes L1 by chunk, so only these entries are touched
+        with self._lock:
+            for chunk_key in chunk_keys:
+                for field in list(self._chunk_fields.get(chunk_key, ())):
+                    self._l1.pop((chunk_key, field), None)
+                    self._forget_l1_locked(chunk_key, field)
+
+        if self._redis:
+            try:
+                self._redis.delete(*[f"{CHUNK_KEY_PREFIX}{k}" for k in chunk_keys])
+            except Exception as e:
+                self._incr("errors")
+                logger.warning(f"⚠️ Redis rerank cache invalidation error: {e}")
+
+        self._incr("invalidated_chunks", len(chunk_keys))
+        return len(chunk_keys)
+
+    def invalidate_document(
+        self, document_id: str, chunk_ids: Optional[Iterable[Any]] = None
+    ) -> int:
+        """
+        Drop cached scores for every chunk of a document.
+
+        Chunks seen by the cache are tracked per document; ``chunk_ids``
+        (e.g. from document_chunks) are invalidated in addition.
+        """
+        chunk_keys = set(str(c) for c in (chunk_ids or []))
+        with self._lock:
+            chunk_keys |= self._doc_chunks.get(str(document_id), set())
+
+        if self._redis:
+            try:
+                doc_key = f"{DOC_KEY_PREFIX}{document_id}"
+                chunk_keys |= set(self._redis.smembers(doc_key))
+                self._redis.delete(doc_key)
+            except Exception as e:
+                self._incr("errors")
+                logger.warning(f"⚠️ Redis rerank cache invalidation error: {e}")
+
+        count = self.invalidate_chunks(chunk_keys)
+        logger.info(f"🗑️ Rerank scores invalidated: doc={document_id}, chunks={count}")
+        return count
+
+    def clear_all(self) -> Dict[str, int]:
+        """Clear L1 and L2 score caches."""
+        with self._lock:
+            l1_count = len(self._l1)
+            self._l1.clear()
+            self._chunk_fields.clear()
+            self._chunk_docs.clear()
+            self._doc_chunks.clear()
+
+        l2_count = 0
+        if self._redis:
+            try:
+                for key in self._redis.scan_iter(match="rag:rerank:*", count=500):
+                    self._redis.delete(key)
+                    l2_count += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Redis clear error: {e}")
+
+        logger.info(f"🗑️ Rerank score cache cleared: L1={l1_count}, L2={l2_count}")
+        return {"l1_cleared": l1_count, "l2_cleared": l2_count}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        lookups = stats["lookups"]
+        hits = stats["l1_hits"] + stats["l2_hits"]
+        return {
+            **stats,
+            "cache_hits": hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "l1_size": len(self._l1),
+            "l2_enabled": self._redis is not None,
+            "ttl": self.ttl,
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_score_cache: Optional[RerankScoreCache] = None
+_score_cache_lock = threading.Lock()
+
+
+def get_rerank_score_cache() -> Optional[RerankScoreCache]:
+    """Get singleton RerankScoreCache (None when ENABLE_RERANK_SCORE_CACHE is off)."""
+    global _score_cache
+
+    if not ENABLE_RERANK_SCORE_CACHE:
+        return None
+    if _score_cache is not None:
+        return _score_cache
+
+    with _score_cache_lock:
+        if _score_cache is None:
+            _score_cache = RerankScoreCache()
+        return _score_cache
+
+
+def reset_rerank_score_cache():
+    """Drop the singleton (tests / config reload)."""
+    global _score_cache
+    with _score_cache_lock:
+        _score_cache = None
@@ -1,40 +1,72 @@
 # src/retrieval/retrievers/__init__.py
 
 import logging
-from typing import Optional, Literal
+import threading
+from typing import Any, Dict, List, Optional, Literal, Tuple
+from langchain_core.retrievers import BaseRetriever
 from .base_vector_retriever import BaseVectorRetriever
 from .enhanced_retriever import EnhancedRetriever
 from .fusion_retriever import FusionRetriever
+from .hybrid_retriever import HybridRetriever, LexicalRetriever
 
 # NOTE: AdaptiveKRetriever removed - use balanced mode instead
 
 logger = logging.getLogger(__name__)
 
-from src.embedding.store.pgvector_store import vector_store
-from src.retrieval.query_processing import EnhancementStrategy
+from src.retrieval.query_processing import (
+    EnhancementStrategy,
+    QueryEnhancer,
+    QueryEnhancerConfig,
+)
 from src.retrieval.ranking import BaseReranker
 from src.config.feature_flags import DEFAULT_RERANKER_TYPE
 
 
+def _build_enhancer(
+    strategies: List[EnhancementStrategy], max_queries: int, llm_client: Optional[Any]
+) -> Optional[QueryEnhancer]:
+    """Dedicated enhancer on llm_client; None lets the retriever use the cached one."""
+    if llm_client is None:
+        return None
+    return QueryEnhancer(
+        QueryEnhancerConfig(strategies=list(strategies), max_queries=max_queries),
+        llm_client=llm_client,
+    )
+
+
 def create_retriever(
     mode: str = "balanced",
     enable_reranking: bool = True,
     reranker: Optional[BaseReranker] = None,
     reranker_type: Literal["bge", "openai", "vertex"] = DEFAULT_RERANKER_TYPE,
     filter_status: Optional[str] = None,  # ⚠️ Deprecated
+    k: int = 5,
+    embeddings: Optional[Any] = None,
+    vector_store: Optional[Any] = None,
+    llm_client: Optional[Any] = None,
 ):
     """
     Factory function to create retriever based on mode.
 
     Args:
-        mode: Retrieval mode (fast, balanced, quality)
+        mode: Retrieval mode (fast, hybrid, balanced, quality)
         enable_reranking: Whether to enable reranking (default: True)
         reranker: Custom reranker instance (if None, creates based on reranker_type)
         reranker_type: Type of reranker to use ("bge", "openai", or "vertex")
         filter_status: ⚠️ DEPRECATED - status not in embedding metadata
+        k: Number of final documents to return
+        embeddings: Query embedder (None = shared PGVector embeddings)
+        vector_store: Vector store (None = shared PGVector store)
+        llm_client: Chat client for query enhancement (None = cached
+            enhancer on the configured LLM provider)
+
+    The injection arguments let offline benchmarks run this exact
+    topology on stand-in providers.
 
     Modes:
     - fast: BaseVectorRetriever (no enhancement, no reranking) ~1s
+    - hybrid: HybridRetriever (vector + full-text search + RRF, no LLM calls,
+      no reranking) ~1s
     - balanced: EnhancedRetriever (Multi-Query + Step-Back + reranking) ~2-3s [DEFAULT]
     - quality: FusionRetriever (All 4 strategies + RRF + reranking) ~3-5s
 
@@ -56,7 +88,9 @@ def create_retriever(
         reranker = get_reranker(provider=reranker_type)
 
     # Base retriever
-    base = BaseVectorRetriever(k=5, filter_status=None)
+    base = BaseVectorRetriever(
+        k=k, filter_status=None, embeddings=embeddings, vector_store=vector_store
+    )
 
     if mode == "fast":
         # Fast mode: no enhancement, no reranking
@@ -66,6 +100,20 @@ def create_retriever(
         )
         return base
 
+    elif mode == "hybrid":
+        # Hybrid mode: exact-term recall without query enhancement/reranking
+        logger.info(
+            f"🔀 Created HybridRetriever | mode=hybrid | "
+            f"strategies=None | reranker=None | rrf_k=60"
+        )
+        return HybridRetriever(
+            base_retriever=base,
+            lexical_retriever=LexicalRetriever(k=k * 2),
+            k=k,
+            retrieval_k=k * 2,
+            rrf_k=60,
+        )
+
     elif mode == "balanced":
         # Balanced mode (recommended default)
         strategies = [EnhancementStrategy.MULTI_QUERY, EnhancementStrategy.STEP_BACK]
@@ -78,8 +126,9 @@ def create_retriever(
             base_retriever=base,
             enhancement_strategies=strategies,
             reranker=reranker,
-            k=5,
-            retrieval_k=5,
+            k=k,
+            retrieval_k=k,
+            query_enhancer=_build_enhancer(strategies, 3, llm_client),
         )
 
     elif mode == "quality":
@@ -99,13 +148,100 @@ def create_retriever(
             base_retriever=base,
             enhancement_strategies=strategies,
             reranker=reranker,
-            k=5,
-            retrieval_k=5,
+            k=k,
+            retrieval_k=k,
             rrf_k=60,
+            query_enhancer=_build_enhancer(strategies, 5, llm_client),
         )
 
     else:
-        raise ValueError(f"Unknown mode: {mode}. Available: fast, balanced, quality")
+        raise ValueError(
+            f"Unknown mode: {mode}. Available: fast, hybrid, balanced, quality"
+        )
+
+
+# ===== Retriever Registry (one instance per configuration) =====
+# Retrievers hold no per-request state (base retriever k is passed explicitly),
+# so a single instance per (mode, reranker_type, k) serves concurrent requests.
+_retriever_registry: Dict[Tuple[str, Optional[str], int], BaseRetriever] = {}
+_retriever_registry_lock = threading.Lock()
+
+
+def get_retriever(
+    mode: str = "balanced",
+    enable_reranking: bool = True,
+    reranker_type: Literal["bge", "openai", "vertex"] = DEFAULT_RERANKER_TYPE,
+    k: int = 5,
+) -> BaseRetriever:
+    """
+    Get shared retriever for (mode, reranker_type, k), building it once.
+
+    Thread-safe lazy initialization (double-check locking). Use this instead
+    of create_retriever() on the request path.
+
+    Args:
+        mode: Retrieval mode (fast, hybrid, balanced, quality)
+        enable_reranking: Whether to enable reranking (ignored in fast/hybrid)
+        reranker_type: Type of reranker to use ("bge", "openai", or "vertex")
+        k: Number of final documents to return
+
+    Returns:
+        Cached retriever instance
+    """
+    use_reranker = enable_reranking and mode not in ("fast", "hybrid")
+    key = (mode, reranker_type if use_reranker else None, k)
+
+    retriever = _retriever_registry.get(key)
+    if retriever is not None:
+        return retriever
+
+    with _retriever_registry_lock:
+        retriever = _retriever_registry.get(key)
+        if retriever is None:
+            retriever = create_retriever(
+                mode=mode,
+                enable_reranking=use_reranker,
+                reranker_type=reranker_type,
+                k=k,
+            )
+            _retriever_registry[key] = retriever
+            logger.info(f"📚 Registered retriever {key} ({type(retriever).__name__})")
+        return retriever
+
+
+def warmup_retrievers(
+    modes: Tuple[str, ...] = ("fast", "hybrid", "balanced", "quality"),
+    reranker_type: Literal["bge", "openai", "vertex"] = DEFAULT_RERANKER_TYPE,
+    k: int = 5,
+) -> Dict[str, str]:
+    """
+    Pre-build retrievers for the given modes (called from FastAPI lifespan).
+
+    Returns:
+        Dict mapping mode -> retriever class name (or error message)
+    """
+    warmed = {}
+    for mode in modes:
+        try:
+            retriever = get_retriever(
+                mode=mode, enable_reranking=True, reranker_type=reranker_type, k=k
+            )
+            warmed[mode] = type(retriever).__name__
+        except Exception as e:
+            logger.error(f"❌ Failed to warm up retriever for mode={mode}: {e}")
+            warmed[mode] = f"error: {e}"
+    return warmed
+
+
+def reset_retriever_registry() -> None:
+    """
+    Drop all cached retrievers.
+
+    ⚠️ Use only for testing or when reranker/enhancer config changes.
+    """
+    with _retriever_registry_lock:
+        _retriever_registry.clear()
+    logger.info("🔄 Reset retriever registry")
 
 
 # Export for backward compatibility
@@ -113,5 +249,10 @@ __all__ = [
     "BaseVectorRetriever",
     "EnhancedRetriever",
     "FusionRetriever",
+    "HybridRetriever",
+    "LexicalRetriever",
     "create_retriever",
+    "get_retriever",
+    "warmup_retrievers",
+    "reset_retriever_registry",
 ]
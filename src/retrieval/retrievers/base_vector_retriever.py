@@ -4,12 +4,52 @@ Base Vector Retriever
 Simple wrapper cho vector store, tuân thủ LangChain BaseRetriever interface.
 """
 
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 
-from src.embedding.store.pgvector_store import vector_store
+from src.config.feature_flags import (
+    ENABLE_FILTERED_VECTOR_SEARCH,
+    PARALLEL_RETRIEVAL_MAX_WORKERS,
+)
+from src.embedding.store.filtered_search import (
+    FilteredVectorSearch,
+    get_filtered_vector_search,
+)
+
+# Shared pool for concurrent per-query vector searches (bounded so one
+# Fusion request cannot exhaust DB connections)
+_search_executor: Optional[ThreadPoolExecutor] = None
+_search_executor_lock = threading.Lock()
+
+
+def _default_vector_store():
+    """
+    Shared embeddings + PGVector store.
+
+    Imported on first use: pgvector_store connects to the database at
+    import time, which retriever construction and unit tests do not need.
+    """
+    from src.embedding.store.pgvector_store import embeddings, vector_store
+
+    return embeddings, vector_store
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Get or create the shared vector search executor."""
+    global _search_executor
+    if _search_executor is None:
+        with _search_executor_lock:
+            if _search_executor is None:
+                _search_executor = ThreadPoolExecutor(
+                    max_workers=PARALLEL_RETRIEVAL_MAX_WORKERS,
+                    thread_name_prefix="vector-search",
+                )
+    return _search_executor
 
 
 class BaseVectorRetriever(BaseRetriever):
@@ -26,14 +66,23 @@ class BaseVectorRetriever(BaseRetriever):
     
     Supports metadata filtering:
     - filter_dict: Custom PGVector filter (e.g. {"document_type": "law", "dieu": "14"})
+    - Equality / $in filters run in SQL with the vector search
+      (FilteredVectorSearch), so filtered top-k is exact (on pgvector < 0.8
+      only when a promoted column is filtered); other filters go through
+      PGVector with over-fetching
     
     Deprecated (no-op):
     - filter_status: Ignored - status not in embedding metadata
+
+    embeddings / vector_store default to the shared PGVector store; pass
+    stand-ins to run the same retrieval path offline (benchmarks).
     """
 
     k: int = 5
     filter_status: Optional[str] = None  # "active", "expired", or None
     filter_dict: Optional[Dict[str, Any]] = None  # Custom PGVector filter
+    embeddings: Optional[Any] = None  # None = pgvector_store.embeddings
+    vector_store: Optional[Any] = None  # None = pgvector_store.vector_store
 
     def _get_relevant_documents(
         self,
@@ -51,28 +100,148 @@ class BaseVectorRetriever(BaseRetriever):
         Returns:
             List of relevant documents (filtered if filter_status or filter_dict set)
         """
+        return self.retrieve(query, k=self.k)
+
+    def retrieve(self, query: str, k: Optional[int] = None) -> List[Document]:
+        """
+        Stateless retrieval with an explicit k.
+
+        Composite retrievers (Enhanced/Fusion) call this with their own
+        retrieval_k instead of mutating ``self.k``, so one shared instance
+        can serve concurrent requests.
+
+        Args:
+            query: User's question
+            k: Number of documents (defaults to self.k)
+
+        Returns:
+            List of relevant documents
+        """
+        k = k or self.k
+        embeddings, vector_store = self._stores()
+
         # Build filter
         pgvector_filter = self._build_filter()
 
         # 🔍 DEBUG: Log filter being used
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"🔍 BaseVectorRetriever - filter_status={self.filter_status}, pgvector_filter={pgvector_filter}, k={self.k}")
+        logger.info(f"🔍 BaseVectorRetriever - filter_status={self.filter_status}, pgvector_filter={pgvector_filter}, k={k}")
 
         # Retrieve with filter
+        filtered_search = self._filtered_search(pgvector_filter)
+        if filtered_search is not None:
+            try:
+                docs = filtered_search.search(
+                    embeddings.embed_query(query), k, pgvector_filter
+                )
+                logger.info(f"✅ Retrieved {len(docs)} docs with filter pushed into SQL")
+                return docs
+            except Exception as e:
+                logger.warning(f"⚠️ Filtered vector search failed, using PGVector filter: {e}")
+
         if pgvector_filter:
             # Retrieve more docs if filtering (to get k after filter)
-            retrieve_k = self.k * 2
+            retrieve_k = k * 2
             docs = vector_store.similarity_search(
                 query, k=retrieve_k, filter=pgvector_filter
-            )[: self.k]
+            )[:k]
             logger.info(f"✅ Retrieved {len(docs)} docs after filtering (retrieve_k={retrieve_k})")
             return docs
         else:
-            docs = vector_store.similarity_search(query, k=self.k)
+            docs = vector_store.similarity_search(query, k=k)
             logger.info(f"✅ Retrieved {len(docs)} docs without filter")
             return docs
 
+    def retrieve_many(
+        self, queries: List[str], k: Optional[int] = None
+    ) -> List[List[Document]]:
+        """
+        Retrieve for several queries (Multi-Query / Fusion variants).
+
+        Query embeddings are computed in one batched call when the provider
+        offers a query-side batch (embed_queries); otherwise each worker
+        calls embed_query, never embed_documents, so asymmetric models keep
+        their query instruction/prefix. The vector searches run
+        concurrently on a bounded thread pool.
+
+        Args:
+            queries: Queries to search
+            k: Number of documents per query (defaults to self.k)
+
+        Returns:
+            One document list per query, in input order
+        """
+        if not queries:
+            return []
+        if len(queries) == 1:
+            return [self.retrieve(queries[0], k=k)]
+
+        k = k or self.k
+        pgvector_filter = self._build_filter()
+        retrieve_k = k * 2 if pgvector_filter else k
+        filtered_search = self._filtered_search(pgvector_filter)
+        embeddings, vector_store = self._stores()
+
+        embed_queries = getattr(embeddings, "embed_queries", None)
+        if embed_queries is not None:
+            vectors = embed_queries(list(queries))
+        else:
+            vectors = [None] * len(queries)
+
+        def search(query: str, vector: Optional[List[float]]) -> List[Document]:
+            if vector is None:
+                vector = embeddings.embed_query(query)
+            if filtered_search is not None:
+                try:
+                    return filtered_search.search(vector, k, pgvector_filter)
+                except Exception as e:
+                    logging.getLogger(__name__).warning(
+                        f"⚠️ Filtered vector search failed, using PGVector filter: {e}"
+                    )
+            if hasattr(vector_store, "search_with_vector"):
+                docs = vector_store.search_with_vector(
+                    query, vector, k=retrieve_k, filter=pgvector_filter
+                )
+            else:
+                docs = vector_store.similarity_search_by_vector(
+                    vector, k=retrieve_k, filter=pgvector_filter
+                )
+            return docs[:k]
+
+        executor = _get_search_executor()
+        futures = [executor.submit(search, q, v) for q, v in zip(queries, vectors)]
+        results = [future.result() for future in futures]
+
+        logging.getLogger(__name__).info(
+            f"✅ Retrieved {sum(len(d) for d in results)} docs for "
+            f"{len(queries)} queries (batched embedding, k={k})"
+        )
+        return results
+
+    def _stores(self):
+        """Injected embeddings / vector store, else the shared PGVector ones."""
+        if self.embeddings is not None and self.vector_store is not None:
+            return self.embeddings, self.vector_store
+        embeddings, vector_store = _default_vector_store()
+        return (
+            embeddings if self.embeddings is None else self.embeddings,
+            vector_store if self.vector_store is None else self.vector_store,
+        )
+
+    @staticmethod
+    def _filtered_search(
+        pgvector_filter: Optional[Dict[str, Any]],
+    ) -> Optional[FilteredVectorSearch]:
+        """Native filtered search if enabled and the filter translates to SQL."""
+        if (
+            ENABLE_FILTERED_VECTOR_SEARCH
+            and pgvector_filter
+            and FilteredVectorSearch.supports(pgvector_filter)
+        ):
+            return get_filtered_vector_search()
+        return None
+
     def _build_filter(self) -> Optional[Dict[str, Any]]:
         """
         Build PGVector filter from filter_dict.
@@ -112,4 +281,5 @@ class BaseVectorRetriever(BaseRetriever):
             List of relevant documents
         """
         # PGVector hỗ trợ async search
+        _, vector_store = self._stores()
         return await vector_store.asimilarity_search(query, k=self.k)
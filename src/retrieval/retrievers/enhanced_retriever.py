@@ -34,7 +34,7 @@ class EnhancedRetriever(BaseRetriever):
     retrieval_k: int = 10  # 🆕 Retrieve more if reranking
     deduplication: bool = True
 
-    # Query enhancer instance (initialized after __init__)
+    # Query enhancer instance (None = cached enhancer, set in __init__)
     query_enhancer: Optional[QueryEnhancer] = None
 
     class Config:
@@ -74,7 +74,7 @@ class EnhancedRetriever(BaseRetriever):
         )
 
         # Initialize query enhancer if strategies provided (🆕 use cached enhancer)
-        if self.enhancement_strategies:
+        if self.enhancement_strategies and self.query_enhancer is None:
             self.query_enhancer = get_cached_enhancer(
                 strategies=self.enhancement_strategies, max_queries=3
             )
@@ -93,14 +93,9 @@ class EnhancedRetriever(BaseRetriever):
         else:
             queries = [query]
 
-        # Step 2: Retrieve for each query (use retrieval_k per query)
+        # Step 2: Retrieve for all queries (batched embedding, parallel search)
         all_docs = []
-        for q in queries:
-            # Temporarily override k for initial retrieval
-            original_k = self.base_retriever.k
-            self.base_retriever.k = self.retrieval_k
-            docs = self.base_retriever.invoke(q)
-            self.base_retriever.k = original_k
+        for docs in self.base_retriever.retrieve_many(queries, k=self.retrieval_k):
             all_docs.extend(docs)
 
         # Step 3: Deduplicate
@@ -1,7 +1,6 @@
 # src/retrieval/retrievers/fusion_retriever.py
 
 from typing import List, Optional
-from collections import defaultdict
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
@@ -13,6 +12,7 @@ from src.retrieval.query_processing import (
     get_cached_enhancer,  # 🆕 Use cached enhancer
 )
 from src.retrieval.ranking import BaseReranker
+from src.retrieval.ranking.fusion import reciprocal_rank_fusion
 from .base_vector_retriever import BaseVectorRetriever
 
 
@@ -37,7 +37,7 @@ class FusionRetriever(BaseRetriever):
     retrieval_k: int = 10  # 🆕 Retrieve more if reranking
     rrf_k: int = 60  # RRF constant (tunable)
 
-    # Query enhancer instance (initialized after __init__)
+    # Query enhancer instance (None = cached enhancer, set in __init__)
     query_enhancer: Optional[QueryEnhancer] = None
 
     class Config:
@@ -68,9 +68,10 @@ class FusionRetriever(BaseRetriever):
         )
 
         # 🆕 Use cached enhancer instead of creating new instance
-        self.query_enhancer = get_cached_enhancer(
-            strategies=self.enhancement_strategies, max_queries=5
-        )
+        if self.query_enhancer is None:
+            self.query_enhancer = get_cached_enhancer(
+                strategies=self.enhancement_strategies, max_queries=5
+            )
 
     def _get_relevant_documents(
         self,
@@ -83,15 +84,10 @@ class FusionRetriever(BaseRetriever):
         # Step 1: Generate multiple queries
         queries = self.query_enhancer.enhance(query)
 
-        # Step 2: Retrieve docs for each query (use retrieval_k per query)
-        query_results = []
-        for q in queries:
-            # Temporarily override k for initial retrieval
-            original_k = self.base_retriever.k
-            self.base_retriever.k = self.retrieval_k
-            docs = self.base_retriever.invoke(q)
-            self.base_retriever.k = original_k
-            query_results.append(docs)
+        # Step 2: Retrieve docs for all queries (batched embedding, parallel search)
+        query_results = self.base_retriever.retrieve_many(
+            queries, k=self.retrieval_k
+        )
 
         # Step 3: Apply RRF algorithm
         fused_docs = self._reciprocal_rank_fusion(query_results)
@@ -133,24 +129,6 @@ class FusionRetriever(BaseRetriever):
     def _reciprocal_rank_fusion(
         self, doc_lists: List[List[Document]]
     ) -> List[Document]:
-        """
-        Reciprocal Rank Fusion algorithm.
-
-        RRF Score = Σ 1 / (k + rank_i)
-        where rank_i is the rank in query i
-        """
-        # Build document → RRF score mapping
-        doc_scores = defaultdict(float)
-        doc_map = {}  # Keep document objects
-
-        for doc_list in doc_lists:
-            for rank, doc in enumerate(doc_list, start=1):
-                doc_key = hash(doc.page_content)
-                doc_scores[doc_key] += 1 / (self.rrf_k + rank)
-                doc_map[doc_key] = doc
-
-        # Sort by RRF score (descending)
-        sorted_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
-
-        # Return documents in fused order
-        return [doc_map[doc_key] for doc_key, _ in sorted_docs]
+        """Reciprocal Rank Fusion over the per-query result lists."""
+        return reciprocal_rank_fusion(doc_lists, rrf_k=self.rrf_k)
+
@@ -0,0 +1,196 @@
+# src/retrieval/retrievers/hybrid_retriever.py
+
+"""
+Hybrid Retriever - lexical full-text search + vector search, fused with RRF
+
+Dense search alone misses queries that hinge on exact identifiers
+("Điều 14 Nghị định 24/2024/NĐ-CP"); balanced/quality modes recover them
+with LLM query expansion and reranking. Hybrid mode instead runs one
+full-text search next to the vector search and fuses both lists with
+reciprocal_rank_fusion - no LLM calls, close to fast-mode latency.
+
+Lexical side: langchain_pg_embedding.document_tsv (alembic
+add_lexical_search), 'simple' config over unaccented text, ranked with
+ts_rank_cd (cover density, length-normalized). Query terms are OR-ed so a
+chunk matching only the article/decree numbers still ranks.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from sqlalchemy import text
+
+from src.retrieval.ranking.fusion import reciprocal_rank_fusion
+from .base_vector_retriever import BaseVectorRetriever, _get_search_executor
+
+logger = logging.getLogger(__name__)
+
+# Function words that match most chunks and only dilute an OR query
+LEXICAL_STOPWORDS = {
+    "là", "của", "và", "các", "có", "được", "trong", "cho", "gì", "nào",
+    "như", "thế", "những", "với", "theo", "về", "khi", "thì", "này", "ra",
+    "bao", "nhiêu", "sao", "hay", "hoặc", "một", "để", "tại", "từ", "đến",
+}
+
+LEXICAL_SEARCH_SQL = """
+    SELECT e.id, e.document, e.cmetadata
+    FROM langchain_pg_embedding e
+    JOIN langchain_pg_collection c ON c.uuid = e.collection_id
+    CROSS JOIN websearch_to_tsquery('simple', vn_unaccent(:query)) AS q(query)
+    WHERE c.name = :collection
+    AND e.document_tsv @@ q.query
+    {filter_sql}
+    ORDER BY ts_rank_cd(e.document_tsv, q.query, 1) DESC
+    LIMIT :k
+"""
+
+
+def build_lexical_query(query: str) -> str:
+    """
+    websearch_to_tsquery input: query terms OR-ed, stopwords removed.
+
+    Quotes and leading '-' are stripped so user text cannot turn into
+    phrase or negation operators.
+    """
+    terms = []
+    for token in query.lower().split():
+        token = token.strip("\"'“”").lstrip("-").strip(".,;:?!()")
+        if token and token not in LEXICAL_STOPWORDS and token != "or":
+            terms.append(token)
+    return " or ".join(dict.fromkeys(terms))
+
+
+def containment_filter(filter_dict: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    JSON for ``cmetadata @> ...`` if filter_dict is plain equality, else None.
+
+    PGVector operator filters ({"$in": ...}) are not translated; the
+    caller skips the lexical side for those.
+    """
+    if not filter_dict:
+        return "{}"
+    for key, value in filter_dict.items():
+        if key.startswith("$") or isinstance(value, (dict, list)):
+            return None
+    return json.dumps(filter_dict, ensure_ascii=False)
+
+
+class LexicalRetriever(BaseRetriever):
+    """Full-text search over the PGVector collection (see module docstring)."""
+
+    k: int = 10
+    collection_name: Optional[str] = None
+    filter_dict: Optional[Dict[str, Any]] = None
+    session_factory: Optional[Callable[[], Any]] = None
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun | None = None,
+    ) -> List[Document]:
+        return self.retrieve(query, k=self.k)
+
+    def retrieve(self, query: str, k: Optional[int] = None) -> List[Document]:
+        """
+        Top-k chunks by ts_rank_cd. Returns [] if the query has no usable
+        terms or the filter cannot be expressed as containment.
+        """
+        k = k or self.k
+        lexical_query = build_lexical_query(query)
+        metadata_filter = containment_filter(self.filter_dict)
+        if not lexical_query or metadata_filter is None:
+            return []
+
+        collection = self.collection_name
+        if collection is None:
+            from src.config.models import settings
+
+            collection = settings.collection
+
+        session_factory = self.session_factory
+        if session_factory is None:
+            from src.models.base import SessionLocal
+
+            session_factory = SessionLocal
+
+        filter_sql = (
+            "AND e.cmetadata @> CAST(:filter AS jsonb)" if metadata_filter != "{}" else ""
+        )
+        db = session_factory()
+        try:
+            rows = db.execute(
+                text(LEXICAL_SEARCH_SQL.format(filter_sql=filter_sql)),
+                {
+                    "query": lexical_query,
+                    "collection": collection,
+                    "filter": metadata_filter,
+                    "k": k,
+                },
+            ).fetchall()
+        finally:
+            db.close()
+
+        return [
+            Document(
+                id=str(row.id),
+                page_content=row.document or "",
+                metadata=row.cmetadata or {},
+            )
+            for row in rows
+        ]
+
+
+class HybridRetriever(BaseRetriever):
+    """
+    Vector + lexical retrieval fused with Reciprocal Rank Fusion.
+
+    Workflow:
+    1. Vector search and lexical search run concurrently (retrieval_k each)
+    2. RRF over the two ranked lists
+    3. Return top-k fused results
+
+    If the lexical search fails (e.g. migration not applied) the vector
+    results are returned alone.
+    """
+
+    base_retriever: BaseVectorRetriever
+    lexical_retriever: LexicalRetriever
+    k: int = 5
+    retrieval_k: int = 10
+    rrf_k: int = 60
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun | None = None,
+    ) -> List[Document]:
+        """Retrieve with vector + lexical search and RRF."""
+        executor = _get_search_executor()
+        lexical_future = executor.submit(
+            self.lexical_retriever.retrieve, query, self.retrieval_k
+        )
+        vector_docs = self.base_retriever.retrieve(query, k=self.retrieval_k)
+
+        try:
+            lexical_docs = lexical_future.result()
+        except Exception as e:
+            logger.warning(f"⚠️ Lexical search failed, using vector results only: {e}")
+            lexical_docs = []
+
+        fused_docs = reciprocal_rank_fusion(
+            [lexical_docs, vector_docs], rrf_k=self.rrf_k
+        )
+        logger.info(
+            f"🔀 Hybrid retrieval: {len(vector_docs)} vector + "
+            f"{len(lexical_docs)} lexical → {len(fused_docs)} fused (k={self.k})"
+        )
+        return fused_docs[: self.k]
@@ -0,0 +1,214 @@
+"""
+Unit Tests for BulkChunkWriter
+Tests COPY staging, set-based upsert/link, native embedding writes
+and transaction handling
+with a fake psycopg connection
+"""
+
+import pytest
+
+from src.embedding.store.bulk_writer import (
+    BulkChunkWriter,
+    ChunkRow,
+    attach_embeddings,
+    embedding_id_for,
+)
+from src.preprocessing.chunking.base_chunker import UniversalChunk
+
+
+class FakeCopy:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+        self._result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy(self, sql):
+        self.conn.statements.append(sql)
+        return FakeCopy(self.conn.copied)
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(sql)
+        if self.conn.fail_on and self.conn.fail_on in sql:
+            raise RuntimeError("db error")
+        if "INSERT INTO document_chunks" in sql:
+            self.conn.upsert_params = params
+            latest = {row[1]: row for row in self.conn.copied}
+            self._result = [(chunk_id, f"uuid-{chunk_id}") for chunk_id in latest]
+        elif "DELETE FROM langchain_pg_embedding" in sql:
+            self.conn.delete_params = params
+        elif "UPDATE langchain_pg_embedding" in sql:
+            self.rowcount = self.conn.linked
+        elif "INSERT INTO langchain_pg_embedding" in sql:
+            self.conn.embedding_params = params
+            self.rowcount = len({row[1] for row in self.conn.copied if row[13]})
+
+    def fetchall(self):
+        return self._result
+
+
+class FakeConnection:
+    def __init__(self, linked=0, fail_on=None):
+        self.statements = []
+        self.copied = []
+        self.upsert_params = None
+        self.embedding_params = None
+        self.delete_params = None
+        self.linked = linked
+        self.fail_on = fail_on
+        self.committed = self.rolled_back = self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+def rows(n):
+    return [ChunkRow(chunk_id=f"c{i}", content="x" * (i + 1), chunk_index=i) for i in range(n)]
+
+
+class TestChunkRow:
+    """Tests for row construction"""
+
+    def test_from_chunk_maps_hierarchy_and_keywords(self):
+        chunk = UniversalChunk(
+            content="Điều 1. Phạm vi điều chỉnh",
+            chunk_id="luat_dieu_1",
+            document_id="luat",
+            document_type="law",
+            hierarchy=["Chương I", "Điều 1"],
+            chunk_index=3,
+            has_table=True,
+            extra_metadata={"keywords": ["phạm vi"], "entities": {"dates": []}},
+        )
+        row = ChunkRow.from_chunk(chunk)
+
+        assert row.chunk_id == "luat_dieu_1"
+        assert row.hierarchy_path == ["Chương I", "Điều 1"]
+        assert row.keywords == ["phạm vi"]
+        assert row.char_count == len(chunk.content)
+        assert row.has_table is True
+
+    def test_missing_chunk_id_falls_back_to_index(self):
+        row = ChunkRow.from_dict({"content": "a", "document_id": "d", "chunk_index": 7})
+        assert row.chunk_id == "d_7"
+
+
+class TestBulkChunkWriter:
+    """Tests for the set-based write path"""
+
+    def test_single_transaction_with_copy(self):
+        conn = FakeConnection(linked=3)
+        result = BulkChunkWriter(lambda: conn).write("doc-uuid", rows(3))
+
+        assert [r[1] for r in conn.copied] == ["c0", "c1", "c2"]
+        assert conn.upsert_params == {"document_id": "doc-uuid"}
+        # One statement per stage, not one per chunk
+        assert len(conn.statements) == 4
+        assert result.chunks_written == 3
+        assert result.embeddings_linked == 3
+        assert result.chunk_id_map["c1"] == "uuid-c1"
+        assert result.rows_per_sec > 0
+        assert conn.committed and conn.closed
+
+    def test_error_rolls_back(self):
+        conn = FakeConnection(fail_on="UPDATE langchain_pg_embedding")
+
+        with pytest.raises(RuntimeError):
+            BulkChunkWriter(lambda: conn).write("doc-uuid", rows(2))
+
+        assert conn.rolled_back and not conn.committed and conn.closed
+
+    def test_caller_owned_connection_is_not_committed(self):
+        conn = FakeConnection()
+        BulkChunkWriter(lambda: None).write(
+            "doc-uuid", rows(1), link_embeddings=False, conn=conn
+        )
+
+        assert not conn.committed and not conn.closed
+        assert not any("UPDATE langchain_pg_embedding" in s for s in conn.statements)
+        assert "DROP TABLE" in conn.statements[-1]
+
+    def test_empty_input_skips_database(self):
+        calls = []
+        result = BulkChunkWriter(lambda: calls.append(1)).write("doc-uuid", [])
+        assert result.chunks_written == 0 and calls == []
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+
+class TestNativeEmbeddings:
+    """Tests for writing langchain_pg_embedding with the chunk FK"""
+
+    def test_embedding_id_is_deterministic(self):
+        assert embedding_id_for("c1", "docs") == embedding_id_for("c1", "docs")
+        assert embedding_id_for("c1", "docs") != embedding_id_for("c2", "docs")
+        assert embedding_id_for("c1", "docs") != embedding_id_for("c1", "other")
+
+    def test_attach_embeddings_single_batch(self):
+        embedder = FakeEmbedder()
+        batch = rows(3)
+
+        assert attach_embeddings(batch, embedder, [{"i": i} for i in range(3)]) == 3
+        assert embedder.calls == [["x", "xx", "xxx"]]
+        assert batch[2].embedding == [3.0, 0.5]
+        assert batch[1].metadata == {"i": 1}
+
+    def test_rows_with_vectors_are_inserted_not_linked(self):
+        conn = FakeConnection()
+        batch = rows(2)
+        attach_embeddings(batch, FakeEmbedder())
+
+        result = BulkChunkWriter(lambda: conn, collection_name="docs").write(
+            "doc-uuid", batch
+        )
+
+        staged = conn.copied[0]
+        assert staged[12] == embedding_id_for("c0", "docs")
+        assert staged[13] == "[1.0,0.5]"
+        assert conn.embedding_params == {"collection": "docs"}
+        # Stale rows are deleted within the collection, before the insert
+        assert conn.delete_params == {"collection": "docs"}
+        delete_at = next(
+            i for i, s in enumerate(conn.statements) if "DELETE FROM langchain_pg_embedding" in s
+        )
+        assert "cmetadata->>'document_id'" in conn.statements[delete_at]
+        assert "INSERT INTO langchain_pg_embedding" in conn.statements[delete_at + 1]
+        assert not any("UPDATE langchain_pg_embedding" in s for s in conn.statements)
+        assert result.embeddings_written == 2
+        assert result.to_dict()["embeddings_written"] == 2
+        assert conn.committed
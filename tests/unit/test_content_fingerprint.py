@@ -0,0 +1,121 @@
+"""
+Unit Tests for content fingerprints and the DuplicateRegistry
+Tests text normalization, MinHash near-duplicate estimation and
+exact/near lookups with a fake psycopg connection
+"""
+
+import random
+
+from src.api.services.duplicate_registry import DuplicateRegistry
+from src.preprocessing.utils.content_fingerprint import (
+    estimate_similarity,
+    fingerprint_document,
+    text_sha256,
+)
+
+
+def legal_text(seed, n_words=2000):
+    rng = random.Random(seed)
+    vocab = [f"điều{i}" for i in range(1500)] + ["nhà thầu", "gói thầu", "Luật"]
+    return " ".join(rng.choice(vocab) for _ in range(n_words))
+
+
+class TestFingerprint:
+    """Tests for hashes and MinHash"""
+
+    def test_text_hash_ignores_formatting(self):
+        assert text_sha256("Điều 1.  Phạm vi\n\nđiều chỉnh") == text_sha256(
+            "điều 1 phạm vi điều chỉnh"
+        )
+        assert text_sha256("Điều 1") != text_sha256("Điều 2")
+
+    def test_near_duplicate_scores_high_unrelated_low(self):
+        original = legal_text(1)
+        amended = original.replace(original.split()[50], "sửa đổi", 1) + " Điều 99 bổ sung"
+
+        a = fingerprint_document(original, "h1")
+        b = fingerprint_document(amended, "h2")
+        c = fingerprint_document(legal_text(2), "h3")
+
+        assert estimate_similarity(a.minhash, b.minhash) >= 0.9
+        assert estimate_similarity(a.minhash, c.minhash) < 0.2
+        assert set(a.bands) & set(b.bands)
+        assert len(a.minhash) == 128 and len(a.bands) == 32
+
+    def test_empty_text_has_no_text_fingerprint(self):
+        fp = fingerprint_document(" \n ... ", "h1")
+
+        assert fp.text_hash == "" and fp.minhash == [] and fp.bands == []
+        assert fp.file_hash == "h1"
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append(sql)
+        self.conn.params.append(params)
+        self._rows = self.conn.exact if "file_hash =" in sql else self.conn.near
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, exact=(), near=()):
+        self.exact, self.near = list(exact), list(near)
+        self.executed = []
+        self.params = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        pass
+
+
+class TestDuplicateRegistry:
+    """Tests for exact-first, near-second lookup"""
+
+    def test_exact_match_short_circuits_near_lookup(self):
+        conn = FakeConnection(exact=[("LUA-43-2024", "Luật Đấu thầu", False)])
+        check = DuplicateRegistry(lambda: conn).check(fingerprint_document("x", "h"))
+
+        assert check.is_exact
+        assert check.exact == {
+            "document_id": "LUA-43-2024",
+            "document_name": "Luật Đấu thầu",
+            "match": "text",
+        }
+        assert len(conn.executed) == 1
+
+    def test_empty_text_matches_by_file_hash_only(self):
+        conn = FakeConnection()
+        check = DuplicateRegistry(lambda: conn).check(fingerprint_document("", "h"))
+
+        assert not check.is_exact and check.near == []
+        assert conn.params == [{"file_hash": "h", "text_hash": None}]
+
+    def test_near_candidates_are_verified_by_similarity(self):
+        fp = fingerprint_document(legal_text(1), "h")
+        other = fingerprint_document(legal_text(2), "h2")
+        conn = FakeConnection(
+            near=[("A", "Copy", fp.minhash), ("B", "Band collision", other.minhash)]
+        )
+
+        check = DuplicateRegistry(lambda: conn).check(fp)
+
+        assert not check.is_exact
+        assert [m["document_id"] for m in check.near] == ["A"]
+        assert check.near[0]["similarity"] == 1.0
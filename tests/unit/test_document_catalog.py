@@ -0,0 +1,94 @@
+"""
+Unit Tests for the document catalog helpers
+Tests keyset cursor round-trip, page ETags and refresh error handling
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.api.services.document_catalog import (
+    decode_cursor,
+    encode_cursor,
+    page_etag,
+    refresh_document_catalog,
+)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        if self.conn.fail:
+            raise RuntimeError("relation document_catalog does not exist")
+        self.conn.executed.append(params)
+
+    def fetchone(self):
+        return (len(self.conn.executed[-1]["document_ids"] or [1, 2, 3]),)
+
+
+class FakeConnection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.executed = []
+        self.committed = self.rolled_back = self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+class TestDocumentCatalog:
+    """Tests for catalog pagination and refresh"""
+
+    def test_cursor_round_trip(self):
+        created_at = datetime(2026, 2, 15, 10, 30, 5, 123456)
+        cursor = encode_cursor(created_at, "ND-24/2024|amended")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, "ND-24/2024|amended")
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(datetime(2026, 1, 1), "")[:-2])
+
+    def test_etag_changes_with_refresh_and_query(self):
+        t1, t2 = datetime(2026, 2, 15, 10), datetime(2026, 2, 15, 11)
+        params = ("law", None, 50, 0, None)
+
+        etag = page_etag(params, [("LUAT-43", t1)])
+        assert etag == page_etag(params, [("LUAT-43", t1)])
+        assert etag != page_etag(params, [("LUAT-43", t2)])
+        assert etag != page_etag(("decree", None, 50, 0, None), [("LUAT-43", t1)])
+
+    def test_refresh_selected_documents(self):
+        conn = FakeConnection()
+
+        assert refresh_document_catalog(["A", "B"], connection_factory=lambda: conn) == 2
+        assert conn.executed == [{"document_ids": ["A", "B"]}]
+        assert conn.committed and conn.closed
+
+        # Nothing to refresh: no round-trip
+        assert refresh_document_catalog([], connection_factory=lambda: conn) == 0
+        assert len(conn.executed) == 1
+
+    def test_refresh_failure_is_not_raised(self):
+        conn = FakeConnection(fail=True)
+
+        assert refresh_document_catalog(None, connection_factory=lambda: conn) == 0
+        assert conn.rolled_back and conn.closed
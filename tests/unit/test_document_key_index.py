@@ -0,0 +1,138 @@
+"""
+Unit Tests for targeted cache invalidation by document_id
+Tests the reverse index and per-cache eviction with a dict-backed Redis
+"""
+
+import numpy as np
+import pytest
+
+from src.retrieval.answer_cache import AnswerCache
+from src.retrieval.document_key_index import DocumentKeyIndex, delete_keys
+from src.retrieval.semantic_cache_v2 import HybridSemanticCache
+
+
+class FakeRedis:
+    """Dict-backed Redis supporting the pipelined commands used by caches."""
+
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.store.get(key)
+
+
+class FakePipeline:
+    def __init__(self, redis_client):
+        self.store = redis_client.store
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ops.append(True)
+
+    def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+        self.ops.append(len(members))
+
+    def expire(self, key, ttl):
+        self.ops.append(key in self.store)
+
+    def smembers(self, key):
+        self.ops.append(set(self.store.get(key, set())))
+
+    def delete(self, *keys):
+        self.ops.append(sum(self.store.pop(k, None) is not None for k in keys))
+
+    def execute(self):
+        ops, self.ops = self.ops, []
+        return ops
+
+
+def sources(*document_ids):
+    return [{"document_id": d, "chunk_id": f"{d}_c0"} for d in document_ids]
+
+
+class TestDocumentKeyIndex:
+    """Tests for local + shared reverse index"""
+
+    def test_local_track_and_pop(self):
+        index = DocumentKeyIndex("test")
+        index.track("k1", ["A", "B"])
+        index.track("k2", ["B", None, ""])
+
+        assert index.pop_local(["B"]) == {"k1", "k2"}
+        assert index.pop_local(["A"]) == set()  # k1 already untracked
+        assert len(index) == 0
+
+    def test_shared_record_and_pop(self):
+        redis_client = FakeRedis()
+        index = DocumentKeyIndex("test")
+        pipe = redis_client.pipeline()
+        index.record(pipe, "k1", ["A"], ttl=60)
+        index.record(pipe, "k2", ["A", "B"], ttl=60)
+        pipe.execute()
+
+        assert index.pop_shared(redis_client, ["A"]) == {"k1", "k2"}
+        assert "rag:docindex:test:A" not in redis_client.store
+        assert "rag:docindex:test:B" in redis_client.store
+
+    def test_delete_keys_counts_existing(self):
+        redis_client = FakeRedis()
+        redis_client.store.update({"a": 1, "b": 2})
+        assert delete_keys(redis_client, ["a", "b", "missing"]) == 2
+
+
+class TestAnswerCacheInvalidation:
+    """Tests for AnswerCache.invalidate_documents"""
+
+    @pytest.fixture
+    def cache(self):
+        cache = AnswerCache(enabled=False)
+        cache._redis = FakeRedis()
+        cache.enabled = True
+        return cache
+
+    def test_only_answers_citing_document_are_evicted(self, cache):
+        cache.set("q1", "a1", sources("DOC-1"))
+        cache.set("q2", "a2", sources("DOC-1", "DOC-2"))
+        cache.set("q3", "a3", sources("DOC-3"))
+
+        counts = cache.invalidate_documents(["DOC-1"])
+
+        assert counts == {"l1_evicted": 2, "l2_evicted": 2}
+        assert cache.get("q1") is None
+        assert cache.get("q2") is None
+        assert cache.get("q3")["answer"] == "a3"
+        assert cache.get_stats()["invalidated_l2"] == 2
+
+    def test_l2_only_entries_are_evicted(self, cache):
+        cache.set("q1", "a1", sources("DOC-1"))
+        cache._l1_cache.clear()
+        cache._l1_order.clear()
+        cache._doc_index.clear()  # e.g. written by another worker
+
+        assert cache.invalidate_documents(["DOC-1"]) == {
+            "l1_evicted": 0,
+            "l2_evicted": 1,
+        }
+        assert cache.get("q1") is None
+
+
+class TestSemanticCacheInvalidation:
+    """Tests for HybridSemanticCache.invalidate_documents"""
+
+    def test_entries_citing_document_are_evicted(self):
+        cache = HybridSemanticCache(enabled=False)
+        cache._redis = FakeRedis()
+        cache.enabled = True
+
+        cache.store_embedding("q1", np.array([1, 0], dtype=np.float32), document_ids=["DOC-1"])
+        cache.store_embedding("q2", np.array([0, 1], dtype=np.float32), document_ids=["DOC-2"])
+
+        counts = cache.invalidate_documents(["DOC-1"])
+
+        assert counts == {"l1_evicted": 1, "l2_evicted": 1}
+        assert [c[2]["query"] for c in cache._cosine_prefilter(np.array([1, 1]))] == ["q2"]
@@ -0,0 +1,119 @@
+"""
+Unit Tests for the document status map
+Tests NOTIFY payload handling, valid_until expiry and annotate/demote
+"""
+
+from datetime import date
+from types import SimpleNamespace
+
+from langchain_core.documents import Document
+
+from src.retrieval.document_status import DocumentStatusMap
+
+
+class FakeConnection:
+    """Returns `rows` for the status load query."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+        self.closed = False
+
+    def execute(self, sql):
+        self.queries += 1
+        return SimpleNamespace(fetchall=lambda: list(self.rows))
+
+    def close(self):
+        self.closed = True
+
+
+def make_map(rows, now=1000.0):
+    conn = FakeConnection(rows)
+    clock = {"now": now}
+    status_map = DocumentStatusMap(
+        connection_factory=lambda: conn,
+        max_age_seconds=60,
+        clock=lambda: clock["now"],
+        today=lambda: date(2026, 3, 1),
+    )
+    return status_map, conn, clock
+
+
+def chunk(document_id, text="chunk"):
+    return Document(page_content=text, metadata={"document_id": document_id})
+
+
+class TestDocumentStatusMap:
+    """Tests for loading, notifications and expiry"""
+
+    def test_load_and_expiry(self):
+        status_map, conn, _ = make_map(
+            [
+                ("law-1", "active", None),
+                ("law-2", "active", "2025-12-31"),
+                ("law-3", "superseded", None),
+                ("law-4", None, "2027-01-01"),
+            ]
+        )
+
+        assert status_map.statuses(["law-1", "law-2", "law-3", "law-4", "law-9"]) == {
+            "law-1": "active",
+            "law-2": "expired",
+            "law-3": "superseded",
+            "law-4": "active",
+        }
+        assert conn.queries == 1  # loaded once, then served from memory
+        assert conn.closed
+
+    def test_notifications(self):
+        status_map, conn, _ = make_map([("law-1", "active", None)])
+        status_map.load()
+
+        status_map.apply_notification(
+            '{"op": "UPDATE", "document_id": "law-1", "status": "superseded", "valid_until": null}'
+        )
+        status_map.apply_notification(
+            {"op": "INSERT", "document_id": "law-2", "status": "active", "valid_until": "2026-02-01"}
+        )
+        assert status_map.status_of("law-1") == "superseded"
+        assert status_map.status_of("law-2") == "expired"
+
+        status_map.apply_notification({"op": "DELETE", "document_id": "law-2"})
+        assert status_map.status_of("law-2") is None
+        assert status_map.get_stats()["notifications"] == 3
+
+    def test_reload_when_stale_without_listener(self):
+        status_map, conn, clock = make_map([("law-1", "active", None)])
+        status_map.status_of("law-1")
+        clock["now"] += 30
+        status_map.status_of("law-1")
+        assert conn.queries == 1
+
+        clock["now"] += 60
+        status_map.status_of("law-1")
+        assert conn.queries == 2
+
+
+class TestAnnotate:
+    """Tests for status annotation and demotion"""
+
+    def test_annotate_and_demote(self):
+        status_map, _, _ = make_map(
+            [("law-1", "expired", None), ("law-2", "active", None)]
+        )
+        docs = [chunk("law-1", "a"), chunk("law-2", "b"), chunk("unknown", "c")]
+
+        result = status_map.annotate(docs, demote=True)
+
+        assert [d.page_content for d in result] == ["b", "c", "a"]
+        assert result[2].metadata["status"] == "expired"
+        assert "status" not in result[1].metadata
+
+    def test_annotate_without_demote_keeps_order(self):
+        status_map, _, _ = make_map([("law-1", "superseded", None)])
+        docs = [chunk("law-1", "a"), chunk("law-2", "b")]
+
+        result = status_map.annotate(docs, demote=False)
+
+        assert [d.page_content for d in result] == ["a", "b"]
+        assert result[0].metadata["status"] == "superseded"
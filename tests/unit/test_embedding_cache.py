@@ -0,0 +1,153 @@
+"""
+Unit Tests for CachedEmbeddings
+Tests L1/L2 embedding caching with a fake provider and mocked Redis
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import MagicMock
+
+from langchain_core.embeddings import Embeddings
+
+from src.embedding.embedders.cached_embedder import (
+    CachedEmbeddings,
+    normalize_embedding_text,
+)
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings that count provider calls."""
+
+    def __init__(self):
+        self.document_calls = []
+        self.query_calls = []
+
+    def _vector(self, text: str):
+        return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+    def embed_documents(self, texts):
+        self.document_calls.append(list(texts))
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        self.query_calls.append(text)
+        return self._vector(text)
+
+
+@pytest.fixture
+def base():
+    return FakeEmbeddings()
+
+
+@pytest.fixture
+def cached(base):
+    return CachedEmbeddings(base, model="test-model", dimension=3, enable_l2_cache=False)
+
+
+class TestKeyGeneration:
+    """Tests for cache key generation"""
+
+    def test_normalize_collapses_whitespace(self):
+        assert normalize_embedding_text("  Điều   14\n Luật ") == "Điều 14 Luật"
+
+    def test_key_preserves_case(self, cached):
+        assert cached._generate_key("Luật") != cached._generate_key("luật")
+
+    def test_key_depends_on_model_dimension_and_kind(self, base):
+        a = CachedEmbeddings(base, model="m1", dimension=3, enable_l2_cache=False)
+        b = CachedEmbeddings(base, model="m2", dimension=3, enable_l2_cache=False)
+        c = CachedEmbeddings(base, model="m1", dimension=768, enable_l2_cache=False)
+        assert a._generate_key("x") != b._generate_key("x")
+        assert a._generate_key("x") != c._generate_key("x")
+        assert a._generate_key("x") != a._generate_key("x", kind="query")
+        assert a._generate_key("x").startswith("rag:embedding:")
+
+
+class TestL1Cache:
+    """Tests for in-memory caching"""
+
+    def test_embed_query_hits_l1(self, cached, base):
+        first = cached.embed_query("Hồ sơ mời thầu")
+        second = cached.embed_query("Hồ sơ   mời thầu")
+
+        assert first == second
+        assert len(base.query_calls) == 1
+        stats = cached.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_embed_documents_only_computes_misses(self, cached, base):
+        cached.embed_documents(["a", "b"])
+        result = cached.embed_documents(["b", "c", "c"])
+
+        assert base.document_calls == [["a", "b"], ["c"]]
+        assert result == [base._vector("b"), base._vector("c"), base._vector("c")]
+
+    def test_embed_documents_preserves_order(self, cached, base):
+        texts = ["x", "yy", "zzz"]
+        assert cached.embed_documents(texts) == [base._vector(t) for t in texts]
+
+    def test_lru_eviction(self, base):
+        cached = CachedEmbeddings(base, model="m", dimension=3, enable_l2_cache=False, l1_size=2)
+        cached.embed_query("a")
+        cached.embed_query("b")
+        cached.embed_query("a")  # refresh "a"
+        cached.embed_query("c")  # evicts "b"
+        cached.embed_query("a")
+        cached.embed_query("b")
+
+        assert base.query_calls == ["a", "b", "c", "b"]
+
+
+class TestL2Cache:
+    """Tests for Redis-backed caching"""
+
+    def test_l2_hit_returns_float32_vector(self, cached, base):
+        stored = np.array([0.5, 0.25, 1.0], dtype=np.float32).tobytes()
+        cached._redis = MagicMock()
+        cached._redis.mget.return_value = [stored]
+
+        assert cached.embed_query("q") == [0.5, 0.25, 1.0]
+        assert base.query_calls == []
+        assert cached.get_stats()["l2_hits"] == 1
+
+    def test_miss_writes_to_redis(self, cached, base):
+        cached._redis = MagicMock()
+        cached._redis.mget.return_value = [None]
+        pipe = cached._redis.pipeline.return_value
+
+        cached.embed_documents(["new chunk"])
+
+        pipe.setex.assert_called_once()
+        pipe.execute.assert_called_once()
+
+    def test_redis_error_falls_back_to_provider(self, cached, base):
+        cached._redis = MagicMock()
+        cached._redis.mget.side_effect = ConnectionError("down")
+
+        assert cached.embed_query("q") == base._vector("q")
+        assert cached.get_stats()["errors"] >= 1
+
+
+class TestEmbedQueries:
+    """Tests for batched query embedding"""
+
+    def test_symmetric_batches_misses(self, base):
+        cached = CachedEmbeddings(
+            base, model="m", dimension=3, enable_l2_cache=False, symmetric=True
+        )
+        cached.embed_query("a")
+        result = cached.embed_queries(["a", "b", "c"])
+
+        assert result == [base._vector(t) for t in ["a", "b", "c"]]
+        assert base.document_calls == [["b", "c"]]
+
+    def test_asymmetric_uses_embed_query(self, cached, base):
+        cached.embed_queries(["a", "b"])
+
+        assert base.document_calls == []
+        assert base.query_calls == ["a", "b"]
+        # Shared with embed_query
+        cached.embed_query("b")
+        assert base.query_calls == ["a", "b"]
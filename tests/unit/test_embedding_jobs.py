@@ -0,0 +1,172 @@
+"""
+Unit Tests for EmbeddingJobRunner
+Tests token packing, concurrency, retries with backoff, failure isolation
+and the sliding-window rate limiter
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.embedding.embedders.embedding_jobs import (
+    EmbeddingJobRunner,
+    RateLimiter,
+    is_retryable_error,
+)
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class BadRequestError(Exception):
+    status_code = 400
+
+
+class FakeEmbedder:
+    """Returns [len(text)] per text; texts in ``poison`` always fail."""
+
+    def __init__(self, poison=(), fail_first=0, delay=0.0, poison_error=None):
+        self.poison = set(poison)
+        self.poison_error = poison_error or BadRequestError("input too long")
+        self.fail_first = fail_first
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts):
+        with self._lock:
+            self.calls.append(list(texts))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.fail_first > 0
+            self.fail_first -= 1
+        try:
+            time.sleep(self.delay)
+            if fail:
+                raise RateLimitError("rate limited")
+            if self.poison & set(texts):
+                raise self.poison_error
+            return [[float(len(t))] for t in texts]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def make_runner(embedder, **kwargs):
+    options = dict(
+        max_concurrency=4,
+        batch_max_tokens=10,
+        batch_max_size=100,
+        max_retries=2,
+        base_delay=0.0,
+        rate_limiter=RateLimiter(),
+        token_counter=len,
+        sleep=lambda s: None,
+    )
+    options.update(kwargs)
+    return EmbeddingJobRunner(embedder, **options)
+
+
+class TestBatchPlanning:
+    """Tests for adaptive, token-based batch sizing"""
+
+    def test_packs_by_tokens_and_size(self):
+        runner = make_runner(FakeEmbedder(), batch_max_tokens=10, batch_max_size=3)
+        assert runner.plan_batches([4, 4, 4, 1, 1, 1, 1, 20, 1]) == [
+            [0, 1],
+            [2, 3, 4],
+            [5, 6],
+            [7],  # oversized text gets its own request
+            [8],
+        ]
+
+
+class TestRun:
+    """Tests for concurrent embedding"""
+
+    def test_vectors_align_with_input(self):
+        embedder = FakeEmbedder(delay=0.02)
+        texts = ["aaaa", "bbbbb", "cc", "dddddd", "e", "ffff"]
+
+        job = make_runner(embedder).run(texts)
+
+        assert job.vectors == [[float(len(t))] for t in texts]
+        assert job.success_rate == 1.0
+        assert job.requests == len(embedder.calls) > 1
+        assert embedder.max_in_flight > 1  # requests overlap
+
+    def test_transient_failure_is_retried(self):
+        embedder = FakeEmbedder(fail_first=2)
+        job = make_runner(embedder, max_concurrency=1).run(["abc"])
+
+        assert job.vectors == [[3.0]]
+        assert job.retries == 2 and job.failed == []
+
+    def test_bad_chunk_is_isolated_and_recorded(self, tmp_path):
+        embedder = FakeEmbedder(poison={"bad"}, poison_error=ConnectionError("reset"))
+        log = tmp_path / "failed.jsonl"
+
+        job = make_runner(embedder, batch_max_tokens=100).run(
+            ["ok1", "bad", "ok2", "ok3"], ids=["c1", "c2", "c3", "c4"], failure_log=log
+        )
+
+        assert job.vectors == [[3.0], None, [3.0], [3.0]]
+        assert job.failed_ids == ["c2"]
+        assert job.success_rate == pytest.approx(0.75)
+        logged = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+        assert [entry["chunk_id"] for entry in logged] == ["c2"]
+
+    def test_non_retryable_error_fails_whole_batch(self):
+        embedder = FakeEmbedder(poison={"bad"})
+
+        job = make_runner(embedder, batch_max_tokens=100).run(
+            ["ok1", "bad", "ok2"], ids=["c1", "c2", "c3"]
+        )
+
+        assert len(embedder.calls) == 1  # no retries, no splitting
+        assert job.vectors == [None, None, None]
+        assert job.failed_ids == ["c1", "c2", "c3"]
+        assert job.retries == 0
+
+    def test_error_classification(self):
+        assert is_retryable_error(RateLimitError())
+        assert is_retryable_error(TimeoutError())
+        assert is_retryable_error(type("APIConnectionError", (Exception,), {})())
+        assert not is_retryable_error(BadRequestError())
+        assert not is_retryable_error(ValueError("input too long"))
+
+
+class TestRateLimiter:
+    """Tests for the sliding-window budget"""
+
+    def test_waits_for_token_budget(self):
+        now = [100.0]
+        limiter = RateLimiter(tokens_per_minute=100, clock=lambda: now[0])
+
+        limiter.acquire(60)
+        now[0] = 130.0
+        assert limiter.wait_time(50) == pytest.approx(30.0)
+        assert limiter.wait_time(40) == 0.0
+
+    def test_waits_for_request_budget(self):
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        limiter = RateLimiter(requests_per_minute=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(3):
+            limiter.acquire(1)
+
+        assert slept == [pytest.approx(60.0)]
+
+    def test_oversized_request_allowed_when_window_empty(self):
+        limiter = RateLimiter(tokens_per_minute=10)
+        assert limiter.wait_time(50) == 0.0
@@ -192,6 +192,40 @@ class TestLocalStorageProvider:
             result = provider.delete("nonexistent.txt")
             assert result is False
 
+    
+    def test_upload_stream_hashes_and_reads_ranges(self):
+        """Streamed upload should hash on the fly and support ranged reads."""
+        import hashlib
+        import io
+        from src.config.storage_provider import LocalStorageProvider, iter_stream
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            provider = LocalStorageProvider(base_path=tmpdir)
+            content = bytes(range(256)) * 10000  # spans several chunks
+            
+            stored = provider.upload_stream("big/file.bin", io.BytesIO(content))
+            
+            assert stored.size_bytes == len(content)
+            assert stored.sha256 == hashlib.sha256(content).hexdigest()
+            assert provider.size("big/file.bin") == len(content)
+            assert not any(p.name.endswith(".part") for p in Path(tmpdir, "big").iterdir())
+            
+            ranged = b"".join(
+                iter_stream(provider.open_read("big/file.bin", 1000), 5000, chunk_size=512)
+            )
+            assert ranged == content[1000:6000]
+    
+    def test_upload_stream_enforces_max_bytes(self):
+        """Oversized streams should fail without leaving partial files."""
+        import io
+        from src.config.storage_provider import LocalStorageProvider
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            provider = LocalStorageProvider(base_path=tmpdir)
+            
+            with pytest.raises(ValueError):
+                provider.upload_stream("f.bin", io.BytesIO(b"x" * 100), max_bytes=10)
+            assert list(Path(tmpdir).iterdir()) == []
 
 class TestGCSStorageProvider:
     """Tests for GCS storage (mocked)."""
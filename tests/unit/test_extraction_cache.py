@@ -0,0 +1,53 @@
+"""
+Unit Tests for the upload extraction cache
+Tests round-trip, stale-source detection and corrupt cache handling
+"""
+
+from src.preprocessing.extraction_cache import (
+    ExtractedDocument,
+    extraction_cache_path,
+    load_extraction,
+    save_extraction,
+)
+
+
+def make_source(tmp_path, content=b"PK fake docx bytes"):
+    source = tmp_path / "Luật 43-2024-QH15.docx"
+    source.write_bytes(content)
+    return source
+
+
+class TestExtractionCache:
+    """Tests for Stage 1 → Stage 2 extraction reuse"""
+
+    def test_round_trip(self, tmp_path):
+        source = make_source(tmp_path)
+        extracted = ExtractedDocument(
+            text="LUẬT ĐẤU THẦU\nĐiều 1. Phạm vi điều chỉnh",
+            extraction_method="docx_loader",
+            metadata={"title": "Luật Đấu thầu"},
+            structure=[{"type": "dieu", "number": "1"}],
+        )
+
+        cache_path = save_extraction(source, extracted)
+        loaded = load_extraction(source)
+
+        assert cache_path == extraction_cache_path(source)
+        assert cache_path.name.endswith(".docx.extracted.json.gz")
+        assert loaded == extracted
+        assert loaded.source_size == len(b"PK fake docx bytes")
+
+    def test_changed_source_is_a_miss(self, tmp_path):
+        source = make_source(tmp_path)
+        save_extraction(source, ExtractedDocument(text="a", extraction_method="m"))
+
+        source.write_bytes(b"PK fake docx bytez")  # same size, new content
+
+        assert load_extraction(source) is None
+
+    def test_missing_or_corrupt_cache_is_a_miss(self, tmp_path):
+        source = make_source(tmp_path)
+        assert load_extraction(source) is None
+
+        extraction_cache_path(source).write_bytes(b"not gzip")
+        assert load_extraction(source) is None
@@ -0,0 +1,107 @@
+"""
+Unit Tests for filtered vector search
+Tests filter translation to SQL and the iterative-scan / exact-rescan paths
+"""
+
+from types import SimpleNamespace
+
+from src.embedding.store.filtered_search import FilteredVectorSearch, translate_filter
+
+
+class FakeSession:
+    """Records SQL; returns `rows_per_search` rows for each search query."""
+
+    def __init__(self, version, rows_per_search):
+        self.version = version
+        self.rows_per_search = list(rows_per_search)
+        self.statements = []
+        self.closed = False
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append((sql, params))
+        if "pg_extension" in sql:
+            return SimpleNamespace(scalar=lambda: self.version)
+        if "langchain_pg_embedding" in sql:
+            count = self.rows_per_search.pop(0)
+            rows = [
+                SimpleNamespace(id=i, document=f"chunk {i}", cmetadata={"dieu": "14"})
+                for i in range(count)
+            ]
+            return SimpleNamespace(fetchall=lambda: rows)
+        return SimpleNamespace()
+
+    def close(self):
+        self.closed = True
+
+    def settings(self):
+        return [
+            (p or {}).get("value", sql) for sql, p in self.statements if "set_config" in sql
+        ]
+
+
+class TestTranslateFilter:
+    """Tests for PGVector filter → SQL"""
+
+    def test_promoted_and_metadata_keys(self):
+        clauses, params = translate_filter(
+            {"document_type": "law", "dieu": 14, "status": {"$in": ["active", "draft"]}}
+        )
+
+        assert clauses == [
+            "e.document_type = :value_0",
+            "(e.cmetadata ->> :key_1) = :value_1",
+            "e.status = ANY(:value_2)",
+        ]
+        assert params == {
+            "value_0": "law",
+            "key_1": "dieu",
+            "value_1": "14",
+            "value_2": ["active", "draft"],
+        }
+
+    def test_unsupported_operators(self):
+        assert translate_filter({"$or": [{"dieu": "1"}, {"dieu": "2"}]}) is None
+        assert translate_filter({"chunk_index": {"$gte": 3}}) is None
+        assert FilteredVectorSearch.supports(None) is False
+
+
+class TestFilteredVectorSearch:
+    """Tests for scan configuration and fallback"""
+
+    def make_search(self, session):
+        return FilteredVectorSearch(
+            session_factory=lambda: session, collection_name="docs", ef_search=80
+        )
+
+    def test_iterative_scan_on_pgvector_08(self):
+        session = FakeSession("0.8.0", [2])
+        docs = self.make_search(session).search([0.1, 0.2], 5, {"document_type": "law"})
+
+        assert len(docs) == 2  # fewer matches exist; no rescan needed
+        assert "strict_order" in " ".join(session.settings())
+        assert sum("langchain_pg_embedding" in s for s, _ in session.statements) == 1
+        assert session.closed
+
+    def test_exact_rescan_on_older_pgvector(self):
+        session = FakeSession("0.7.4", [1, 5])
+        search = self.make_search(session)
+        docs = search.search([0.1, 0.2], 5, {"document_type": "law", "dieu": "14"})
+
+        assert len(docs) == 5
+        assert any("enable_indexscan" in s for s in session.settings())
+        assert search.get_stats() == {
+            "searches": 1,
+            "exact_rescans": 1,
+            "rescans_skipped": 0,
+            "iterative_scan": False,
+        }
+
+    def test_no_rescan_for_unindexed_filter(self):
+        session = FakeSession("0.7.4", [1])
+        search = self.make_search(session)
+        docs = search.search([0.1, 0.2], 5, {"dieu": "14"})
+
+        assert len(docs) == 1
+        assert not any("enable_indexscan" in s for s in session.settings())
+        assert search.get_stats()["rescans_skipped"] == 1
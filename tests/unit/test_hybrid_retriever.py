@@ -0,0 +1,149 @@
+"""
+Unit Tests for hybrid (lexical + vector) retrieval
+Tests lexical query building, containment filters, RRF fusion and fallback
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+
+from src.retrieval.retrievers.base_vector_retriever import BaseVectorRetriever
+from src.retrieval.retrievers.hybrid_retriever import (
+    HybridRetriever,
+    LexicalRetriever,
+    build_lexical_query,
+    containment_filter,
+)
+
+
+def doc(content):
+    return Document(page_content=content, metadata={"chunk_id": content})
+
+
+class FakeVectorRetriever(BaseVectorRetriever):
+    results: list = []
+
+    def retrieve(self, query, k=None):
+        return self.results[: k or self.k]
+
+
+class FakeLexicalRetriever(LexicalRetriever):
+    results: list = []
+    error: bool = False
+
+    def retrieve(self, query, k=None):
+        if self.error:
+            raise RuntimeError('relation "document_tsv" does not exist')
+        return self.results[: k or self.k]
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def execute(self, statement, params):
+        self.calls.append((str(statement), params))
+        return SimpleNamespace(fetchall=lambda: self.rows)
+
+    def close(self):
+        pass
+
+
+class TestLexicalQuery:
+    """Tests for websearch_to_tsquery input"""
+
+    def test_keeps_diacritics_and_drops_stopwords(self):
+        # Unaccenting happens in SQL (vn_unaccent), not here
+        assert build_lexical_query("Bảo đảm dự thầu là gì?") == "bảo or đảm or dự or thầu"
+        assert build_lexical_query("Điều 14 Nghị định 24/2024/NĐ-CP") == (
+            "điều or 14 or nghị or định or 24/2024/nđ-cp"
+        )
+
+    def test_strips_operators_and_duplicates(self):
+        assert build_lexical_query('"thầu" -thầu OR thầu') == "thầu"
+        assert build_lexical_query("là gì và của") == ""
+
+    def test_containment_filter(self):
+        assert containment_filter(None) == "{}"
+        assert containment_filter({"document_type": "luật", "dieu": "14"}) == (
+            '{"document_type": "luật", "dieu": "14"}'
+        )
+        assert containment_filter({"document_type": {"$in": ["law", "decree"]}}) is None
+        assert containment_filter({"$or": [{"dieu": "14"}]}) is None
+
+
+class TestLexicalRetriever:
+    """Tests for the full-text search SQL"""
+
+    def test_filter_is_bound_as_jsonb_containment(self):
+        session = FakeSession(
+            [SimpleNamespace(id="e1", document="Điều 14", cmetadata={"dieu": "14"})]
+        )
+        retriever = LexicalRetriever(
+            k=3,
+            collection_name="docs",
+            filter_dict={"dieu": "14"},
+            session_factory=lambda: session,
+        )
+
+        docs = retriever.retrieve("Điều 14 là gì")
+
+        sql, params = session.calls[0]
+        assert "e.cmetadata @> CAST(:filter AS jsonb)" in sql
+        assert params == {
+            "query": "điều or 14",
+            "collection": "docs",
+            "filter": '{"dieu": "14"}',
+            "k": 3,
+        }
+        assert docs[0].id == "e1" and docs[0].metadata == {"dieu": "14"}
+
+    def test_skips_database_when_query_or_filter_unusable(self):
+        def no_session():
+            pytest.fail("database should not be queried")
+
+        assert LexicalRetriever(session_factory=no_session).retrieve("là gì") == []
+        operator_filter = LexicalRetriever(
+            filter_dict={"dieu": {"$in": ["1", "2"]}}, session_factory=no_session
+        )
+        assert operator_filter.retrieve("bảo đảm dự thầu") == []
+
+
+class TestHybridRetriever:
+    """Tests for RRF fusion of vector + lexical results"""
+
+    def _retriever(self, vector, lexical=(), lexical_error=False, k=3):
+        return HybridRetriever(
+            base_retriever=FakeVectorRetriever(results=list(vector)),
+            lexical_retriever=FakeLexicalRetriever(
+                results=list(lexical), error=lexical_error
+            ),
+            k=k,
+            retrieval_k=10,
+        )
+
+    def test_rrf_order_and_dedup(self):
+        retriever = self._retriever(
+            vector=[doc("B"), doc("C")], lexical=[doc("A"), doc("B")]
+        )
+
+        docs = retriever.invoke("Điều 14")
+
+        # B is in both lists; A (lexical rank 1) beats C (vector rank 2)
+        assert [d.page_content for d in docs] == ["B", "A", "C"]
+
+    def test_truncates_to_k(self):
+        retriever = self._retriever(
+            vector=[doc(c) for c in "ABCD"], lexical=[doc(c) for c in "EFGH"], k=2
+        )
+
+        assert [d.page_content for d in retriever.invoke("q")] == ["E", "A"]
+
+    def test_falls_back_to_vector_only_when_lexical_fails(self):
+        retriever = self._retriever(
+            vector=[doc("A"), doc("B"), doc("C"), doc("D")], lexical_error=True
+        )
+
+        assert [d.page_content for d in retriever.invoke("q")] == ["A", "B", "C"]
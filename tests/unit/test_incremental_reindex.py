@@ -0,0 +1,173 @@
+"""
+Unit Tests for IncrementalReindexer
+Tests content-hash vector reuse, miss-only embedding and orphan removal
+with a fake psycopg connection
+"""
+
+import pytest
+
+from src.embedding.embedders.embedding_jobs import EmbeddingJobError
+from src.embedding.store.bulk_writer import ChunkRow, embedding_id_for
+from src.embedding.store.incremental_reindex import (
+    EMBEDDING_HASH_KEY,
+    IncrementalReindexer,
+    embedding_hash,
+)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+        self._result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((sql, params))
+        if "SELECT DISTINCT ON" in sql:
+            self._result = [
+                (h, self.conn.stored[h]) for h in params["hashes"] if h in self.conn.stored
+            ]
+        elif "DELETE" in sql:
+            self.rowcount = self.conn.deleted
+
+    def fetchall(self):
+        return self._result
+
+
+class FakeConnection:
+    def __init__(self, stored=None, deleted=0):
+        self.stored = stored or {}
+        self.deleted = deleted
+        self.executed = []
+        self.committed = self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeEmbedder:
+    def __init__(self, poison=()):
+        self.calls = []
+        self.poison = set(poison)
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        if self.poison & set(texts):
+            raise ValueError("input too long")
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def make_reindexer(conn, embedder=None):
+    return IncrementalReindexer(
+        embedder or FakeEmbedder(),
+        model_name="text-embedding-3-small",
+        dimension=1536,
+        collection_name="docs",
+        connection_factory=lambda: conn,
+    )
+
+
+def rows(*texts):
+    return [ChunkRow(chunk_id=f"c{i}", content=t) for i, t in enumerate(texts)]
+
+
+class TestEmbeddingHash:
+    """Tests for the vector identity hash"""
+
+    def test_hash_depends_on_text_model_and_dimension(self):
+        base = embedding_hash("Điều 1", "text-embedding-3-small", 1536)
+        assert base == embedding_hash("Điều 1", "text-embedding-3-small", 1536)
+        assert base != embedding_hash("Điều 2", "text-embedding-3-small", 1536)
+        assert base != embedding_hash("Điều 1", "text-embedding-3-large", 1536)
+        assert base != embedding_hash("Điều 1", "text-embedding-3-small", 768)
+
+
+class TestAttachEmbeddings:
+    """Tests for reuse vs embed"""
+
+    def test_only_changed_text_is_embedded(self):
+        unchanged = embedding_hash("same", "text-embedding-3-small", 1536)
+        embedder = FakeEmbedder()
+        reindexer = make_reindexer(
+            FakeConnection(stored={unchanged: "[0.25,0.5]"}), embedder
+        )
+        batch = rows("same", "new text", "new text")
+
+        diff = reindexer.attach_embeddings(batch, [{"i": 0}, {"i": 1}, {"i": 2}])
+
+        assert embedder.calls == [["new text"]]  # deduplicated miss
+        assert batch[0].embedding == [0.25, 0.5]
+        assert batch[1].embedding == batch[2].embedding == [8.0, 1.0]
+        assert batch[0].metadata == {"i": 0, EMBEDDING_HASH_KEY: unchanged}
+        assert (diff.added, diff.reused, diff.texts_embedded) == (2, 1, 1)
+        assert reindexer.diff.reuse_rate == pytest.approx(1 / 3)
+
+    def test_failures_are_recorded_per_chunk_id(self):
+        reindexer = make_reindexer(FakeConnection(), FakeEmbedder(poison={"bad"}))
+        reindexer.runner.batch_max_size = 1
+
+        with pytest.raises(EmbeddingJobError) as exc_info:
+            reindexer.attach_embeddings(rows("ok", "bad", "bad"))
+
+        failed = exc_info.value.result.failed
+        assert [(f.index, f.chunk_id) for f in failed] == [(1, "c1"), (2, "c2")]
+
+    def test_lookup_is_batched(self):
+        conn = FakeConnection()
+        reindexer = make_reindexer(conn)
+        reindexer.batch_size = 2
+
+        reindexer.attach_embeddings(rows("a", "b", "c"))
+
+        assert len(conn.executed) == 2
+        assert conn.closed
+
+
+class TestRemoveOrphans:
+    """Tests for orphan deletion"""
+
+    def test_collection_sweep_keeps_written_ids(self):
+        conn = FakeConnection(deleted=4)
+        reindexer = make_reindexer(conn)
+
+        assert reindexer.remove_orphans(["c1", "c0"]) == 4
+
+        sql, params = conn.executed[0]
+        assert params["keep_ids"] == [
+            embedding_id_for("c0", "docs"),
+            embedding_id_for("c1", "docs"),
+        ]
+        assert reindexer.diff.removed == 4
+        assert conn.committed
+
+    def test_document_scope_removes_chunks_and_embeddings(self):
+        conn = FakeConnection(deleted=2)
+        reindexer = make_reindexer(conn)
+
+        reindexer.remove_orphans(["c0"], document_uuids=["doc-uuid"])
+
+        assert [sql.split()[2] for sql, _ in conn.executed] == [
+            "langchain_pg_embedding",
+            "document_chunks",
+        ]
+        assert reindexer.diff.to_dict()["chunks_removed"] == 2
+
+    def test_empty_run_never_sweeps_collection(self):
+        conn = FakeConnection(deleted=100)
+        assert make_reindexer(conn).remove_orphans([]) == 0
+        assert conn.executed == []
@@ -0,0 +1,225 @@
+"""
+Unit Tests for streamed answers
+Tests astream_answer and the conversation turn it feeds: normal completion,
+a mid-stream LLM error and a client disconnect
+"""
+
+import asyncio
+import itertools
+import uuid
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+# qa_chain builds the default LLM at import (needs the provider package)
+qa_chain = pytest.importorskip("src.generation.chains.qa_chain", exc_type=ImportError)
+conversation_service = pytest.importorskip(
+    "src.api.services.conversation_service", exc_type=ImportError
+)
+
+from src.api.services.conversation_service import (
+    RAG_ABORTED_SUFFIX,
+    RAG_ERROR_MESSAGE,
+    ConversationService,
+)
+
+ANSWER = "Điều 5 quy định phạm vi điều chỉnh của Luật Đấu thầu."
+
+
+class FailingChatModel(GenericFakeChatModel):
+    """Streams one chunk, then the connection to the LLM drops."""
+
+    def _stream(self, *args, **kwargs):
+        yield from itertools.islice(super()._stream(*args, **kwargs), 1)
+        raise RuntimeError("LLM connection reset")
+
+
+def fake_generation(question, mode, reranker_type):
+    selected_mode = mode or "balanced"
+    return {
+        "selected_mode": selected_mode,
+        "enhancement_enabled": selected_mode not in ("fast", "hybrid"),
+        "prompt": ChatPromptTemplate.from_messages([("user", "{context}\n\n{question}")]),
+        "context": "[#1] Điều 5",
+        "question": question,
+        "source_documents": [
+            Document(page_content="Điều 5", metadata={"document_id": "luat"})
+        ],
+        "retrieval_time_ms": 12,
+    }
+
+
+@pytest.fixture
+def cached(monkeypatch):
+    """Offline qa_chain; returns the list of answers written to the cache."""
+    writes = []
+    monkeypatch.setattr(qa_chain, "_early_answer", lambda *args: None)
+    monkeypatch.setattr(qa_chain, "_prepare_generation", fake_generation)
+    monkeypatch.setattr(qa_chain, "_get_document_statuses", lambda docs: {})
+    monkeypatch.setattr(
+        qa_chain, "_cache_answer", lambda query, answer, *args: writes.append(answer)
+    )
+    monkeypatch.setattr(
+        qa_chain, "model", GenericFakeChatModel(messages=iter([AIMessage(content=ANSWER)]))
+    )
+    return writes
+
+
+class TestAstreamAnswer:
+    """Tests for qa_chain.astream_answer"""
+
+    def test_streams_metadata_tokens_then_done(self, cached):
+        async def run():
+            return [event async for event in qa_chain.astream_answer("Điều 5?")]
+
+        events = asyncio.run(run())
+
+        assert events[0][0] == "metadata"
+        assert events[-1][0] == "done"
+        tokens = "".join(data["text"] for event, data in events if event == "token")
+        assert tokens == ANSWER
+        assert events[-1][1]["answer"] == ANSWER
+        assert events[-1][1]["time_to_first_token_ms"] is not None
+        assert cached == [ANSWER]
+
+    def test_streamed_metadata_matches_final_result(self, cached):
+        async def run():
+            return [event async for event in qa_chain.astream_answer("Điều 5?", mode="hybrid")]
+
+        events = asyncio.run(run())
+
+        metadata, result = events[0][1], events[-1][1]
+        assert metadata["enhancement_enabled"] is False
+        assert result["adaptive_retrieval"]["enhancement_enabled"] is False
+
+    def test_llm_error_mid_stream_is_raised_and_not_cached(self, cached, monkeypatch):
+        monkeypatch.setattr(
+            qa_chain, "model", FailingChatModel(messages=iter([AIMessage(content=ANSWER)]))
+        )
+        events = []
+
+        async def run():
+            async for event in qa_chain.astream_answer("Điều 5?"):
+                events.append(event)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(run())
+
+        assert [event for event, _ in events] == ["metadata", "token"]
+        assert cached == []
+
+    def test_disconnect_stops_generation_without_caching(self, cached):
+        async def run():
+            stream = qa_chain.astream_answer("Điều 5?")
+            events = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return events
+
+        events = asyncio.run(run())
+
+        assert [event for event, _ in events] == ["metadata", "token"]
+        assert cached == []
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def get(self, model, key):
+        return key
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    """Offline turn persistence; returns the (content, sources) saved per turn."""
+    turns = []
+
+    async def run_in_pipeline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def complete_message(db, state, content, sources, include_sources):
+        turns.append((state["user_message"], content, sources))
+        return content
+
+    monkeypatch.setattr(conversation_service, "run_in_pipeline", run_in_pipeline)
+    monkeypatch.setattr(conversation_service, "SessionLocal", FakeSession)
+    monkeypatch.setattr(
+        ConversationService, "_complete_message", staticmethod(complete_message)
+    )
+    monkeypatch.setattr(
+        ConversationService,
+        "_dump_sent_response",
+        staticmethod(lambda conversation_id, result: {"content": result}),
+    )
+    return turns
+
+
+def stream_answer(monkeypatch, fail=False):
+    async def astream_answer(**kwargs):
+        yield "metadata", {"mode": "balanced"}
+        yield "token", {"text": "Điều 5 "}
+        if fail:
+            raise RuntimeError("LLM connection reset")
+        yield "token", {"text": "quy định"}
+        yield "done", {"answer": "Điều 5 quy định", "source_documents_raw": [{"id": 1}]}
+
+    monkeypatch.setattr(conversation_service, "astream_answer", astream_answer)
+
+
+def message_events():
+    pending = {
+        "question": "Điều 5?",
+        "content": "Điều 5?",
+        "rag_mode": "balanced",
+        "use_cot": False,
+        "user_message_id": "m1",
+    }
+    return ConversationService._message_events(uuid.uuid4(), pending, True, None)
+
+
+class TestMessageEvents:
+    """Tests for ConversationService._message_events"""
+
+    def test_completed_turn_is_saved_once(self, monkeypatch, saved):
+        stream_answer(monkeypatch)
+
+        async def run():
+            return [event async for event in message_events()]
+
+        events = asyncio.run(run())
+
+        assert [event for event, _ in events] == ["metadata", "token", "token", "done"]
+        assert events[-1][1]["content"] == "Điều 5 quy định"
+        assert saved == [("m1", "Điều 5 quy định", [{"id": 1}])]
+
+    def test_llm_error_saves_error_reply(self, monkeypatch, saved):
+        stream_answer(monkeypatch, fail=True)
+
+        async def run():
+            return [event async for event in message_events()]
+
+        events = asyncio.run(run())
+
+        assert [event for event, _ in events] == ["metadata", "token", "error", "done"]
+        assert saved == [("m1", RAG_ERROR_MESSAGE, [])]
+
+    def test_disconnect_saves_partial_answer(self, monkeypatch, saved):
+        stream_answer(monkeypatch)
+
+        async def run():
+            stream = message_events()
+            await stream.__anext__()
+            await stream.__anext__()
+            await stream.aclose()
+            # The interrupted turn is saved in the background
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        assert saved == [("m1", "Điều 5" + RAG_ABORTED_SUFFIX, [])]
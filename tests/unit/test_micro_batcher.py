@@ -0,0 +1,119 @@
+"""
+Unit Tests for MicroBatcher
+Tests cross-request batching, score scatter and metrics with a fake model
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.retrieval.ranking.micro_batcher import MicroBatcher
+
+
+class FakeModel:
+    """Scores a pair by text length and records batch sizes."""
+
+    def __init__(self, delay=0.0, error=None):
+        self.batches = []
+        self.delay = delay
+        self.error = error
+
+    def predict(self, pairs):
+        self.batches.append(len(pairs))
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [float(len(text)) for _, text in pairs]
+
+
+class TestMicroBatcher:
+    """Tests for micro-batching"""
+
+    def test_concurrent_requests_share_one_predict(self):
+        model = FakeModel()
+        batcher = MicroBatcher(model.predict, max_wait_ms=100, max_pairs=1000)
+        requests = [[["q", "x" * (i + j)] for j in range(3)] for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(batcher.score, requests))
+
+        assert results == [[float(i + j) for j in range(3)] for i in range(8)]
+        assert sum(model.batches) == 24
+        assert len(model.batches) < 8
+        batcher.close()
+
+    def test_flushes_when_max_pairs_reached(self):
+        model = FakeModel()
+        batcher = MicroBatcher(model.predict, max_wait_ms=5000, max_pairs=4)
+
+        start = time.perf_counter()
+        assert batcher.score([["q", "ab"]] * 4) == [2.0] * 4
+        assert time.perf_counter() - start < 1.0
+        batcher.close()
+
+    def test_single_request_waits_at_most_max_wait(self):
+        batcher = MicroBatcher(FakeModel().predict, max_wait_ms=20, max_pairs=100)
+
+        start = time.perf_counter()
+        batcher.score([["q", "a"]])
+
+        assert time.perf_counter() - start < 0.5
+        stats = batcher.get_stats()
+        assert stats["batches"] == 1
+        assert stats["avg_fill_rate"] == 0.01
+        assert stats["avg_queue_wait_ms"] >= 15
+        batcher.close()
+
+    def test_errors_propagate_to_every_caller(self):
+        model = FakeModel(error=RuntimeError("CUDA out of memory"))
+        batcher = MicroBatcher(model.predict, max_wait_ms=50, max_pairs=100)
+        errors = []
+
+        def call():
+            try:
+                batcher.score([["q", "a"]])
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == ["CUDA out of memory"] * 3
+        assert batcher.get_stats()["errors"] >= 1
+        batcher.close()
+
+    def test_score_times_out_and_skips_cancelled_job(self):
+        model = FakeModel(delay=0.3)
+        batcher = MicroBatcher(model.predict, max_wait_ms=0, max_pairs=1)
+        blocker = threading.Thread(target=batcher.score, args=([["q", "busy"]],))
+        blocker.start()
+        time.sleep(0.05)  # worker is now inside predict()
+
+        with pytest.raises(TimeoutError):
+            batcher.score([["q", "late"]], timeout=0.05)
+        blocker.join()
+        time.sleep(0.05)
+
+        assert model.batches == [1]  # the timed-out job never reached the model
+        assert batcher.get_stats()["timeouts"] == 1
+        batcher.close()
+
+    def test_close_fails_queued_requests(self):
+        model = FakeModel(delay=0.3)
+        batcher = MicroBatcher(model.predict, max_wait_ms=0, max_pairs=1)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(batcher.score, [["q", "a"]]) for _ in range(3)]
+            time.sleep(0.05)  # one request in predict(), two queued
+            batcher.close()
+            outcomes = [f.exception(timeout=2) for f in futures]
+
+        failed = [e for e in outcomes if e is not None]
+        assert len(failed) == 2
+        assert all("closed" in str(e) for e in failed)
+        with pytest.raises(RuntimeError):
+            batcher.score([["q", "a"]])
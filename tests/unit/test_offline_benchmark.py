@@ -0,0 +1,127 @@
+"""
+Unit Tests for the offline RAG benchmark
+Tests the stand-in providers, corpus loading and baseline regression checks
+"""
+
+import copy
+import zipfile
+
+from langchain_core.documents import Document
+
+from src.evaluation.benchmarks import BenchmarkConfig, compare_to_baseline, run_benchmark
+from src.evaluation.benchmarks.corpus import load_corpus
+from src.evaluation.benchmarks.harness import build_vector_store
+from src.evaluation.benchmarks.pipeline import STAGES, OfflineRAGPipeline
+from src.evaluation.benchmarks.providers import (
+    LATENCY_PROFILES,
+    FakeEmbeddings,
+    LatencyModel,
+    make_providers,
+)
+from src.retrieval.retrievers import BaseVectorRetriever, EnhancedRetriever, FusionRetriever
+
+DOCX_XML = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>{}</w:body></w:document>"
+)
+
+
+def write_docx(path, paragraphs):
+    body = "".join(f"<w:p><w:r><w:t>{p}</w:t></w:r></w:p>" for p in paragraphs)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", DOCX_XML.format(body))
+
+
+def make_chunks():
+    topics = ["bảo đảm dự thầu", "hồ sơ mời thầu", "hợp đồng xây dựng", "đấu thầu rộng rãi"]
+    return [
+        Document(page_content=f"Quy định về {topic} điều {i}", metadata={"document_id": f"d{i}"})
+        for i, topic in enumerate(topics * 5)
+    ]
+
+
+class TestProviders:
+    """Tests for deterministic stand-ins"""
+
+    def test_embeddings_deterministic_and_similar(self):
+        embeddings = FakeEmbeddings(dimensions=64)
+        a, b, c = embeddings.embed_documents(
+            ["bảo đảm dự thầu", "bảo đảm dự thầu là gì", "mẫu báo cáo thẩm định"]
+        )
+        dot = lambda x, y: sum(i * j for i, j in zip(x, y))
+
+        assert a == embeddings.embed_query("bảo đảm dự thầu")
+        assert dot(a, b) > dot(a, c)
+
+    def test_latency_model(self):
+        model = LatencyModel(base_ms=10, per_item_ms=2, jitter_ms=4)
+        delay = model.delay_ms("query", items=3)
+
+        assert 16 <= delay < 20
+        assert delay == model.delay_ms("query", items=3)
+
+
+class TestCorpus:
+    """Tests for data/raw style .docx loading"""
+
+    def test_load_corpus(self, tmp_path):
+        write_docx(tmp_path / "Luat chinh" / "luat.docx", ["Điều 1. " + "a" * 50, "Điều 2."])
+        write_docx(tmp_path / "Nghi dinh" / "nd.docx", ["Chương I"])
+        (tmp_path / "Nghi dinh" / "broken.docx").write_bytes(b"not a zip")
+
+        chunks = load_corpus(tmp_path, chunk_chars=40)
+
+        assert [c.metadata["document_type"] for c in chunks] == ["law", "decree", "law"]
+        assert chunks[0].page_content.startswith("Điều 1.")
+        assert chunks[2].page_content == "Điều 2."
+
+
+class TestPipeline:
+    """Tests for the production retrievers on injected stand-ins"""
+
+    def test_modes_build_production_retrievers(self):
+        providers = make_providers(LATENCY_PROFILES["zero"])
+        store = build_vector_store(make_chunks(), providers["embeddings"].dimensions)
+        expected = {
+            "fast": BaseVectorRetriever,
+            "balanced": EnhancedRetriever,
+            "quality": FusionRetriever,
+        }
+
+        for mode, retriever_class in expected.items():
+            pipeline = OfflineRAGPipeline(store, providers, mode=mode, k=3)
+            result = pipeline.run("Bảo đảm dự thầu năm 2024 là bao nhiêu?")
+            retriever, _ = pipeline._idle[0]
+
+            assert isinstance(retriever, retriever_class)
+            assert len(result.documents) == 3
+            assert set(result.stage_ms) == set(STAGES)
+            if mode == "fast":
+                assert result.stage_ms["enhancement"] == 0.0
+            else:
+                enhancer = retriever.query_enhancer.inner
+                assert enhancer.llm_client is providers["enhancement_llm"]
+                assert result.stage_ms["rerank"] > 0.0
+
+
+class TestHarness:
+    """Tests for the benchmark run and baseline comparison"""
+
+    def test_run_and_compare(self):
+        config = BenchmarkConfig(modes=("fast", "quality"), profile="zero", warmup=0)
+        report = run_benchmark(config, chunks=make_chunks())
+
+        quality = report["modes"]["quality"]
+        assert quality["questions"] == 26
+        assert set(quality["stages"]) >= {"enhancement", "vector_search", "rerank", "total"}
+        assert compare_to_baseline(report, report) == []
+
+        slower = copy.deepcopy(report)
+        slower["modes"]["quality"]["stages"]["rerank"]["p95"] += 100
+        slower["modes"]["fast"]["throughput_qps"] = 0.01
+        regressions = compare_to_baseline(slower, report)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("fast throughput")
+        assert regressions[1].startswith("quality/rerank p95")
@@ -0,0 +1,88 @@
+"""
+Unit Tests for PipelineExecutor
+Tests event-loop offloading and backpressure
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+
+from src.api.services.pipeline_executor import (
+    PipelineExecutor,
+    PipelineOverloadedError,
+)
+
+
+def blocking_call(delay, value):
+    time.sleep(delay)
+    return value
+
+
+class TestPipelineExecutor:
+    """Tests for the bounded pipeline executor"""
+
+    def test_blocking_calls_run_concurrently(self):
+        executor = PipelineExecutor(max_workers=4, max_pending=0)
+
+        async def main():
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(executor.run(blocking_call, 0.2, i) for i in range(4))
+            )
+            return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(main())
+
+        assert results == [0, 1, 2, 3]
+        assert elapsed < 0.6
+        assert executor.get_stats()["completed"] == 4
+
+    def test_event_loop_stays_responsive(self):
+        executor = PipelineExecutor(max_workers=1, max_pending=0)
+
+        async def main():
+            job = asyncio.ensure_future(executor.run(blocking_call, 0.3, "done"))
+            ticks = 0
+            while not job.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return await job, ticks
+
+        value, ticks = asyncio.run(main())
+
+        assert value == "done"
+        assert ticks > 10
+
+    def test_rejects_when_queue_is_full(self):
+        executor = PipelineExecutor(max_workers=1, max_pending=1)
+        release = threading.Event()
+
+        async def main():
+            first = asyncio.ensure_future(executor.run(release.wait))
+            second = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.05)
+            with pytest.raises(PipelineOverloadedError):
+                await executor.run(release.wait)
+            release.set()
+            await asyncio.gather(first, second)
+
+        asyncio.run(main())
+
+        stats = executor.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_exceptions_propagate_and_free_slot(self):
+        executor = PipelineExecutor(max_workers=1, max_pending=0)
+
+        def fail():
+            raise ValueError("boom")
+
+        async def main():
+            with pytest.raises(ValueError):
+                await executor.run(fail)
+            return await executor.run(blocking_call, 0, "ok")
+
+        assert asyncio.run(main()) == "ok"
+        assert executor.get_stats()["failed"] == 1
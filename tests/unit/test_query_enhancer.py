@@ -0,0 +1,139 @@
+"""
+Unit Tests for QueryEnhancer parallel execution
+Tests concurrency, timeout budget and ordering with fake strategies
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+
+from src.retrieval.query_processing.query_enhancer import (
+    QueryEnhancer,
+    QueryEnhancerConfig,
+    EnhancementStrategy,
+)
+
+
+class FakeStrategy:
+    """Strategy stub returning fixed variants after a delay."""
+
+    def __init__(self, variants, delay=0.0, error=False):
+        self.variants = variants
+        self.delay = delay
+        self.error = error
+
+    def enhance(self, query):
+        time.sleep(self.delay)
+        if self.error:
+            raise RuntimeError("LLM failure")
+        return list(self.variants)
+
+
+def make_enhancer(strategies, parallel=True, timeout=2.0, max_queries=3):
+    """Build a QueryEnhancer with fake strategies (no LLM clients)."""
+    config = QueryEnhancerConfig(
+        strategies=list(strategies.keys()),
+        max_queries=max_queries,
+        parallel=parallel,
+        strategy_timeout=timeout,
+    )
+    with patch.object(QueryEnhancer, "_init_strategies", return_value=strategies):
+        return QueryEnhancer(config)
+
+
+class TestParallelEnhance:
+    """Tests for concurrent strategy execution"""
+
+    def test_strategies_run_concurrently(self):
+        enhancer = make_enhancer(
+            {
+                EnhancementStrategy.MULTI_QUERY: FakeStrategy(["a"], delay=0.3),
+                EnhancementStrategy.STEP_BACK: FakeStrategy(["b"], delay=0.3),
+                EnhancementStrategy.HYDE: FakeStrategy(["c"], delay=0.3),
+            }
+        )
+
+        start = time.perf_counter()
+        result = enhancer.enhance("q")
+        elapsed = time.perf_counter() - start
+
+        assert result == ["q", "a", "b", "c"]
+        assert elapsed < 0.8
+
+    def test_order_matches_sequential(self):
+        strategies = {
+            EnhancementStrategy.MULTI_QUERY: FakeStrategy(["x", "Q", "y"], delay=0.1),
+            EnhancementStrategy.STEP_BACK: FakeStrategy(["y", "z"]),
+        }
+        parallel = make_enhancer(strategies, parallel=True).enhance("q")
+        sequential = make_enhancer(strategies, parallel=False).enhance("q")
+
+        assert parallel == sequential == ["q", "x", "y", "z"]
+
+    def test_slow_strategy_is_dropped(self):
+        enhancer = make_enhancer(
+            {
+                EnhancementStrategy.MULTI_QUERY: FakeStrategy(["fast"]),
+                EnhancementStrategy.DECOMPOSITION: FakeStrategy(["slow"], delay=1.0),
+            },
+            timeout=0.2,
+        )
+
+        result = enhancer.enhance("q")
+
+        assert result == ["q", "fast"]
+        assert enhancer.get_latency_stats()["decomposition"]["timeouts"] == 1
+        # Degraded results are not cached
+        assert "q" not in enhancer.cache
+
+    def test_failing_strategy_is_skipped(self):
+        enhancer = make_enhancer(
+            {
+                EnhancementStrategy.MULTI_QUERY: FakeStrategy(["a"]),
+                EnhancementStrategy.HYDE: FakeStrategy([], error=True),
+            }
+        )
+
+        assert enhancer.enhance("q") == ["q", "a"]
+        assert enhancer.get_latency_stats()["hyde"]["errors"] == 1
+
+    def test_latency_recorded_per_strategy(self):
+        enhancer = make_enhancer(
+            {
+                EnhancementStrategy.MULTI_QUERY: FakeStrategy(["a"], delay=0.05),
+                EnhancementStrategy.STEP_BACK: FakeStrategy(["b"]),
+            }
+        )
+        enhancer.enhance("q")
+
+        stats = enhancer.get_latency_stats()
+        assert stats["multi_query"]["calls"] == 1
+        assert stats["multi_query"]["avg_ms"] >= 50
+        assert stats["step_back"]["calls"] == 1
+
+
+class TestAsyncEnhance:
+    """Tests for aenhance()"""
+
+    def test_aenhance_matches_enhance(self):
+        strategies = {
+            EnhancementStrategy.MULTI_QUERY: FakeStrategy(["a", "b"]),
+            EnhancementStrategy.STEP_BACK: FakeStrategy(["c"], delay=0.05),
+        }
+        sync_result = make_enhancer(strategies).enhance("q")
+        async_result = asyncio.run(make_enhancer(strategies).aenhance("q"))
+
+        assert async_result == sync_result
+
+    def test_aenhance_drops_timeouts(self):
+        enhancer = make_enhancer(
+            {
+                EnhancementStrategy.MULTI_QUERY: FakeStrategy(["a"]),
+                EnhancementStrategy.HYDE: FakeStrategy(["late"], delay=0.6),
+            },
+            timeout=0.1,
+        )
+
+        assert asyncio.run(enhancer.aenhance("q")) == ["q", "a"]
+        assert enhancer.get_latency_stats()["hyde"]["timeouts"] == 1
@@ -0,0 +1,122 @@
+"""
+Unit Tests for RerankScoreCache
+Tests pair-score reuse, miss-only scoring and chunk/document invalidation
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from langchain_core.documents import Document
+
+from src.retrieval.ranking.score_cache import RerankScoreCache, chunk_key_for
+
+
+MODEL = "bge:test-model:512"
+
+
+def make_doc(chunk_id, text, document_id="DOC-1"):
+    return Document(
+        page_content=text,
+        metadata={"chunk_id": chunk_id, "document_id": document_id},
+    )
+
+
+class CountingScorer:
+    """Scores documents by content length and records what it was asked."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, docs):
+        self.calls.append([d.metadata.get("chunk_id") for d in docs])
+        return [float(len(d.page_content)) for d in docs]
+
+
+@pytest.fixture
+def cache():
+    return RerankScoreCache(enable_l2_cache=False, l1_size=100)
+
+
+class TestScoreDocuments:
+    """Tests for miss-only scoring"""
+
+    def test_only_misses_are_scored(self, cache):
+        scorer = CountingScorer()
+        a, b, c = make_doc("a", "x"), make_doc("b", "yy"), make_doc("c", "zzz")
+
+        cache.score_documents(MODEL, "q", [a, b], scorer)
+        scores = cache.score_documents(MODEL, "q", [b, c, a], scorer)
+
+        assert scores == [2.0, 3.0, 1.0]
+        assert scorer.calls == [["a", "b"], ["c"]]
+        assert cache.get_stats()["l1_hits"] == 2
+
+    def test_key_depends_on_query_model_and_content(self, cache):
+        scorer = CountingScorer()
+        doc = make_doc("a", "text")
+
+        cache.score_documents(MODEL, "Điều 14", [doc], scorer)
+        cache.score_documents(MODEL, "  Điều   14 ", [doc], scorer)  # normalized
+        cache.score_documents(MODEL, "Điều 15", [doc], scorer)
+        cache.score_documents("openai:gpt-4o-mini", "Điều 14", [doc], scorer)
+        cache.score_documents(MODEL, "Điều 14", [make_doc("a", "edited")], scorer)
+
+        assert len(scorer.calls) == 4
+
+    def test_failed_scores_are_not_cached(self, cache):
+        doc = make_doc("a", "text")
+
+        assert cache.score_documents(MODEL, "q", [doc], lambda docs: [None]) == [0.0]
+        assert cache.get_many(MODEL, "q", [doc]) == [None]
+
+    def test_chunk_key_falls_back_to_content(self):
+        doc = Document(page_content="abc", metadata={})
+        assert chunk_key_for(doc).startswith("content:")
+
+
+class TestInvalidation:
+    """Tests for chunk/document invalidation"""
+
+    def test_invalidate_chunks(self, cache):
+        scorer = CountingScorer()
+        a, b = make_doc("a", "x"), make_doc("b", "yy")
+        cache.score_documents(MODEL, "q1", [a, b], scorer)
+        cache.score_documents(MODEL, "q2", [a], scorer)
+
+        assert cache.invalidate_chunks(["a"]) == 1
+        assert cache.get_many(MODEL, "q1", [a, b]) == [None, 2.0]
+        assert cache.get_many(MODEL, "q2", [a]) == [None]
+        assert "a" not in cache._chunk_fields
+
+    def test_invalidate_document_uses_tracked_chunks(self, cache):
+        scorer = CountingScorer()
+        docs = [make_doc("a", "x", "DOC-1"), make_doc("b", "yy", "DOC-2")]
+        cache.score_documents(MODEL, "q", docs, scorer)
+
+        cache.invalidate_document("DOC-1")
+
+        assert cache.get_many(MODEL, "q", docs) == [None, 2.0]
+
+    def test_lru_eviction_cleans_indexes(self):
+        cache = RerankScoreCache(enable_l2_cache=False, l1_size=1)
+        scorer = CountingScorer()
+        cache.score_documents(MODEL, "q", [make_doc("a", "x")], scorer)
+        cache.score_documents(MODEL, "q", [make_doc("b", "y", "DOC-2")], scorer)
+
+        assert cache._doc_chunks == {"DOC-2": {"b"}}
+
+
+class TestL2Cache:
+    """Tests for Redis-backed sharing"""
+
+    def test_l2_hit_and_single_key_invalidation(self, cache):
+        cache._redis = MagicMock()
+        pipe = cache._redis.pipeline.return_value
+        pipe.execute.return_value = ["0.75"]
+        doc = make_doc("a", "text")
+
+        assert cache.get_many(MODEL, "q", [doc]) == [0.75]
+        assert cache.get_stats()["l2_hits"] == 1
+
+        cache.invalidate_chunks(["a"])
+        cache._redis.delete.assert_called_once_with("rag:rerank:chunk:a")
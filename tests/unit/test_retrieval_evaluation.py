@@ -0,0 +1,116 @@
+"""
+Unit Tests for retrieval evaluation
+Tests rank metrics, golden-set result caching and the Pareto frontier
+"""
+
+import pytest
+from langchain_core.documents import Document
+
+from src.evaluation.metrics.retrieval_metrics import (
+    evaluate_ranking,
+    ndcg_at_k,
+    recall_at_k,
+    reciprocal_rank,
+)
+from src.evaluation.retrieval_evaluator import (
+    EvalConfig,
+    GoldenItem,
+    GoldenSet,
+    RetrievalEvaluator,
+    build_configs,
+    pareto_frontier,
+)
+
+
+class TestRetrievalMetrics:
+    """Tests for recall@k, MRR and nDCG"""
+
+    def test_evaluate_ranking(self):
+        metrics = evaluate_ranking(["c3", "c1", "c9"], {"c1", "c2"}, k=3)
+
+        assert metrics["recall@3"] == 0.5
+        assert metrics["mrr"] == 0.5
+        assert metrics["hit@3"] == 1.0
+        assert metrics["ndcg@3"] == pytest.approx(0.3869, abs=1e-4)
+
+    def test_duplicates_and_cutoff(self):
+        assert recall_at_k(["c1", "c1", "c2"], {"c1", "c2"}, k=2) == 1.0
+        assert reciprocal_rank(["c9", "c8", "c1"], {"c1"}, k=2) == 0.0
+        assert ndcg_at_k(["c1", "c2"], {"c1", "c2"}, k=2) == 1.0
+        assert ndcg_at_k([], set(), k=5) == 0.0
+
+
+def make_factory(calls):
+    """Fake retriever: deeper k finds the relevant chunk later in the list."""
+
+    def factory(config):
+        calls.append(config)
+
+        def retrieve(question):
+            ids = ["noise", f"{question}-relevant"] if config.mode == "fast" else [f"{question}-relevant"]
+            docs = [Document(id=i, page_content=i) for i in ids][: config.k]
+            latency = 10.0 if config.mode == "fast" else 50.0
+            return docs, {"search": latency, "total": latency}
+
+        return retrieve
+
+    return factory
+
+
+def golden_set():
+    return GoldenSet(
+        name="test",
+        items=[
+            GoldenItem(question=q, expected_chunk_ids=[f"{q}-relevant"])
+            for q in ("q1", "q2")
+        ]
+        + [GoldenItem(question="unlabelled", expected_chunk_ids=[])],
+    )
+
+
+class TestRetrievalEvaluator:
+    """Tests for evaluation, caching and Pareto table input"""
+
+    def test_cached_results_only_recompute_changed_configs(self, tmp_path):
+        calls = []
+        evaluator = RetrievalEvaluator(
+            golden_set(), retriever_factory=make_factory(calls), backend="fake", cache_dir=tmp_path
+        )
+        configs = [EvalConfig(mode="fast", k=1), EvalConfig(mode="balanced", reranker_type="bge", k=1)]
+
+        first = evaluator.evaluate_many(configs)
+        assert [r["cached"] for r in first] == [False, False]
+        assert first[0]["questions"] == 2  # unlabelled item skipped
+        assert first[0]["metrics"]["recall@1"] == 0.0
+        assert first[1]["metrics"]["recall@1"] == 1.0
+
+        second = evaluator.evaluate_many(configs + [EvalConfig(mode="fast", k=2)])
+        assert [r["cached"] for r in second] == [True, True, False]
+        assert len(calls) == 3
+        assert second[2]["metrics"]["mrr"] == 0.5
+
+    def test_pareto_frontier(self, tmp_path):
+        evaluator = RetrievalEvaluator(
+            golden_set(), retriever_factory=make_factory([]), backend="fake", cache_dir=None
+        )
+        results = evaluator.evaluate_many(
+            [
+                EvalConfig(mode="fast", k=1),  # fast, misses
+                EvalConfig(mode="fast", k=2),  # fast, finds at rank 2
+                EvalConfig(mode="balanced", reranker_type="bge", k=1),  # slow, perfect
+            ]
+        )
+
+        assert pareto_frontier(results) == ["fast/none/k=2", "balanced/bge/k=1"]
+
+    def test_build_configs(self):
+        configs = build_configs(["fast", "quality"], ["bge", None], [3, 5])
+
+        assert [c.name for c in configs] == [
+            "fast/none/k=3",
+            "fast/none/k=5",
+            "quality/bge/k=3",
+            "quality/bge/k=5",
+            "quality/none/k=3",
+            "quality/none/k=5",
+        ]
@@ -0,0 +1,159 @@
+"""
+Unit Tests for the semantic cache embedding index
+Tests top-k search, expiry, compaction and incremental Redis sync
+"""
+
+import pickle
+import time
+import numpy as np
+import pytest
+
+from src.retrieval.semantic_cache_v2 import EmbeddingIndex, HybridSemanticCache
+
+
+def unit(v):
+    v = np.asarray(v, dtype=np.float32)
+    return v / np.linalg.norm(v)
+
+
+class FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.ops = []
+
+    def get(self, key):
+        self.ops.append(self.store.get(key))
+
+    def pttl(self, key):
+        self.ops.append(60_000 if key in self.store else -2)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ops.append(True)
+
+    def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+        self.ops.append(len(members))
+
+    def expire(self, key, ttl):
+        self.ops.append(True)
+
+    def execute(self):
+        ops, self.ops = self.ops, []
+        return ops
+
+
+class FakeRedis:
+    """Minimal dict-backed Redis for sync tests."""
+
+    def __init__(self):
+        self.store = {}
+
+    def scan_iter(self, match="*", count=None):
+        prefix = match.rstrip("*")
+        return [k.encode() for k in list(self.store) if k.startswith(prefix)]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.store)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+class TestEmbeddingIndex:
+    """Tests for matrix search"""
+
+    def test_top_k_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(500, 16)).astype(np.float32)
+        index = EmbeddingIndex(initial_capacity=8)
+        for i, v in enumerate(vectors):
+            index.add(f"k{i}", v, {"query": f"q{i}"})
+
+        query = rng.normal(size=16).astype(np.float32)
+        results = index.search(query, top_k=5, threshold=-1.0)
+
+        expected = np.argsort(-(vectors / np.linalg.norm(vectors, axis=1)[:, None]) @ unit(query))[:5]
+        assert [key for key, _, _ in results] == [f"k{i}" for i in expected]
+        assert results[0][2] == {"query": f"q{expected[0]}"}
+
+    def test_threshold_and_replace(self):
+        index = EmbeddingIndex()
+        index.add("a", [1, 0, 0], {"query": "a"})
+        index.add("b", [0, 1, 0], {"query": "b"})
+        index.add("a", [0, 0, 1], {"query": "a2"})
+
+        results = index.search([0, 0.1, 1], top_k=5, threshold=0.5)
+
+        assert [(k, d["query"]) for k, _, d in results] == [("a", "a2")]
+        assert len(index) == 2
+
+    def test_expired_and_removed_entries_are_skipped(self):
+        index = EmbeddingIndex()
+        now = time.time()
+        index.add("old", [1, 0], {}, expires_at=now - 1)
+        index.add("gone", [1, 0.1], {})
+        index.add("live", [1, 0.2], {})
+        index.remove("gone")
+
+        assert [k for k, _, _ in index.search([1, 0], 5, 0.0)] == ["live"]
+        assert index.prune_expired() == 1
+        assert index.keys() == ["live"]
+
+    def test_compaction_keeps_live_rows(self):
+        index = EmbeddingIndex(initial_capacity=4)
+        for i in range(200):
+            index.add(f"k{i}", [np.cos(i / 100), np.sin(i / 100)], {"i": i})
+        for i in range(0, 200, 2):
+            index.remove(f"k{i}")
+
+        assert len(index) == 100
+        assert index._tombstones < 100  # compacted at least once
+        key, score, data = index.search([np.cos(1.99), np.sin(1.99)], 1, 0.0)[0]
+        assert (key, data) == ("k199", {"i": 199})
+
+
+class TestIndexSync:
+    """Tests for Redis → index sync"""
+
+    def _cache(self, redis_client):
+        cache = HybridSemanticCache(enabled=False)
+        cache._redis = redis_client
+        cache.enabled = True
+        return cache
+
+    def test_sync_loads_entries_from_other_workers(self):
+        redis_client = FakeRedis()
+        redis_client.store["rag:semantic:v2:x"] = pickle.dumps(
+            {
+                "query": "thầu",
+                "embedding": unit([1, 0, 0]).tobytes(),
+                "answer_cache_key": "rag:answer:thầu",
+            }
+        )
+        cache = self._cache(redis_client)
+
+        assert cache.sync_index() == 1
+        assert cache.sync_index() == 0  # incremental
+
+        candidates = cache._cosine_prefilter(unit([1, 0.1, 0]))
+        assert candidates[0][0] == "rag:semantic:v2:x"
+        assert candidates[0][2]["query"] == "thầu"
+
+        del redis_client.store["rag:semantic:v2:x"]
+        cache.sync_index()
+        assert cache.get_stats()["index"]["size"] == 0
+
+    def test_prefilter_never_scans_redis(self):
+        redis_client = FakeRedis()
+        cache = self._cache(redis_client)
+        cache.sync_interval = 0
+        redis_client.scan_iter = lambda *a, **kw: pytest.fail("request path scanned Redis")
+
+        assert cache._cosine_prefilter(unit([1, 0])) == []
+
+    def test_store_embedding_is_searchable_without_sync(self):
+        cache = self._cache(FakeRedis())
+
+        assert cache.store_embedding("q", unit([0, 1]), "rag:answer:q")
+        assert cache._cosine_prefilter(unit([0, 1]))[0][2]["query"] == "q"
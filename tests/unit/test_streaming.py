@@ -0,0 +1,53 @@
+"""
+Unit Tests for SSE streaming helpers
+"""
+
+import asyncio
+import json
+
+from src.api.services.streaming import format_sse, sse_response
+
+
+def parse_frames(body: str):
+    frames = []
+    for block in body.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        frames.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return frames
+
+
+async def collect(response):
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+class TestSSE:
+    """Tests for SSE encoding"""
+
+    def test_format_sse_keeps_unicode(self):
+        frame = format_sse("token", {"text": "Điều 5"})
+        assert frame == 'event: token\ndata: {"text": "Điều 5"}\n\n'
+
+    def test_response_streams_events_in_order(self):
+        async def events():
+            yield "metadata", {"docs_retrieved": 3}
+            yield "token", {"text": "a\nb"}
+            yield "done", {"answer": "a\nb"}
+
+        response = sse_response(events())
+        body = asyncio.run(collect(response))
+
+        assert response.media_type == "text/event-stream"
+        assert parse_frames(body) == [
+            ("metadata", {"docs_retrieved": 3}),
+            ("token", {"text": "a\nb"}),
+            ("done", {"answer": "a\nb"}),
+        ]
+
+    def test_exception_becomes_error_event(self):
+        async def events():
+            yield "token", {"text": "partial"}
+            raise RuntimeError("LLM down")
+
+        body = asyncio.run(collect(sse_response(events())))
+
+        assert parse_frames(body)[-1] == ("error", {"message": "LLM down"})
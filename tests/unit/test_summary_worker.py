@@ -0,0 +1,85 @@
+"""
+Unit Tests for the background summary worker
+Tests coalescing, lag/queue metrics and failure accounting (in-process queue)
+"""
+
+from uuid import uuid4
+
+from src.api.services.summary_worker import InMemorySummaryQueue, SummaryWorker
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_worker(summarize_fn, clock):
+    return SummaryWorker(
+        summarize_fn=summarize_fn,
+        queue=InMemorySummaryQueue(),
+        autostart=False,
+        clock=clock,
+    )
+
+
+class TestSummaryWorker:
+    """Tests for SummaryWorker with the in-process queue"""
+
+    def test_repeat_requests_are_coalesced(self):
+        done = []
+        clock = FakeClock()
+        worker = make_worker(done.append, clock)
+        a, b = uuid4(), uuid4()
+
+        assert worker.enqueue(a) is True
+        assert worker.enqueue(a) is False
+        assert worker.enqueue(b) is True
+        assert worker.get_stats()["queue_depth"] == 2
+
+        assert worker.run_pending() == 2
+        assert done == [a, b]
+
+        # Queued again once the pending one has been processed
+        assert worker.enqueue(a) is True
+
+        stats = worker.get_stats()
+        assert stats["enqueued"] == 3
+        assert stats["coalesced"] == 1
+        assert stats["processed"] == 2
+
+    def test_lag_and_oldest_pending_age(self):
+        clock = FakeClock()
+        worker = make_worker(lambda _: clock.__setattr__("now", clock.now + 3), clock)
+
+        worker.enqueue(uuid4())
+        clock.now += 5
+        assert worker.get_stats()["oldest_pending_age_s"] == 5.0
+
+        worker.run_pending()
+        stats = worker.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["oldest_pending_age_s"] == 0.0
+        assert stats["summary_lag_s"] == {"last": 8.0, "avg": 8.0, "max": 8.0}
+
+    def test_failure_is_counted_and_worker_continues(self):
+        done = []
+
+        def summarize(conversation_id):
+            if not done:
+                done.append(None)
+                raise RuntimeError("LLM timeout")
+            done.append(conversation_id)
+
+        worker = make_worker(summarize, FakeClock())
+        second = uuid4()
+        worker.enqueue(uuid4())
+        worker.enqueue(second)
+
+        assert worker.run_pending() == 2
+        assert done[-1] == second
+        stats = worker.get_stats()
+        assert stats["failed"] == 1
+        assert stats["processed"] == 1
@@ -0,0 +1,153 @@
+"""
+Unit Tests for UploadProcessingService Stage 2
+Tests that the documents row and its chunks are written in one transaction
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+# src.config.database builds the async engine at import time
+pytest.importorskip("greenlet")
+
+from src.api.services import upload_service
+from src.api.services.upload_service import UploadProcessingService
+from src.embedding.store.bulk_writer import BulkChunkWriter, BulkWriteResult
+from src.preprocessing.chunking.base_chunker import UniversalChunk
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(sql)
+
+    def fetchone(self):
+        return ("doc-uuid",)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.committed = self.rolled_back = self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeJobRepo:
+    def __init__(self, job):
+        self.job = job
+        self.statuses = []
+        self.progress = None
+
+    def get_job(self, upload_id):
+        return self.job
+
+    def update_job_status(self, upload_id, status, error_message=None):
+        self.statuses.append(status)
+
+    def update_progress(self, upload_id, progress_data, completed, failed):
+        self.progress = (progress_data, completed, failed)
+
+
+def make_service(monkeypatch, conn, job):
+    service = UploadProcessingService.__new__(UploadProcessingService)
+    service.job_repo = FakeJobRepo(job)
+    service.embedder = None
+    service.executor = None
+
+    async def run_pipeline(file_path, document_type, batch_name=None):
+        return [
+            UniversalChunk(
+                content="Điều 1. Phạm vi điều chỉnh",
+                chunk_id="luat_dieu_1",
+                document_id="luat",
+                document_type="law",
+                chunk_index=0,
+            )
+        ]
+
+    def attach_embeddings(rows, embedder):
+        service.embedding_threads.append(threading.get_ident())
+
+    service._run_working_pipeline = run_pipeline
+    service.embedding_threads = []
+    monkeypatch.setattr(upload_service, "get_db_sync", lambda: conn)
+    monkeypatch.setattr(upload_service, "attach_embeddings", attach_embeddings)
+    return service
+
+
+def failing_write(self, document_uuid, rows, link_embeddings=True, conn=None):
+    raise RuntimeError("COPY failed")
+
+
+class TestConfirmedUpload:
+    """Tests for the Stage 2 database write"""
+
+    def test_chunk_write_failure_rolls_back_document_row(self, monkeypatch):
+        conn = FakeConnection()
+        job = {
+            "files_data": [
+                {"file_id": "f1", "filename": "luat.docx", "file_path": "/tmp/luat.docx"}
+            ],
+            "admin_metadata": {"document_type": "law"},
+        }
+        service = make_service(monkeypatch, conn, job)
+        monkeypatch.setattr(BulkChunkWriter, "write", failing_write)
+
+        asyncio.run(service._process_confirmed_upload("u1"))
+
+        # Embedding (rate-limit waits, retry backoff) runs off the event loop
+        assert service.embedding_threads
+        assert service.embedding_threads[0] != threading.get_ident()
+        # The documents row was inserted on the same connection, never committed
+        assert any("INSERT INTO documents" in sql for sql in conn.statements)
+        assert conn.rolled_back and not conn.committed and conn.closed
+        progress, completed, failed = service.job_repo.progress
+        assert progress[0]["status"] == "failed"
+        assert (completed, failed) == (0, 1)
+        assert service.job_repo.statuses[-1] == "failed"
+
+    def test_document_and_chunks_commit_together(self, monkeypatch):
+        conn = FakeConnection()
+        writes = []
+
+        def write(self, document_uuid, rows, link_embeddings=True, conn=None):
+            writes.append((document_uuid, conn))
+            return BulkWriteResult()
+
+        service = make_service(monkeypatch, conn, {})
+        monkeypatch.setattr(BulkChunkWriter, "write", write)
+
+        doc_uuid = service._store_document(
+            [],
+            document_id="luat",
+            document_name="Luật đấu thầu",
+            document_type="law",
+            category="Luật chính",
+            filename="luat.docx",
+            source_file="/tmp/luat.docx",
+            total_chunks=0,
+        )
+
+        assert doc_uuid == "doc-uuid"
+        assert writes == [("doc-uuid", conn)]
+        assert conn.committed and not conn.rolled_back and conn.closed